@@ -2,28 +2,35 @@
 일정 및 시험 관리자 설정
 """
 from django.contrib import admin
+
+from core.admin import LargeTableAdmin
+
 from .models import Event, RepeatEvent, Exam
 
 
 @admin.register(Event)
-class EventAdmin(admin.ModelAdmin):
+class EventAdmin(LargeTableAdmin):
     list_display = ('title', 'user', 'start_at', 'end_at', 'created_at')
-    list_filter = ('created_at', 'start_at')
-    search_fields = ('title', 'user__username')
-    date_hierarchy = 'start_at'
+    # 인덱스가 있는 필드로만 필터 (date_hierarchy 는 전체 테이블의 날짜를 집계하므로 사용하지 않음)
+    list_filter = ('start_at',)
+    search_fields = ('title', 'user__email')
+    list_select_related = ('user',)
+    raw_id_fields = ('user',)
 
 
 @admin.register(RepeatEvent)
-class RepeatEventAdmin(admin.ModelAdmin):
+class RepeatEventAdmin(LargeTableAdmin):
     list_display = ('title', 'user', 'start_at', 'end_at', 'until', 'created_at')
-    list_filter = ('created_at', 'start_at')
-    search_fields = ('title', 'user__username')
-    date_hierarchy = 'start_at'
+    list_filter = ('start_at',)
+    search_fields = ('title', 'user__email')
+    list_select_related = ('user',)
+    raw_id_fields = ('user',)
 
 
 @admin.register(Exam)
-class ExamAdmin(admin.ModelAdmin):
+class ExamAdmin(LargeTableAdmin):
     list_display = ('subject', 'user', 'exam_date', 'score', 'max_score', 'created_at')
-    list_filter = ('exam_date', 'created_at')
-    search_fields = ('subject', 'user__username')
-    date_hierarchy = 'exam_date'
+    list_filter = ('exam_date',)
+    search_fields = ('subject', 'user__email')
+    list_select_related = ('user',)
+    raw_id_fields = ('user',)
@@ -0,0 +1,216 @@
+"""
+일정 겹침(충돌) 감지
+
+사용자의 일정(Event), 스터디 일정(StudyEvent), 반복 일정(RepeatEvent)의 펼친 발생 중
+주어진 시간 [start, end) 와 겹치는 항목을 찾습니다.
+
+- PostgreSQL: (user_id, tstzrange(start_at, end_at)) GiST 인덱스 (마이그레이션에서 생성) 와
+  같은 식으로 && 조회하여 인덱스만으로 겹치는 행을 찾음
+- 그 외 DB (SQLite/테스트): 사용자별 구간 트리(core.intervals)를 메모리에 만들어 조회하고,
+  (수정 시각 최대값, 행 수) 가 바뀔 때만 다시 만듦
+- 반복 일정: 조회 구간 근처의 발생만 RRULE 로 펼쳐 비교 (until 날짜까지)
+
+구간은 반열린 구간이므로 이어지는 일정(10:00~11:00, 11:00~12:00)은 겹치지 않습니다.
+"""
+import threading
+from collections import OrderedDict
+from datetime import datetime, time, timedelta
+
+from dateutil.rrule import rrulestr
+from django.contrib.postgres.fields import DateTimeRangeField
+from django.db import connection
+from django.db.models import Count, Func, Max
+from django.db.models.functions import Greatest, Least
+from django.utils import timezone
+
+from apps.study.models import StudyEvent
+from core.intervals import IntervalTree
+
+from .exceptions import ScheduleConflictException
+from .models import Event, RepeatEvent
+
+
+# ?check_conflicts=true 로 생성/수정 시 겹침 검사
+CHECK_CONFLICTS_PARAM = 'check_conflicts'
+
+# 반복 일정 하나에서 펼칠 최대 발생 수 (조회 구간이 넓을 때 응답 크기 제한)
+MAX_OCCURRENCES = 500
+
+# (종류, 모델) - 단일 일정 출처
+SOURCES = (
+    ('event', Event),
+    ('study_event', StudyEvent),
+)
+
+
+def get_span():
+    """인덱스와 같은 범위 식 (끝이 시작보다 앞선 행도 오류 없이 범위로 만듦)"""
+    return Func(
+        Least('start_at', 'end_at'),
+        Greatest('start_at', 'end_at'),
+        function='tstzrange',
+        output_field=DateTimeRangeField(),
+    )
+
+
+class _TreeCache:
+    """사용자/모델별 구간 트리 LRU 캐시"""
+    size = 256
+
+    def __init__(self):
+        self._trees = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, fingerprint):
+        with self._lock:
+            entry = self._trees.get(key)
+            if entry is None or entry[0] != fingerprint:
+                return None
+            self._trees.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, fingerprint, tree):
+        with self._lock:
+            self._trees[key] = (fingerprint, tree)
+            self._trees.move_to_end(key)
+            if len(self._trees) > self.size:
+                self._trees.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._trees.clear()
+
+
+class ConflictService:
+    """일정 겹침 조회 서비스"""
+
+    _trees = _TreeCache()
+
+    @staticmethod
+    def is_requested(request):
+        """요청에 겹침 검사 옵션(?check_conflicts=true)이 있는지"""
+        value = request.query_params.get(CHECK_CONFLICTS_PARAM, '')
+        return value.lower() in ('1', 'true', 'yes')
+
+    @staticmethod
+    def find_conflicts(user, start, end, exclude=None):
+        """
+        [start, end) 와 겹치는 일정 목록
+
+        :param user: 사용자
+        :param start: 시작 시각
+        :param end: 종료 시각
+        :param exclude: 제외할 (종류, ID) - 수정 중인 일정 자신
+        :return: [{'type', 'id', 'title', 'start_at', 'end_at'}, ...] (시작 시각 순)
+        """
+        start, end = min(start, end), max(start, end)
+        if start == end:
+            return []
+
+        conflicts = []
+        for kind, model in SOURCES:
+            if connection.vendor == 'postgresql':
+                rows = ConflictService._query_overlaps(model, user, start, end)
+            else:
+                rows = ConflictService._get_tree(model, user).overlap(start, end)
+            conflicts.extend(
+                {'type': kind, 'id': pk, 'title': title, 'start_at': start_at, 'end_at': end_at}
+                for pk, title, start_at, end_at in rows
+                if (kind, pk) != exclude
+            )
+        conflicts.extend(ConflictService._find_repeat_conflicts(user, start, end))
+        conflicts.sort(key=lambda item: (item['start_at'], item['type'], item['id']))
+        return conflicts
+
+    @staticmethod
+    def check(user, start, end, exclude=None):
+        """
+        겹치는 일정이 있으면 예외
+
+        :raises: ScheduleConflictException
+        """
+        conflicts = ConflictService.find_conflicts(user, start, end, exclude=exclude)
+        if conflicts:
+            raise ScheduleConflictException(conflicts)
+
+    @staticmethod
+    def clear_cache():
+        """구간 트리 캐시 비우기"""
+        ConflictService._trees.clear()
+
+    @staticmethod
+    def _query_overlaps(model, user, start, end):
+        """PostgreSQL: GiST 인덱스를 사용하는 && 조회"""
+        return (
+            model.objects.filter(user=user)
+            .annotate(span=get_span())
+            .filter(span__overlap=(start, end))
+            .order_by()
+            .values_list('id', 'title', 'start_at', 'end_at')
+        )
+
+    @staticmethod
+    def _get_tree(model, user):
+        """사용자의 구간 트리 (행이 추가/수정/삭제되면 다시 만듦)"""
+        queryset = model.objects.filter(user=user).order_by()
+        # 소프트 삭제/수정은 updated_at 을, 추가/삭제는 행 수를 바꿈
+        fingerprint = tuple(queryset.aggregate(updated=Max('updated_at'), count=Count('id')).values())
+        key = (model._meta.label, user.pk)
+        tree = ConflictService._trees.get(key, fingerprint)
+        if tree is None:
+            tree = IntervalTree(
+                (start_at, end_at, (pk, title, start_at, end_at))
+                for pk, title, start_at, end_at in queryset.values_list('id', 'title', 'start_at', 'end_at')
+            )
+            ConflictService._trees.set(key, fingerprint, tree)
+        return tree
+
+    @staticmethod
+    def _find_repeat_conflicts(user, start, end):
+        """반복 일정의 발생 중 [start, end) 와 겹치는 항목"""
+        conflicts = []
+        repeat_events = RepeatEvent.objects.filter(
+            user=user, start_at__lt=end, until__gte=timezone.localtime(start).date() - timedelta(days=1),
+        ).order_by().only('id', 'title', 'start_at', 'end_at', 'rule', 'until')
+        for repeat_event in repeat_events:
+            conflicts.extend(
+                {
+                    'type': 'repeat_event',
+                    'id': repeat_event.id,
+                    'title': repeat_event.title,
+                    'start_at': occurrence,
+                    'end_at': occurrence + abs(repeat_event.end_at - repeat_event.start_at),
+                }
+                for occurrence in ConflictService.get_occurrences(repeat_event, start, end)
+            )
+        return conflicts
+
+    @staticmethod
+    def get_occurrences(repeat_event, start, end):
+        """
+        반복 일정에서 [start, end) 와 겹치는 발생의 시작 시각 목록
+
+        규칙이 잘못된 반복 일정은 발생이 없는 것으로 봄
+        """
+        duration = abs(repeat_event.end_at - repeat_event.start_at)
+        if not duration:
+            return []
+        # 요일/날짜 규칙이 사용자 시간대 기준이 되도록 현지 시각으로 펼침
+        dtstart = timezone.localtime(repeat_event.start_at)
+        until = timezone.make_aware(datetime.combine(repeat_event.until + timedelta(days=1), time.min))
+        before = min(end, until)
+        try:
+            rule = rrulestr(repeat_event.rule, dtstart=dtstart)
+            occurrences = []
+            # 발생 + 길이 > start 이고 발생 < end (until 날짜 이후 발생 제외)
+            # rrule 은 마이크로초를 버리므로 시작 시각의 마이크로초를 다시 붙임
+            for occurrence in rule.xafter(start - duration - timedelta(seconds=1)):
+                occurrence = occurrence.replace(microsecond=dtstart.microsecond)
+                if occurrence + duration <= start:
+                    continue
+                if occurrence >= before or len(occurrences) >= MAX_OCCURRENCES:
+                    break
+                occurrences.append(occurrence)
+            return occurrences
+        except (ValueError, TypeError):
+            return []
@@ -8,6 +8,8 @@ SOLID 원칙:
 from rest_framework import status
 from rest_framework.exceptions import APIException
 
+from .serializers import ConflictSerializer
+
 
 class CalendarException(APIException):
     """일정 관련 기본 예외 클래스"""
@@ -35,3 +37,18 @@ class ExamNotFoundException(CalendarException):
     status_code = status.HTTP_404_NOT_FOUND
     default_detail = "시험을 찾을 수 없습니다."
     default_code = "exam_not_found"
+
+
+class ScheduleConflictException(CalendarException):
+    """다른 일정과 시간이 겹칠 때 발생하는 예외 (?check_conflicts=true)"""
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "다른 일정과 시간이 겹칩니다."
+    default_code = "schedule_conflict"
+
+    def __init__(self, conflicts):
+        super().__init__()
+        # 문자열로 바꾸지 않도록 detail 을 직접 지정 (id 는 정수, 시각은 시리얼라이저 형식)
+        self.detail = {
+            'detail': self.default_detail,
+            'conflicts': ConflictSerializer(conflicts, many=True).data,
+        }
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calendars', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exam',
+            name='pass_threshold',
+            field=models.FloatField(blank=True, help_text='합격 기준 (백분율, 비워두면 REPORTS_DEFAULT_PASS_THRESHOLD 사용)', null=True),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:45
+
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def normalize_subject_name(name):
+    """apps.study.models.normalize_subject_name 과 동일 (마이그레이션 시점 고정본)"""
+    return ''.join(unicodedata.normalize('NFKC', name or '').casefold().split())
+
+
+def backfill_exam_subjects(apps, schema_editor):
+    """기존 시험의 subject 로 정규화된 과목 지정"""
+    Subject = apps.get_model('study', 'Subject')
+    Exam = apps.get_model('calendars', 'Exam')
+    subject_ids = {}
+    names = Exam.objects.order_by().values_list('subject', flat=True).distinct()
+    for name in names:
+        key = normalize_subject_name(name)
+        if not key:
+            continue
+        if key not in subject_ids:
+            subject, _ = Subject.objects.get_or_create(
+                normalized_name=key[:200],
+                defaults={'name': ' '.join(name.split())[:200]},
+            )
+            subject_ids[key] = subject.id
+        Exam.objects.filter(subject=name).update(canonical_subject_id=subject_ids[key])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calendars', '0003_exam_pass_threshold'),
+        ('study', '0003_subject_studyevent_canonical_subject'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exam',
+            name='canonical_subject',
+            field=models.ForeignKey(blank=True, help_text='정규화된 과목 (과목명으로부터 자동 지정)', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='exams', to='study.subject'),
+        ),
+        migrations.RunPython(backfill_exam_subjects, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calendars', '0004_exam_canonical_subject'),
+        ('study', '0004_updated_at_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['user', 'updated_at'], name='calendars_event_user_updated'),
+        ),
+        migrations.AddIndex(
+            model_name='exam',
+            index=models.Index(fields=['user', 'updated_at'], name='calendars_exam_user_updated'),
+        ),
+        migrations.AddIndex(
+            model_name='repeatevent',
+            index=models.Index(fields=['user', 'updated_at'], name='calendars_repeat_user_updated'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.1 on 2026-10-19 13:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calendars', '0007_event_span_gist_index'),
+        ('study', '0007_admin_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['start_at'], name='calendars_event_start_at'),
+        ),
+        migrations.AddIndex(
+            model_name='exam',
+            index=models.Index(fields=['exam_date'], name='calendars_exam_date'),
+        ),
+        migrations.AddIndex(
+            model_name='repeatevent',
+            index=models.Index(fields=['start_at'], name='calendars_repeat_start_at'),
+        ),
+    ]
@@ -5,8 +5,11 @@ from django.db import models
 from django.conf import settings
 from django.utils import timezone
 
+from apps.study.models import Subject
+from core.softdelete import SoftDeleteModel
 
-class Event(models.Model):
+
+class Event(SoftDeleteModel):
     """
     일정 모델
     
@@ -29,12 +32,18 @@ class Event(models.Model):
         verbose_name = '일정'
         verbose_name_plural = '일정들'
         ordering = ['start_at']
+        indexes = [
+            # 증분 동기화 (user, updated_at > since) 조회용
+            models.Index(fields=['user', 'updated_at'], name='calendars_event_user_updated'),
+            # 관리자 목록 정렬/날짜 필터용
+            models.Index(fields=['start_at'], name='calendars_event_start_at'),
+        ]
     
     def __str__(self):
-        return f"{self.title} ({self.user.username})"
+        return f"{self.title} ({self.user.email})"
 
 
-class RepeatEvent(models.Model):
+class RepeatEvent(SoftDeleteModel):
     """
     반복 일정 모델
     
@@ -59,12 +68,18 @@ class RepeatEvent(models.Model):
         verbose_name = '반복 일정'
         verbose_name_plural = '반복 일정들'
         ordering = ['start_at']
+        indexes = [
+            # 증분 동기화 (user, updated_at > since) 조회용
+            models.Index(fields=['user', 'updated_at'], name='calendars_repeat_user_updated'),
+            # 관리자 목록 날짜 필터용
+            models.Index(fields=['start_at'], name='calendars_repeat_start_at'),
+        ]
     
     def __str__(self):
-        return f"{self.title} (반복) ({self.user.username})"
+        return f"{self.title} (반복) ({self.user.email})"
 
 
-class Exam(models.Model):
+class Exam(SoftDeleteModel):
     """
     시험 모델
     
@@ -77,9 +92,22 @@ class Exam(models.Model):
         help_text="시험 소유자"
     )
     subject = models.CharField(max_length=100, help_text="과목명")
+    canonical_subject = models.ForeignKey(
+        Subject,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name='exams',
+        help_text="정규화된 과목 (과목명으로부터 자동 지정)"
+    )
     exam_date = models.DateField(help_text="시험 날짜")
     score = models.IntegerField(null=True, blank=True, help_text="점수 (시험 전에는 None)")
     max_score = models.IntegerField(help_text="만점")
+    pass_threshold = models.FloatField(
+        null=True,
+        blank=True,
+        help_text="합격 기준 (백분율, 비워두면 REPORTS_DEFAULT_PASS_THRESHOLD 사용)"
+    )
     created_at = models.DateTimeField(auto_now_add=True, help_text="생성 시간")
     updated_at = models.DateTimeField(auto_now=True, help_text="수정 시간")
     
@@ -87,9 +115,23 @@ class Exam(models.Model):
         verbose_name = '시험'
         verbose_name_plural = '시험들'
         ordering = ['exam_date']
+        indexes = [
+            # 증분 동기화 (user, updated_at > since) 조회용
+            models.Index(fields=['user', 'updated_at'], name='calendars_exam_user_updated'),
+            # 관리자 목록 정렬/날짜 필터용
+            models.Index(fields=['exam_date'], name='calendars_exam_date'),
+        ]
     
     def __str__(self):
-        return f"{self.subject} - {self.exam_date} ({self.user.username})"
+        return f"{self.subject} - {self.exam_date} ({self.user.email})"
+    
+    def save(self, *args, **kwargs):
+        """저장 시 과목명으로 정규화된 과목 지정"""
+        self.canonical_subject_id = Subject.objects.resolve_id(self.subject)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'subject' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'canonical_subject'}
+        super().save(*args, **kwargs)
     
     @property
     def is_upcoming(self):
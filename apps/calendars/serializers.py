@@ -1,10 +1,16 @@
 """
 일정 및 시험 관련 시리얼라이저
 """
+from datetime import time, timedelta
+
 from rest_framework import serializers
 from .models import Event, RepeatEvent, Exam
 
 
+# 겹침/빈 시간 조회 최대 기간 (반복 일정 발생을 펼치는 양 제한)
+MAX_CONFLICT_WINDOW = timedelta(days=92)
+
+
 class CalendarSerializer(serializers.ModelSerializer):
     """일정 시리얼라이저"""
     
@@ -33,10 +39,67 @@ class ExamSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Exam
-        fields = ['id', 'subject', 'exam_date', 'score', 'max_score', 'created_at', 'updated_at']
+        fields = ['id', 'subject', 'exam_date', 'score', 'max_score', 'pass_threshold', 'created_at', 'updated_at']
         read_only_fields = ['id', 'created_at', 'updated_at']
     
     def create(self, validated_data):
         """시험 생성 시 현재 사용자 자동 할당"""
         validated_data['user'] = self.context['request'].user
         return super().create(validated_data)
+
+
+class ConflictQuerySerializer(serializers.Serializer):
+    """겹침 조회 쿼리 파라미터"""
+    start = serializers.DateTimeField(help_text="조회 시작 시각 (ISO 8601)")
+    end = serializers.DateTimeField(help_text="조회 종료 시각 (ISO 8601, 시작보다 늦어야 함)")
+
+    def validate(self, attrs):
+        if attrs['end'] <= attrs['start']:
+            raise serializers.ValidationError({'end': '종료 시각은 시작 시각보다 늦어야 합니다.'})
+        if attrs['end'] - attrs['start'] > MAX_CONFLICT_WINDOW:
+            raise serializers.ValidationError({'end': f'조회 기간은 최대 {MAX_CONFLICT_WINDOW.days}일입니다.'})
+        return attrs
+
+
+class ConflictSerializer(serializers.Serializer):
+    """겹치는 일정 (반복 일정은 발생마다 한 항목)"""
+    type = serializers.ChoiceField(choices=['event', 'study_event', 'repeat_event'])
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    start_at = serializers.DateTimeField()
+    end_at = serializers.DateTimeField()
+
+
+class FreeSlotQuerySerializer(serializers.Serializer):
+    """빈 시간 조회 쿼리 파라미터"""
+    start = serializers.DateTimeField(help_text="조회 시작 시각 (ISO 8601)")
+    end = serializers.DateTimeField(help_text="조회 종료 시각 (ISO 8601, 최대 92일)")
+    min_minutes = serializers.IntegerField(default=60, min_value=10, max_value=24 * 60, help_text="최소 길이 (분)")
+    day_start = serializers.TimeField(default=time(8, 0), help_text="하루 중 공부 시작 시각 (현지 시각)")
+    day_end = serializers.TimeField(default=time(23, 0), help_text="하루 중 공부 종료 시각 (현지 시각, 같으면 하루 종일)")
+    prefer_exams = serializers.BooleanField(default=False, help_text="다가오는 시험이 가까운 빈 시간부터 정렬")
+    limit = serializers.IntegerField(default=50, min_value=1, max_value=500, help_text="최대 개수")
+
+    def validate(self, attrs):
+        if attrs['end'] <= attrs['start']:
+            raise serializers.ValidationError({'end': '종료 시각은 시작 시각보다 늦어야 합니다.'})
+        if attrs['end'] - attrs['start'] > MAX_CONFLICT_WINDOW:
+            raise serializers.ValidationError({'end': f'조회 기간은 최대 {MAX_CONFLICT_WINDOW.days}일입니다.'})
+        return attrs
+
+
+class FreeSlotExamSerializer(serializers.ModelSerializer):
+    """빈 시간 이후 가장 가까운 시험"""
+
+    class Meta:
+        model = Exam
+        fields = ['id', 'subject', 'exam_date']
+
+
+class FreeSlotSerializer(serializers.Serializer):
+    """빈 시간"""
+    start_at = serializers.DateTimeField()
+    end_at = serializers.DateTimeField()
+    minutes = serializers.IntegerField()
+    exam = FreeSlotExamSerializer(allow_null=True, help_text="이후 가장 가까운 시험 (prefer_exams 일 때)")
+    weight = serializers.FloatField(help_text="시험 근접도 (시험 당일 1, 멀어질수록 0 에 가까움)")
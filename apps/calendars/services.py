@@ -8,7 +8,12 @@ SOLID 원칙:
 """
 from django.utils import timezone
 from django.db import transaction
+from django.db.models import Avg, Count
 
+from apps.sync.services import TombstoneService
+from core.versioning import DataVersionService
+
+from .conflicts import ConflictService
 from .models import Event, RepeatEvent, Exam
 
 
@@ -16,16 +21,22 @@ class EventService:
     """일정 관련 비즈니스 로직 서비스"""
     
     @staticmethod
-    def create_event(user, validated_data):
+    def create_event(user, validated_data, check_conflicts=False):
         """
         일정 생성
         
         :param user: 현재 사용자
         :param validated_data: 검증된 데이터
+        :param check_conflicts: 다른 일정과 겹치면 생성하지 않음
         :return: 생성된 Event 인스턴스
+        :raises: ScheduleConflictException
         """
+        if check_conflicts:
+            ConflictService.check(user, validated_data['start_at'], validated_data['end_at'])
         validated_data['user'] = user
-        return Event.objects.create(**validated_data)
+        event = Event.objects.create(**validated_data)
+        DataVersionService.bump(user.id)
+        return event
     
     @staticmethod
     def get_user_events(user):
@@ -54,19 +65,29 @@ class EventService:
             raise EventNotFoundException()
     
     @staticmethod
-    def update_event(user, event_id, validated_data):
+    def update_event(user, event_id, validated_data, check_conflicts=False):
         """
         일정 수정
         
         :param user: 현재 사용자
         :param event_id: 일정 ID
         :param validated_data: 검증된 데이터
+        :param check_conflicts: 수정한 시간이 다른 일정과 겹치면 수정하지 않음
         :return: 수정된 Event 인스턴스
+        :raises: ScheduleConflictException
         """
         event = EventService.get_event_by_id(user, event_id)
+        if check_conflicts:
+            ConflictService.check(
+                user,
+                validated_data.get('start_at', event.start_at),
+                validated_data.get('end_at', event.end_at),
+                exclude=('event', event.id),
+            )
         for key, value in validated_data.items():
             setattr(event, key, value)
         event.save()
+        DataVersionService.bump(user.id)
         return event
     
     @staticmethod
@@ -79,7 +100,8 @@ class EventService:
         :return: None
         """
         event = EventService.get_event_by_id(user, event_id)
-        event.delete()
+        TombstoneService.delete(user, event)
+        DataVersionService.bump(user.id)
 
 
 class RepeatEventService:
@@ -95,7 +117,9 @@ class RepeatEventService:
         :return: 생성된 RepeatEvent 인스턴스
         """
         validated_data['user'] = user
-        return RepeatEvent.objects.create(**validated_data)
+        event = RepeatEvent.objects.create(**validated_data)
+        DataVersionService.bump(user.id)
+        return event
     
     @staticmethod
     def get_repeat_event_by_id(user, event_id):
@@ -127,6 +151,7 @@ class RepeatEventService:
         for key, value in validated_data.items():
             setattr(event, key, value)
         event.save()
+        DataVersionService.bump(user.id)
         return event
     
     @staticmethod
@@ -139,7 +164,8 @@ class RepeatEventService:
         :return: None
         """
         event = RepeatEventService.get_repeat_event_by_id(user, event_id)
-        event.delete()
+        TombstoneService.delete(user, event)
+        DataVersionService.bump(user.id)
 
 
 class ExamService:
@@ -155,7 +181,10 @@ class ExamService:
         :return: 생성된 Exam 인스턴스
         """
         validated_data['user'] = user
-        return Exam.objects.create(**validated_data)
+        exam = Exam.objects.create(**validated_data)
+        DataVersionService.bump(user.id)
+        ExamService._schedule_prediction_training(user)
+        return exam
     
     @staticmethod
     def get_user_exams(user):
@@ -167,6 +196,39 @@ class ExamService:
         """
         return Exam.objects.filter(user=user)
     
+    @staticmethod
+    def get_subject_score_averages(user):
+        """
+        정규화된 과목별 평균 점수 (점수가 있는 시험만, 취약 과목 판단 기준)
+        
+        :param user: 현재 사용자
+        :return: QuerySet (canonical_subject_id, canonical_subject__name, avg_score, avg_max_score, count)
+        """
+        return Exam.objects.filter(
+            user=user,
+            score__isnull=False,
+            canonical_subject__isnull=False
+        ).values('canonical_subject_id', 'canonical_subject__name').annotate(
+            avg_score=Avg('score'),
+            avg_max_score=Avg('max_score'),
+            count=Count('id')
+        )
+    
+    @staticmethod
+    def get_upcoming_exams(user):
+        """
+        오늘 이후의 시험 중 점수가 없는 시험 조회 (시험일 순)
+        
+        :param user: 현재 사용자
+        :return: QuerySet
+        """
+        today = timezone.now().date()
+        return Exam.objects.filter(
+            user=user,
+            exam_date__gte=today,
+            score__isnull=True
+        ).order_by('exam_date')
+    
     @staticmethod
     def get_exam_by_id(user, exam_id):
         """
@@ -197,6 +259,8 @@ class ExamService:
         for key, value in validated_data.items():
             setattr(exam, key, value)
         exam.save()
+        DataVersionService.bump(user.id)
+        ExamService._schedule_prediction_training(user)
         return exam
     
     @staticmethod
@@ -209,4 +273,17 @@ class ExamService:
         :return: None
         """
         exam = ExamService.get_exam_by_id(user, exam_id)
-        exam.delete()
+        TombstoneService.delete(user, exam)
+        DataVersionService.bump(user.id)
+        ExamService._schedule_prediction_training(user)
+    
+    @staticmethod
+    def _schedule_prediction_training(user):
+        """
+        시험 점수/일정 변경 시 합격 예측 모델 재학습 요청
+        
+        :param user: 현재 사용자
+        :return: None
+        """
+        from apps.reports.prediction import PassPredictionService
+        PassPredictionService.schedule_training(user.id)
@@ -0,0 +1,85 @@
+"""
+빈 시간 찾기 (공부 시간 추천)
+
+조회 구간의 일정, 반복 일정 발생, 스터디 일정(ConflictService 로 조회)과
+하루 중 공부하지 않는 시간(day_end ~ 다음 날 day_start)을 바쁜 구간으로 모아
+시작 시각으로 정렬한 뒤 한 번 훑어(core.intervals.find_gaps) 빈 구간을 찾습니다.
+슬롯마다 DB 를 조회하지 않으므로 구간 안의 일정 수 n 에 대해 O(n log n) 입니다.
+
+prefer_exams 이면 각 빈 구간 이후 가장 가까운 다가오는 시험(ExamService.get_upcoming_exams)을
+이분 탐색으로 찾아 시험이 가까운 구간부터 돌려줍니다.
+"""
+from bisect import bisect_left
+from datetime import datetime, timedelta
+
+from django.utils import timezone
+
+from core.intervals import find_gaps
+
+from .conflicts import ConflictService
+from .services import ExamService
+
+
+class FreeSlotService:
+    """빈 시간 조회 서비스"""
+
+    @staticmethod
+    def find_free_slots(user, start, end, min_minutes, day_start, day_end, prefer_exams=False, limit=None):
+        """
+        [start, end) 안의 min_minutes 분 이상 빈 시간
+
+        :param user: 사용자
+        :param start: 조회 시작 시각
+        :param end: 조회 종료 시각
+        :param min_minutes: 최소 길이 (분)
+        :param day_start: 하루 중 공부 시작 시각 (현지 시각, day_start == day_end 이면 하루 종일)
+        :param day_end: 하루 중 공부 종료 시각 (day_start 보다 이르면 자정을 넘기는 구간)
+        :param prefer_exams: 시험이 가까운 빈 시간부터 정렬
+        :param limit: 최대 개수
+        :return: [{'start_at', 'end_at', 'minutes', 'exam', 'weight'}, ...]
+        """
+        busy = [
+            (conflict['start_at'], conflict['end_at'])
+            for conflict in ConflictService.find_conflicts(user, start, end)
+        ]
+        busy.extend(FreeSlotService.get_off_hours(start, end, day_start, day_end))
+
+        exams = list(ExamService.get_upcoming_exams(user).only('id', 'subject', 'exam_date')) if prefer_exams else []
+        exam_dates = [exam.exam_date for exam in exams]
+
+        slots = []
+        for slot_start, slot_end in find_gaps(busy, start, end, timedelta(minutes=min_minutes)):
+            exam, weight = None, 0.0
+            slot_date = timezone.localtime(slot_start).date()
+            index = bisect_left(exam_dates, slot_date)
+            if index < len(exams):
+                exam = exams[index]
+                # 시험 당일이 1 이고 시험일에서 멀어질수록 낮아짐
+                weight = 1 / (1 + (exam.exam_date - slot_date).days)
+            slots.append({
+                'start_at': slot_start,
+                'end_at': slot_end,
+                'minutes': int((slot_end - slot_start).total_seconds() // 60),
+                'exam': exam,
+                'weight': round(weight, 4),
+            })
+
+        if prefer_exams:
+            slots.sort(key=lambda slot: (-slot['weight'], slot['start_at']))
+        return slots[:limit] if limit else slots
+
+    @staticmethod
+    def get_off_hours(start, end, day_start, day_end):
+        """[start, end) 에 걸친 날짜마다 공부하지 않는 시간 (day_end ~ day_start)"""
+        if day_start == day_end:
+            return []
+        tz = timezone.get_current_timezone()
+        off_hours = []
+        day = timezone.localtime(start).date() - timedelta(days=1)
+        last_day = timezone.localtime(end).date()
+        while day <= last_day:
+            off_start = timezone.make_aware(datetime.combine(day, day_end), tz)
+            off_day = day + timedelta(days=1) if day_start < day_end else day
+            off_hours.append((off_start, timezone.make_aware(datetime.combine(off_day, day_start), tz)))
+            day += timedelta(days=1)
+        return off_hours
@@ -1,3 +1,153 @@
-from django.test import TestCase
+"""
+일정 앱 테스트 (응답 필드 선택, 조건부 요청, 일정 겹침 감지, 빈 시간 찾기)
+"""
+from datetime import timedelta
 
-# Create your tests here.
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.calendars.conflicts import ConflictService
+from apps.calendars.models import Event, Exam, RepeatEvent
+from apps.calendars.serializers import ExamSerializer
+from apps.study.models import StudyEvent, Subject
+from apps.users.models import CustomUser
+
+
+@pytest.fixture
+def user(db):
+    # 이전 테스트에서 롤백된 사용자 ID 의 구간 트리가 프로세스 캐시에 남지 않도록 초기화
+    ConflictService.clear_cache()
+    return CustomUser.objects.create_user('calendar@example.com', 'password123!', nickname='calendar')
+
+
+@pytest.fixture
+def api_client(user):
+    client = APIClient()
+    client.force_authenticate(user)
+    return client
+
+
+@pytest.fixture
+def event(user):
+    now = timezone.now()
+    return Event.objects.create(user=user, title='일정', start_at=now, end_at=now + timedelta(hours=1))
+
+
+def test_sparse_fieldsets(user, api_client):
+    today = timezone.localdate()
+    for i in range(3):
+        Exam.objects.create(
+            user=user, subject=f'과목 {i}', exam_date=today + timedelta(days=i),
+            score=80 + i if i else None, max_score=100, pass_threshold=60
+        )
+
+    # values() 빠른 경로도 DRF 시리얼라이저와 같은 응답
+    response = api_client.get('/api/calendars/exams/')
+    assert response.status_code == 200
+    expected = ExamSerializer(Exam.objects.filter(user=user), many=True).data
+    assert sorted(response.json()['results'], key=lambda row: row['id']) == sorted(
+        (dict(row) for row in expected), key=lambda row: row['id']
+    )
+
+    # 선택한 필드만 선언 순서대로 응답
+    response = api_client.get('/api/calendars/exams/', {'fields': 'exam_date,subject'})
+    assert [list(row) for row in response.json()['results']] == [['subject', 'exam_date']] * 3
+    exam = Exam.objects.filter(user=user).first()
+    assert list(api_client.get(f'/api/calendars/exams/{exam.pk}/', {'fields': 'score'}).json()) == ['score']
+
+    response = api_client.get('/api/calendars/exams/', {'fields': 'subject,secret'})
+    assert response.status_code == 400
+    assert 'secret' in response.json()['fields']
+
+
+@pytest.fixture
+def commit_caches():
+    """커밋 후 콜백을 실행하면 롤백될 ID 로 채운 캐시(과목 ID, 통계 캐시 등)가 남으므로 테스트 후 초기화"""
+    yield
+    Subject.objects.clear_cache()
+    cache.clear()
+
+
+def test_conditional_requests(user, api_client, settings, commit_caches, django_capture_on_commit_callbacks):
+    # Redis 대신 DB 미러로 데이터 버전 관리
+    settings.DATA_VERSION_REDIS_URL = None
+    exam = Exam.objects.create(user=user, subject='수학', exam_date=timezone.localdate(), max_score=100)
+    url = f'/api/calendars/exams/{exam.pk}/'
+
+    detail = api_client.get(url)
+    assert detail['ETag'] and detail['Last-Modified']
+    assert api_client.get(url, HTTP_IF_NONE_MATCH=detail['ETag']).status_code == 304
+    listing = api_client.get('/api/calendars/exams/')
+    assert api_client.get('/api/calendars/exams/', HTTP_IF_NONE_MATCH=listing['ETag']).status_code == 304
+
+    # If-Match 가 현재 버전이면 수정하고 새 ETag 응답, 이전 버전이면 412
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.patch(url, {'score': 90}, format='json', HTTP_IF_MATCH=detail['ETag'])
+    assert response.status_code == 200
+    assert response['ETag'] != detail['ETag']
+    response = api_client.patch(url, {'score': 50}, format='json', HTTP_IF_MATCH=detail['ETag'])
+    assert response.status_code == 412
+    exam.refresh_from_db()
+    assert exam.score == 90
+
+    # 수정하면 목록 ETag 도 바뀜
+    response = api_client.get('/api/calendars/exams/', HTTP_IF_NONE_MATCH=listing['ETag'])
+    assert response.status_code == 200
+    listing = response
+    assert api_client.get('/api/calendars/exams/', HTTP_IF_NONE_MATCH=listing['ETag']).status_code == 304
+
+    # 서비스 레이어를 거치지 않은 변경(bulk update / 삭제)도 목록 ETag 에 반영
+    Exam.objects.filter(pk=exam.pk).update(score=70, updated_at=timezone.now())
+    response = api_client.get('/api/calendars/exams/', HTTP_IF_NONE_MATCH=listing['ETag'])
+    assert response.status_code == 200
+    Exam.objects.filter(pk=exam.pk).delete()
+    assert api_client.get('/api/calendars/exams/', HTTP_IF_NONE_MATCH=response['ETag']).status_code == 200
+
+
+def test_schedule_conflicts(user, api_client, event):
+    StudyEvent.objects.create(user=user, title='스터디', goal='목표', start_at=event.start_at, end_at=event.end_at)
+    RepeatEvent.objects.create(
+        user=user, title='반복', start_at=event.start_at, end_at=event.end_at,
+        rule='FREQ=DAILY;INTERVAL=1', until=(event.start_at + timedelta(days=7)).date()
+    )
+    window = {'start': event.start_at.isoformat(), 'end': event.end_at.isoformat()}
+
+    response = api_client.get('/api/calendars/conflicts/', window)
+    assert response.status_code == 200
+    # 매일 반복 일정은 첫 발생만 겹침
+    assert sorted(item['type'] for item in response.json()) == ['event', 'repeat_event', 'study_event']
+
+    started = event.start_at + timedelta(days=1, minutes=30)
+    body = {'title': '겹침', 'description': '', 'start_at': started, 'end_at': started + timedelta(hours=1)}
+    response = api_client.post('/api/calendars/events/?check_conflicts=true', body, format='json')
+    assert response.status_code == 409
+    assert {item['type'] for item in response.json()['conflicts']} == {'repeat_event'}
+    assert api_client.post('/api/calendars/events/', body, format='json').status_code == 201
+
+    # 수정할 때는 자기 자신과 겹치지 않음
+    response = api_client.patch(
+        f'/api/calendars/events/{event.pk}/?check_conflicts=true', {'title': '수정'}, format='json'
+    )
+    assert response.status_code == 409
+    assert {item['type'] for item in response.json()['conflicts']} == {'repeat_event', 'study_event'}
+
+    response = api_client.get('/api/calendars/conflicts/', {'start': window['end'], 'end': window['start']})
+    assert response.status_code == 400
+
+
+def test_free_slots(user, api_client, event):
+    Exam.objects.create(user=user, subject='수학', exam_date=timezone.localdate() + timedelta(days=1), max_score=100)
+    query = {
+        'start': (event.start_at - timedelta(hours=3)).isoformat(),
+        'end': (event.end_at + timedelta(hours=3)).isoformat(),
+        'day_start': '00:00', 'day_end': '00:00', 'min_minutes': 30,
+    }
+
+    slots = api_client.get('/api/calendars/free-slots/', query).json()
+    assert [slot['minutes'] for slot in slots] == [180, 180]
+    assert slots[0]['end_at'] == api_client.get(f'/api/calendars/events/{event.pk}/').json()['start_at']
+
+    slots = api_client.get('/api/calendars/free-slots/', {**query, 'prefer_exams': 'true'}).json()
+    assert slots[0]['exam']['subject'] == '수학'
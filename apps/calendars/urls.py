@@ -11,6 +11,8 @@ urlpatterns = [
     path('events/', views.CalendarCreateView.as_view(), name='event-create'),   # POST
     path('events/', views.CalendarListView.as_view(), name='event-list'),       # GET
     path('events/<int:pk>/', views.CalendarDetailView.as_view(), name='event-detail'),
+    path('conflicts/', views.ConflictView.as_view(), name='conflicts'),
+    path('free-slots/', views.FreeSlotView.as_view(), name='free-slots'),
 
     # 반복 일정
     path('events/repeat/', views.RepeatCalendarCreateView.as_view()),
@@ -8,21 +8,31 @@ SOLID 원칙:
 from rest_framework import status, generics, viewsets
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from drf_spectacular.utils import extend_schema
 
-from .models import Event, RepeatEvent, Exam
+from core.conditional import ConditionalGetMixin
+from core.projection import SparseFieldsetMixin
+
+from .conflicts import ConflictService
+from .models import Event, RepeatEvent
 from .services import EventService, RepeatEventService, ExamService
+from .slots import FreeSlotService
 from .serializers import (
     CalendarSerializer,
     RepeatCalendarSerializer,
     ExamSerializer,
+    ConflictQuerySerializer,
+    ConflictSerializer,
+    FreeSlotQuerySerializer,
+    FreeSlotSerializer,
 )
 
 
 @extend_schema(
     tags=['일정'],
     summary='일정 생성',
-    description='학습 또는 개인 일정을 생성합니다'
+    description='학습 또는 개인 일정을 생성합니다 (?check_conflicts=true 이면 다른 일정과 겹칠 때 저장하지 않고 409 와 겹치는 일정 목록 반환)'
 )
 class CalendarCreateView(generics.CreateAPIView):
     """일정 생성 API (설계서 기준: CalendarSerializer 사용)"""
@@ -33,7 +43,8 @@ class CalendarCreateView(generics.CreateAPIView):
         """일정 생성 시 서비스 레이어 사용"""
         event = EventService.create_event(
             user=self.request.user,
-            validated_data=serializer.validated_data
+            validated_data=serializer.validated_data,
+            check_conflicts=ConflictService.is_requested(self.request)
         )
         serializer.instance = event
 
@@ -41,9 +52,9 @@ class CalendarCreateView(generics.CreateAPIView):
 @extend_schema(
     tags=['일정'],
     summary='일정 목록 조회',
-    description='전체 일정을 조회합니다'
+    description='전체 일정을 조회합니다 (?fields=title,start_at 로 응답 필드 선택 가능)'
 )
-class CalendarListView(generics.ListAPIView):
+class CalendarListView(ConditionalGetMixin, SparseFieldsetMixin, generics.ListAPIView):
     """일정 목록 조회 API"""
     permission_classes = [IsAuthenticated]
     serializer_class = CalendarSerializer
@@ -56,9 +67,9 @@ class CalendarListView(generics.ListAPIView):
 @extend_schema(
     tags=['일정'],
     summary='일정 상세/수정/삭제',
-    description='일정의 상세 정보를 조회하거나 수정/삭제합니다'
+    description='일정의 상세 정보를 조회하거나 수정/삭제합니다 (수정 시 ?check_conflicts=true 로 겹침 검사)'
 )
-class CalendarDetailView(generics.RetrieveUpdateDestroyAPIView):
+class CalendarDetailView(ConditionalGetMixin, SparseFieldsetMixin, generics.RetrieveUpdateDestroyAPIView):
     """일정 상세/수정/삭제 API"""
     permission_classes = [IsAuthenticated]
     serializer_class = CalendarSerializer
@@ -72,7 +83,8 @@ class CalendarDetailView(generics.RetrieveUpdateDestroyAPIView):
         event = EventService.update_event(
             user=self.request.user,
             event_id=self.kwargs['pk'],
-            validated_data=serializer.validated_data
+            validated_data=serializer.validated_data,
+            check_conflicts=ConflictService.is_requested(self.request)
         )
         serializer.instance = event
     
@@ -108,7 +120,7 @@ class RepeatCalendarCreateView(generics.CreateAPIView):
     summary='반복 일정 상세/수정/삭제',
     description='반복 일정의 상세 정보를 조회하거나 수정/삭제합니다'
 )
-class RepeatCalendarDetailView(generics.RetrieveUpdateDestroyAPIView):
+class RepeatCalendarDetailView(ConditionalGetMixin, SparseFieldsetMixin, generics.RetrieveUpdateDestroyAPIView):
     """반복 일정 상세/수정/삭제 API (설계서 기준: RetrieveUpdateDestroyAPIView)"""
     permission_classes = [IsAuthenticated]
     serializer_class = RepeatCalendarSerializer
@@ -139,7 +151,7 @@ class RepeatCalendarDetailView(generics.RetrieveUpdateDestroyAPIView):
     summary='시험 관리',
     description='시험 또는 모의고사 일정을 생성, 조회, 수정, 삭제합니다'
 )
-class ExamView(viewsets.ModelViewSet):
+class ExamView(ConditionalGetMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     """시험 ViewSet (설계서 기준: ExamView, ModelViewSet)"""
     permission_classes = [IsAuthenticated]
     serializer_class = ExamSerializer
@@ -178,17 +190,62 @@ class ExamView(viewsets.ModelViewSet):
     summary='다가오는 시험 조회',
     description='시험일이 가까운 시험 목록을 조회합니다'
 )
-class UpcomingExamView(generics.ListAPIView):
+class UpcomingExamView(ConditionalGetMixin, SparseFieldsetMixin, generics.ListAPIView):
     """다가오는 시험 목록 조회 API (설계서 기준)"""
     permission_classes = [IsAuthenticated]
     serializer_class = ExamSerializer
     
+    def get_collection_version(self):
+        """날짜가 바뀌면 데이터 변경 없이도 목록이 달라지므로 오늘 날짜를 포함"""
+        from django.utils import timezone
+        return f'{super().get_collection_version()}:{timezone.now().date()}'
+    
     def get_queryset(self):
         """오늘 이후의 시험 중 점수가 없는 시험만 조회"""
-        from django.utils import timezone
-        today = timezone.now().date()
-        return Exam.objects.filter(
-            user=self.request.user,
-            exam_date__gte=today,
-            score__isnull=True
-        ).order_by('exam_date')
+        return ExamService.get_upcoming_exams(self.request.user)
+
+
+@extend_schema(
+    tags=['일정'],
+    summary='겹치는 일정 조회',
+    description=(
+        '[start, end) 와 겹치는 일정, 스터디 일정, 반복 일정 발생을 시작 시각 순으로 조회합니다. '
+        '끝과 시작이 같은 일정은 겹치지 않는 것으로 봅니다 (최대 92일)'
+    ),
+    parameters=[ConflictQuerySerializer],
+    responses=ConflictSerializer(many=True),
+)
+class ConflictView(APIView):
+    """겹치는 일정 조회 API"""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """start~end 와 겹치는 일정 조회"""
+        query = ConflictQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        conflicts = ConflictService.find_conflicts(
+            request.user, query.validated_data['start'], query.validated_data['end']
+        )
+        return Response(ConflictSerializer(conflicts, many=True).data, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    tags=['일정'],
+    summary='빈 시간 조회',
+    description=(
+        '[start, end) 안에서 일정, 스터디 일정, 반복 일정 발생이 없는 min_minutes 분 이상의 시간을 조회합니다. '
+        'day_start~day_end 밖의 시간은 제외하고, prefer_exams=true 이면 다가오는 시험이 가까운 시간부터 정렬합니다'
+    ),
+    parameters=[FreeSlotQuerySerializer],
+    responses=FreeSlotSerializer(many=True),
+)
+class FreeSlotView(APIView):
+    """빈 시간 조회 API"""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """start~end 의 빈 시간 조회"""
+        query = FreeSlotQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        slots = FreeSlotService.find_free_slots(request.user, **query.validated_data)
+        return Response(FreeSlotSerializer(slots, many=True).data, status=status.HTTP_200_OK)
@@ -1,3 +1,44 @@
+"""
+통계 관리자 설정
+"""
 from django.contrib import admin
+from .models import CohortReport, DailySiteMetric, SiteMetricSnapshot
 
-# Register your models here.
+
+@admin.register(CohortReport)
+class CohortReportAdmin(admin.ModelAdmin):
+    list_display = ('generated_at', 'user_count', 'study_row_count', 'exam_row_count', 'duration_ms')
+    readonly_fields = (
+        'generated_at',
+        'duration_ms',
+        'user_count',
+        'study_row_count',
+        'exam_row_count',
+        'study_minutes_by_subject',
+        'score_distribution_by_subject',
+        'study_score_correlation',
+    )
+
+    def has_add_permission(self, request):
+        """스냅샷은 배치 작업으로만 생성"""
+        return False
+
+
+@admin.register(DailySiteMetric)
+class DailySiteMetricAdmin(admin.ModelAdmin):
+    list_display = ('date', 'signups', 'active_users', 'updated_at')
+    readonly_fields = ('date', 'signups', 'active_users', 'updated_at')
+
+    def has_add_permission(self, request):
+        """지표는 집계 작업으로만 생성"""
+        return False
+
+
+@admin.register(SiteMetricSnapshot)
+class SiteMetricSnapshotAdmin(admin.ModelAdmin):
+    list_display = ('generated_at', 'total_users', 'timers_running', 'exams_this_week', 'duration_ms')
+    readonly_fields = ('generated_at', 'duration_ms', 'total_users', 'timers_running', 'exams_this_week')
+
+    def has_add_permission(self, request):
+        """스냅샷은 집계 작업으로만 생성"""
+        return False
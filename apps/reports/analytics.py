@@ -0,0 +1,296 @@
+"""
+코호트 배치 분석 엔진
+
+전체 사용자를 대상으로 한 통계를 NumPy/pandas 벡터 연산으로 계산합니다.
+- values_list 결과를 청크 단위로 읽어 컬럼(DataFrame)으로 변환
+- 청크별 부분 집계(합계, 개수, 히스토그램)만 누적하므로 메모리 사용량이 전체 행 수에 비례하지 않음
+- 최종 결과는 CohortReport 스냅샷으로 저장
+- 탈퇴 유예 기간 중인 사용자의 데이터는 제외
+"""
+import time
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+
+from apps.study.models import StudyContent, Subject
+from apps.calendars.models import Exam
+from .models import CohortReport
+
+
+DEFAULT_CHUNK_SIZE = 5000
+
+# 0~100% 를 1% 단위로 나눈 히스토그램 (백분위 계산용)
+SCORE_BINS = 101
+
+# 응답에 포함할 점수 구간 수 (0-9, 10-19, ..., 90-100)
+HISTOGRAM_BUCKETS = 10
+
+# 부분 집계가 이 개수만큼 쌓이면 한 번 합쳐서 메모리 사용량을 제한
+PARTIAL_MERGE_THRESHOLD = 8
+
+
+def iter_column_chunks(queryset, fields, chunk_size):
+    """
+    values_list 결과를 청크 단위 DataFrame 으로 변환하는 제너레이터
+
+    :param queryset: 조회할 QuerySet
+    :param fields: values_list 로 가져올 필드 목록 (DataFrame 컬럼명으로도 사용)
+    :param chunk_size: 한 번에 읽을 행 수
+    :return: DataFrame 제너레이터
+    """
+    rows = queryset.values_list(*fields).iterator(chunk_size=chunk_size)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield pd.DataFrame.from_records(chunk, columns=list(fields))
+
+
+def _merge_partials(partials):
+    """MultiIndex Series 부분 합계 목록을 하나로 합침"""
+    if not partials:
+        return pd.Series(dtype='float64')
+    merged = pd.concat(partials)
+    return merged.groupby(level=list(range(merged.index.nlevels))).sum()
+
+
+def _append_partial(partials, partial):
+    """부분 합계를 추가하고 임계값을 넘으면 병합"""
+    partials.append(partial)
+    if len(partials) >= PARTIAL_MERGE_THRESHOLD:
+        partials[:] = [_merge_partials(partials)]
+
+
+def _percentile_from_histogram(histogram, fraction):
+    """1% 단위 히스토그램에서 백분위 값 계산"""
+    total = histogram.sum()
+    if total == 0:
+        return 0.0
+    cumulative = np.cumsum(histogram)
+    return float(np.searchsorted(cumulative, fraction * total))
+
+
+def _pearson(x, y):
+    """피어슨 상관계수 (표본이 부족하거나 분산이 0이면 None)"""
+    if len(x) < 2 or np.std(x) == 0 or np.std(y) == 0:
+        return None
+    return round(float(np.corrcoef(x, y)[0, 1]), 4)
+
+
+class CohortAnalyticsService:
+    """코호트 리포트 배치 집계 서비스"""
+
+    @staticmethod
+    def get_chunk_size():
+        """settings 에서 청크 크기 조회"""
+        return getattr(settings, 'REPORTS_ANALYTICS_CHUNK_SIZE', DEFAULT_CHUNK_SIZE)
+
+    @staticmethod
+    def collect_study_minutes(chunk_size):
+        """
+        (과목, 사용자)별 공부 시간 합계 집계
+
+        :return: (MultiIndex[subject, user_id] Series, 읽은 행 수)
+        """
+        queryset = StudyContent.objects.exclude_withdrawn().filter(
+            study_event__canonical_subject__isnull=False
+        ).order_by()
+        fields = ('study_event__canonical_subject_id', 'study_event__user_id', 'duration_minutes')
+
+        partials = []
+        row_count = 0
+        for frame in iter_column_chunks(queryset, fields, chunk_size):
+            row_count += len(frame)
+            frame.columns = ['subject', 'user_id', 'minutes']
+            _append_partial(
+                partials,
+                frame.groupby(['subject', 'user_id'], sort=False)['minutes'].sum()
+            )
+
+        return _merge_partials(partials), row_count
+
+    @staticmethod
+    def collect_exam_scores(chunk_size):
+        """
+        시험 점수를 과목별 히스토그램과 (과목, 사용자)별 백분율 합계로 집계
+
+        :return: (과목별 히스토그램 dict, (과목, 사용자)별 합계 DataFrame, 읽은 행 수)
+        """
+        queryset = Exam.objects.exclude_withdrawn().filter(
+            score__isnull=False,
+            max_score__gt=0,
+            canonical_subject__isnull=False
+        ).order_by()
+        fields = ('canonical_subject_id', 'user_id', 'score', 'max_score')
+
+        histograms = {}
+        sum_partials = []
+        count_partials = []
+        row_count = 0
+        for frame in iter_column_chunks(queryset, fields, chunk_size):
+            row_count += len(frame)
+            frame.columns = ['subject', 'user_id', 'score', 'max_score']
+            percentage = frame['score'].to_numpy(dtype='float64') / frame['max_score'].to_numpy(dtype='float64') * 100
+            frame = frame.assign(percentage=percentage)
+
+            # 과목별 1% 단위 히스토그램 (과목 코드 * SCORE_BINS + 구간 으로 한 번에 bincount)
+            codes, subjects = pd.factorize(frame['subject'])
+            bins = np.clip(np.floor(percentage), 0, SCORE_BINS - 1).astype('int64')
+            counts = np.bincount(
+                codes * SCORE_BINS + bins,
+                minlength=len(subjects) * SCORE_BINS
+            ).reshape(len(subjects), SCORE_BINS)
+            for code, subject in enumerate(subjects):
+                if subject in histograms:
+                    histograms[subject] += counts[code]
+                else:
+                    histograms[subject] = counts[code].copy()
+
+            grouped = frame.groupby(['subject', 'user_id'], sort=False)['percentage']
+            _append_partial(sum_partials, grouped.sum())
+            _append_partial(count_partials, grouped.count())
+
+        totals = pd.DataFrame({
+            'percentage_sum': _merge_partials(sum_partials),
+            'count': _merge_partials(count_partials),
+        })
+        return histograms, totals, row_count
+
+    @staticmethod
+    def summarize_study_minutes(study_minutes, subject_names):
+        """과목별 평균/중앙값 공부 시간 요약"""
+        if study_minutes.empty:
+            return []
+
+        by_subject = study_minutes.groupby(level=0)
+        summary = pd.DataFrame({
+            'user_count': by_subject.count(),
+            'total_minutes': by_subject.sum(),
+            'median_minutes': by_subject.median(),
+        })
+        summary['average_minutes'] = summary['total_minutes'] / summary['user_count']
+        summary = summary.sort_values('total_minutes', ascending=False)
+
+        return [
+            {
+                'subject_id': int(subject),
+                'subject': subject_names.get(subject, ''),
+                'user_count': int(row.user_count),
+                'total_minutes': int(row.total_minutes),
+                'average_minutes': round(float(row.average_minutes), 2),
+                'median_minutes': round(float(row.median_minutes), 2),
+            }
+            for subject, row in summary.iterrows()
+        ]
+
+    @staticmethod
+    def summarize_score_distribution(histograms, exam_totals, subject_names):
+        """과목별 점수 분포 (평균, 표준편차, 백분위, 10% 구간 히스토그램) 요약"""
+        centers = np.arange(SCORE_BINS, dtype='float64')
+        result = []
+        for subject, histogram in sorted(histograms.items(), key=lambda item: subject_names.get(item[0], '')):
+            count = int(histogram.sum())
+            totals = exam_totals.xs(subject, level=0)
+            mean = float(totals['percentage_sum'].sum() / count)
+            # 표준편차는 히스토그램 구간 값 기준 근사치
+            variance = float((histogram * (centers - mean) ** 2).sum() / count)
+            nonzero = np.flatnonzero(histogram)
+            # 마지막 구간(90~)은 배열 끝까지 합산되므로 100% 도 포함됨
+            buckets = np.add.reduceat(histogram, np.arange(0, SCORE_BINS - 1, HISTOGRAM_BUCKETS))
+
+            result.append({
+                'subject_id': int(subject),
+                'subject': subject_names.get(subject, ''),
+                'count': count,
+                'mean': round(mean, 2),
+                'std': round(variance ** 0.5, 2),
+                'min': float(nonzero[0]),
+                'p25': _percentile_from_histogram(histogram, 0.25),
+                'median': _percentile_from_histogram(histogram, 0.5),
+                'p75': _percentile_from_histogram(histogram, 0.75),
+                'max': float(nonzero[-1]),
+                'histogram': [int(value) for value in buckets],
+            })
+        return result
+
+    @staticmethod
+    def summarize_correlation(study_minutes, exam_totals, subject_names):
+        """
+        공부 시간과 시험 백분율의 상관관계
+
+        - overall: 사용자별 전체 공부 시간 vs 사용자별 평균 시험 백분율
+        - by_subject: 같은 과목 내에서 사용자별 공부 시간 vs 평균 백분율
+        시험을 봤지만 공부 기록이 없는 사용자는 공부 시간 0 으로 포함
+        """
+        if exam_totals.empty:
+            return {'overall': {'users': 0, 'pearson_r': None}, 'by_subject': []}
+
+        user_totals = exam_totals.groupby(level=1).sum()
+        user_percentage = user_totals['percentage_sum'] / user_totals['count']
+        user_minutes = (
+            study_minutes.groupby(level=1).sum().reindex(user_percentage.index, fill_value=0)
+            if not study_minutes.empty else pd.Series(0, index=user_percentage.index)
+        )
+
+        subject_percentage = exam_totals['percentage_sum'] / exam_totals['count']
+        subject_minutes = (
+            study_minutes.reindex(subject_percentage.index, fill_value=0)
+            if not study_minutes.empty else pd.Series(0, index=subject_percentage.index)
+        )
+
+        by_subject = []
+        for subject, percentage in subject_percentage.groupby(level=0):
+            minutes = subject_minutes.loc[percentage.index]
+            by_subject.append({
+                'subject_id': int(subject),
+                'subject': subject_names.get(subject, ''),
+                'users': int(len(percentage)),
+                'pearson_r': _pearson(minutes.to_numpy(dtype='float64'), percentage.to_numpy(dtype='float64')),
+            })
+
+        return {
+            'overall': {
+                'users': int(len(user_percentage)),
+                'pearson_r': _pearson(user_minutes.to_numpy(dtype='float64'), user_percentage.to_numpy(dtype='float64')),
+            },
+            'by_subject': by_subject,
+        }
+
+    @staticmethod
+    def build_report(chunk_size=None):
+        """
+        코호트 리포트 생성 및 스냅샷 저장
+
+        :param chunk_size: 청크 크기 (기본값: settings.REPORTS_ANALYTICS_CHUNK_SIZE)
+        :return: 생성된 CohortReport 인스턴스
+        """
+        chunk_size = chunk_size or CohortAnalyticsService.get_chunk_size()
+        started = time.perf_counter()
+
+        study_minutes, study_rows = CohortAnalyticsService.collect_study_minutes(chunk_size)
+        histograms, exam_totals, exam_rows = CohortAnalyticsService.collect_exam_scores(chunk_size)
+
+        user_ids = set()
+        subject_ids = set(histograms)
+        if not study_minutes.empty:
+            user_ids.update(study_minutes.index.get_level_values(1))
+            subject_ids.update(study_minutes.index.get_level_values(0))
+        if not exam_totals.empty:
+            user_ids.update(exam_totals.index.get_level_values(1))
+
+        # 집계는 정수 키로 하고, 과목명은 마지막에 한 번만 조회
+        subject_names = dict(
+            Subject.objects.filter(id__in=[int(value) for value in subject_ids]).values_list('id', 'name')
+        )
+
+        return CohortReport.objects.create(
+            duration_ms=int((time.perf_counter() - started) * 1000),
+            user_count=len(user_ids),
+            study_row_count=study_rows,
+            exam_row_count=exam_rows,
+            study_minutes_by_subject=CohortAnalyticsService.summarize_study_minutes(study_minutes, subject_names),
+            score_distribution_by_subject=CohortAnalyticsService.summarize_score_distribution(histograms, exam_totals, subject_names),
+            study_score_correlation=CohortAnalyticsService.summarize_correlation(study_minutes, exam_totals, subject_names),
+        )
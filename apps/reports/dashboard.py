@@ -0,0 +1,192 @@
+"""
+관리자 대시보드 사이트 지표
+
+요청마다 users/StudyTimer/Exam 전체를 집계하지 않도록 Celery beat 작업이 미리 집계해 두고,
+API 는 집계 테이블(DailySiteMetric, SiteMetricSnapshot)의 몇 행만 읽습니다.
+
+- 가입자 수: users.date_joined 워터마크 이후 가입이 있는 날짜부터 다시 집계
+- 활동 사용자 수: StudyContent.created_at / StudyTimer.updated_at 워터마크 이후 바뀐 행의
+  (날짜, 사용자) 를 DailyActiveUser 에 넣고 (중복 무시), 바뀐 날짜부터 다시 집계
+  (정리 작업이 자동 종료한 타이머는 사용자 활동이 아니므로 제외)
+- 실행 중인 타이머 / 이번 주 시험 / 전체 사용자 수: 집계할 때마다 스냅샷으로 덮어씀
+- 탈퇴한 사용자(실제 삭제 전 유예 기간 포함)는 모든 지표에서 제외
+  users.deleted_at 워터마크 이후 탈퇴한 사용자의 활동 기록을 지우고 가입일/활동일부터 다시 집계
+- 늦게 커밋된 트랜잭션의 행을 놓치지 않도록 워터마크를 REPORTS_SITE_METRICS_OVERLAP_SECONDS 만큼
+  겹쳐 읽음 (날짜 단위로 다시 집계하므로 겹쳐 읽어도 수가 늘지 않음)
+"""
+import time
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.calendars.models import Exam
+from apps.study.models import StudyContent, StudyTimer
+from apps.users.models import CustomUser
+
+from .models import DailyActiveUser, DailySiteMetric, MetricWatermark, SiteMetricSnapshot
+
+
+# (워터마크 이름, 쿼리셋, 사용자 ID 경로, 시각 필드) - 활동 사용자 출처
+ACTIVITY_SOURCES = (
+    ('study_content.created_at', StudyContent.all_objects.exclude_withdrawn(), 'study_event__user_id', 'created_at'),
+    # 자동 종료(auto_closed) 는 정리 작업이 updated_at 을 갱신한 것이므로 활동으로 세지 않음
+    (
+        'study_timer.updated_at', StudyTimer.objects.filter(auto_closed=False).exclude_withdrawn(),
+        'study_event__user_id', 'updated_at',
+    ),
+)
+
+SIGNUP_WATERMARK = 'users.date_joined'
+WITHDRAWAL_WATERMARK = 'users.deleted_at'
+
+
+def get_day_start(day):
+    """현지 날짜의 시작 시각"""
+    return timezone.make_aware(datetime.combine(day, datetime.min.time()))
+
+
+class SiteMetricsService:
+    """사이트 지표 집계/조회 서비스"""
+
+    @staticmethod
+    def refresh(now=None):
+        """
+        워터마크 이후 바뀐 날짜의 지표를 다시 집계하고 스냅샷 갱신 (Celery beat 로 주기 실행)
+
+        :param now: 기준 시각 (테스트용)
+        :return: SiteMetricSnapshot
+        """
+        started = time.perf_counter()
+        now = now or timezone.now()
+        overlap = timedelta(seconds=settings.REPORTS_SITE_METRICS_OVERLAP_SECONDS)
+        watermarks = dict(MetricWatermark.objects.values_list('name', 'value'))
+
+        with transaction.atomic():
+            # 워터마크 이후 탈퇴한 사용자의 활동 기록을 지우고, 가입일/활동일부터 다시 집계해 지표에서 뺌
+            since = watermarks.get(WITHDRAWAL_WATERMARK)
+            withdrawn = CustomUser.objects.filter(deleted_at__isnull=False)
+            if since:
+                withdrawn = withdrawn.filter(deleted_at__gte=since - overlap)
+            withdrawn_activity = DailyActiveUser.objects.filter(user__in=withdrawn)
+            first_days = [withdrawn_activity.order_by('date').values_list('date', flat=True).first()]
+            withdrawn_activity.delete()
+
+            # 워터마크가 없으면 (처음 실행) 전체 기간 집계
+            since = watermarks.get(SIGNUP_WATERMARK)
+            signup_days = [
+                SiteMetricsService.get_first_changed_day(
+                    CustomUser.objects.all(), 'date_joined', since - overlap if since else None
+                ),
+                SiteMetricsService.get_first_changed_day(withdrawn, 'date_joined', None),
+            ]
+            signup_days = [day for day in signup_days if day is not None]
+            if signup_days:
+                first_day = min(signup_days)
+                SiteMetricsService.update_days(first_day, 'signups', SiteMetricsService.count_signups(first_day))
+
+            for name, manager, user_path, field in ACTIVITY_SOURCES:
+                since = watermarks.get(name)
+                queryset = manager.all()
+                if since:
+                    queryset = queryset.filter(**{f'{field}__gte': since - overlap})
+                DailyActiveUser.objects.bulk_create(
+                    [
+                        DailyActiveUser(date=day, user_id=user_id)
+                        for day, user_id in queryset.order_by().annotate(day=TruncDate(field))
+                        .values_list('day', user_path).distinct().iterator()
+                    ],
+                    batch_size=1000,
+                    ignore_conflicts=True,
+                )
+                first_days.append(SiteMetricsService.get_first_changed_day(
+                    manager.all(), field, since - overlap if since else None
+                ))
+            first_days = [day for day in first_days if day is not None]
+            if first_days:
+                first_day = min(first_days)
+                SiteMetricsService.update_days(first_day, 'active_users', dict(
+                    DailyActiveUser.objects.filter(date__gte=first_day)
+                    .values_list('date').annotate(count=Count('user_id')).order_by()
+                ))
+
+            names = [WITHDRAWAL_WATERMARK, SIGNUP_WATERMARK] + [source[0] for source in ACTIVITY_SOURCES]
+            for name in names:
+                MetricWatermark.objects.update_or_create(name=name, defaults={'value': now})
+
+            today = timezone.localtime(now).date()
+            week_start = today - timedelta(days=today.weekday())
+            values = {
+                'generated_at': now,
+                'total_users': CustomUser.objects.filter(deleted_at__isnull=True).count(),
+                'timers_running': StudyTimer.objects.exclude_withdrawn().filter(is_running=True).count(),
+                'exams_this_week': Exam.objects.exclude_withdrawn().filter(
+                    exam_date__gte=week_start, exam_date__lt=week_start + timedelta(days=7)
+                ).count(),
+            }
+            values['duration_ms'] = int((time.perf_counter() - started) * 1000)
+            snapshot, _ = SiteMetricSnapshot.objects.update_or_create(pk=1, defaults=values)
+        return snapshot
+
+    @staticmethod
+    def get_first_changed_day(queryset, field, since):
+        """since 이후 바뀐 행 중 가장 이른 날짜 (since 가 None 이면 전체 중 가장 이른 날짜)"""
+        if since is not None:
+            queryset = queryset.filter(**{f'{field}__gte': since})
+        first = queryset.order_by(field).values_list(field, flat=True).first()
+        return timezone.localtime(first).date() if first else None
+
+    @staticmethod
+    def count_signups(first_day):
+        """first_day 부터의 날짜별 가입자 수 (date_joined 인덱스 범위 조회, 탈퇴한 사용자 제외)"""
+        return dict(
+            CustomUser.objects.filter(date_joined__gte=get_day_start(first_day), deleted_at__isnull=True)
+            .annotate(day=TruncDate('date_joined')).values_list('day')
+            .annotate(count=Count('id')).order_by()
+        )
+
+    @staticmethod
+    def update_days(first_day, field, counts):
+        """first_day 부터의 날짜별 지표 덮어쓰기 (집계에 없는 날짜는 0)"""
+        DailySiteMetric.objects.filter(date__gte=first_day).exclude(date__in=counts).update(**{field: 0})
+        DailySiteMetric.objects.bulk_create(
+            [DailySiteMetric(date=day, **{field: count}) for day, count in counts.items()],
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=['date'],
+            update_fields=[field, 'updated_at'],
+        )
+
+    @staticmethod
+    def get_dashboard(days):
+        """
+        대시보드 지표 (집계 테이블만 읽음)
+
+        :param days: 일별 지표를 조회할 최근 일수 (오늘 포함)
+        :return: 스냅샷 값과 날짜 오름차순 일별 지표, 아직 집계하지 않았으면 None
+        """
+        snapshot = SiteMetricSnapshot.objects.filter(pk=1).first()
+        if snapshot is None:
+            return None
+        today = timezone.localtime(snapshot.generated_at).date()
+        rows = dict(
+            (row[0], row[1:]) for row in DailySiteMetric.objects.filter(
+                date__gt=today - timedelta(days=days), date__lte=today,
+            ).values_list('date', 'signups', 'active_users')
+        )
+        daily = []
+        for offset in range(days - 1, -1, -1):
+            day = today - timedelta(days=offset)
+            signups, active_users = rows.get(day, (0, 0))
+            daily.append({'date': day, 'signups': signups, 'active_users': active_users})
+        return {
+            'generated_at': snapshot.generated_at,
+            'duration_ms': snapshot.duration_ms,
+            'total_users': snapshot.total_users,
+            'timers_running': snapshot.timers_running,
+            'exams_this_week': snapshot.exams_this_week,
+            'daily': daily,
+        }
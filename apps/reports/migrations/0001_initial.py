@@ -0,0 +1,33 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CohortReport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('generated_at', models.DateTimeField(auto_now_add=True, db_index=True, help_text='생성 시간')),
+                ('duration_ms', models.IntegerField(default=0, help_text='집계 소요 시간 (밀리초)')),
+                ('user_count', models.IntegerField(default=0, help_text='집계에 포함된 사용자 수')),
+                ('study_row_count', models.IntegerField(default=0, help_text='집계한 공부 내용 행 수')),
+                ('exam_row_count', models.IntegerField(default=0, help_text='집계한 시험 행 수')),
+                ('study_minutes_by_subject', models.JSONField(default=list, help_text='과목별 평균 공부 시간')),
+                ('score_distribution_by_subject', models.JSONField(default=list, help_text='과목별 점수 분포')),
+                ('study_score_correlation', models.JSONField(default=dict, help_text='공부 시간과 시험 백분율의 상관관계')),
+            ],
+            options={
+                'verbose_name': '코호트 리포트',
+                'verbose_name_plural': '코호트 리포트들',
+                'ordering': ['-generated_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:44
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0001_initial'),
+        ('users', '0003_alter_customuser_options_remove_customuser_username_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PassPredictionModel',
+            fields=[
+                ('user', models.OneToOneField(help_text='예측 대상 사용자', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='pass_prediction_model', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('coefficients', models.JSONField(default=list, help_text='회귀 계수 [절편, log(1+공부 시간)]')),
+                ('residual_std', models.FloatField(default=0.0, help_text='잔차 표준편차 (백분율)')),
+                ('sample_count', models.IntegerField(default=0, help_text='학습에 사용한 시험 수')),
+                ('statistics', models.JSONField(default=list, help_text='통계 API 응답 (label/value 목록)')),
+                ('trained_at', models.DateTimeField(auto_now=True, help_text='학습 시간')),
+            ],
+            options={
+                'verbose_name': '합격 예측 모델',
+                'verbose_name_plural': '합격 예측 모델들',
+            },
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 6.0.1 on 2026-10-19 13:58
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0002_passpredictionmodel'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailySiteMetric',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(help_text='날짜 (현지 시각 기준)', unique=True)),
+                ('signups', models.IntegerField(default=0, help_text='가입자 수')),
+                ('active_users', models.IntegerField(default=0, help_text='활동 사용자 수 (타이머 사용 또는 공부 내용 기록)')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='집계 시간')),
+            ],
+            options={
+                'verbose_name': '일별 사이트 지표',
+                'verbose_name_plural': '일별 사이트 지표들',
+                'ordering': ['-date'],
+            },
+        ),
+        migrations.CreateModel(
+            name='MetricWatermark',
+            fields=[
+                ('name', models.CharField(help_text='워터마크 이름 (원본 테이블.컬럼)', max_length=50, primary_key=True, serialize=False)),
+                ('value', models.DateTimeField(help_text='마지막으로 집계한 시각')),
+            ],
+            options={
+                'verbose_name': '집계 워터마크',
+                'verbose_name_plural': '집계 워터마크들',
+            },
+        ),
+        migrations.CreateModel(
+            name='SiteMetricSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('generated_at', models.DateTimeField(help_text='집계 시간')),
+                ('duration_ms', models.IntegerField(default=0, help_text='집계 소요 시간 (밀리초)')),
+                ('total_users', models.IntegerField(default=0, help_text='전체 사용자 수 (탈퇴 제외)')),
+                ('timers_running', models.IntegerField(default=0, help_text='실행 중인 타이머 수')),
+                ('exams_this_week', models.IntegerField(default=0, help_text='이번 주(월~일) 시험 수')),
+            ],
+            options={
+                'verbose_name': '사이트 지표 스냅샷',
+                'verbose_name_plural': '사이트 지표 스냅샷',
+            },
+        ),
+        migrations.CreateModel(
+            name='DailyActiveUser',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(help_text='활동 날짜 (현지 시각 기준)')),
+                ('user', models.ForeignKey(help_text='활동 사용자', on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '일별 활동 사용자',
+                'verbose_name_plural': '일별 활동 사용자들',
+                'constraints': [models.UniqueConstraint(fields=('date', 'user'), name='reports_daily_active_user_unique')],
+            },
+        ),
+    ]
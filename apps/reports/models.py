@@ -1,12 +1,138 @@
 """
 통계 관련 모델
 
-통계는 주로 다른 앱의 데이터를 집계하므로 별도의 모델이 필요하지 않을 수 있습니다.
-하지만 통계 결과를 캐싱하거나 저장해야 한다면 모델을 추가할 수 있습니다.
+통계는 주로 다른 앱의 데이터를 집계하므로 사용자별 통계는 요청 시점에 계산합니다.
+전체 사용자를 대상으로 하는 코호트 리포트는 배치로 계산한 뒤 스냅샷으로 저장합니다.
 """
 from django.db import models
+from django.conf import settings
 
-# 통계 결과를 저장할 필요가 있다면 아래 모델을 사용할 수 있습니다.
-# class StatisticsCache(models.Model):
-#     """통계 결과 캐시 모델"""
-#     pass
+
+class CohortReport(models.Model):
+    """
+    코호트 리포트 스냅샷 모델
+
+    전체 사용자의 공부 시간/시험 점수를 배치로 집계한 결과를 저장
+    """
+    generated_at = models.DateTimeField(auto_now_add=True, db_index=True, help_text="생성 시간")
+    duration_ms = models.IntegerField(default=0, help_text="집계 소요 시간 (밀리초)")
+    user_count = models.IntegerField(default=0, help_text="집계에 포함된 사용자 수")
+    study_row_count = models.IntegerField(default=0, help_text="집계한 공부 내용 행 수")
+    exam_row_count = models.IntegerField(default=0, help_text="집계한 시험 행 수")
+    study_minutes_by_subject = models.JSONField(default=list, help_text="과목별 평균 공부 시간")
+    score_distribution_by_subject = models.JSONField(default=list, help_text="과목별 점수 분포")
+    study_score_correlation = models.JSONField(default=dict, help_text="공부 시간과 시험 백분율의 상관관계")
+
+    class Meta:
+        verbose_name = '코호트 리포트'
+        verbose_name_plural = '코호트 리포트들'
+        ordering = ['-generated_at']
+
+    def __str__(self):
+        return f"코호트 리포트 ({self.generated_at:%Y-%m-%d %H:%M})"
+
+
+class PassPredictionModel(models.Model):
+    """
+    사용자별 합격 예측 모델 (학습된 회귀 계수)
+
+    Celery 작업에서 학습한 계수와 예측 결과를 저장하고,
+    통계 API 는 이 값을 캐시에서 바로 읽어 응답
+    """
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='pass_prediction_model',
+        help_text="예측 대상 사용자"
+    )
+    coefficients = models.JSONField(default=list, help_text="회귀 계수 [절편, log(1+공부 시간)]")
+    residual_std = models.FloatField(default=0.0, help_text="잔차 표준편차 (백분율)")
+    sample_count = models.IntegerField(default=0, help_text="학습에 사용한 시험 수")
+    statistics = models.JSONField(default=list, help_text="통계 API 응답 (label/value 목록)")
+    trained_at = models.DateTimeField(auto_now=True, help_text="학습 시간")
+
+    class Meta:
+        verbose_name = '합격 예측 모델'
+        verbose_name_plural = '합격 예측 모델들'
+
+    def __str__(self):
+        return f"합격 예측 모델 (user={self.user_id}, n={self.sample_count})"
+
+
+class DailySiteMetric(models.Model):
+    """
+    일별 사이트 지표 (관리자 대시보드용 집계 테이블)
+
+    Celery beat 작업(apps.reports.tasks.refresh_site_metrics)이 워터마크 이후 바뀐 날짜만 다시 집계
+    """
+    date = models.DateField(unique=True, help_text="날짜 (현지 시각 기준)")
+    signups = models.IntegerField(default=0, help_text="가입자 수")
+    active_users = models.IntegerField(default=0, help_text="활동 사용자 수 (타이머 사용 또는 공부 내용 기록)")
+    updated_at = models.DateTimeField(auto_now=True, help_text="집계 시간")
+
+    class Meta:
+        verbose_name = '일별 사이트 지표'
+        verbose_name_plural = '일별 사이트 지표들'
+        ordering = ['-date']
+
+    def __str__(self):
+        return f"사이트 지표 ({self.date})"
+
+
+class DailyActiveUser(models.Model):
+    """
+    날짜별 활동 사용자 (일별 활동 사용자 수 중복 제거용)
+
+    같은 행을 여러 번 넣어도 한 번만 저장되므로 워터마크를 겹쳐 읽어도 수가 늘지 않음
+    """
+    date = models.DateField(help_text="활동 날짜 (현지 시각 기준)")
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='+',
+        help_text="활동 사용자"
+    )
+
+    class Meta:
+        verbose_name = '일별 활동 사용자'
+        verbose_name_plural = '일별 활동 사용자들'
+        constraints = [
+            models.UniqueConstraint(fields=['date', 'user'], name='reports_daily_active_user_unique'),
+        ]
+
+    def __str__(self):
+        return f"활동 사용자 ({self.date}, user={self.user_id})"
+
+
+class MetricWatermark(models.Model):
+    """집계 작업별 워터마크 (이 시각 이후 바뀐 행만 다시 읽음)"""
+    name = models.CharField(max_length=50, primary_key=True, help_text="워터마크 이름 (원본 테이블.컬럼)")
+    value = models.DateTimeField(help_text="마지막으로 집계한 시각")
+
+    class Meta:
+        verbose_name = '집계 워터마크'
+        verbose_name_plural = '집계 워터마크들'
+
+    def __str__(self):
+        return f"{self.name} ({self.value:%Y-%m-%d %H:%M:%S})"
+
+
+class SiteMetricSnapshot(models.Model):
+    """
+    현재 사이트 상태 스냅샷 (한 행만 유지)
+
+    실행 중인 타이머 수처럼 날짜별로 쌓이지 않는 지표를 집계 작업마다 덮어씀
+    """
+    generated_at = models.DateTimeField(help_text="집계 시간")
+    duration_ms = models.IntegerField(default=0, help_text="집계 소요 시간 (밀리초)")
+    total_users = models.IntegerField(default=0, help_text="전체 사용자 수 (탈퇴 제외)")
+    timers_running = models.IntegerField(default=0, help_text="실행 중인 타이머 수")
+    exams_this_week = models.IntegerField(default=0, help_text="이번 주(월~일) 시험 수")
+
+    class Meta:
+        verbose_name = '사이트 지표 스냅샷'
+        verbose_name_plural = '사이트 지표 스냅샷'
+
+    def __str__(self):
+        return f"사이트 지표 스냅샷 ({self.generated_at:%Y-%m-%d %H:%M})"
@@ -0,0 +1,271 @@
+"""
+합격 예측 모델
+
+사용자별 시험 이력과 과목별 공부 시간으로 가벼운 회귀 모델을 학습합니다.
+- 특징: [1, log(1 + 시험일까지 해당 과목 누적 공부 시간)]
+- 학습: 절편을 제외한 계수에 L2 규제를 둔 닫힌 형태 최소제곱 (시험 1개로도 해가 존재)
+- 예측: 예상 백분율과 잔차 표준편차로 정규분포를 가정해 합격 확률 계산
+
+학습은 Celery 작업에서 수행하고, 통계 API 는 캐시된 결과만 읽으므로 O(1) 입니다.
+재학습 작업을 넣지 못했거나 REPORTS_PASS_PREDICTION_MAX_AGE 보다 오래 전에 학습한 모델은
+다음 조회에서 다시 학습합니다.
+"""
+import logging
+import math
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.calendars.models import Exam
+from apps.study.models import StudyContent
+from .models import PassPredictionModel
+
+
+# 기울기 계수에 적용할 L2 규제 강도
+RIDGE_LAMBDA = 1.0
+
+# 시험 수가 부족해 잔차를 추정할 수 없을 때 사용하는 표준편차 (백분율)
+PRIOR_RESIDUAL_STD = 15.0
+
+# 응답에 포함할 다가오는 시험 수
+MAX_UPCOMING_EXAMS = 5
+
+CACHE_KEY = 'reports:pass-prediction:{user_id}'
+
+logger = logging.getLogger(__name__)
+
+
+def fit_ridge(features, targets, ridge_lambda=RIDGE_LAMBDA):
+    """
+    절편을 제외한 계수에 L2 규제를 둔 최소제곱 (닫힌 형태)
+
+    beta = (X^T X + λI')^-1 X^T y, I' 는 절편 위치가 0 인 단위 행렬
+
+    :param features: (n, p) 특징 행렬 (첫 열은 1)
+    :param targets: (n,) 목표값
+    :return: (p,) 계수
+    """
+    penalty = ridge_lambda * np.eye(features.shape[1])
+    penalty[0, 0] = 0.0
+    return np.linalg.solve(features.T @ features + penalty, features.T @ targets)
+
+
+def pass_probability(predicted, threshold, residual_std):
+    """예상 백분율이 정규분포를 따른다고 가정했을 때 합격 기준 이상일 확률"""
+    if residual_std <= 0:
+        return 1.0 if predicted >= threshold else 0.0
+    z = (predicted - threshold) / residual_std
+    return 0.5 * (1.0 + math.erf(z / math.sqrt(2.0)))
+
+
+class StudyMinutesIndex:
+    """
+    과목별 누적 공부 시간 조회용 인덱스
+
+    과목별로 (날짜, 누적 분) 배열을 만들어 두고 이진 탐색으로 특정 날짜까지의 누적 시간을 조회
+    """
+
+    def __init__(self, rows):
+        """
+        :param rows: (과목 ID, 날짜, 분) 튜플 목록
+        """
+        by_subject = {}
+        for subject, day, minutes in rows:
+            by_subject.setdefault(subject, []).append((day.toordinal(), minutes or 0))
+
+        self._index = {}
+        for subject, items in by_subject.items():
+            items.sort()
+            days = np.array([day for day, _ in items], dtype='int64')
+            cumulative = np.cumsum([minutes for _, minutes in items], dtype='float64')
+            self._index[subject] = (days, cumulative)
+
+    def minutes_until(self, subject, day):
+        """해당 과목(ID)의 day(포함)까지 누적 공부 시간"""
+        if subject not in self._index:
+            return 0.0
+        days, cumulative = self._index[subject]
+        position = np.searchsorted(days, day.toordinal(), side='right')
+        return float(cumulative[position - 1]) if position > 0 else 0.0
+
+
+class PassPredictionService:
+    """합격 예측 모델 학습/조회 서비스"""
+
+    @staticmethod
+    def get_cache_key(user_id):
+        """사용자별 캐시 키"""
+        return CACHE_KEY.format(user_id=user_id)
+
+    @staticmethod
+    def get_default_threshold():
+        """시험별 합격 기준이 없을 때 사용할 기본값"""
+        return getattr(settings, 'REPORTS_DEFAULT_PASS_THRESHOLD', 70.0)
+
+    @staticmethod
+    def is_expired(model, now=None):
+        """REPORTS_PASS_PREDICTION_MAX_AGE 보다 오래 전에 학습한 모델인지 (0 이면 만료 없음)"""
+        max_age = getattr(settings, 'REPORTS_PASS_PREDICTION_MAX_AGE', 0)
+        if not max_age:
+            return False
+        return ((now or timezone.now()) - model.trained_at).total_seconds() >= max_age
+
+    @staticmethod
+    def get_cache_timeout(model):
+        """결과 캐시 유지 시간 (모델이 만료되는 시각을 넘기지 않음)"""
+        timeout = getattr(settings, 'REPORTS_PASS_PREDICTION_CACHE_TIMEOUT', None)
+        max_age = getattr(settings, 'REPORTS_PASS_PREDICTION_MAX_AGE', 0)
+        if not max_age:
+            return timeout
+        remaining = max(int(max_age - (timezone.now() - model.trained_at).total_seconds()), 1)
+        return min(timeout, remaining) if timeout else remaining
+
+    @staticmethod
+    def build_study_minutes_index(user_id):
+        """사용자의 과목/날짜별 공부 시간을 한 번의 집계 쿼리로 조회"""
+        rows = StudyContent.objects.filter(
+            study_event__user_id=user_id
+        ).annotate(
+            day=TruncDate('study_event__start_at')
+        ).values_list('study_event__canonical_subject_id', 'day').annotate(
+            minutes=Sum('duration_minutes')
+        ).order_by()
+        return StudyMinutesIndex(rows)
+
+    @staticmethod
+    def train(user_id):
+        """
+        사용자 합격 예측 모델 학습 및 결과 캐시
+
+        :param user_id: 사용자 ID
+        :return: 저장된 PassPredictionModel 인스턴스
+        """
+        minutes_index = PassPredictionService.build_study_minutes_index(user_id)
+        default_threshold = PassPredictionService.get_default_threshold()
+
+        scored = list(Exam.objects.filter(
+            user_id=user_id,
+            score__isnull=False,
+            max_score__gt=0
+        ).values_list('canonical_subject_id', 'exam_date', 'score', 'max_score'))
+
+        today = timezone.now().date()
+        upcoming = list(Exam.objects.filter(
+            user_id=user_id,
+            exam_date__gte=today,
+            score__isnull=True
+        ).order_by('exam_date').values_list(
+            'subject', 'canonical_subject_id', 'exam_date', 'pass_threshold'
+        )[:MAX_UPCOMING_EXAMS])
+
+        coefficients = []
+        residual_std = 0.0
+        if scored:
+            features = np.array(
+                [[1.0, math.log1p(minutes_index.minutes_until(subject, exam_date))]
+                 for subject, exam_date, _, _ in scored]
+            )
+            scores = np.array([score for _, _, score, _ in scored], dtype='float64')
+            max_scores = np.array([max_score for _, _, _, max_score in scored], dtype='float64')
+            targets = scores / max_scores * 100
+
+            beta = fit_ridge(features, targets)
+            coefficients = [float(value) for value in beta]
+
+            degrees_of_freedom = len(targets) - features.shape[1]
+            if degrees_of_freedom > 0:
+                residuals = targets - features @ beta
+                residual_std = float(np.sqrt((residuals ** 2).sum() / degrees_of_freedom))
+            # 표본이 적으면 잔차가 과소추정되므로 사전 표준편차보다 작아지지 않게 보정
+            residual_std = max(residual_std, PRIOR_RESIDUAL_STD / math.sqrt(len(targets)))
+
+            # 기존 응답과 동일하게 평균 점수 / 평균 만점으로 현재 백분율 계산
+            current_percentage = scores.mean() / max_scores.mean() * 100
+            threshold = upcoming[0][3] if upcoming and upcoming[0][3] is not None else default_threshold
+
+            statistics = [
+                {'label': '현재 평균 점수', 'value': round(float(current_percentage), 2)},
+                {'label': '합격 기준', 'value': round(float(threshold), 2)},
+                {'label': '차이', 'value': round(float(current_percentage - threshold), 2)},
+            ]
+            for subject, subject_id, exam_date, exam_threshold in upcoming:
+                exam_threshold = exam_threshold if exam_threshold is not None else default_threshold
+                minutes = minutes_index.minutes_until(subject_id, exam_date)
+                predicted = float(min(max(beta[0] + beta[1] * math.log1p(minutes), 0.0), 100.0))
+                probability = pass_probability(predicted, exam_threshold, residual_std)
+                statistics.append({
+                    'label': f'{subject} ({exam_date}) 예상 점수',
+                    'value': round(predicted, 2),
+                })
+                statistics.append({
+                    'label': f'{subject} ({exam_date}) 합격 확률',
+                    'value': round(probability * 100, 2),
+                })
+        else:
+            statistics = [{'label': '데이터 없음', 'value': 0.0}]
+
+        model, _ = PassPredictionModel.objects.update_or_create(
+            user_id=user_id,
+            defaults={
+                'coefficients': coefficients,
+                'residual_std': residual_std,
+                'sample_count': len(scored),
+                'statistics': statistics,
+            }
+        )
+        cache.set(
+            PassPredictionService.get_cache_key(user_id),
+            statistics,
+            PassPredictionService.get_cache_timeout(model)
+        )
+        return model
+
+    @staticmethod
+    def get_statistics(user_id):
+        """
+        캐시된 합격 예측 결과 조회
+
+        캐시 → 저장된 모델 → (최초 1회 또는 모델 만료 시) 즉시 학습 순으로 조회
+        """
+        cache_key = PassPredictionService.get_cache_key(user_id)
+        statistics = cache.get(cache_key)
+        if statistics is not None:
+            return statistics
+
+        model = PassPredictionModel.objects.filter(user_id=user_id).first()
+        if model is None or PassPredictionService.is_expired(model):
+            model = PassPredictionService.train(user_id)
+        else:
+            cache.set(cache_key, model.statistics, PassPredictionService.get_cache_timeout(model))
+        return model.statistics
+
+    @staticmethod
+    def invalidate(user_id):
+        """저장된 모델과 캐시를 지워 다음 조회에서 다시 학습하게 함"""
+        PassPredictionModel.objects.filter(user_id=user_id).delete()
+        cache.delete(PassPredictionService.get_cache_key(user_id))
+
+    @staticmethod
+    def enqueue_training(user_id):
+        """
+        Celery 작업으로 재학습 요청
+
+        브로커 장애 등으로 작업을 넣지 못하면 점수 변경 요청은 실패시키지 않고,
+        오래된 예측이 남지 않도록 모델을 무효화 (다음 조회에서 즉시 학습)
+        """
+        from .tasks import train_pass_prediction
+        try:
+            train_pass_prediction.delay(user_id)
+        except Exception:
+            logger.warning('합격 예측 재학습 작업 등록 실패, 모델 무효화 (user=%s)', user_id, exc_info=True)
+            PassPredictionService.invalidate(user_id)
+
+    @staticmethod
+    def schedule_training(user_id):
+        """트랜잭션 커밋 후 Celery 작업으로 재학습 요청"""
+        transaction.on_commit(lambda: PassPredictionService.enqueue_training(user_id))
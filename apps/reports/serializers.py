@@ -1,10 +1,58 @@
 """
 통계 관련 시리얼라이저
 """
+from django.conf import settings
 from rest_framework import serializers
+from .models import CohortReport
 
 
 class StatisticsSerializer(serializers.Serializer):
     """통계 시리얼라이저"""
     label = serializers.CharField(help_text="통계 항목 (예: 과목명)")
     value = serializers.FloatField(help_text="계산된 값 (예: 시간, 점수, 비율)")
+
+
+class CohortReportSerializer(serializers.ModelSerializer):
+    """코호트 리포트 스냅샷 시리얼라이저"""
+
+    class Meta:
+        model = CohortReport
+        fields = [
+            'id',
+            'generated_at',
+            'duration_ms',
+            'user_count',
+            'study_row_count',
+            'exam_row_count',
+            'study_minutes_by_subject',
+            'score_distribution_by_subject',
+            'study_score_correlation',
+        ]
+        read_only_fields = fields
+
+
+class SiteMetricsQuerySerializer(serializers.Serializer):
+    """관리자 대시보드 조회 파라미터"""
+    days = serializers.IntegerField(default=30, min_value=1, help_text="일별 지표를 조회할 최근 일수 (오늘 포함)")
+
+    def validate_days(self, value):
+        if value > settings.REPORTS_SITE_METRICS_MAX_DAYS:
+            raise serializers.ValidationError(f'최대 {settings.REPORTS_SITE_METRICS_MAX_DAYS}일까지 조회할 수 있습니다.')
+        return value
+
+
+class DailySiteMetricSerializer(serializers.Serializer):
+    """일별 사이트 지표"""
+    date = serializers.DateField()
+    signups = serializers.IntegerField(help_text="가입자 수")
+    active_users = serializers.IntegerField(help_text="활동 사용자 수 (타이머 사용 또는 공부 내용 기록)")
+
+
+class SiteMetricsSerializer(serializers.Serializer):
+    """관리자 대시보드 사이트 지표"""
+    generated_at = serializers.DateTimeField(help_text="집계 시간")
+    duration_ms = serializers.IntegerField(help_text="집계 소요 시간 (밀리초)")
+    total_users = serializers.IntegerField(help_text="전체 사용자 수 (탈퇴 제외)")
+    timers_running = serializers.IntegerField(help_text="실행 중인 타이머 수")
+    exams_this_week = serializers.IntegerField(help_text="이번 주(월~일) 시험 수")
+    daily = DailySiteMetricSerializer(many=True, help_text="일별 지표 (날짜 오름차순)")
@@ -0,0 +1,45 @@
+"""
+통계 관련 Celery 작업
+"""
+from celery import shared_task
+
+from core.db_router import read_from_replica
+from .analytics import CohortAnalyticsService
+
+
+@shared_task
+def build_cohort_report():
+    """
+    코호트 리포트 배치 집계 (Celery beat 로 주기 실행)
+
+    :return: 생성된 CohortReport ID
+    """
+    # 전체 사용자 데이터를 읽는 배치 집계이므로 replica 에서 읽음 (스냅샷 저장은 primary)
+    with read_from_replica():
+        report = CohortAnalyticsService.build_report()
+    return report.id
+
+
+@shared_task
+def train_pass_prediction(user_id):
+    """
+    사용자 합격 예측 모델 재학습 (시험 점수 변경 시 실행)
+
+    :param user_id: 사용자 ID
+    :return: 학습에 사용한 시험 수
+    """
+    from .prediction import PassPredictionService
+    model = PassPredictionService.train(user_id)
+    return model.sample_count
+
+
+@shared_task
+def refresh_site_metrics():
+    """
+    관리자 대시보드 사이트 지표 증분 집계 (Celery beat 로 주기 실행)
+
+    :return: 집계 소요 시간 (밀리초)
+    """
+    from .dashboard import SiteMetricsService
+    snapshot = SiteMetricsService.refresh()
+    return snapshot.duration_ms
@@ -1,3 +1,162 @@
-from django.test import TestCase
+"""
+통계 앱 테스트 (코호트 리포트, 관리자 대시보드 사이트 지표, 합격 예측)
+"""
+from datetime import timedelta
 
-# Create your tests here.
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.calendars.models import Exam
+from apps.reports import analytics
+from apps.reports.analytics import CohortAnalyticsService
+from apps.reports.dashboard import SiteMetricsService
+from apps.reports.models import PassPredictionModel
+from apps.reports.prediction import PassPredictionService
+from apps.reports.tasks import train_pass_prediction
+from apps.study.models import StudyContent, StudyEvent, StudyTimer
+from apps.study.services import StudyTimerSweeper
+from apps.users.models import CustomUser
+from apps.users.services import UserService
+
+
+@pytest.fixture
+def staff(db):
+    return CustomUser.objects.create_user('staff@example.com', 'password123!', nickname='staff', is_staff=True)
+
+
+@pytest.fixture
+def api_client(staff):
+    client = APIClient()
+    client.force_authenticate(staff)
+    return client
+
+
+def test_cohort_report(db, monkeypatch):
+    # 청크마다 부분 집계를 만들고 중간 병합도 거치도록 청크/병합 기준을 작게 설정
+    monkeypatch.setattr(analytics, 'PARTIAL_MERGE_THRESHOLD', 2)
+    now = timezone.now()
+    for i, (minutes, score) in enumerate([((60, 60), 90), ((60,), 70), ((), 50)]):
+        user = CustomUser.objects.create_user(f'cohort{i}@example.com', 'password123!', nickname=f'cohort{i}')
+        study_event = StudyEvent.objects.create(user=user, title='수학', goal='목표', start_at=now, end_at=now)
+        for value in minutes:
+            StudyContent.objects.create(study_event=study_event, content='내용', duration_minutes=value)
+        Exam.objects.create(user=user, subject='수학', exam_date=now.date(), score=score, max_score=100)
+
+    report = CohortAnalyticsService.build_report(chunk_size=1)
+    assert (report.user_count, report.study_row_count, report.exam_row_count) == (3, 3, 3)
+
+    [study] = report.study_minutes_by_subject
+    assert study['subject'] == '수학'
+    assert (study['user_count'], study['total_minutes'], study['average_minutes']) == (2, 180, 90.0)
+
+    [scores] = report.score_distribution_by_subject
+    assert (scores['count'], scores['mean'], scores['min'], scores['max']) == (3, 70.0, 50.0, 90.0)
+    assert (scores['p25'], scores['median'], scores['p75']) == (50.0, 70.0, 90.0)
+    assert scores['histogram'] == [0, 0, 0, 0, 0, 1, 0, 1, 0, 1]
+
+    # 공부 기록이 없는 사용자도 0분으로 포함 (120, 60, 0분 -> 90, 70, 50%)
+    assert report.study_score_correlation['overall'] == {'users': 3, 'pearson_r': 1.0}
+
+
+def test_site_metrics(staff, api_client):
+    now = timezone.now()
+    study_event = StudyEvent.objects.create(user=staff, title='수학', goal='목표', start_at=now, end_at=now)
+    StudyContent.objects.create(study_event=study_event, content='내용', duration_minutes=30)
+    assert api_client.get('/api/reports/api/statistics/site/').status_code == 404
+
+    SiteMetricsService.refresh()
+    CustomUser.objects.create_user('late@example.com', 'password123!', nickname='late')
+    # 워터마크 이후 가입만 다시 집계하고, 겹쳐 읽어도 수가 늘지 않음
+    SiteMetricsService.refresh()
+    SiteMetricsService.refresh()
+
+    response = api_client.get('/api/reports/api/statistics/site/', {'days': 7})
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data['daily']) == 7
+    assert data['daily'][-1]['signups'] == 2
+    assert data['daily'][-1]['active_users'] == 1
+    assert data['total_users'] == 2 and data['timers_running'] == 0
+
+    api_client.force_authenticate(CustomUser.objects.get(email='late@example.com'))
+    assert api_client.get('/api/reports/api/statistics/site/').status_code == 403
+
+
+def test_site_metrics_ignore_auto_closed_timers(staff, api_client):
+    started_at = timezone.now() - timedelta(days=3)
+    user = CustomUser.objects.create_user('idle@example.com', 'password123!', nickname='idle')
+    study_event = StudyEvent.objects.create(user=user, title='수학', goal='목표', start_at=started_at, end_at=started_at)
+    timer = StudyTimer.objects.create(study_event=study_event, is_running=True, started_at=started_at)
+    StudyTimer.objects.filter(pk=timer.pk).update(updated_at=started_at)
+    SiteMetricsService.refresh()
+
+    # 정리 작업이 updated_at 을 갱신해도 오늘 활동한 사용자로 세지 않음
+    assert StudyTimerSweeper.run()['closed'] == 1
+    SiteMetricsService.refresh()
+
+    daily = api_client.get('/api/reports/api/statistics/site/', {'days': 7}).json()['daily']
+    assert daily[-1]['active_users'] == 0
+    assert sum(day['active_users'] for day in daily) == 1
+
+
+def test_reports_exclude_withdrawn_users(staff, api_client):
+    now = timezone.now()
+    user = CustomUser.objects.create_user('leaving@example.com', 'password123!', nickname='leaving')
+    study_event = StudyEvent.objects.create(user=user, title='수학', goal='목표', start_at=now, end_at=now)
+    StudyContent.objects.create(study_event=study_event, content='내용', duration_minutes=30)
+    StudyTimer.objects.create(study_event=study_event, is_running=True, started_at=now)
+    Exam.objects.create(user=user, subject='수학', exam_date=timezone.localdate(), score=80, max_score=100)
+
+    def get_metrics():
+        data = api_client.get('/api/reports/api/statistics/site/', {'days': 7}).json()
+        today = data['daily'][-1]
+        return today['signups'], today['active_users'], data['timers_running'], data['exams_this_week']
+
+    SiteMetricsService.refresh()
+    assert get_metrics() == (2, 1, 1, 1)
+
+    # 탈퇴하면 실제 삭제 전(유예 기간)에도 이미 집계한 날짜를 다시 집계해 지표에서 제외
+    UserService.delete_user(user)
+    SiteMetricsService.refresh()
+    assert get_metrics() == (1, 0, 0, 0)
+
+    report = CohortAnalyticsService.build_report()
+    assert (report.user_count, report.study_row_count, report.exam_row_count) == (0, 0, 0)
+
+
+def test_pass_prediction_retrains_expired_model(staff, settings):
+    settings.REPORTS_PASS_PREDICTION_MAX_AGE = 60
+    cache_key = PassPredictionService.get_cache_key(staff.id)
+    assert PassPredictionService.get_statistics(staff.id)[0]['label'] == '데이터 없음'
+    Exam.objects.create(
+        user=staff, subject='수학', exam_date=timezone.localdate() - timedelta(days=1), score=80, max_score=100
+    )
+
+    # 만료 전에는 저장된 모델을 그대로 사용
+    cache.delete(cache_key)
+    assert PassPredictionService.get_statistics(staff.id)[0]['label'] == '데이터 없음'
+
+    PassPredictionModel.objects.filter(user=staff).update(trained_at=timezone.now() - timedelta(minutes=2))
+    cache.delete(cache_key)
+    statistics = PassPredictionService.get_statistics(staff.id)
+    assert statistics[0] == {'label': '현재 평균 점수', 'value': 80.0}
+    assert PassPredictionModel.objects.get(user=staff).sample_count == 1
+
+
+def test_pass_prediction_enqueue_failure_invalidates_model(
+    staff, monkeypatch, caplog, django_capture_on_commit_callbacks
+):
+    def delay(user_id):
+        raise ConnectionError('broker down')
+
+    PassPredictionService.train(staff.id)
+    monkeypatch.setattr(train_pass_prediction, 'delay', delay)
+
+    # 작업을 넣지 못해도 커밋 후 콜백에서 예외가 나지 않고, 다음 조회에서 다시 학습
+    with django_capture_on_commit_callbacks(execute=True):
+        PassPredictionService.schedule_training(staff.id)
+    assert '재학습 작업 등록 실패' in caplog.text
+    assert not PassPredictionModel.objects.filter(user=staff).exists()
+    assert cache.get(PassPredictionService.get_cache_key(staff.id)) is None
@@ -7,6 +7,12 @@ from . import views
 app_name = 'reports'
 
 urlpatterns = [
+    # 코호트 리포트 (관리자 전용, stat_type 패턴보다 먼저 매칭되어야 함)
+    path('api/statistics/cohort/', views.CohortReportView.as_view(), name='statistics-cohort'),
+
+    # 관리자 대시보드 사이트 지표 (관리자 전용, stat_type 패턴보다 먼저 매칭되어야 함)
+    path('api/statistics/site/', views.SiteMetricsView.as_view(), name='statistics-site'),
+    
     # 통계 조회 (타입별로 분기)
     path('api/statistics/<str:stat_type>/', views.StatisticsView.as_view(), name='statistics'),
     
@@ -4,15 +4,20 @@
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from drf_spectacular.utils import extend_schema
-from django.db.models import Sum, Avg, Count, Q
+from django.db.models import Sum, Avg, Q
 from django.utils import timezone
 from datetime import timedelta
 
 from apps.study.models import StudyEvent, StudyContent, StudyTimer
 from apps.calendars.models import Exam
-from .serializers import StatisticsSerializer
+from apps.calendars.services import ExamService
+from .dashboard import SiteMetricsService
+from .models import CohortReport
+from .serializers import (
+    StatisticsSerializer, CohortReportSerializer, SiteMetricsQuerySerializer, SiteMetricsSerializer,
+)
 
 
 @extend_schema(
@@ -58,10 +63,14 @@ class StatisticsView(APIView):
         user = request.user
         
         # 공부 내용에서 과목별 시간 집계
-        # StudyContent에 subject 필드가 없다면 StudyEvent의 title이나 goal을 과목으로 사용
+        # 스터디 이벤트 제목으로 정규화된 과목(정수 키) 기준으로 그룹화
         study_contents = StudyContent.objects.filter(
-            study_event__user=user
-        ).values('study_event__title').annotate(
+            study_event__user=user,
+            study_event__canonical_subject__isnull=False
+        ).values(
+            'study_event__canonical_subject_id',
+            'study_event__canonical_subject__name'
+        ).annotate(
             total_minutes=Sum('duration_minutes')
         )
         
@@ -77,7 +86,7 @@ class StatisticsView(APIView):
                 ratio = 0.0
             
             statistics.append({
-                'label': item['study_event__title'],
+                'label': item['study_event__canonical_subject__name'],
                 'value': round(ratio, 2)
             })
         
@@ -91,8 +100,9 @@ class StatisticsView(APIView):
         # 시험에서 과목별 평균 점수 계산
         exams = Exam.objects.filter(
             user=user,
-            score__isnull=False
-        ).values('subject').annotate(
+            score__isnull=False,
+            canonical_subject__isnull=False
+        ).values('canonical_subject_id', 'canonical_subject__name').annotate(
             avg_score=Avg('score'),
             max_score=Avg('max_score')
         )
@@ -106,7 +116,7 @@ class StatisticsView(APIView):
                 percentage = 0.0
             
             statistics.append({
-                'label': exam['subject'],
+                'label': exam['canonical_subject__name'],
                 'value': round(percentage, 2)
             })
         
@@ -118,19 +128,13 @@ class StatisticsView(APIView):
         user = request.user
         
         # 시험에서 과목별 평균 점수 계산
-        # 점수가 낮은 과목을 취약 파트로 판단
-        exams = Exam.objects.filter(
-            user=user,
-            score__isnull=False
-        ).values('subject').annotate(
-            avg_score=Avg('score'),
-            count=Count('id')
-        ).order_by('avg_score')[:5]  # 점수가 낮은 상위 5개
+        # 점수가 낮은 과목을 취약 파트로 판단 (학습 계획 생성기와 같은 기준)
+        exams = ExamService.get_subject_score_averages(user).order_by('avg_score')[:5]  # 점수가 낮은 상위 5개
         
         statistics = []
         for exam in exams:
             statistics.append({
-                'label': exam['subject'],
+                'label': exam['canonical_subject__name'],
                 'value': round(exam['avg_score'], 2)
             })
         
@@ -166,48 +170,77 @@ class StatisticsView(APIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
     
     def _get_pass_prediction(self, request):
-        """합격 기준 대비 현재 점수 분석"""
-        user = request.user
-        
-        # 시험 데이터에서 평균 점수 계산
-        exams = Exam.objects.filter(
-            user=user,
-            score__isnull=False
-        )
-        
-        if exams.exists():
-            # 평균 점수와 만점 계산
-            avg_score = exams.aggregate(avg=Avg('score'))['avg'] or 0
-            avg_max_score = exams.aggregate(avg=Avg('max_score'))['avg'] or 0
-            
-            if avg_max_score > 0:
-                current_percentage = (avg_score / avg_max_score) * 100
-            else:
-                current_percentage = 0.0
-            
-            # 합격 기준을 70%로 가정 (실제로는 설정 가능하도록 해야 함)
-            pass_standard = 70.0
-            gap = current_percentage - pass_standard
-            
-            statistics = [
-                {
-                    'label': '현재 평균 점수',
-                    'value': round(current_percentage, 2)
-                },
-                {
-                    'label': '합격 기준',
-                    'value': pass_standard
-                },
-                {
-                    'label': '차이',
-                    'value': round(gap, 2)
-                }
-            ]
-        else:
-            statistics = [{
-                'label': '데이터 없음',
-                'value': 0.0
-            }]
+        """합격 기준 대비 현재 점수 및 다가오는 시험의 합격 확률 분석"""
+        from .prediction import PassPredictionService
+
+        # Celery 작업에서 학습한 결과를 캐시에서 조회 (O(1))
+        statistics = PassPredictionService.get_statistics(request.user.id)
         
         serializer = StatisticsSerializer(statistics, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    tags=['통계'],
+    summary='코호트 리포트 조회/생성',
+    description='전체 사용자 대상 코호트 리포트의 최신 스냅샷을 조회하거나 재집계를 요청합니다 (관리자 전용)'
+)
+class CohortReportView(APIView):
+    """코호트 리포트 API (관리자 전용)"""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        """최신 코호트 리포트 스냅샷 조회"""
+        report = CohortReport.objects.first()
+        if report is None:
+            return Response(
+                {'error': '생성된 코호트 리포트가 없습니다.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        serializer = CohortReportSerializer(report)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    def post(self, request):
+        """코호트 리포트 재집계 요청 (Celery 작업으로 처리)"""
+        from .tasks import build_cohort_report
+        result = build_cohort_report.delay()
+        return Response(
+            {'message': '코호트 리포트 집계를 요청했습니다.', 'task_id': result.id},
+            status=status.HTTP_202_ACCEPTED
+        )
+
+
+@extend_schema(
+    tags=['통계'],
+    summary='관리자 대시보드 사이트 지표',
+    description=(
+        '일별 가입자/활동 사용자 수, 실행 중인 타이머 수, 이번 주 시험 수를 조회합니다 (관리자 전용). '
+        '주기적으로 미리 집계한 값이므로 generated_at 시점 기준입니다'
+    ),
+    parameters=[SiteMetricsQuerySerializer],
+    responses=SiteMetricsSerializer,
+)
+class SiteMetricsView(APIView):
+    """관리자 대시보드 사이트 지표 API (관리자 전용)"""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        """미리 집계한 사이트 지표 조회"""
+        query = SiteMetricsQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        data = SiteMetricsService.get_dashboard(query.validated_data['days'])
+        if data is None:
+            return Response(
+                {'error': '아직 집계된 사이트 지표가 없습니다.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return Response(SiteMetricsSerializer(data).data, status=status.HTTP_200_OK)
+
+    def post(self, request):
+        """사이트 지표 재집계 요청 (Celery 작업으로 처리)"""
+        from .tasks import refresh_site_metrics
+        result = refresh_site_metrics.delay()
+        return Response(
+            {'message': '사이트 지표 집계를 요청했습니다.', 'task_id': result.id},
+            status=status.HTTP_202_ACCEPTED
+        )
@@ -0,0 +1,70 @@
+# Generated by Django 6.0.1 on 2026-10-19 15:10
+
+import sqlite3
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+# (테이블, 문서 컬럼, 인덱스/FTS 테이블 이름) - apps.search.services.SEARCH_SOURCES 와 같아야 함
+SOURCES = (
+    ('calendars_event', ('title', 'description'), 'search_event'),
+    ('study_studyevent', ('title', 'goal'), 'search_studyevent'),
+    ('study_studycontent', ('content',), 'search_studycontent'),
+)
+
+
+def get_document(columns, prefix=''):
+    """컬럼을 공백으로 이은 문서 식 (apps.search.services.get_document 와 같은 식)"""
+    return " || ' ' || ".join(f'{prefix}{column}' for column in columns)
+
+
+def create_search_indexes(apps, schema_editor):
+    """
+    PostgreSQL: lower(문서) 의 pg_trgm GIN 인덱스 (한국어 부분 일치 LIKE 를 인덱스로 처리)
+    SQLite: trigram 토크나이저 FTS5 테이블과 원본 테이블 트리거 (3.34 이상)
+    """
+    vendor = schema_editor.connection.vendor
+    for table, columns, name in SOURCES:
+        if vendor == 'postgresql':
+            schema_editor.execute(
+                f'CREATE INDEX IF NOT EXISTS {name}_trgm ON {table} '
+                f'USING gin (lower(({get_document(columns)})) gin_trgm_ops) WHERE deleted_at IS NULL'
+            )
+        elif vendor == 'sqlite' and sqlite3.sqlite_version_info >= (3, 34):
+            insert = f'INSERT INTO {name}_fts (rowid, document) VALUES (new.id, {get_document(columns, "new.")});'
+            schema_editor.execute(f"CREATE VIRTUAL TABLE {name}_fts USING fts5(document, tokenize='trigram')")
+            schema_editor.execute(f'INSERT INTO {name}_fts (rowid, document) SELECT id, {get_document(columns)} FROM {table}')
+            schema_editor.execute(f'CREATE TRIGGER {name}_fts_insert AFTER INSERT ON {table} BEGIN {insert} END')
+            schema_editor.execute(
+                f'CREATE TRIGGER {name}_fts_update AFTER UPDATE OF {", ".join(columns)} ON {table} '
+                f'BEGIN DELETE FROM {name}_fts WHERE rowid = old.id; {insert} END'
+            )
+            schema_editor.execute(
+                f'CREATE TRIGGER {name}_fts_delete AFTER DELETE ON {table} '
+                f'BEGIN DELETE FROM {name}_fts WHERE rowid = old.id; END'
+            )
+
+
+def drop_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for table, columns, name in SOURCES:
+        if vendor == 'postgresql':
+            schema_editor.execute(f'DROP INDEX IF EXISTS {name}_trgm')
+        elif vendor == 'sqlite':
+            for action in ('insert', 'update', 'delete'):
+                schema_editor.execute(f'DROP TRIGGER IF EXISTS {name}_fts_{action}')
+            schema_editor.execute(f'DROP TABLE IF EXISTS {name}_fts')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calendars', '0007_event_span_gist_index'),
+        ('study', '0006_studyevent_span_gist_index'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
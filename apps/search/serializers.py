@@ -0,0 +1,40 @@
+"""
+검색 관련 시리얼라이저
+"""
+from rest_framework import serializers
+
+from .services import SEARCH_KINDS
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    """검색 쿼리 파라미터"""
+    q = serializers.CharField(min_length=1, max_length=100, help_text="검색어 (부분 일치)")
+    types = serializers.CharField(
+        required=False,
+        help_text=f"검색할 종류 (쉼표로 구분, 기본: 전체): {', '.join(SEARCH_KINDS)}"
+    )
+    limit = serializers.IntegerField(default=20, min_value=1, max_value=50, help_text="페이지 크기")
+    cursor = serializers.CharField(required=False, help_text="이전 응답의 next (다음 페이지)")
+
+    def validate_types(self, value):
+        kinds = [kind.strip() for kind in value.split(',') if kind.strip()]
+        unknown = sorted(set(kinds) - set(SEARCH_KINDS))
+        if unknown:
+            raise serializers.ValidationError(f"알 수 없는 종류입니다: {', '.join(unknown)}")
+        return tuple(kinds) or SEARCH_KINDS
+
+
+class SearchResultSerializer(serializers.Serializer):
+    """검색 결과 항목"""
+    type = serializers.ChoiceField(choices=SEARCH_KINDS)
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    snippet = serializers.CharField(help_text="검색어 주변 미리보기")
+    start_at = serializers.DateTimeField(help_text="일정/스터디 시작 시간 (공부 내용은 스터디 시작 시간)")
+    rank = serializers.FloatField(help_text="관련도 (클수록 관련도가 높음)")
+
+
+class SearchResponseSerializer(serializers.Serializer):
+    """검색 결과 페이지"""
+    results = SearchResultSerializer(many=True)
+    next = serializers.CharField(allow_null=True, help_text="다음 페이지 커서 (없으면 null)")
@@ -0,0 +1,186 @@
+"""
+전체 텍스트 검색 (공부 내용, 스터디 목표/제목, 일정 제목/설명)
+
+- PostgreSQL: lower(문서) LIKE '%검색어%' 를 pg_trgm GIN 인덱스로 처리하고
+  word_similarity 로 순위를 매김 (한국어는 형태소 분석 없이도 부분 일치)
+- SQLite: trigram FTS5 테이블 MATCH 와 bm25 순위 (3글자 미만 검색어는 LIKE)
+- 인덱스/FTS 테이블은 DB 가 쓰기 시점에 갱신 (GIN 인덱스, SQLite 트리거)하므로
+  bulk_create 등 서비스 레이어를 거치지 않는 쓰기도 검색됨 (apps/search/migrations/0001)
+
+결과는 (순위 내림차순, 종류, ID 내림차순) 으로 정렬하고 마지막 결과의 키를 서명한 커서로
+다음 페이지를 조회합니다 (keyset, OFFSET 없음).
+"""
+from dataclasses import dataclass
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.core import signing
+from django.db import connection
+from django.db.models import F, FloatField, Func, Q, TextField, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Lower
+from rest_framework.exceptions import ValidationError
+
+from apps.calendars.models import Event
+from apps.study.models import StudyContent, StudyEvent
+
+
+CURSOR_SALT = 'apps.search.cursor'
+
+# FTS5 trigram 토크나이저가 MATCH 할 수 있는 최소 검색어 길이
+FTS_MIN_QUERY_LENGTH = 3
+
+# 결과 미리보기 길이 (검색어 앞뒤 글자 수)
+SNIPPET_RADIUS = 40
+
+
+@dataclass(frozen=True)
+class SearchSource:
+    """검색 대상 모델"""
+    kind: str
+    model: object
+    # 문서로 이어 붙일 컬럼 (마이그레이션의 인덱스 식과 같은 순서)
+    columns: tuple
+    fts_table: str
+    user_lookup: str
+    title_field: str
+    text_field: str
+    date_field: str
+
+
+SEARCH_SOURCES = (
+    SearchSource('event', Event, ('title', 'description'), 'search_event_fts',
+                 'user', 'title', 'description', 'start_at'),
+    SearchSource('study_content', StudyContent, ('content',), 'search_studycontent_fts',
+                 'study_event__user', 'study_event__title', 'content', 'study_event__start_at'),
+    SearchSource('study_event', StudyEvent, ('title', 'goal'), 'search_studyevent_fts',
+                 'user', 'title', 'goal', 'start_at'),
+)
+
+SEARCH_KINDS = tuple(source.kind for source in SEARCH_SOURCES)
+
+
+def get_document(columns):
+    """인덱스와 같은 문서 식 (title || ' ' || description)"""
+    if len(columns) == 1:
+        return F(columns[0])
+    return Func(
+        *[F(column) for column in columns],
+        template='(%(expressions)s)', arg_joiner=" || ' ' || ", output_field=TextField(),
+    )
+
+
+def get_snippet(text, query):
+    """검색어 주변 미리보기"""
+    text = ' '.join(text.split())
+    position = text.lower().find(query.lower())
+    if position < 0:
+        return text[:SNIPPET_RADIUS * 2]
+    start = max(position - SNIPPET_RADIUS, 0)
+    end = position + len(query) + SNIPPET_RADIUS
+    return ('…' if start else '') + text[start:end] + ('…' if end < len(text) else '')
+
+
+class SearchCursor:
+    """keyset 커서 (순위, 종류, ID) 서명/해석"""
+
+    @staticmethod
+    def dumps(item):
+        return signing.dumps([item['rank'], item['type'], item['id']], salt=CURSOR_SALT)
+
+    @staticmethod
+    def loads(cursor):
+        """
+        :raises: ValidationError (변조되었거나 형식이 잘못된 커서)
+        """
+        try:
+            rank, kind, pk = signing.loads(cursor, salt=CURSOR_SALT)
+            return float(rank), str(kind), int(pk)
+        except (signing.BadSignature, TypeError, ValueError):
+            raise ValidationError({'cursor': '유효하지 않은 커서입니다.'})
+
+
+class SearchService:
+    """검색 서비스"""
+
+    @staticmethod
+    def search(user, query, kinds=SEARCH_KINDS, limit=20, cursor=None):
+        """
+        사용자 데이터 검색
+
+        :param user: 사용자
+        :param query: 검색어
+        :param kinds: 검색할 종류 (SEARCH_KINDS 중)
+        :param limit: 페이지 크기
+        :param cursor: 이전 페이지의 next 커서
+        :return: {'results': [...], 'next': 다음 페이지 커서 또는 None}
+        """
+        query = ' '.join(query.split())
+        after = SearchCursor.loads(cursor) if cursor else None
+
+        # SQLite 는 trigram FTS5 테이블이 있을 때만 사용 (3.34 미만은 마이그레이션에서 만들지 않음)
+        fts_tables = set(connection.introspection.table_names()) if connection.vendor == 'sqlite' else set()
+        items = []
+        for source in SEARCH_SOURCES:
+            if source.kind in kinds:
+                items.extend(SearchService._search_source(source, user, query, after, limit + 1, fts_tables))
+        items.sort(key=lambda item: (-item['rank'], item['type'], -item['id']))
+
+        page = items[:limit]
+        return {
+            'results': page,
+            'next': SearchCursor.dumps(page[-1]) if len(items) > limit else None,
+        }
+
+    @staticmethod
+    def _search_source(source, user, query, after, limit, fts_tables):
+        """한 모델에서 커서 이후 limit 개 검색"""
+        queryset = source.model.objects.filter(**{source.user_lookup: user})
+        table = source.model._meta.db_table
+        if connection.vendor == 'postgresql':
+            queryset = queryset.annotate(
+                document=Lower(get_document(source.columns)),
+                rank=TrigramWordSimilarity(query.lower(), 'document'),
+            ).filter(document__contains=query.lower())
+        elif source.fts_table in fts_tables and len(query) >= FTS_MIN_QUERY_LENGTH:
+            # bm25 는 작을수록 관련도가 높으므로 부호를 바꿈
+            phrase = '"' + query.replace('"', '""') + '"'
+            fts = source.fts_table
+            queryset = queryset.annotate(
+                rank=RawSQL(
+                    f'SELECT -bm25({fts}) FROM {fts} WHERE {fts} MATCH %s AND {fts}.rowid = {table}.id',
+                    [phrase], output_field=FloatField(),
+                ),
+            ).filter(id__in=RawSQL(f'SELECT rowid FROM {fts} WHERE {fts} MATCH %s', [phrase]))
+        else:
+            queryset = queryset.annotate(
+                document=Lower(get_document(source.columns)),
+                rank=Value(0.0, output_field=FloatField()),
+            ).filter(document__contains=query.lower())
+
+        if after is not None:
+            queryset = queryset.filter(SearchService._after_filter(source.kind, after))
+        rows = queryset.order_by('-rank', '-id').values(
+            'id', 'rank', source.title_field, source.text_field, source.date_field
+        )[:limit]
+        return [
+            {
+                'type': source.kind,
+                'id': row['id'],
+                'title': row[source.title_field],
+                'snippet': get_snippet(row[source.text_field] or row[source.title_field], query),
+                'start_at': row[source.date_field],
+                'rank': row['rank'],
+            }
+            for row in rows
+        ]
+
+    @staticmethod
+    def _after_filter(kind, after):
+        """(순위 내림차순, 종류, ID 내림차순) 에서 커서 다음 행 조건"""
+        rank, after_kind, after_id = after
+        condition = Q(rank__lt=rank)
+        if kind > after_kind:
+            condition |= Q(rank=rank)
+        elif kind == after_kind:
+            condition |= Q(rank=rank, id__lt=after_id)
+        return condition
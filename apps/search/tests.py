@@ -0,0 +1,65 @@
+"""
+검색 앱 테스트
+"""
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.calendars.models import Event
+from apps.study.models import StudyContent, StudyEvent
+from apps.users.models import CustomUser
+
+
+ROWS = 3
+
+
+@pytest.fixture
+def user(db):
+    user = CustomUser.objects.create_user('search@example.com', 'password123!', nickname='search')
+    now = timezone.now()
+    for i in range(ROWS):
+        Event.objects.create(user=user, title=f'일정 {i}', start_at=now, end_at=now + timedelta(hours=1))
+        study_event = StudyEvent.objects.create(
+            user=user, title=f'스터디 {i}', goal='목표', start_at=now, end_at=now + timedelta(hours=1)
+        )
+        StudyContent.objects.create(study_event=study_event, content='내용', duration_minutes=30)
+    return user
+
+
+@pytest.fixture
+def api_client(user):
+    client = APIClient()
+    client.force_authenticate(user)
+    return client
+
+
+def test_search(api_client):
+    # 3글자 이상 (SQLite 는 FTS5 MATCH)
+    response = api_client.get('/api/search/', {'q': '스터디', 'types': 'study_event'})
+    assert response.status_code == 200
+    assert len(response.json()['results']) == ROWS
+
+    # keyset 페이지를 끝까지 따라가도 중복/누락 없음 (2글자 검색어는 부분 일치)
+    seen, cursor = [], None
+    while True:
+        params = {'q': '일정', 'limit': 2, **({'cursor': cursor} if cursor else {})}
+        page = api_client.get('/api/search/', params).json()
+        seen.extend((item['type'], item['id']) for item in page['results'])
+        cursor = page['next']
+        if not cursor:
+            break
+    assert len(seen) == len(set(seen)) == ROWS
+
+    assert api_client.get('/api/search/', {'q': '일정', 'cursor': 'invalid'}).status_code == 400
+    assert api_client.get('/api/search/', {'q': '일정', 'types': 'unknown'}).status_code == 400
+
+
+def test_search_only_own_rows(user, api_client):
+    other = CustomUser.objects.create_user('other@example.com', 'password123!', nickname='other')
+    now = timezone.now()
+    Event.objects.create(user=other, title='다른 사람 일정', start_at=now, end_at=now)
+
+    results = api_client.get('/api/search/', {'q': '일정'}).json()['results']
+    assert len(results) == ROWS
@@ -0,0 +1,12 @@
+"""
+검색 관련 URL 라우팅
+"""
+from django.urls import path
+from . import views
+
+app_name = 'search'
+
+urlpatterns = [
+    # 전체 검색 (GET /api/search/?q=<검색어>&cursor=<next>)
+    path('', views.SearchView.as_view(), name='search'),
+]
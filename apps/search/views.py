@@ -0,0 +1,39 @@
+"""
+검색 관련 API 뷰
+"""
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from drf_spectacular.utils import extend_schema
+
+from .serializers import SearchQuerySerializer, SearchResponseSerializer
+from .services import SEARCH_KINDS, SearchService
+
+
+@extend_schema(
+    tags=['검색'],
+    summary='전체 검색',
+    description=(
+        '일정 제목/설명, 스터디 제목/목표, 공부 내용에서 검색어를 부분 일치로 찾아 관련도 순으로 조회합니다. '
+        '응답의 next 를 cursor 로 넘기면 다음 페이지를 조회합니다'
+    ),
+    parameters=[SearchQuerySerializer],
+    responses=SearchResponseSerializer,
+)
+class SearchView(APIView):
+    """전체 검색 API"""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """검색어로 사용자 데이터 검색"""
+        query = SearchQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        data = SearchService.search(
+            request.user,
+            query.validated_data['q'],
+            kinds=query.validated_data.get('types', SEARCH_KINDS),
+            limit=query.validated_data['limit'],
+            cursor=query.validated_data.get('cursor'),
+        )
+        return Response(SearchResponseSerializer(data).data, status=status.HTTP_200_OK)
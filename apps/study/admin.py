@@ -2,26 +2,37 @@
 스터디 관리자 설정
 """
 from django.contrib import admin
+
+from core.admin import LargeTableAdmin
+
 from .models import StudyEvent, StudyTimer, StudyContent
 
 
 @admin.register(StudyEvent)
-class StudyEventAdmin(admin.ModelAdmin):
+class StudyEventAdmin(LargeTableAdmin):
     list_display = ('title', 'user', 'start_at', 'end_at', 'created_at')
-    list_filter = ('created_at', 'start_at')
-    search_fields = ('title', 'user__username', 'goal')
-    date_hierarchy = 'start_at'
+    # 인덱스가 있는 필드로만 필터 (date_hierarchy 는 전체 테이블의 날짜를 집계하므로 사용하지 않음)
+    list_filter = ('start_at',)
+    search_fields = ('title', 'user__email', 'goal')
+    list_select_related = ('user',)
+    raw_id_fields = ('user',)
 
 
 @admin.register(StudyTimer)
-class StudyTimerAdmin(admin.ModelAdmin):
-    list_display = ('study_event', 'started_at', 'ended_at', 'total_minutes', 'is_running', 'created_at')
+class StudyTimerAdmin(LargeTableAdmin):
+    list_display = (
+        'study_event', 'started_at', 'ended_at', 'total_minutes', 'is_running', 'needs_review', 'created_at'
+    )
     list_filter = ('is_running', 'created_at')
-    search_fields = ('study_event__title', 'study_event__user__username')
+    search_fields = ('study_event__title', 'study_event__user__email')
+    list_select_related = ('study_event__user',)
+    raw_id_fields = ('study_event',)
 
 
 @admin.register(StudyContent)
-class StudyContentAdmin(admin.ModelAdmin):
+class StudyContentAdmin(LargeTableAdmin):
     list_display = ('study_event', 'content', 'duration_minutes', 'created_at')
     list_filter = ('created_at',)
-    search_fields = ('content', 'study_event__title', 'study_event__user__username')
+    search_fields = ('content', 'study_event__title', 'study_event__user__email')
+    list_select_related = ('study_event__user',)
+    raw_id_fields = ('study_event',)
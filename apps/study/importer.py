@@ -0,0 +1,289 @@
+"""
+과거 공부 기록 CSV 대량 가져오기
+
+기관 이전 시 받는 여러 해 분량의 공부 기록을 행마다 StudyContentService.create_study_content
+(행마다 스터디 일정 조회 + INSERT) 를 거치지 않고 집합 단위로 가져옵니다.
+
+1. CSV 를 스트리밍으로 읽으며 행 형식을 검사하고, 올바른 행은 임시 스테이징 테이블에 적재
+   (PostgreSQL: psycopg3 COPY FROM STDIN, 그 외 DB: executemany), 잘못된 행은 거부 파일에 기록
+2. 사용자(이메일), 과목, 스터디 일정(사용자 + 제목 + 시작 시간) 외래 키를 조인으로 한 번에 해석
+   (없는 사용자 행은 거부, 없는 스터디 일정은 한 번의 INSERT ... SELECT 로 생성)
+3. 공부 내용을 INSERT ... SELECT 로 한 번에 병합하고 사용자별 데이터 버전 증가
+
+전체가 한 트랜잭션이므로 도중에 실패하면 아무 것도 반영되지 않습니다.
+
+CSV 열 (첫 줄은 헤더)
+    email, title, subject, start_at, end_at, content, duration_minutes
+    start_at / end_at 은 ISO 8601 (시간대가 없으면 TIME_ZONE 기준)
+"""
+import csv
+import time
+from dataclasses import dataclass, field
+
+from django.contrib.auth.base_user import BaseUserManager
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from core.versioning import DataVersionService
+from apps.users.models import CustomUser
+from .models import StudyContent, StudyEvent, Subject
+
+
+CSV_COLUMNS = ('email', 'title', 'subject', 'start_at', 'end_at', 'content', 'duration_minutes')
+REJECT_COLUMNS = ('line', 'error') + CSV_COLUMNS
+
+STAGING_TABLE = 'study_import_staging'
+SUBJECT_TABLE = 'study_import_subject'
+
+# executemany 경로의 배치 크기
+INSERT_BATCH_SIZE = 2000
+
+MAX_DURATION_MINUTES = 24 * 60
+
+
+class ImportRowError(ValueError):
+    """행 형식 오류 (거부 파일에 사유로 기록)"""
+
+
+@dataclass
+class ImportResult:
+    rows_read: int = 0
+    rows_loaded: int = 0
+    rows_rejected: int = 0
+    study_events_created: int = 0
+    users: int = 0
+    elapsed: float = 0.0
+    rejects: dict = field(default_factory=dict)
+
+    @property
+    def rows_per_second(self):
+        return self.rows_read / self.elapsed if self.elapsed else 0.0
+
+
+def _parse_datetime(value, name):
+    parsed = parse_datetime(value or '')
+    if parsed is None:
+        raise ImportRowError(f'{name} 형식 오류')
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def parse_row(row):
+    """
+    CSV 행 검사/변환
+
+    :return: (email, title, subject, start_at, end_at, content, duration_minutes)
+    :raises: ImportRowError
+    """
+    email = BaseUserManager.normalize_email((row.get('email') or '').strip())
+    title = (row.get('title') or '').strip()
+    subject = (row.get('subject') or '').strip()
+    content = row.get('content') or ''
+    if not email:
+        raise ImportRowError('email 없음')
+    if not title or len(title) > StudyEvent._meta.get_field('title').max_length:
+        raise ImportRowError('title 이 없거나 너무 김')
+    if not subject or len(subject) > Subject._meta.get_field('name').max_length:
+        raise ImportRowError('subject 가 없거나 너무 김')
+    if not content.strip():
+        raise ImportRowError('content 없음')
+
+    start_at = _parse_datetime(row.get('start_at'), 'start_at')
+    end_at = _parse_datetime(row.get('end_at'), 'end_at')
+    if end_at < start_at:
+        raise ImportRowError('end_at 이 start_at 보다 이전')
+    try:
+        duration = int(row.get('duration_minutes') or '')
+    except ValueError:
+        raise ImportRowError('duration_minutes 형식 오류')
+    if not 0 <= duration <= MAX_DURATION_MINUTES:
+        raise ImportRowError('duration_minutes 범위 오류')
+    return email, title, subject, start_at, end_at, content, duration
+
+
+class StudyLogImportService:
+    """공부 기록 CSV 대량 가져오기 서비스"""
+
+    @staticmethod
+    def _create_staging(cursor):
+        cursor.execute(f'DROP TABLE IF EXISTS {STAGING_TABLE}')
+        cursor.execute(f'DROP TABLE IF EXISTS {SUBJECT_TABLE}')
+        cursor.execute(
+            f'CREATE TEMPORARY TABLE {STAGING_TABLE} ('
+            'line_no integer NOT NULL, email varchar(254) NOT NULL, title varchar(200) NOT NULL, '
+            'subject varchar(200) NOT NULL, start_at timestamp with time zone NOT NULL, '
+            'end_at timestamp with time zone NOT NULL, content text NOT NULL, duration_minutes integer NOT NULL, '
+            'user_id bigint NULL, subject_id bigint NULL, study_event_id bigint NULL)'
+        )
+        cursor.execute(f'CREATE TEMPORARY TABLE {SUBJECT_TABLE} (name varchar(200) NOT NULL, subject_id bigint NOT NULL)')
+
+    @staticmethod
+    def _drop_staging(cursor):
+        cursor.execute(f'DROP TABLE IF EXISTS {STAGING_TABLE}')
+        cursor.execute(f'DROP TABLE IF EXISTS {SUBJECT_TABLE}')
+
+    @staticmethod
+    def _iter_valid_rows(reader, result, reject_writer):
+        """형식이 올바른 행 (줄 번호 포함), 잘못된 행은 거부 파일에 기록"""
+        for row in reader:
+            result.rows_read += 1
+            line_no = reader.line_num
+            try:
+                yield (line_no,) + parse_row(row)
+            except ImportRowError as error:
+                StudyLogImportService._reject(result, reject_writer, line_no, str(error), row)
+
+    @staticmethod
+    def _reject(result, reject_writer, line_no, reason, row):
+        result.rows_rejected += 1
+        result.rejects[reason] = result.rejects.get(reason, 0) + 1
+        if reject_writer is not None:
+            reject_writer.writerow({'line': line_no, 'error': reason, **{
+                column: row.get(column, '') for column in CSV_COLUMNS
+            }})
+
+    @staticmethod
+    def _load_staging(cursor, rows):
+        columns = 'line_no, email, title, subject, start_at, end_at, content, duration_minutes'
+        if connection.vendor == 'postgresql':
+            with cursor.cursor.copy(f'COPY {STAGING_TABLE} ({columns}) FROM STDIN') as copy:
+                for row in rows:
+                    copy.write_row(row)
+            return
+
+        adapt = connection.ops.adapt_datetimefield_value
+        sql = f'INSERT INTO {STAGING_TABLE} ({columns}) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)'
+        batch = []
+        for row in rows:
+            batch.append(row[:4] + (adapt(row[4]), adapt(row[5])) + row[6:])
+            if len(batch) >= INSERT_BATCH_SIZE:
+                cursor.executemany(sql, batch)
+                batch = []
+        if batch:
+            cursor.executemany(sql, batch)
+
+    @staticmethod
+    def _resolve_users(cursor, result, reject_writer):
+        """이메일로 사용자 id 를 채우고, 없거나 비활성인 사용자의 행은 거부"""
+        users = connection.ops.quote_name(CustomUser._meta.db_table)
+        cursor.execute(
+            f'UPDATE {STAGING_TABLE} AS s SET user_id = u.id FROM {users} u '
+            f'WHERE u.email = s.email AND u.is_active'
+        )
+        cursor.execute(
+            f'SELECT line_no, email, title, subject, start_at, end_at, content, duration_minutes '
+            f'FROM {STAGING_TABLE} WHERE user_id IS NULL ORDER BY line_no'
+        )
+        for values in cursor.fetchall():
+            row = dict(zip(CSV_COLUMNS, (str(value) for value in values[1:])))
+            StudyLogImportService._reject(result, reject_writer, values[0], '사용자 없음', row)
+        cursor.execute(f'DELETE FROM {STAGING_TABLE} WHERE user_id IS NULL')
+        # 스터디 일정 매칭 조인용 (기존 일정 쪽에는 (user, title, start_at) 인덱스가 없음)
+        cursor.execute(f'CREATE INDEX {STAGING_TABLE}_event_key ON {STAGING_TABLE} (user_id, title, start_at)')
+
+    @staticmethod
+    def _resolve_subjects(cursor):
+        """과목명 -> 표준 과목 id (과목 수만큼만 조회/생성)"""
+        cursor.execute(f'SELECT DISTINCT subject FROM {STAGING_TABLE}')
+        mapping = [(name, Subject.objects.resolve_id(name)) for (name,) in cursor.fetchall()]
+        if not mapping:
+            return
+        cursor.executemany(f'INSERT INTO {SUBJECT_TABLE} (name, subject_id) VALUES (%s, %s)', mapping)
+        cursor.execute(
+            f'UPDATE {STAGING_TABLE} AS s SET subject_id = m.subject_id FROM {SUBJECT_TABLE} m '
+            f'WHERE m.name = s.subject'
+        )
+
+    @staticmethod
+    def _match_study_events(cursor):
+        events = connection.ops.quote_name(StudyEvent._meta.db_table)
+        cursor.execute(
+            f'UPDATE {STAGING_TABLE} AS s SET study_event_id = e.id FROM {events} e '
+            f'WHERE s.study_event_id IS NULL AND e.user_id = s.user_id AND e.title = s.title '
+            f'AND e.start_at = s.start_at AND e.deleted_at IS NULL'
+        )
+
+    @staticmethod
+    def _resolve_study_events(cursor, now):
+        """(사용자, 제목, 시작 시간) 으로 기존 스터디 일정을 찾고 없으면 한 번에 생성, 생성 수 반환"""
+        StudyLogImportService._match_study_events(cursor)
+        events = connection.ops.quote_name(StudyEvent._meta.db_table)
+        cursor.execute(
+            f'INSERT INTO {events} (user_id, title, canonical_subject_id, goal, start_at, end_at, '
+            f'created_at, updated_at, deleted_at) '
+            f"SELECT user_id, title, MIN(subject_id), '', start_at, MAX(end_at), %s, %s, NULL "
+            f'FROM {STAGING_TABLE} WHERE study_event_id IS NULL GROUP BY user_id, title, start_at',
+            [now, now],
+        )
+        created = cursor.rowcount
+        if created:
+            StudyLogImportService._match_study_events(cursor)
+        return created
+
+    @staticmethod
+    def _merge_contents(cursor, now):
+        contents = connection.ops.quote_name(StudyContent._meta.db_table)
+        cursor.execute(
+            f'INSERT INTO {contents} (study_event_id, content, duration_minutes, created_at, updated_at, deleted_at) '
+            f'SELECT study_event_id, content, duration_minutes, %s, %s, NULL '
+            f'FROM {STAGING_TABLE} ORDER BY line_no',
+            [now, now],
+        )
+        return cursor.rowcount
+
+    @staticmethod
+    def import_csv(file, reject_file=None, dry_run=False):
+        """
+        공부 기록 CSV 가져오기
+
+        :param file: 텍스트 모드 파일 객체 (헤더 포함 CSV)
+        :param reject_file: 거부 행을 기록할 텍스트 모드 파일 객체 (없으면 개수만 집계)
+        :param dry_run: True 면 검사/해석까지만 하고 롤백
+        :return: ImportResult
+        :raises: ValueError (필수 열이 없는 경우)
+        """
+        started = time.perf_counter()
+        result = ImportResult()
+        reader = csv.DictReader(file)
+        missing = set(CSV_COLUMNS) - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f'CSV 에 필요한 열이 없습니다: {", ".join(sorted(missing))}')
+
+        reject_writer = None
+        if reject_file is not None:
+            reject_writer = csv.DictWriter(reject_file, fieldnames=REJECT_COLUMNS)
+            reject_writer.writeheader()
+
+        now = timezone.now()
+        try:
+            # 실패하면 임시 테이블 생성까지 함께 롤백됨
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    StudyLogImportService._create_staging(cursor)
+                    rows = StudyLogImportService._iter_valid_rows(reader, result, reject_writer)
+                    StudyLogImportService._load_staging(cursor, rows)
+                    StudyLogImportService._resolve_users(cursor, result, reject_writer)
+                    StudyLogImportService._resolve_subjects(cursor)
+                    result.study_events_created = StudyLogImportService._resolve_study_events(cursor, now)
+                    result.rows_loaded = StudyLogImportService._merge_contents(cursor, now)
+
+                    cursor.execute(f'SELECT DISTINCT user_id FROM {STAGING_TABLE}')
+                    user_ids = [user_id for (user_id,) in cursor.fetchall()]
+                    StudyLogImportService._drop_staging(cursor)
+
+                result.users = len(user_ids)
+                if dry_run:
+                    raise _DryRun()
+                for user_id in user_ids:
+                    DataVersionService.bump(user_id)
+        except _DryRun:
+            # 롤백된 과목 id 는 커밋 후에만 캐시되므로 프로세스 캐시에 남지 않음
+            pass
+        result.elapsed = time.perf_counter() - started
+        return result
+
+
+class _DryRun(Exception):
+    """dry_run 롤백용"""
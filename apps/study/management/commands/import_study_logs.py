@@ -0,0 +1,59 @@
+"""
+과거 공부 기록 CSV 대량 가져오기
+
+CSV 를 스테이징 테이블에 적재(PostgreSQL 은 COPY)하고 사용자/스터디 일정을 집합 단위로 해석하여
+한 트랜잭션으로 공부 내용에 병합합니다 (apps.study.importer).
+
+사용 예시:
+    python manage.py import_study_logs logs-2019.csv logs-2020.csv --rejects rejects/
+    python manage.py import_study_logs logs.csv --dry-run
+"""
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.study.importer import StudyLogImportService
+
+
+class Command(BaseCommand):
+    help = '공부 기록 CSV 를 COPY/집합 연산으로 대량 가져오기 (거부 행은 별도 파일에 기록)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('files', nargs='+', help='CSV 파일 (email,title,subject,start_at,end_at,content,duration_minutes)')
+        parser.add_argument('--rejects', help='거부 행 파일(<파일명>.rejects.csv)을 저장할 디렉터리 (기본: CSV 와 같은 위치)')
+        parser.add_argument('--encoding', default='utf-8-sig', help='CSV 인코딩')
+        parser.add_argument('--dry-run', action='store_true', help='검사만 하고 롤백')
+
+    def handle(self, *args, **options):
+        reject_dir = Path(options['rejects']) if options['rejects'] else None
+        if reject_dir is not None:
+            reject_dir.mkdir(parents=True, exist_ok=True)
+
+        failed = False
+        for name in options['files']:
+            path = Path(name)
+            reject_path = (reject_dir or path.parent) / f'{path.stem}.rejects.csv'
+            try:
+                with open(path, newline='', encoding=options['encoding']) as file, \
+                        open(reject_path, 'w', newline='', encoding='utf-8') as reject_file:
+                    result = StudyLogImportService.import_csv(file, reject_file, dry_run=options['dry_run'])
+            except (OSError, ValueError) as error:
+                self.stderr.write(self.style.ERROR(f'{path}: {error}'))
+                failed = True
+                continue
+
+            if not result.rows_rejected:
+                reject_path.unlink(missing_ok=True)
+            self.stdout.write(
+                f'{path}: {result.rows_read:,} 행 중 {result.rows_loaded:,} 행 가져옴, '
+                f'{result.rows_rejected:,} 행 거부, 스터디 일정 {result.study_events_created:,}개 생성, '
+                f'사용자 {result.users:,}명 ({result.elapsed:.2f}초, {result.rows_per_second:,.0f} rows/sec)'
+                + (' [dry-run]' if options['dry_run'] else '')
+            )
+            for reason, count in sorted(result.rejects.items(), key=lambda item: -item[1]):
+                self.stdout.write(f'  거부 {count:>8,}  {reason}')
+            if result.rows_rejected:
+                self.stdout.write(f'  거부 행: {reject_path}')
+
+        if failed:
+            raise CommandError('일부 파일을 가져오지 못했습니다.')
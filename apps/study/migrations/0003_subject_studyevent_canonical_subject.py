@@ -0,0 +1,60 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:45
+
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def normalize_subject_name(name):
+    """apps.study.models.normalize_subject_name 과 동일 (마이그레이션 시점 고정본)"""
+    return ''.join(unicodedata.normalize('NFKC', name or '').casefold().split())
+
+
+def backfill_study_event_subjects(apps, schema_editor):
+    """기존 스터디 이벤트의 title 로 정규화된 과목 지정"""
+    Subject = apps.get_model('study', 'Subject')
+    StudyEvent = apps.get_model('study', 'StudyEvent')
+    subject_ids = {}
+    names = StudyEvent.objects.order_by().values_list('title', flat=True).distinct()
+    for name in names:
+        key = normalize_subject_name(name)
+        if not key:
+            continue
+        if key not in subject_ids:
+            subject, _ = Subject.objects.get_or_create(
+                normalized_name=key[:200],
+                defaults={'name': ' '.join(name.split())[:200]},
+            )
+            subject_ids[key] = subject.id
+        StudyEvent.objects.filter(title=name).update(canonical_subject_id=subject_ids[key])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('study', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Subject',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='과목명 (처음 입력된 표기)', max_length=200)),
+                ('normalized_name', models.CharField(help_text='정규화된 과목명 (조회 키)', max_length=200, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='생성 시간')),
+            ],
+            options={
+                'verbose_name': '과목',
+                'verbose_name_plural': '과목들',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='studyevent',
+            name='canonical_subject',
+            field=models.ForeignKey(blank=True, help_text='정규화된 과목 (제목으로부터 자동 지정)', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='study_events', to='study.subject'),
+        ),
+        migrations.RunPython(backfill_study_event_subjects, migrations.RunPython.noop),
+    ]
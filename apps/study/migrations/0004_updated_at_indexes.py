@@ -0,0 +1,27 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('study', '0003_subject_studyevent_canonical_subject'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='studycontent',
+            index=models.Index(fields=['updated_at'], name='study_content_updated'),
+        ),
+        migrations.AddIndex(
+            model_name='studyevent',
+            index=models.Index(fields=['user', 'updated_at'], name='study_event_user_updated'),
+        ),
+        migrations.AddIndex(
+            model_name='studytimer',
+            index=models.Index(fields=['updated_at'], name='study_timer_updated'),
+        ),
+    ]
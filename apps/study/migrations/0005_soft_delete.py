@@ -0,0 +1,28 @@
+# Generated by Django 6.0.1 on 2026-10-19 13:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('study', '0004_updated_at_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studycontent',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, db_index=True, help_text='삭제 시간 (소프트 삭제)', null=True),
+        ),
+        migrations.AddField(
+            model_name='studyevent',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, db_index=True, help_text='삭제 시간 (소프트 삭제)', null=True),
+        ),
+        migrations.AddField(
+            model_name='studytimer',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, db_index=True, help_text='삭제 시간 (소프트 삭제)', null=True),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 6.0.1 on 2026-10-19 13:40
+
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations
+
+
+# apps.calendars.conflicts.get_span 과 같은 식이어야 겹침 조회(&&)에서 인덱스를 사용함
+INDEX_SQL = (
+    'CREATE INDEX IF NOT EXISTS study_studyevent_user_span_gist ON study_studyevent '
+    'USING gist (user_id, tstzrange(LEAST(start_at, end_at), GREATEST(start_at, end_at))) '
+    'WHERE deleted_at IS NULL'
+)
+
+
+def create_span_index(apps, schema_editor):
+    """PostgreSQL 에서만 (user_id, tstzrange) GiST 인덱스 생성 (다른 DB 는 메모리 구간 트리 사용)"""
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(INDEX_SQL)
+
+
+def drop_span_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS study_studyevent_user_span_gist')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('study', '0005_soft_delete'),
+    ]
+
+    operations = [
+        # user_id(정수) 를 GiST 인덱스에 함께 넣기 위한 확장 (PostgreSQL 외에는 아무것도 하지 않음)
+        BtreeGistExtension(),
+        migrations.RunPython(create_span_index, drop_span_index),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 6.0.1 on 2026-10-19 13:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('study', '0006_studyevent_span_gist_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='studycontent',
+            index=models.Index(fields=['created_at'], name='study_content_created'),
+        ),
+        migrations.AddIndex(
+            model_name='studyevent',
+            index=models.Index(fields=['start_at'], name='study_event_start_at'),
+        ),
+        migrations.AddIndex(
+            model_name='studytimer',
+            index=models.Index(fields=['created_at'], name='study_timer_created'),
+        ),
+    ]
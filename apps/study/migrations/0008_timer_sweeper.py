@@ -0,0 +1,27 @@
+# Generated by Django 6.0.1 on 2026-10-19 13:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('study', '0007_admin_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studytimer',
+            name='auto_closed',
+            field=models.BooleanField(default=False, help_text='오래 실행된 타이머를 정리 작업이 자동으로 종료했는지 여부'),
+        ),
+        migrations.AddField(
+            model_name='studytimer',
+            name='needs_review',
+            field=models.BooleanField(default=False, help_text='사용자 확인 필요 여부 (자동 종료되었거나 최대 시간을 넘겨 공부 시간을 제한한 타이머)'),
+        ),
+        migrations.AddIndex(
+            model_name='studytimer',
+            index=models.Index(fields=['is_running', 'started_at'], name='study_timer_running_started'),
+        ),
+    ]
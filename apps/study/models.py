@@ -1,17 +1,120 @@
 """
 스터디 이벤트, 타이머, 공부 내용 관련 모델
 """
-from django.db import models
+import threading
+import unicodedata
+from collections import OrderedDict
+
+from django.db import models, IntegrityError, router, transaction
 from django.conf import settings
 from django.utils import timezone
 
+from core.softdelete import SoftDeleteModel
+
+
+def normalize_subject_name(name):
+    """
+    과목명 정규화 키 생성
+    
+    - 유니코드 NFKC 정규화 (전각/반각 등 통일)
+    - 대소문자 통일 (casefold)
+    - 공백 제거 ("Math " / "math" / "수학 1" / "수학1" 을 같은 과목으로 취급)
+    """
+    return ''.join(unicodedata.normalize('NFKC', name or '').casefold().split())
+
+
+class SubjectManager(models.Manager):
+    """
+    과목 조회/생성 매니저
+    
+    정규화 키 → Subject ID 를 프로세스 메모리(LRU)에 캐시하여
+    쓰기 시점의 과목 해석이 대부분 쿼리 없이 끝나도록 함
+    (트랜잭션 안에서 조회/생성한 ID 는 커밋된 뒤에만 캐시하므로 롤백된 ID 가 남지 않음)
+    """
+    cache_size = 10000
+    _cache = OrderedDict()
+    _lock = threading.Lock()
+    
+    def resolve_id(self, name):
+        """
+        과목명을 Subject ID 로 변환 (없으면 생성)
+        
+        :param name: 입력된 과목명 (자유 텍스트)
+        :return: Subject ID (빈 문자열이면 None)
+        """
+        key = normalize_subject_name(name)
+        if not key:
+            return None
+        
+        with self._lock:
+            subject_id = self._cache.get(key)
+            if subject_id is not None:
+                self._cache.move_to_end(key)
+                return subject_id
+        
+        subject_id = self._get_or_create_id(key, ' '.join(name.split()))
+        # 트랜잭션 밖이면 바로, 안이면 커밋 후 캐시 (롤백되면 캐시하지 않음)
+        transaction.on_commit(
+            lambda: self._remember(key, subject_id), using=router.db_for_write(self.model)
+        )
+        return subject_id
+    
+    def _remember(self, key, subject_id):
+        with self._lock:
+            self._cache[key] = subject_id
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
+    def _get_or_create_id(self, key, display_name):
+        """정규화 키로 Subject 조회, 없으면 생성 (동시 생성 경합 처리)"""
+        subject_id = self.filter(normalized_name=key).values_list('id', flat=True).first()
+        if subject_id is not None:
+            return subject_id
+        try:
+            with transaction.atomic():
+                return self.create(name=display_name[:200], normalized_name=key[:200]).id
+        except IntegrityError:
+            return self.get(normalized_name=key).id
+    
+    @classmethod
+    def clear_cache(cls):
+        """프로세스 캐시 초기화 (과목 행을 직접 수정/삭제한 뒤 등)"""
+        with cls._lock:
+            cls._cache.clear()
+
 
-class StudyEvent(models.Model):
+class Subject(models.Model):
+    """
+    과목 모델
+    
+    스터디 이벤트와 시험이 공통으로 참조하는 과목 차원 테이블
+    통계는 자유 텍스트 대신 이 테이블의 정수 키로 그룹화
+    """
+    name = models.CharField(max_length=200, help_text="과목명 (처음 입력된 표기)")
+    normalized_name = models.CharField(max_length=200, unique=True, help_text="정규화된 과목명 (조회 키)")
+    created_at = models.DateTimeField(auto_now_add=True, help_text="생성 시간")
+    
+    objects = SubjectManager()
+    
+    class Meta:
+        verbose_name = '과목'
+        verbose_name_plural = '과목들'
+        ordering = ['name']
+    
+    def __str__(self):
+        return self.name
+
+
+class StudyEvent(SoftDeleteModel):
     """
     스터디 이벤트 모델
     
     사용자의 스터디 세션을 저장
     """
+    # 스터디를 삭제하면 타이머/공부 내용도 함께 소프트 삭제
+    soft_delete_cascade = ('timers', 'contents')
+    
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -19,6 +122,14 @@ class StudyEvent(models.Model):
         help_text="스터디 소유자"
     )
     title = models.CharField(max_length=200, help_text="스터디 제목")
+    canonical_subject = models.ForeignKey(
+        Subject,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name='study_events',
+        help_text="정규화된 과목 (제목으로부터 자동 지정)"
+    )
     goal = models.TextField(help_text="학습 목표")
     start_at = models.DateTimeField(help_text="시작 시간")
     end_at = models.DateTimeField(help_text="종료 시간")
@@ -29,17 +140,33 @@ class StudyEvent(models.Model):
         verbose_name = '스터디 이벤트'
         verbose_name_plural = '스터디 이벤트들'
         ordering = ['-start_at']
+        indexes = [
+            # 증분 동기화 (user, updated_at > since) 조회용
+            models.Index(fields=['user', 'updated_at'], name='study_event_user_updated'),
+            # 관리자 목록 정렬/날짜 필터용
+            models.Index(fields=['start_at'], name='study_event_start_at'),
+        ]
     
     def __str__(self):
-        return f"{self.title} ({self.user.username})"
+        return f"{self.title} ({self.user.email})"
+    
+    def save(self, *args, **kwargs):
+        """저장 시 제목으로 정규화된 과목 지정"""
+        self.canonical_subject_id = Subject.objects.resolve_id(self.title)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'title' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'canonical_subject'}
+        super().save(*args, **kwargs)
 
 
-class StudyTimer(models.Model):
+class StudyTimer(SoftDeleteModel):
     """
     스터디 타이머 모델
     
     스터디 세션의 타이머 정보를 저장
     """
+    owner_lookup = 'study_event__user'
+    
     study_event = models.ForeignKey(
         StudyEvent,
         on_delete=models.CASCADE,
@@ -50,6 +177,14 @@ class StudyTimer(models.Model):
     ended_at = models.DateTimeField(null=True, blank=True, help_text="타이머 종료 시간")
     total_minutes = models.IntegerField(default=0, help_text="총 공부 시간 (분)")
     is_running = models.BooleanField(default=False, help_text="타이머 실행 중 여부")
+    auto_closed = models.BooleanField(
+        default=False,
+        help_text="오래 실행된 타이머를 정리 작업이 자동으로 종료했는지 여부"
+    )
+    needs_review = models.BooleanField(
+        default=False,
+        help_text="사용자 확인 필요 여부 (자동 종료되었거나 최대 시간을 넘겨 공부 시간을 제한한 타이머)"
+    )
     created_at = models.DateTimeField(auto_now_add=True, help_text="생성 시간")
     updated_at = models.DateTimeField(auto_now=True, help_text="수정 시간")
     
@@ -57,17 +192,27 @@ class StudyTimer(models.Model):
         verbose_name = '스터디 타이머'
         verbose_name_plural = '스터디 타이머들'
         ordering = ['-created_at']
+        indexes = [
+            # 증분 동기화 (updated_at > since) 조회용
+            models.Index(fields=['updated_at'], name='study_timer_updated'),
+            # 관리자 목록 정렬/날짜 필터용
+            models.Index(fields=['created_at'], name='study_timer_created'),
+            # 오래 실행된 타이머 정리 (is_running=True, started_at < 기준) 조회용
+            models.Index(fields=['is_running', 'started_at'], name='study_timer_running_started'),
+        ]
     
     def __str__(self):
         return f"타이머 - {self.study_event.title} ({self.total_minutes}분)"
 
 
-class StudyContent(models.Model):
+class StudyContent(SoftDeleteModel):
     """
     공부 내용 모델
     
     스터디 세션에서 학습한 내용을 저장
     """
+    owner_lookup = 'study_event__user'
+    
     study_event = models.ForeignKey(
         StudyEvent,
         on_delete=models.CASCADE,
@@ -83,6 +228,12 @@ class StudyContent(models.Model):
         verbose_name = '공부 내용'
         verbose_name_plural = '공부 내용들'
         ordering = ['-created_at']
+        indexes = [
+            # 증분 동기화 (updated_at > since) 조회용
+            models.Index(fields=['updated_at'], name='study_content_updated'),
+            # 관리자 목록 정렬/날짜 필터용
+            models.Index(fields=['created_at'], name='study_content_created'),
+        ]
     
     def __str__(self):
         return f"{self.study_event.title} - {self.content[:50]}..."
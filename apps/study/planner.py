@@ -0,0 +1,265 @@
+"""
+학습 계획 생성기
+
+다가오는 시험(ExamService.get_upcoming_exams) 전까지의 빈 시간(FreeSlotService)에
+과목별 스터디 세션을 배정하고 StudyEvent 로 한 번에 저장(bulk_create)합니다.
+
+- 과목별 목표 시간: STUDY_PLANNER_TARGET_MINUTES x (0.5 + 취약도)
+  취약도는 통계의 취약 파트와 같은 과목별 평균 점수(ExamService.get_subject_score_averages)로 계산
+  (1 - 평균 점수 / 평균 만점, 점수가 없으면 0.5)
+- 남은 시간: 목표 - 최근 공부 시간(공부 내용) - 시험 전까지 이미 잡힌 스터디 일정
+  이미 잡힌 일정을 빼므로 다시 실행해도 같은 계획이 중복으로 생기지 않음
+- 배정: 날짜마다 남은 시간 x 가중치 / 남은 일수 가 큰 과목을 우선순위 큐에서 꺼내 세션을 배정
+  (세션 수 S, 과목 수 m, 날짜 수 D 에 대해 O((S + D m) log m))
+- 시간 예산(time_budget 초)을 넘기면 그때까지 배정한 계획만 저장 (truncated)
+
+시험이 많은 사용자는 Celery 작업(apps.study.tasks.generate_study_plan)으로 실행합니다.
+"""
+import heapq
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta
+from itertools import groupby
+from time import monotonic
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from apps.calendars.serializers import MAX_CONFLICT_WINDOW
+from apps.calendars.services import ExamService
+from apps.calendars.slots import FreeSlotService
+from core.versioning import DataVersionService
+
+from .models import StudyContent, StudyEvent, Subject
+
+
+# 최근 공부 시간으로 인정하는 기간
+RECENT_STUDY_DAYS = 14
+
+# 한 과목에 하루 배정할 최대 세션 수 (여러 날에 나누어 공부하도록)
+MAX_SESSIONS_PER_SUBJECT_PER_DAY = 2
+
+
+@dataclass
+class SubjectDemand:
+    """과목별 남은 공부 시간"""
+    subject_id: int
+    subject_name: str
+    exam: object
+    weakness: float
+    remaining: float
+
+    @property
+    def deadline(self):
+        return self.exam.exam_date
+
+    def priority(self, day):
+        """남은 시간이 많고 취약하며 시험이 가까울수록 큼"""
+        days_left = max((self.deadline - day).days, 1)
+        return self.remaining * (0.5 + self.weakness) / days_left
+
+
+@dataclass
+class StudyPlan:
+    """생성한 학습 계획"""
+    study_events: list = field(default_factory=list)
+    demands: list = field(default_factory=list)
+    truncated: bool = False
+
+    def get_unmet(self):
+        """배정하지 못한 남은 시간이 있는 과목"""
+        return [
+            {
+                'exam_id': demand.exam.id,
+                'subject': demand.subject_name,
+                'exam_date': demand.deadline,
+                'remaining_minutes': math.ceil(demand.remaining),
+            }
+            for demand in self.demands
+            if demand.remaining > 0
+        ]
+
+
+class StudyPlanService:
+    """학습 계획 생성 서비스"""
+
+    @staticmethod
+    def count_upcoming_exams(user):
+        """계획 대상 시험 수 (동기 실행/Celery 작업 선택 기준)"""
+        return ExamService.get_upcoming_exams(user).filter(exam_date__gt=timezone.localdate()).count()
+
+    @staticmethod
+    def build_plan(user, session_minutes, break_minutes, max_sessions_per_day, day_start, day_end,
+                   time_budget=None):
+        """
+        학습 계획 생성 (저장하지 않음)
+
+        :param user: 사용자
+        :param session_minutes: 세션 길이 (분)
+        :param break_minutes: 같은 빈 시간 안의 세션 사이 쉬는 시간 (분)
+        :param max_sessions_per_day: 하루 최대 세션 수
+        :param day_start: 하루 중 공부 시작 시각 (현지 시각)
+        :param day_end: 하루 중 공부 종료 시각 (현지 시각)
+        :param time_budget: 배정에 쓸 최대 시간 (초, 기본 STUDY_PLANNER_TIME_BUDGET_SECONDS)
+        :return: StudyPlan
+        """
+        started = monotonic()
+        time_budget = time_budget or settings.STUDY_PLANNER_TIME_BUDGET_SECONDS
+
+        now = timezone.now()
+        plan = StudyPlan(demands=StudyPlanService.get_demands(user, now))
+        if not plan.demands:
+            return plan
+
+        # 시험 당일 0시 전까지 배정 (조회 기간 제한 안에서)
+        last_deadline = max(demand.deadline for demand in plan.demands)
+        end = min(
+            timezone.make_aware(datetime.combine(last_deadline, time.min)),
+            now + MAX_CONFLICT_WINDOW,
+        )
+        # 세션을 10분 단위 시각에서 시작
+        start = now.replace(second=0, microsecond=0) + timedelta(minutes=-now.minute % 10 or 10)
+        if start >= end:
+            return plan
+
+        # 이미 잡힌 스터디 일정도 하루 세션 수에 포함 (다시 실행해도 하루 제한을 넘지 않도록)
+        scheduled = Counter()
+        for subject_id, start_at in StudyEvent.objects.filter(
+            user=user, start_at__gte=start, start_at__lt=end,
+        ).order_by().values_list('canonical_subject_id', 'start_at'):
+            day = timezone.localtime(start_at).date()
+            scheduled[day] += 1
+            scheduled[day, subject_id] += 1
+
+        slots = FreeSlotService.find_free_slots(user, start, end, session_minutes, day_start, day_end)
+        sessions = StudyPlanService.split_sessions(slots, session_minutes, break_minutes)
+        for day, day_sessions in groupby(sessions, key=lambda session: timezone.localtime(session[0]).date()):
+            if monotonic() - started > time_budget:
+                plan.truncated = True
+                break
+            day_sessions = list(day_sessions)[:max(max_sessions_per_day - scheduled[day], 0)]
+            assigned = StudyPlanService.allocate_day(plan.demands, day, day_sessions, scheduled)
+            for demand, (session_start, session_end) in assigned:
+                plan.study_events.append(StudyEvent(
+                    user=user,
+                    title=demand.subject_name,
+                    canonical_subject_id=demand.subject_id,
+                    goal=f'{demand.exam.subject} 시험 대비 (시험일 {demand.deadline.isoformat()})',
+                    start_at=session_start,
+                    end_at=session_end,
+                ))
+        return plan
+
+    @staticmethod
+    def create_plan(user, dry_run=False, **options):
+        """
+        학습 계획 생성 후 StudyEvent 로 저장 (bulk_create 한 번)
+
+        :param dry_run: 저장하지 않고 계획만 반환
+        :param options: build_plan 인자
+        :return: StudyPlan
+        """
+        plan = StudyPlanService.build_plan(user, **options)
+        if plan.study_events and not dry_run:
+            with transaction.atomic():
+                # bulk_create 는 save() 를 거치지 않으므로 canonical_subject_id 를 직접 채워 둠
+                plan.study_events = StudyEvent.objects.bulk_create(plan.study_events)
+                DataVersionService.bump(user.id)
+        return plan
+
+    @staticmethod
+    def get_demands(user, now):
+        """과목별 남은 공부 시간 (가장 가까운 시험 기준, 남은 시간이 없는 과목 제외)"""
+        today = timezone.localtime(now).date()
+        exams = {}
+        for exam in ExamService.get_upcoming_exams(user).filter(exam_date__gt=today):
+            subject_id = exam.canonical_subject_id or Subject.objects.resolve_id(exam.subject)
+            # 시험일 순이므로 과목별 첫 시험이 가장 가까운 시험
+            if subject_id is not None and subject_id not in exams:
+                exams[subject_id] = exam
+        if not exams:
+            return []
+
+        names = dict(Subject.objects.filter(id__in=exams).values_list('id', 'name'))
+        weakness = {
+            row['canonical_subject_id']: min(max(1 - row['avg_score'] / row['avg_max_score'], 0.0), 1.0)
+            for row in ExamService.get_subject_score_averages(user).filter(canonical_subject_id__in=exams)
+            if row['avg_max_score']
+        }
+        studied = dict(
+            StudyContent.objects.filter(
+                study_event__user=user,
+                study_event__deleted_at__isnull=True,
+                study_event__canonical_subject_id__in=exams,
+                study_event__start_at__gte=now - timedelta(days=RECENT_STUDY_DAYS),
+                study_event__start_at__lt=now,
+            ).values_list('study_event__canonical_subject_id').annotate(minutes=Sum('duration_minutes')).order_by()
+        )
+        planned = {}
+        for subject_id, start_at, end_at in StudyEvent.objects.filter(
+            user=user, canonical_subject_id__in=exams, start_at__gte=now,
+        ).order_by().values_list('canonical_subject_id', 'start_at', 'end_at'):
+            if timezone.localtime(start_at).date() < exams[subject_id].exam_date:
+                planned[subject_id] = planned.get(subject_id, 0) + (end_at - start_at).total_seconds() / 60
+
+        demands = []
+        target_minutes = settings.STUDY_PLANNER_TARGET_MINUTES
+        for subject_id, exam in exams.items():
+            subject_weakness = weakness.get(subject_id, 0.5)
+            remaining = (
+                target_minutes * (0.5 + subject_weakness)
+                - (studied.get(subject_id) or 0)
+                - planned.get(subject_id, 0)
+            )
+            if remaining > 0:
+                demands.append(SubjectDemand(
+                    subject_id=subject_id,
+                    subject_name=names.get(subject_id, exam.subject),
+                    exam=exam,
+                    weakness=subject_weakness,
+                    remaining=remaining,
+                ))
+        return demands
+
+    @staticmethod
+    def split_sessions(slots, session_minutes, break_minutes):
+        """빈 시간을 세션 길이로 나눔 (시작 시각 순)"""
+        length = timedelta(minutes=session_minutes)
+        step = length + timedelta(minutes=break_minutes)
+        sessions = []
+        for slot in slots:
+            cursor = slot['start_at']
+            while cursor + length <= slot['end_at']:
+                sessions.append((cursor, cursor + length))
+                cursor += step
+        return sessions
+
+    @staticmethod
+    def allocate_day(demands, day, sessions, scheduled):
+        """
+        하루의 세션을 우선순위가 큰 과목부터 배정
+
+        :param scheduled: 이미 잡힌 세션 수 ((날짜, 과목 ID) -> 개수)
+        :return: [(SubjectDemand, 세션), ...]
+        """
+        heap = [
+            (-demand.priority(day), index, demand)
+            for index, demand in enumerate(demands)
+            if demand.remaining > 0 and day < demand.deadline
+            and scheduled[day, demand.subject_id] < MAX_SESSIONS_PER_SUBJECT_PER_DAY
+        ]
+        heapq.heapify(heap)
+        assigned = []
+        for session in sessions:
+            if not heap:
+                break
+            _, index, demand = heapq.heappop(heap)
+            assigned.append((demand, session))
+            demand.remaining -= (session[1] - session[0]).total_seconds() / 60
+            scheduled[day, demand.subject_id] += 1
+            if demand.remaining > 0 and scheduled[day, demand.subject_id] < MAX_SESSIONS_PER_SUBJECT_PER_DAY:
+                heapq.heappush(heap, (-demand.priority(day), index, demand))
+        return assigned
@@ -1,6 +1,8 @@
 """
 스터디 관련 시리얼라이저
 """
+from datetime import time
+
 from rest_framework import serializers
 from .models import StudyEvent, StudyTimer, StudyContent
 
@@ -33,8 +35,8 @@ class TimerEndSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = StudyTimer
-        fields = ['ended_at', 'total_minutes']
-        read_only_fields = ['ended_at', 'total_minutes']
+        fields = ['ended_at', 'total_minutes', 'needs_review']
+        read_only_fields = ['ended_at', 'total_minutes', 'needs_review']
 
 
 class StudyContentSerializer(serializers.ModelSerializer):
@@ -44,3 +46,29 @@ class StudyContentSerializer(serializers.ModelSerializer):
         model = StudyContent
         fields = ['id', 'content', 'duration_minutes', 'created_at', 'updated_at']
         read_only_fields = ['id', 'created_at', 'updated_at']
+
+
+class StudyPlanRequestSerializer(serializers.Serializer):
+    """학습 계획 생성 요청"""
+    session_minutes = serializers.IntegerField(default=60, min_value=20, max_value=240, help_text="세션 길이 (분)")
+    break_minutes = serializers.IntegerField(default=10, min_value=0, max_value=120, help_text="세션 사이 쉬는 시간 (분)")
+    max_sessions_per_day = serializers.IntegerField(default=3, min_value=1, max_value=12, help_text="하루 최대 세션 수")
+    day_start = serializers.TimeField(default=time(8, 0), help_text="하루 중 공부 시작 시각 (현지 시각)")
+    day_end = serializers.TimeField(default=time(23, 0), help_text="하루 중 공부 종료 시각 (현지 시각)")
+    dry_run = serializers.BooleanField(default=False, help_text="저장하지 않고 계획만 조회")
+
+
+class StudyPlanUnmetSerializer(serializers.Serializer):
+    """빈 시간이 부족해 배정하지 못한 과목"""
+    exam_id = serializers.IntegerField()
+    subject = serializers.CharField()
+    exam_date = serializers.DateField()
+    remaining_minutes = serializers.IntegerField()
+
+
+class StudyPlanSerializer(serializers.Serializer):
+    """학습 계획 생성 결과"""
+    created = serializers.IntegerField(help_text="저장한 스터디 일정 수 (dry_run 이면 0)")
+    truncated = serializers.BooleanField(help_text="시간 예산을 넘겨 일부 기간만 배정했는지")
+    study_events = StudySerializer(many=True)
+    unmet = StudyPlanUnmetSerializer(many=True)
@@ -6,9 +6,19 @@ SOLID 원칙:
 - Open/Closed: 확장에는 열려있고 수정에는 닫혀있음
 - Dependency Inversion: 뷰는 서비스 추상화에 의존
 """
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
 from datetime import timedelta
 
+from apps.calendars.conflicts import ConflictService
+from apps.sync.services import TombstoneService
+from core import metrics
+from core.versioning import DataVersionService
+
 from .models import StudyEvent, StudyTimer, StudyContent
 from .exceptions import StudyException
 
@@ -17,16 +27,22 @@ class StudyEventService:
     """스터디 이벤트 관련 비즈니스 로직 서비스"""
     
     @staticmethod
-    def create_study_event(user, validated_data):
+    def create_study_event(user, validated_data, check_conflicts=False):
         """
         스터디 이벤트 생성
         
         :param user: 현재 사용자
         :param validated_data: 검증된 데이터
+        :param check_conflicts: 다른 일정과 겹치면 생성하지 않음
         :return: 생성된 StudyEvent 인스턴스
+        :raises: ScheduleConflictException
         """
+        if check_conflicts:
+            ConflictService.check(user, validated_data['start_at'], validated_data['end_at'])
         validated_data['user'] = user
-        return StudyEvent.objects.create(**validated_data)
+        event = StudyEvent.objects.create(**validated_data)
+        DataVersionService.bump(user.id)
+        return event
     
     @staticmethod
     def get_user_study_events(user):
@@ -55,19 +71,29 @@ class StudyEventService:
             raise StudyEventNotFoundException()
     
     @staticmethod
-    def update_study_event(user, event_id, validated_data):
+    def update_study_event(user, event_id, validated_data, check_conflicts=False):
         """
         스터디 이벤트 수정
         
         :param user: 현재 사용자
         :param event_id: 스터디 이벤트 ID
         :param validated_data: 검증된 데이터
+        :param check_conflicts: 수정한 시간이 다른 일정과 겹치면 수정하지 않음
         :return: 수정된 StudyEvent 인스턴스
+        :raises: ScheduleConflictException
         """
         event = StudyEventService.get_study_event_by_id(user, event_id)
+        if check_conflicts:
+            ConflictService.check(
+                user,
+                validated_data.get('start_at', event.start_at),
+                validated_data.get('end_at', event.end_at),
+                exclude=('study_event', event.id),
+            )
         for key, value in validated_data.items():
             setattr(event, key, value)
         event.save()
+        DataVersionService.bump(user.id)
         return event
     
     @staticmethod
@@ -80,7 +106,8 @@ class StudyEventService:
         :return: None
         """
         event = StudyEventService.get_study_event_by_id(user, event_id)
-        event.delete()
+        TombstoneService.delete(user, event)
+        DataVersionService.bump(user.id)
 
 
 class StudyTimerService:
@@ -104,7 +131,8 @@ class StudyTimerService:
             is_running=True
         ).update(
             is_running=False,
-            ended_at=timezone.now()
+            ended_at=timezone.now(),
+            updated_at=timezone.now()
         )
         
         # 새 타이머 생성
@@ -113,6 +141,7 @@ class StudyTimerService:
             started_at=timezone.now(),
             is_running=True
         )
+        DataVersionService.bump(user.id)
         
         return timer
     
@@ -142,12 +171,90 @@ class StudyTimerService:
         if timer.started_at:
             duration = timer.ended_at - timer.started_at
             timer.total_minutes = int(duration.total_seconds() / 60)
+            # 정리 작업 전에 종료한 오래된 타이머도 같은 기준으로 공부 시간 제한
+            if duration > StudyTimerSweeper.get_stale_after():
+                timer.total_minutes = settings.STUDY_TIMER_AUTO_CLOSE_MINUTES
+                timer.needs_review = True
         timer.is_running = False
         timer.save()
+        DataVersionService.bump(user.id)
         
         return timer
 
 
+class StudyTimerSweeper:
+    """
+    오래 실행된 타이머 자동 종료
+
+    탭을 닫거나 앱이 종료되어 is_running=True 로 남은 타이머를 (is_running, started_at) 인덱스로 찾아
+    STUDY_TIMER_SWEEP_BATCH_SIZE 개씩 짧은 트랜잭션으로 종료합니다 (한 번에 최대 STUDY_TIMER_SWEEP_MAX_PER_RUN 개).
+    공부 시간은 STUDY_TIMER_AUTO_CLOSE_MINUTES 분으로 제한하고 사용자 확인 필요(needs_review)로 표시합니다.
+    """
+
+    @staticmethod
+    def get_stale_after():
+        """이 시간보다 오래 실행된 타이머를 자동 종료 대상으로 봄"""
+        return timedelta(hours=settings.STUDY_TIMER_STALE_HOURS)
+
+    @staticmethod
+    def close_batch(cutoff, batch_size, now):
+        """
+        cutoff 이전에 시작한 실행 중 타이머를 started_at 순으로 batch_size 개까지 종료
+
+        :return: 종료한 타이머 수
+        """
+        rows = list(
+            StudyTimer.objects.filter(is_running=True, started_at__lt=cutoff)
+            .order_by('started_at')
+            .values_list('id', 'study_event__user_id')[:batch_size]
+        )
+        if not rows:
+            return 0
+        minutes = settings.STUDY_TIMER_AUTO_CLOSE_MINUTES
+        with transaction.atomic():
+            # 조회 후 사용자가 직접 종료한 타이머는 건너뜀 (is_running 재확인)
+            closed = StudyTimer.objects.filter(id__in=[row[0] for row in rows], is_running=True).update(
+                is_running=False,
+                ended_at=F('started_at') + timedelta(minutes=minutes),
+                total_minutes=minutes,
+                auto_closed=True,
+                needs_review=True,
+                updated_at=now,
+            )
+            for user_id in {row[1] for row in rows}:
+                DataVersionService.bump(user_id)
+        return closed
+
+    @staticmethod
+    def run(batch_size=None, max_timers=None):
+        """
+        오래 실행된 타이머 종료 (남은 타이머는 다음 실행에서 이어서 처리)
+
+        :param batch_size: 한 트랜잭션에서 종료할 타이머 수
+        :param max_timers: 한 번의 실행에서 종료할 최대 타이머 수
+        :return: {'closed': 종료한 타이머 수, 'finished': 남은 대상이 없는지, 'duration_ms': 소요 시간}
+        """
+        started = time.perf_counter()
+        batch_size = batch_size or settings.STUDY_TIMER_SWEEP_BATCH_SIZE
+        max_timers = max_timers or settings.STUDY_TIMER_SWEEP_MAX_PER_RUN
+        now = timezone.now()
+        cutoff = now - StudyTimerSweeper.get_stale_after()
+
+        result = {'closed': 0, 'finished': False}
+        while result['closed'] < max_timers:
+            size = min(batch_size, max_timers - result['closed'])
+            closed = StudyTimerSweeper.close_batch(cutoff, size, now)
+            result['closed'] += closed
+            if closed < size:
+                result['finished'] = True
+                break
+
+        if result['closed']:
+            metrics.increment('study_timers_auto_closed_total', result['closed'])
+        result['duration_ms'] = int((time.perf_counter() - started) * 1000)
+        return result
+
+
 class StudyContentService:
     """공부 내용 관련 비즈니스 로직 서비스"""
     
@@ -164,7 +271,9 @@ class StudyContentService:
         """
         study_event = StudyEventService.get_study_event_by_id(user, event_id)
         validated_data['study_event'] = study_event
-        return StudyContent.objects.create(**validated_data)
+        content = StudyContent.objects.create(**validated_data)
+        DataVersionService.bump(user.id)
+        return content
     
     @staticmethod
     def get_study_contents_by_event(user, event_id):
@@ -210,6 +319,7 @@ class StudyContentService:
         for key, value in validated_data.items():
             setattr(content, key, value)
         content.save()
+        DataVersionService.bump(user.id)
         return content
     
     @staticmethod
@@ -222,4 +332,5 @@ class StudyContentService:
         :return: None
         """
         content = StudyContentService.get_study_content_by_id(user, content_id)
-        content.delete()
+        TombstoneService.delete(user, content)
+        DataVersionService.bump(user.id)
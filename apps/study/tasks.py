@@ -0,0 +1,38 @@
+"""
+스터디 관련 Celery 작업
+"""
+from celery import shared_task
+from django.contrib.auth import get_user_model
+
+from .planner import StudyPlanService
+from .serializers import StudyPlanRequestSerializer
+from .services import StudyTimerSweeper
+
+
+@shared_task
+def generate_study_plan(user_id, options):
+    """
+    학습 계획 생성 (다가오는 시험이 많은 사용자, 시간 예산 STUDY_PLANNER_TIME_BUDGET_SECONDS)
+
+    :param user_id: 사용자 ID
+    :param options: 학습 계획 요청 파라미터 (StudyPlanRequestSerializer 입력)
+    :return: 생성한 스터디 일정 수
+    """
+    user = get_user_model().objects.filter(id=user_id).first()
+    if user is None:
+        return 0
+    request = StudyPlanRequestSerializer(data=options)
+    request.is_valid(raise_exception=True)
+    plan = StudyPlanService.create_plan(user, **request.validated_data)
+    return len(plan.study_events)
+
+
+@shared_task
+def sweep_stale_timers():
+    """
+    오래 실행된 타이머 자동 종료 (Celery beat 로 주기 실행)
+
+    한 번에 STUDY_TIMER_SWEEP_MAX_PER_RUN 개까지만 종료하고 남은 타이머는 다음 실행에서 이어서 처리
+    :return: 정리 결과
+    """
+    return StudyTimerSweeper.run()
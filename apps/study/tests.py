@@ -1,3 +1,152 @@
-from django.test import TestCase
+"""
+스터디 앱 테스트 (과목 정규화, 학습 계획 생성, 오래된 타이머 정리, 공부 기록 CSV 가져오기)
+"""
+import csv
+import io
+from datetime import datetime, timedelta
 
-# Create your tests here.
+import pytest
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.calendars.models import Exam
+from apps.study.importer import StudyLogImportService
+from apps.study.models import StudyContent, StudyEvent, StudyTimer, Subject
+from apps.study.services import StudyTimerSweeper
+from apps.users.models import CustomUser
+from core import metrics
+
+
+@pytest.fixture
+def user(db):
+    return CustomUser.objects.create_user('study@example.com', 'password123!', nickname='study')
+
+
+@pytest.fixture
+def api_client(user):
+    client = APIClient()
+    client.force_authenticate(user)
+    return client
+
+
+@pytest.fixture
+def study_event(user):
+    now = timezone.now()
+    return StudyEvent.objects.create(user=user, title='수학', goal='목표', start_at=now, end_at=now + timedelta(hours=1))
+
+
+def test_subject_normalization(user):
+    now = timezone.now()
+    study_event = StudyEvent.objects.create(user=user, title='Math 1', goal='목표', start_at=now, end_at=now)
+    # 전각/대소문자/공백이 달라도 같은 과목
+    exam = Exam.objects.create(user=user, subject=' ｍａｔｈ１ ', exam_date=now.date(), max_score=100)
+    assert exam.canonical_subject_id == study_event.canonical_subject_id
+    assert study_event.canonical_subject.name == 'Math 1'
+
+    # 제목만 바꿔 저장해도 과목을 다시 해석
+    study_event.title = '영어'
+    study_event.save(update_fields=['title'])
+    study_event.refresh_from_db()
+    assert study_event.canonical_subject.name == '영어'
+
+    # 롤백된 트랜잭션에서 만든 과목 ID 는 캐시되지 않음
+    with pytest.raises(RuntimeError), transaction.atomic():
+        Subject.objects.resolve_id('과학')
+        raise RuntimeError
+    assert Subject.objects.resolve_id('과학') == Subject.objects.get(normalized_name='과학').id
+
+
+def test_study_plan(user, api_client):
+    Exam.objects.create(user=user, subject='수학', exam_date=timezone.localdate() + timedelta(days=3), max_score=100)
+
+    response = api_client.post('/api/study/api/study-plans/', {'dry_run': True}, format='json')
+    assert response.status_code == 200
+    preview = response.json()
+    assert preview['created'] == 0 and preview['study_events']
+    assert {event['title'] for event in preview['study_events']} == {'수학'}
+
+    response = api_client.post('/api/study/api/study-plans/', {}, format='json')
+    assert response.status_code == 201
+    planned = StudyEvent.objects.filter(user=user, goal__startswith='수학 시험 대비')
+    assert planned.count() == len(preview['study_events'])
+    assert not planned.filter(canonical_subject__isnull=True).exists()
+
+    # 이미 잡힌 스터디 일정만큼 빼므로 다시 실행해도 중복으로 만들지 않음
+    response = api_client.post('/api/study/api/study-plans/', {'dry_run': True}, format='json')
+    assert response.json()['study_events'] == []
+
+
+def test_sweep_stale_timers(study_event):
+    now = timezone.now()
+    stale = [
+        StudyTimer.objects.create(study_event=study_event, is_running=True, started_at=now - timedelta(days=3, hours=i))
+        for i in range(5)
+    ]
+    fresh = StudyTimer.objects.create(study_event=study_event, is_running=True, started_at=now - timedelta(minutes=30))
+    counter_key = ('study_timers_auto_closed_total', ())
+    before = metrics.registry.counters.get(counter_key, 0)
+
+    # 한 번에 최대 개수까지만 종료하고 남은 타이머는 다음 실행에서 처리
+    assert StudyTimerSweeper.run(batch_size=2, max_timers=3)['closed'] == 3
+    result = StudyTimerSweeper.run(batch_size=2, max_timers=3)
+    assert result['closed'] == 2 and result['finished']
+    assert metrics.registry.counters[counter_key] - before == 5
+
+    for timer in stale:
+        timer.refresh_from_db()
+        assert not timer.is_running and timer.auto_closed and timer.needs_review
+        assert timer.ended_at - timer.started_at == timedelta(minutes=timer.total_minutes)
+    fresh.refresh_from_db()
+    assert fresh.is_running and not fresh.needs_review
+
+
+IMPORT_CSV = """email,title,subject,start_at,end_at,content,duration_minutes
+study@example.com,수학,수학,2026-01-05T09:00:00,2026-01-05T10:00:00,미적분,60
+study@example.com,영어,영어,2026-01-06T09:00:00,2026-01-06T10:00:00,독해,30
+study@example.com,영어,영어,2026-01-06T09:00:00,2026-01-06T11:00:00,문법,40
+nobody@example.com,영어,영어,2026-01-06T09:00:00,2026-01-06T10:00:00,독해,30
+study@example.com,영어,영어,2026-01-07T09:00:00,2026-01-07T10:00:00,독해,abc
+"""
+
+
+@pytest.fixture
+def math_event(user):
+    start_at = timezone.make_aware(datetime(2026, 1, 5, 9))
+    return StudyEvent.objects.create(
+        user=user, title='수학', goal='목표', start_at=start_at, end_at=start_at + timedelta(hours=1)
+    )
+
+
+def test_import_study_logs(user, math_event):
+    reject_file = io.StringIO()
+    result = StudyLogImportService.import_csv(io.StringIO(IMPORT_CSV), reject_file)
+    assert (result.rows_read, result.rows_loaded, result.rows_rejected) == (5, 3, 2)
+    assert result.users == 1
+    assert result.rejects == {'사용자 없음': 1, 'duration_minutes 형식 오류': 1}
+
+    rejects = list(csv.DictReader(io.StringIO(reject_file.getvalue())))
+    assert {(row['line'], row['error'], row['email']) for row in rejects} == {
+        ('5', '사용자 없음', 'nobody@example.com'),
+        ('6', 'duration_minutes 형식 오류', 'study@example.com'),
+    }
+
+    # 기존 일정은 (사용자, 제목, 시작 시간) 으로 찾고, 없는 일정은 한 번만 생성
+    assert result.study_events_created == 1
+    assert list(math_event.contents.values_list('content', flat=True)) == ['미적분']
+    english = StudyEvent.objects.get(user=user, title='영어')
+    assert english.canonical_subject.name == '영어'
+    assert english.end_at == timezone.make_aware(datetime(2026, 1, 6, 11))
+    assert sorted(english.contents.values_list('content', flat=True)) == ['독해', '문법']
+
+
+def test_import_study_logs_dry_run(user, math_event):
+    result = StudyLogImportService.import_csv(io.StringIO(IMPORT_CSV), dry_run=True)
+    assert (result.rows_loaded, result.rows_rejected, result.study_events_created) == (3, 2, 1)
+    assert not StudyContent.objects.exists()
+    assert not StudyEvent.objects.filter(title='영어').exists()
+    assert not Subject.objects.filter(name='영어').exists()
+
+    # 롤백된 과목 id 가 캐시에 남지 않아 이어서 가져와도 외래 키 오류가 나지 않음
+    assert StudyLogImportService.import_csv(io.StringIO(IMPORT_CSV)).rows_loaded == 3
+    assert StudyEvent.objects.get(title='영어').canonical_subject.name == '영어'
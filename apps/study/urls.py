@@ -10,6 +10,7 @@ urlpatterns = [
     # 스터디 이벤트 관련
     path('api/study-events/', views.StudyListCreateView.as_view(), name='study-list-create'),
     path('api/study-events/<int:pk>/', views.StudyDetailView.as_view(), name='study-detail'),
+    path('api/study-plans/', views.StudyPlanView.as_view(), name='study-plan'),
     
     # 타이머 관련
     path('api/events/<int:event_id>/timer/start/', views.StudyTimerStartView.as_view(), name='timer-start'),
@@ -5,28 +5,37 @@ SOLID 원칙:
 - Single Responsibility: HTTP 요청/응답 처리만 담당
 - Dependency Inversion: 서비스 레이어에 의존
 """
+from django.conf import settings
 from rest_framework import status, generics
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from drf_spectacular.utils import extend_schema
 
+from apps.calendars.conflicts import ConflictService
+from core.conditional import ConditionalGetMixin, get_collection_validators, get_not_modified_response, set_validator_headers
+from core.projection import SparseFieldsetMixin, parse_requested_fields, get_fast_list_serializer
+from core.versioning import DataVersionService
+
 from .models import StudyEvent, StudyContent
+from .planner import StudyPlanService
 from .services import StudyEventService, StudyTimerService, StudyContentService
 from .serializers import (
     StudySerializer,
     TimerStartSerializer,
     TimerEndSerializer,
     StudyContentSerializer,
+    StudyPlanRequestSerializer,
+    StudyPlanSerializer,
 )
 
 
 @extend_schema(
     tags=['스터디'],
     summary='스터디 목록 조회/생성',
-    description='사용자의 전체 스터디 일정을 조회하거나 생성합니다'
+    description='사용자의 전체 스터디 일정을 조회하거나 생성합니다 (생성 시 ?check_conflicts=true 이면 다른 일정과 겹칠 때 409)'
 )
-class StudyListCreateView(generics.ListCreateAPIView):
+class StudyListCreateView(ConditionalGetMixin, SparseFieldsetMixin, generics.ListCreateAPIView):
     """스터디 이벤트 목록 조회 및 생성 API"""
     permission_classes = [IsAuthenticated]
     serializer_class = StudySerializer
@@ -39,7 +48,8 @@ class StudyListCreateView(generics.ListCreateAPIView):
         """스터디 이벤트 생성 시 서비스 레이어 사용"""
         event = StudyEventService.create_study_event(
             user=self.request.user,
-            validated_data=serializer.validated_data
+            validated_data=serializer.validated_data,
+            check_conflicts=ConflictService.is_requested(self.request)
         )
         serializer.instance = event
 
@@ -47,9 +57,9 @@ class StudyListCreateView(generics.ListCreateAPIView):
 @extend_schema(
     tags=['스터디'],
     summary='스터디 상세/수정/삭제',
-    description='특정 스터디 일정의 상세 정보를 조회하거나 수정/삭제합니다'
+    description='특정 스터디 일정의 상세 정보를 조회하거나 수정/삭제합니다 (수정 시 ?check_conflicts=true 로 겹침 검사)'
 )
-class StudyDetailView(generics.RetrieveUpdateDestroyAPIView):
+class StudyDetailView(ConditionalGetMixin, SparseFieldsetMixin, generics.RetrieveUpdateDestroyAPIView):
     """스터디 이벤트 상세/수정/삭제 API"""
     permission_classes = [IsAuthenticated]
     serializer_class = StudySerializer
@@ -63,7 +73,8 @@ class StudyDetailView(generics.RetrieveUpdateDestroyAPIView):
         event = StudyEventService.update_study_event(
             user=self.request.user,
             event_id=self.kwargs['pk'],
-            validated_data=serializer.validated_data
+            validated_data=serializer.validated_data,
+            check_conflicts=ConflictService.is_requested(self.request)
         )
         serializer.instance = event
     
@@ -154,8 +165,19 @@ class StudyContentView(APIView):
             user=request.user,
             event_id=event_id
         )
-        serializer = StudyContentSerializer(contents, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        etag, _ = get_collection_validators(request, contents, DataVersionService.get_version(request.user.pk))
+        not_modified = get_not_modified_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+
+        # ?fields= 로 선택한 컬럼만 values() 로 조회하여 직렬화
+        field_names = parse_requested_fields(request, StudyContentSerializer)
+        fast_serializer = get_fast_list_serializer(
+            StudyContentSerializer,
+            tuple(field_names) if field_names else None
+        )
+        data = fast_serializer.to_representation(fast_serializer.get_values_queryset(contents))
+        return set_validator_headers(Response(data, status=status.HTTP_200_OK), etag)
 
 
 @extend_schema(
@@ -163,10 +185,11 @@ class StudyContentView(APIView):
     summary='공부 내용 상세/수정/삭제',
     description='등록된 공부 내용의 상세 정보를 조회하거나 수정/삭제합니다'
 )
-class StudyContentDetailView(generics.RetrieveUpdateDestroyAPIView):
+class StudyContentDetailView(ConditionalGetMixin, SparseFieldsetMixin, generics.RetrieveUpdateDestroyAPIView):
     """공부 내용 상세/수정/삭제 API (설계서 기준: RetrieveUpdateDestroyAPIView)"""
     permission_classes = [IsAuthenticated]
     serializer_class = StudyContentSerializer
+    lookup_url_kwarg = 'content_id'
     
     def get_queryset(self):
         """서비스 레이어를 통해 공부 내용 조회"""
@@ -189,3 +212,44 @@ class StudyContentDetailView(generics.RetrieveUpdateDestroyAPIView):
             user=self.request.user,
             content_id=content_id
         )
+
+
+@extend_schema(
+    tags=['스터디'],
+    summary='학습 계획 생성',
+    description=(
+        '다가오는 시험 전까지의 빈 시간에 과목별 스터디 일정을 배정하여 생성합니다. '
+        '취약 과목(평균 점수가 낮은 과목)과 시험이 가까운 과목에 더 많은 시간을 배정하고, 이미 잡힌 스터디 일정만큼은 빼고 배정합니다. '
+        '계획 대상 시험이 많으면 Celery 작업으로 생성하고 202 와 task_id 를 반환합니다 (dry_run 은 항상 바로 계획만 반환)'
+    ),
+    request=StudyPlanRequestSerializer,
+    responses=StudyPlanSerializer,
+)
+class StudyPlanView(APIView):
+    """학습 계획 생성 API"""
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        """학습 계획 생성"""
+        serializer = StudyPlanRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        options = serializer.validated_data
+
+        if not options['dry_run'] and (
+            StudyPlanService.count_upcoming_exams(request.user) > settings.STUDY_PLANNER_SYNC_EXAM_LIMIT
+        ):
+            from .tasks import generate_study_plan
+            result = generate_study_plan.delay(request.user.id, serializer.data)
+            return Response(
+                {'message': '학습 계획 생성을 요청했습니다.', 'task_id': result.id},
+                status=status.HTTP_202_ACCEPTED
+            )
+
+        plan = StudyPlanService.create_plan(request.user, **options)
+        data = StudyPlanSerializer({
+            'created': 0 if options['dry_run'] else len(plan.study_events),
+            'truncated': plan.truncated,
+            'study_events': plan.study_events,
+            'unmet': plan.get_unmet(),
+        }).data
+        return Response(data, status=status.HTTP_200_OK if options['dry_run'] else status.HTTP_201_CREATED)
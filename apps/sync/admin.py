@@ -0,0 +1,17 @@
+"""
+동기화 관리자 설정
+"""
+from django.contrib import admin
+from .models import Tombstone
+
+
+@admin.register(Tombstone)
+class TombstoneAdmin(admin.ModelAdmin):
+    list_display = ('model', 'object_id', 'user', 'deleted_at')
+    list_filter = ('model',)
+    list_select_related = ('user',)
+    readonly_fields = ('user', 'model', 'object_id', 'deleted_at')
+
+    def has_add_permission(self, request):
+        """삭제 기록은 서비스 레이어에서만 생성"""
+        return False
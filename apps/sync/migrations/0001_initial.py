@@ -0,0 +1,33 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:58
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(help_text='삭제된 모델 (app_label.ModelName)', max_length=100)),
+                ('object_id', models.BigIntegerField(help_text='삭제된 행 ID')),
+                ('deleted_at', models.DateTimeField(default=django.utils.timezone.now, help_text='삭제 시간')),
+                ('user', models.ForeignKey(help_text='삭제된 데이터의 소유자', on_delete=django.db.models.deletion.CASCADE, related_name='tombstones', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '삭제 기록',
+                'verbose_name_plural': '삭제 기록들',
+                'indexes': [models.Index(fields=['user', 'deleted_at'], name='sync_tombstone_user_deleted'), models.Index(fields=['deleted_at'], name='sync_tombstone_deleted_at')],
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+"""
+동기화 관련 모델
+
+모바일 클라이언트의 증분 동기화를 위해 삭제된 행을 툼스톤으로 남깁니다.
+생성/수정된 행은 각 모델의 updated_at 으로 찾습니다.
+"""
+from django.db import models
+from django.conf import settings
+from django.utils import timezone
+
+
+class Tombstone(models.Model):
+    """
+    삭제 기록 모델
+
+    서비스 레이어에서 삭제한 행(CASCADE 로 함께 삭제된 하위 행 포함)의 모델/ID 를 저장
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='tombstones',
+        help_text="삭제된 데이터의 소유자"
+    )
+    model = models.CharField(max_length=100, help_text="삭제된 모델 (app_label.ModelName)")
+    object_id = models.BigIntegerField(help_text="삭제된 행 ID")
+    deleted_at = models.DateTimeField(default=timezone.now, help_text="삭제 시간")
+
+    class Meta:
+        verbose_name = '삭제 기록'
+        verbose_name_plural = '삭제 기록들'
+        indexes = [
+            models.Index(fields=['user', 'deleted_at'], name='sync_tombstone_user_deleted'),
+            models.Index(fields=['deleted_at'], name='sync_tombstone_deleted_at'),
+        ]
+
+    def __str__(self):
+        return f"{self.model}#{self.object_id} 삭제 (user={self.user_id})"
@@ -0,0 +1,60 @@
+"""
+동기화 관련 시리얼라이저
+
+동기화 응답은 values() 기반 빠른 경로로 직렬화하므로 모든 필드가 모델 컬럼에 바로 대응해야 합니다.
+(외래 키는 *_id 정수로 전달)
+"""
+from rest_framework import serializers
+
+from apps.calendars.models import Event, RepeatEvent, Exam
+from apps.study.models import StudyEvent, StudyTimer, StudyContent
+
+
+class SyncQuerySerializer(serializers.Serializer):
+    since = serializers.CharField(
+        required=False,
+        help_text="이전 동기화 응답의 token (없으면 전체 데이터를 내려받음)"
+    )
+
+
+class EventSyncSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Event
+        fields = ['id', 'title', 'start_at', 'end_at', 'description', 'created_at', 'updated_at']
+
+
+class RepeatEventSyncSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = RepeatEvent
+        fields = ['id', 'title', 'start_at', 'end_at', 'description', 'rule', 'until', 'created_at', 'updated_at']
+
+
+class ExamSyncSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Exam
+        fields = ['id', 'subject', 'exam_date', 'score', 'max_score', 'pass_threshold', 'created_at', 'updated_at']
+
+
+class StudyEventSyncSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = StudyEvent
+        fields = ['id', 'title', 'goal', 'start_at', 'end_at', 'created_at', 'updated_at']
+
+
+class StudyTimerSyncSerializer(serializers.ModelSerializer):
+    study_event_id = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = StudyTimer
+        fields = [
+            'id', 'study_event_id', 'started_at', 'ended_at', 'total_minutes', 'is_running',
+            'auto_closed', 'needs_review', 'created_at', 'updated_at',
+        ]
+
+
+class StudyContentSyncSerializer(serializers.ModelSerializer):
+    study_event_id = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = StudyContent
+        fields = ['id', 'study_event_id', 'content', 'duration_minutes', 'created_at', 'updated_at']
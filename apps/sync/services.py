@@ -0,0 +1,232 @@
+"""
+증분 동기화 비즈니스 로직 서비스 레이어
+
+SOLID 원칙:
+- Single Responsibility: 각 서비스 클래스는 하나의 책임만 가짐
+- Dependency Inversion: 뷰와 다른 앱의 서비스는 이 서비스 추상화에 의존
+
+- 생성/수정: (user, updated_at) 인덱스로 since 이후 변경된 행만 조회
+- 삭제: 서비스 레이어의 삭제가 남긴 Tombstone 을 (user, deleted_at) 인덱스로 조회
+- 동기화 토큰: 서명된 시각 값. 커밋이 늦게 끝난 트랜잭션의 행을 놓치지 않도록
+  SYNC_OVERLAP_SECONDS 만큼 앞당긴 시각을 돌려주며, 겹치는 행은 다음 동기화에서 다시 전달됨
+  한 번에 다 보내지 못한 모델은 마지막 행의 (시각, pk) 를 토큰에 담아 다음 요청에서 이어받음
+"""
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.core import signing
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from apps.calendars.models import Event, RepeatEvent, Exam
+from apps.study.models import StudyEvent, StudyTimer, StudyContent
+from core.projection import get_fast_list_serializer
+from core.versioning import DataVersionService
+from .models import Tombstone
+from .serializers import (
+    EventSyncSerializer,
+    RepeatEventSyncSerializer,
+    ExamSyncSerializer,
+    StudyEventSyncSerializer,
+    StudyTimerSyncSerializer,
+    StudyContentSyncSerializer,
+)
+
+
+TOKEN_SALT = 'apps.sync.token'
+
+# 삭제 기록의 이어받기 위치를 담는 토큰 키
+TOMBSTONE_CURSOR_KEY = 'tombstones'
+
+# (응답 키, 모델, 시리얼라이저, 사용자 필터 경로)
+SYNC_MODELS = [
+    ('events', Event, EventSyncSerializer, 'user'),
+    ('repeat_events', RepeatEvent, RepeatEventSyncSerializer, 'user'),
+    ('exams', Exam, ExamSyncSerializer, 'user'),
+    ('study_events', StudyEvent, StudyEventSyncSerializer, 'user'),
+    ('study_timers', StudyTimer, StudyTimerSyncSerializer, 'study_event__user'),
+    ('study_contents', StudyContent, StudyContentSyncSerializer, 'study_event__user'),
+]
+
+# Tombstone.model 값 (app_label.modelname) → 응답 키
+SYNC_MODEL_KEYS = {model._meta.label_lower: key for key, model, _, _ in SYNC_MODELS}
+
+
+class SyncTokenService:
+    """동기화 토큰 생성/해석"""
+
+    @staticmethod
+    def to_micros(moment):
+        return int(moment.timestamp() * 1_000_000)
+
+    @staticmethod
+    def from_micros(micros):
+        return datetime.fromtimestamp(micros / 1_000_000, tz=dt_timezone.utc)
+
+    @staticmethod
+    def make_token(moment, cursors=None):
+        """
+        시각(과 잘린 모델별 마지막 위치)을 서명된 토큰으로 변환
+
+        :param cursors: {응답 키: (시각, pk)} - 다음 페이지는 이 위치 다음 행부터 전달
+        """
+        payload = SyncTokenService.to_micros(moment)
+        if cursors:
+            payload = {
+                'since': payload,
+                'after': {key: [SyncTokenService.to_micros(at), pk] for key, (at, pk) in cursors.items()},
+            }
+        return signing.dumps(payload, salt=TOKEN_SALT)
+
+    @staticmethod
+    def parse_token(token):
+        """
+        토큰을 시각과 모델별 마지막 위치로 변환
+
+        :return: (시각, {응답 키: (시각, pk)})
+        :raises: ValidationError (변조되었거나 형식이 잘못된 토큰)
+        """
+        try:
+            payload = signing.loads(token, salt=TOKEN_SALT)
+            if isinstance(payload, dict):
+                since = int(payload['since'])
+                cursors = {
+                    key: (SyncTokenService.from_micros(int(micros)), int(pk))
+                    for key, (micros, pk) in payload['after'].items()
+                }
+            else:
+                since, cursors = int(payload), {}
+        except (signing.BadSignature, KeyError, TypeError, ValueError):
+            raise ValidationError({'since': '유효하지 않은 동기화 토큰입니다.'})
+        return SyncTokenService.from_micros(since), cursors
+
+
+class TombstoneService:
+    """삭제 기록 관련 비즈니스 로직 서비스"""
+
+    @staticmethod
+    def delete(user, instance):
+        """
+        행 소프트 삭제 및 삭제 기록 저장
+
+        soft_delete_cascade 로 함께 소프트 삭제된 하위 행(타이머/공부 내용 등)의 기록도 남기며,
+        실제 삭제는 SoftDeleteReaper 가 백그라운드에서 수행
+
+        :param user: 데이터 소유자
+        :param instance: 삭제할 SoftDeleteModel 인스턴스
+        :return: None
+        """
+        deleted_at = timezone.now()
+        with transaction.atomic():
+            deleted = instance.soft_delete(deleted_at)
+            Tombstone.objects.bulk_create([
+                Tombstone(user=user, model=model._meta.label_lower, object_id=object_id, deleted_at=deleted_at)
+                for model, ids in deleted.items()
+                if model._meta.label_lower in SYNC_MODEL_KEYS
+                for object_id in ids
+            ])
+
+    @staticmethod
+    def prune(retention_days=None, batch_size=5000):
+        """
+        보관 기간이 지난 삭제 기록 정리
+
+        보관 기간보다 오래된 토큰으로 동기화하면 전체 데이터를 다시 내려주므로 안전하게 삭제 가능
+        :return: 삭제한 행 수
+        """
+        retention_days = retention_days or settings.SYNC_TOMBSTONE_RETENTION_DAYS
+        cutoff = timezone.now() - timedelta(days=retention_days)
+        total = 0
+        while True:
+            ids = list(Tombstone.objects.filter(deleted_at__lt=cutoff).values_list('pk', flat=True)[:batch_size])
+            if not ids:
+                return total
+            total += Tombstone.objects.filter(pk__in=ids).delete()[0]
+
+
+class SyncService:
+    """증분 동기화 관련 비즈니스 로직 서비스"""
+
+    @staticmethod
+    def filter_after(queryset, field, since, cursor=None):
+        """
+        since 이후의 행, 또는 이전 페이지의 마지막 위치 (시각, pk) 다음 행만 조회
+
+        같은 시각의 행이 한 페이지보다 많아도(일괄 삭제/수정) pk 순으로 이어받을 수 있음
+        """
+        if cursor is None:
+            return queryset.filter(**{f'{field}__gt': since})
+        at, pk = cursor
+        return queryset.filter(Q(**{f'{field}__gt': at}) | Q(**{field: at, 'pk__gt': pk}))
+
+    @staticmethod
+    def get_changes(user, since_token=None):
+        """
+        since 토큰 이후 생성/수정/삭제된 데이터 조회
+
+        모델별로 최대 SYNC_MAX_ROWS_PER_MODEL 행까지 (updated_at, pk) 순으로 돌려주며,
+        잘린 모델이 있으면 has_more=True 와 함께 모델별 마지막 위치를 담은 이어받기 토큰을 돌려줌
+
+        :param user: 현재 사용자
+        :param since_token: 이전 응답의 token (None 이면 전체 데이터)
+        :return: 응답 dict
+        """
+        now = timezone.now()
+        since, cursors = SyncTokenService.parse_token(since_token) if since_token else (None, {})
+        # 삭제 기록 보관 기간보다 오래된 토큰은 삭제를 놓칠 수 있으므로 전체 데이터로 재동기화
+        full = since is None or since < now - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+        if full:
+            cursors = {}
+        limit = settings.SYNC_MAX_ROWS_PER_MODEL
+        version = DataVersionService.get_version(user.pk)
+
+        changes = {}
+        next_cursors = {}
+        for key, model, serializer_class, user_lookup in SYNC_MODELS:
+            queryset = model.objects.filter(**{user_lookup: user}).order_by('updated_at', 'pk')
+            if not full:
+                queryset = SyncService.filter_after(queryset, 'updated_at', since, cursors.get(key))
+            fast_serializer = get_fast_list_serializer(serializer_class)
+            rows = list(fast_serializer.get_values_queryset(queryset)[:limit + 1])
+            if len(rows) > limit:
+                rows = rows[:limit]
+                next_cursors[key] = (rows[-1]['updated_at'], rows[-1]['id'])
+
+            created = rows if full else [row for row in rows if row['created_at'] > since]
+            updated = [] if full else [row for row in rows if row['created_at'] <= since]
+            changes[key] = {
+                'created': fast_serializer.to_representation(created),
+                'updated': fast_serializer.to_representation(updated),
+                'deleted': [],
+            }
+
+        if not full:
+            queryset = SyncService.filter_after(
+                Tombstone.objects.filter(user=user), 'deleted_at', since, cursors.get(TOMBSTONE_CURSOR_KEY)
+            )
+            tombstones = list(
+                queryset.order_by('deleted_at', 'pk').values_list('model', 'object_id', 'deleted_at', 'pk')[:limit + 1]
+            )
+            if len(tombstones) > limit:
+                tombstones = tombstones[:limit]
+                next_cursors[TOMBSTONE_CURSOR_KEY] = (tombstones[-1][2], tombstones[-1][3])
+            for label, object_id, _, _ in tombstones:
+                if label in SYNC_MODEL_KEYS:
+                    changes[SYNC_MODEL_KEYS[label]]['deleted'].append(object_id)
+
+        if next_cursors:
+            # 잘리지 않은 모델은 가장 이른 잘린 위치부터 다시 받고(겹치는 행은 다시 전달),
+            # 잘린 모델은 마지막 위치 다음 행부터 이어받음
+            next_since = min(at for at, _ in next_cursors.values()) - timedelta(microseconds=1)
+        else:
+            next_since = now - timedelta(seconds=settings.SYNC_OVERLAP_SECONDS)
+
+        return {
+            'token': SyncTokenService.make_token(next_since, next_cursors),
+            'full': full,
+            'has_more': bool(next_cursors),
+            'version': version,
+            'changes': changes,
+        }
@@ -0,0 +1,16 @@
+"""
+동기화 관련 Celery 작업
+"""
+from celery import shared_task
+
+from .services import TombstoneService
+
+
+@shared_task
+def prune_tombstones():
+    """
+    보관 기간이 지난 삭제 기록 정리 (Celery beat 로 주기 실행)
+
+    :return: 삭제한 행 수
+    """
+    return TombstoneService.prune()
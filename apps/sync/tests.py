@@ -0,0 +1,99 @@
+"""
+동기화 앱 테스트 (증분 동기화, 삭제 기록)
+"""
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.calendars.models import Event
+from apps.study.models import StudyContent, StudyEvent, StudyTimer
+from apps.sync.services import TombstoneService
+from apps.users.models import CustomUser
+
+
+@pytest.fixture
+def user(db):
+    return CustomUser.objects.create_user('sync@example.com', 'password123!', nickname='sync')
+
+
+@pytest.fixture
+def api_client(user):
+    client = APIClient()
+    client.force_authenticate(user)
+    return client
+
+
+def test_delta_sync(user, api_client, settings):
+    settings.SYNC_OVERLAP_SECONDS = 0
+    now = timezone.now()
+    event = Event.objects.create(user=user, title='일정', start_at=now, end_at=now + timedelta(hours=1))
+    study_event = StudyEvent.objects.create(user=user, title='수학', goal='목표', start_at=now, end_at=now)
+    timer = StudyTimer.objects.create(study_event=study_event, total_minutes=30)
+    content = StudyContent.objects.create(study_event=study_event, content='내용', duration_minutes=30)
+
+    full = api_client.get('/api/sync/').json()
+    assert full['full'] and not full['has_more']
+    assert [row['id'] for row in full['changes']['events']['created']] == [event.pk]
+
+    event.title = '수정'
+    event.save()
+    created = Event.objects.create(user=user, title='새 일정', start_at=now, end_at=now + timedelta(hours=1))
+    # 스터디를 지우면 함께 소프트 삭제된 타이머/공부 내용의 삭제 기록도 전달
+    TombstoneService.delete(user, study_event)
+
+    delta = api_client.get('/api/sync/', {'since': full['token']}).json()
+    assert not delta['full']
+    events = delta['changes']['events']
+    assert [row['id'] for row in events['created']] == [created.pk]
+    assert [(row['id'], row['title']) for row in events['updated']] == [(event.pk, '수정')]
+    assert delta['changes']['study_events']['deleted'] == [study_event.pk]
+    assert delta['changes']['study_timers']['deleted'] == [timer.pk]
+    assert delta['changes']['study_contents']['deleted'] == [content.pk]
+    assert not StudyEvent.objects.filter(pk=study_event.pk).exists()
+
+
+def sync_all(api_client, since=None, max_pages=10):
+    """has_more 가 없을 때까지 이어받은 응답 목록"""
+    pages = []
+    params = {'since': since} if since else {}
+    while len(pages) < max_pages:
+        pages.append(api_client.get('/api/sync/', params).json())
+        if not pages[-1]['has_more']:
+            return pages
+        params = {'since': pages[-1]['token']}
+    raise AssertionError('동기화 페이지가 끝나지 않음')
+
+
+def test_delta_sync_pages_and_rejects_bad_tokens(user, api_client, settings):
+    settings.SYNC_MAX_ROWS_PER_MODEL = 2
+    now = timezone.now()
+    study_event = StudyEvent.objects.create(user=user, title='수학', goal='목표', start_at=now, end_at=now)
+    contents = [
+        StudyContent.objects.create(study_event=study_event, content=f'내용 {i}', duration_minutes=10).pk
+        for i in range(5)
+    ]
+    events = [
+        Event.objects.create(user=user, title=f'일정 {i}', start_at=now, end_at=now + timedelta(hours=1)).pk
+        for i in range(5)
+    ]
+    # 한 페이지보다 많은 행이 같은 updated_at 을 가져도(일괄 update) 끝까지 이어받음
+    Event.objects.filter(pk__in=events).update(updated_at=now)
+
+    pages = sync_all(api_client)
+    assert len(pages) == 3 and pages[0]['full']
+    received = {
+        row['id'] for page in pages
+        for kind in ('created', 'updated') for row in page['changes']['events'][kind]
+    }
+    assert received == set(events)
+
+    # 일괄 삭제로 같은 deleted_at 을 가진 삭제 기록도 페이지를 나눠 모두 전달
+    TombstoneService.delete(user, study_event)
+    pages = sync_all(api_client, pages[-1]['token'])
+    assert len(pages) == 3
+    deleted = [object_id for page in pages for object_id in page['changes']['study_contents']['deleted']]
+    assert sorted(deleted) == contents
+
+    assert api_client.get('/api/sync/', {'since': 'tampered'}).status_code == 400
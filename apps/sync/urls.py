@@ -0,0 +1,12 @@
+"""
+동기화 관련 URL 라우팅
+"""
+from django.urls import path
+from . import views
+
+app_name = 'sync'
+
+urlpatterns = [
+    # 증분 동기화 (GET /api/sync/?since=<token>)
+    path('', views.SyncView.as_view(), name='sync'),
+]
@@ -0,0 +1,35 @@
+"""
+동기화 관련 API 뷰
+"""
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from drf_spectacular.utils import extend_schema
+
+from .serializers import SyncQuerySerializer
+from .services import SyncService
+
+
+@extend_schema(
+    tags=['동기화'],
+    summary='증분 동기화',
+    description=(
+        'since 토큰 이후 생성/수정/삭제된 일정, 반복 일정, 시험, 스터디, 타이머, 공부 내용을 한 번에 조회합니다. '
+        '응답의 token 을 다음 요청의 since 로 사용하고, has_more 가 true 이면 바로 이어서 요청합니다. '
+        'full 이 true 이면 전체 데이터이므로 로컬 데이터를 교체합니다. 같은 행이 중복 전달될 수 있으므로 id 기준으로 덮어씁니다'
+    ),
+    parameters=[SyncQuerySerializer],
+)
+class SyncView(APIView):
+    """증분 동기화 API"""
+    permission_classes = [IsAuthenticated]
+    # 복제 지연이 토큰의 겹침 구간보다 길면 변경을 놓칠 수 있으므로 primary 에서 읽음
+    replica_reads = False
+    
+    def get(self, request):
+        """since 토큰 이후 변경 사항 조회"""
+        query = SyncQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        data = SyncService.get_changes(request.user, query.validated_data.get('since'))
+        return Response(data, status=status.HTTP_200_OK)
@@ -17,7 +17,10 @@ Django Admin 설정 모듈
 """
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from .models import CustomUser
+
+from core.admin import EstimatedCountPaginator, LargeTableAdmin
+
+from .models import CustomUser, DataExport
 
 
 @admin.register(CustomUser)
@@ -66,6 +69,10 @@ class CustomUserAdmin(BaseUserAdmin):
     # 정렬 기준 (기본 정렬)
     # 목록 화면의 기본 정렬 순서 (-는 내림차순)
     ordering = ('-date_joined',)  # 가입일 내림차순 (최신순)
+
+    # 페이지 수는 추정 행 수로 계산하고 검색 결과 화면에서 전체 행 수를 세지 않음 (core/admin.py)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     
     # 사용자 수정 화면의 필드 그룹 설정
     # 사용자 정보를 수정할 때 보이는 필드 그룹
@@ -116,3 +123,16 @@ class CustomUserAdmin(BaseUserAdmin):
             ),
         }),
     )
+
+
+@admin.register(DataExport)
+class DataExportAdmin(LargeTableAdmin):
+    """데이터 내보내기 작업 관리자 클래스 (조회 전용)"""
+    list_display = ('id', 'user', 'status', 'row_count', 'file_size', 'created_at', 'completed_at')
+    list_filter = ('status',)
+    search_fields = ('user__email',)
+    list_select_related = ('user',)
+    readonly_fields = (
+        'user', 'status', 'completed_tables', 'row_count', 'file_size', 'error',
+        'created_at', 'updated_at', 'completed_at',
+    )
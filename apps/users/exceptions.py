@@ -52,3 +52,13 @@ class InvalidPasswordError(UserException):
 class EmailAlreadyExistsError(UserException):
     default_message = "이미 가입된 이메일입니다."
     default_status = status.HTTP_400_BAD_REQUEST
+
+
+class DataExportNotFoundError(UserException):
+    default_message = "데이터 내보내기를 찾을 수 없습니다."
+    default_status = status.HTTP_404_NOT_FOUND
+
+
+class DataExportNotReadyError(UserException):
+    default_message = "데이터 내보내기가 아직 완료되지 않았습니다."
+    default_status = status.HTTP_409_CONFLICT
@@ -0,0 +1,214 @@
+"""
+사용자 데이터 내보내기
+
+- 테이블마다 .iterator(chunk_size) 로 행을 읽어 gzip JSON Lines 파일에 바로 기록하므로
+  메모리 사용량은 데이터 양과 관계없이 청크 크기 정도로 유지
+- 테이블 파일은 .part 로 작성한 뒤 이름을 바꾸고 completed_tables 에 기록하므로,
+  작업이 중단되면 다음 실행에서 마지막으로 완료한 테이블 다음부터 이어서 진행
+- 모든 테이블을 마치면 테이블 파일을 하나의 ZIP 으로 묶고 (이미 gzip 이므로 재압축하지 않음) 원본 파일은 삭제
+- 대기/진행 중인 작업이 DATA_EXPORT_STALE_MINUTES 동안 갱신되지 않으면 (작업 유실, 워커 종료 등)
+  다시 요청할 때 이어서 실행하도록 다시 예약
+"""
+import gzip
+import os
+import shutil
+import zipfile
+from datetime import timedelta
+from itertools import islice
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.sync.services import SYNC_MODELS
+from core.projection import get_fast_list_serializer
+from core.renderers import FastJSONRenderer
+from .models import DataExport
+
+
+PROFILE_TABLE = 'profile'
+
+PROFILE_FIELDS = ('email', 'nickname', 'bio', 'profile_image', 'email_verified', 'date_joined', 'last_login')
+
+ARCHIVE_NAME = 'export.zip'
+
+# 파일 복사 버퍼 크기 (바이트)
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+class DataExportService:
+    """사용자 데이터 내보내기 서비스"""
+
+    @staticmethod
+    def get_tables():
+        """내보낼 테이블 이름 목록 (작성 순서)"""
+        return [PROFILE_TABLE] + [key for key, _, _, _ in SYNC_MODELS]
+
+    @staticmethod
+    def get_export_dir(export):
+        """내보내기 작업별 작업 디렉터리"""
+        return Path(settings.DATA_EXPORT_ROOT) / str(export.pk)
+
+    @staticmethod
+    def get_archive_path(export):
+        """완료된 ZIP 파일 경로"""
+        return DataExportService.get_export_dir(export) / ARCHIVE_NAME
+
+    @staticmethod
+    def is_stale(export, now=None):
+        """대기/진행 중인데 DATA_EXPORT_STALE_MINUTES 동안 갱신되지 않은 작업인지"""
+        cutoff = (now or timezone.now()) - timedelta(minutes=settings.DATA_EXPORT_STALE_MINUTES)
+        return export.updated_at < cutoff
+
+    @staticmethod
+    def request_export(user):
+        """
+        데이터 내보내기 요청
+
+        진행 중인 작업이 있으면 그 작업을, 마지막 작업이 실패했거나 오래 갱신되지 않았으면
+        이어서 실행하도록 다시 예약한 작업을 반환
+        :param user: 요청한 사용자
+        :return: DataExport 인스턴스
+        """
+        from .tasks import run_data_export
+
+        with transaction.atomic():
+            export = DataExport.objects.select_for_update().filter(user=user).first()
+            in_progress = export is not None and export.status in (DataExport.STATUS_PENDING, DataExport.STATUS_RUNNING)
+            if in_progress and not DataExportService.is_stale(export):
+                return export
+
+            if export is not None and (in_progress or export.status == DataExport.STATUS_FAILED):
+                export.status = DataExport.STATUS_PENDING
+                export.error = ''
+                export.save(update_fields=['status', 'error', 'updated_at'])
+            else:
+                export = DataExport.objects.create(user=user)
+
+            transaction.on_commit(lambda: run_data_export.delay(export.pk))
+        return export
+
+    @staticmethod
+    def get_table_rows(user, table):
+        """
+        테이블 행 제너레이터 (dict)
+
+        :param user: 내보낼 사용자
+        :param table: get_tables() 의 테이블 이름
+        """
+        chunk_size = settings.DATA_EXPORT_CHUNK_SIZE
+        if table == PROFILE_TABLE:
+            profile = type(user).objects.filter(pk=user.pk).values(*PROFILE_FIELDS).first()
+            if profile is not None:
+                yield profile
+            return
+
+        for key, model, serializer_class, user_lookup in SYNC_MODELS:
+            if key != table:
+                continue
+            fast_serializer = get_fast_list_serializer(serializer_class)
+            queryset = fast_serializer.get_values_queryset(
+                model.objects.filter(**{user_lookup: user}).order_by('pk')
+            )
+            rows = queryset.iterator(chunk_size=chunk_size)
+            while chunk := list(islice(rows, chunk_size)):
+                yield from fast_serializer.to_representation(chunk)
+            return
+
+    @staticmethod
+    def write_table(export, table):
+        """
+        테이블 하나를 gzip JSON Lines 파일로 작성
+
+        :return: 작성한 행 수
+        """
+        export_dir = DataExportService.get_export_dir(export)
+        path = export_dir / f'{table}.jsonl.gz'
+        part_path = export_dir / f'{table}.jsonl.gz.part'
+        renderer = FastJSONRenderer()
+
+        count = 0
+        with gzip.open(part_path, 'wb') as output:
+            for row in DataExportService.get_table_rows(export.user, table):
+                output.write(renderer.render(row))
+                output.write(b'\n')
+                count += 1
+        os.replace(part_path, path)
+        return count
+
+    @staticmethod
+    def build_archive(export, tables):
+        """테이블 파일을 ZIP 으로 묶고 원본 파일 삭제"""
+        export_dir = DataExportService.get_export_dir(export)
+        archive_path = DataExportService.get_archive_path(export)
+        if not archive_path.exists():
+            part_path = export_dir / f'{ARCHIVE_NAME}.part'
+            with zipfile.ZipFile(part_path, 'w', compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+                for table in tables:
+                    name = f'{table}.jsonl.gz'
+                    with open(export_dir / name, 'rb') as source, archive.open(name, 'w', force_zip64=True) as target:
+                        shutil.copyfileobj(source, target, COPY_BUFFER_SIZE)
+            os.replace(part_path, archive_path)
+
+        for table in tables:
+            (export_dir / f'{table}.jsonl.gz').unlink(missing_ok=True)
+        return archive_path
+
+    @staticmethod
+    def run(export_id):
+        """
+        내보내기 실행 (completed_tables 에 있는 테이블은 건너뛰고 이어서 진행)
+
+        :param export_id: DataExport ID
+        :return: DataExport 인스턴스
+        """
+        export = DataExport.objects.select_related('user').get(pk=export_id)
+        if export.status == DataExport.STATUS_COMPLETED:
+            return export
+
+        export.status = DataExport.STATUS_RUNNING
+        export.save(update_fields=['status', 'updated_at'])
+        DataExportService.get_export_dir(export).mkdir(parents=True, exist_ok=True)
+
+        tables = DataExportService.get_tables()
+        for table in tables:
+            if table in export.completed_tables:
+                continue
+            export.row_count += DataExportService.write_table(export, table)
+            export.completed_tables = export.completed_tables + [table]
+            export.save(update_fields=['completed_tables', 'row_count', 'updated_at'])
+
+        archive_path = DataExportService.build_archive(export, tables)
+        export.status = DataExport.STATUS_COMPLETED
+        export.file_size = archive_path.stat().st_size
+        export.completed_at = timezone.now()
+        export.save(update_fields=['status', 'file_size', 'completed_at', 'updated_at'])
+        return export
+
+    @staticmethod
+    def mark_failed(export_id, error):
+        """실패 사유 기록 (완료한 테이블은 유지하여 재시도 시 이어서 진행)"""
+        DataExport.objects.filter(pk=export_id).exclude(
+            status=DataExport.STATUS_COMPLETED
+        ).update(status=DataExport.STATUS_FAILED, error=str(error)[:1000], updated_at=timezone.now())
+
+    @staticmethod
+    def prune(retention_days=None):
+        """
+        보관 기간이 지난 내보내기와 DB 에 기록이 없는 작업 디렉터리 삭제
+
+        :return: 삭제한 내보내기 수
+        """
+        retention_days = retention_days or settings.DATA_EXPORT_RETENTION_DAYS
+        cutoff = timezone.now() - timedelta(days=retention_days)
+        expired = DataExport.objects.filter(created_at__lt=cutoff)
+        count = expired.delete()[0]
+
+        root = Path(settings.DATA_EXPORT_ROOT)
+        if root.is_dir():
+            existing = {str(pk) for pk in DataExport.objects.values_list('pk', flat=True)}
+            for path in root.iterdir():
+                if path.is_dir() and path.name not in existing:
+                    shutil.rmtree(path, ignore_errors=True)
+        return count
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-19 13:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_alter_customuser_options_remove_customuser_username_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, db_index=True, help_text='탈퇴 일시 (탈퇴 시 비활성화되고, 유예 기간 후 백그라운드 작업이 데이터와 함께 실제 삭제)', null=True),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 6.0.1 on 2026-10-19 13:04
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_customuser_deleted_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DataExport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('running', '진행 중'), ('completed', '완료'), ('failed', '실패')], default='pending', help_text='진행 상태', max_length=20)),
+                ('completed_tables', models.JSONField(default=list, help_text='파일 작성을 마친 테이블 목록 (재시작 시 건너뜀)')),
+                ('row_count', models.PositiveIntegerField(default=0, help_text='내보낸 행 수')),
+                ('file_size', models.PositiveBigIntegerField(default=0, help_text='ZIP 파일 크기 (바이트)')),
+                ('error', models.TextField(blank=True, help_text='마지막 실패 사유')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='요청 시간')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='수정 시간')),
+                ('completed_at', models.DateTimeField(blank=True, help_text='완료 시간', null=True)),
+                ('user', models.ForeignKey(help_text='내보내기를 요청한 사용자', on_delete=django.db.models.deletion.CASCADE, related_name='data_exports', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '데이터 내보내기',
+                'verbose_name_plural': '데이터 내보내기들',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['user', '-created_at'], name='users_datae_user_id_c97527_idx')],
+            },
+        ),
+    ]
@@ -107,6 +107,12 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
         null=True,
         help_text="마지막 로그인 일시 (자동 기록, 비워둘 수 있음, 로그인 시 업데이트)"
     )
+    deleted_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        db_index=True,
+        help_text="탈퇴 일시 (탈퇴 시 비활성화되고, 유예 기간 후 백그라운드 작업이 데이터와 함께 실제 삭제)"
+    )
     
     # 사용자 객체 반환 매니저 지정
     objects = CustomUserManager()
@@ -123,6 +129,10 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
         verbose_name_plural = '사용자들'     # 복수형 이름 (Django Admin에서 표시)
         db_table = 'users'                  # 실제 데이터베이스 테이블명 명시
         ordering = ['-date_joined']          # 기본 정렬 순서 (가입일 내림차순, 최신순)
+        indexes = [
+            # 관리자 목록 정렬/가입일 필터용
+            models.Index(fields=['date_joined'], name='users_date_joined'),
+        ]
     
     def __str__(self):
         """
@@ -161,3 +171,56 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
         - user.nickname = "" -> "test@example.com" 반환
         """
         return self.nickname or self.email
+
+
+class DataExport(models.Model):
+    """
+    사용자 데이터 내보내기 작업 모델
+
+    Celery 작업이 테이블별로 gzip JSON Lines 파일을 만들고, 모두 끝나면 ZIP 으로 묶음
+    완료한 테이블 목록(completed_tables)을 저장하므로 작업이 중단되어도 다음 테이블부터 이어서 진행
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_COMPLETED = 'completed'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, '대기'),
+        (STATUS_RUNNING, '진행 중'),
+        (STATUS_COMPLETED, '완료'),
+        (STATUS_FAILED, '실패'),
+    ]
+
+    user = models.ForeignKey(
+        CustomUser,
+        on_delete=models.CASCADE,
+        related_name='data_exports',
+        help_text="내보내기를 요청한 사용자"
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+        help_text="진행 상태"
+    )
+    completed_tables = models.JSONField(
+        default=list,
+        help_text="파일 작성을 마친 테이블 목록 (재시작 시 건너뜀)"
+    )
+    row_count = models.PositiveIntegerField(default=0, help_text="내보낸 행 수")
+    file_size = models.PositiveBigIntegerField(default=0, help_text="ZIP 파일 크기 (바이트)")
+    error = models.TextField(blank=True, help_text="마지막 실패 사유")
+    created_at = models.DateTimeField(auto_now_add=True, help_text="요청 시간")
+    updated_at = models.DateTimeField(auto_now=True, help_text="수정 시간")
+    completed_at = models.DateTimeField(null=True, blank=True, help_text="완료 시간")
+
+    class Meta:
+        verbose_name = '데이터 내보내기'
+        verbose_name_plural = '데이터 내보내기들'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+        ]
+
+    def __str__(self):
+        return f"데이터 내보내기 #{self.pk} ({self.user.email}, {self.status})"
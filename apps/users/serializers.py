@@ -1,5 +1,8 @@
+from django.urls import reverse
 from rest_framework import serializers
 
+from .models import DataExport
+
 
 class RegisterSerializer(serializers.Serializer):
     email = serializers.EmailField(
@@ -103,3 +106,51 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
 
 class DestroySerializer(serializers.Serializer):
     pass
+
+
+class DataVersionQuerySerializer(serializers.Serializer):
+    after = serializers.IntegerField(
+        required=False,
+        min_value=0,
+        help_text="클라이언트가 알고 있는 데이터 버전 (이후 변경 여부를 changed 로 응답, 롱 폴링 허용 시 변경까지 대기)"
+    )
+    timeout = serializers.IntegerField(
+        required=False,
+        min_value=0,
+        help_text="최대 대기 시간 (초, 서버 설정값 DATA_VERSION_MAX_WAIT 를 넘지 않음, 기본 설정에서는 대기하지 않음)"
+    )
+
+
+class DataVersionSerializer(serializers.Serializer):
+    version = serializers.IntegerField(
+        help_text="사용자 데이터 버전 (일정/시험/스터디 데이터가 바뀔 때마다 증가)"
+    )
+    changed = serializers.BooleanField(
+        help_text="after 로 지정한 버전 이후 변경이 있었는지 (after 가 없으면 항상 true)"
+    )
+
+
+class DataExportSerializer(serializers.Serializer):
+    id = serializers.IntegerField(read_only=True)
+    status = serializers.CharField(
+        read_only=True,
+        help_text="진행 상태 (pending/running/completed/failed)"
+    )
+    completed_tables = serializers.ListField(
+        child=serializers.CharField(),
+        read_only=True,
+        help_text="파일 작성을 마친 테이블 목록"
+    )
+    row_count = serializers.IntegerField(read_only=True, help_text="내보낸 행 수")
+    file_size = serializers.IntegerField(read_only=True, help_text="ZIP 파일 크기 (바이트)")
+    error = serializers.CharField(read_only=True, help_text="마지막 실패 사유")
+    created_at = serializers.DateTimeField(read_only=True)
+    completed_at = serializers.DateTimeField(read_only=True, allow_null=True)
+    download_url = serializers.SerializerMethodField(help_text="완료된 경우 다운로드 URL")
+
+    def get_download_url(self, obj) -> str | None:
+        if obj.status != DataExport.STATUS_COMPLETED:
+            return None
+        request = self.context.get('request')
+        path = reverse('users:data-export-download', kwargs={'export_id': obj.pk})
+        return request.build_absolute_uri(path) if request else path
@@ -89,6 +89,21 @@ class UserService:
         user.last_login = timezone.now()
         user.save(update_fields=['last_login'])
 
+    @staticmethod
+    def delete_user(user: CustomUser) -> None:
+        """
+        회원탈퇴 (소프트 삭제)
+
+        - 계정을 비활성화하고 탈퇴 일시만 기록한 뒤 바로 반환
+        - 같은 이메일로 다시 가입할 수 있도록 이메일을 탈퇴 전용 주소로 변경
+        - 사용자의 일정/스터디 데이터와 계정은 SoftDeleteReaper 가 청크 단위로 실제 삭제
+        """
+        user.is_active = False
+        user.deleted_at = timezone.now()
+        user.email = f'deleted-{user.pk}@deleted.invalid'
+        user.set_unusable_password()
+        user.save(update_fields=['is_active', 'deleted_at', 'email', 'password'])
+
     @staticmethod
     def check_email_exists(email: str) -> bool:
         """
@@ -0,0 +1,36 @@
+"""
+사용자 관련 Celery 작업
+"""
+from celery import shared_task
+
+from .export import DataExportService
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def run_data_export(self, export_id):
+    """
+    사용자 데이터 내보내기 실행
+
+    실패하면 완료한 테이블을 유지한 채 재시도하여 다음 테이블부터 이어서 진행하고,
+    재시도를 모두 소진하면 실패로 기록 (사용자가 다시 요청하면 같은 작업을 이어서 실행)
+    :param export_id: DataExport ID
+    :return: 내보낸 행 수
+    """
+    try:
+        export = DataExportService.run(export_id)
+    except Exception as exc:
+        if self.request.retries >= self.max_retries:
+            DataExportService.mark_failed(export_id, exc)
+            raise
+        raise self.retry(exc=exc)
+    return export.row_count
+
+
+@shared_task
+def prune_data_exports():
+    """
+    보관 기간이 지난 데이터 내보내기 파일 정리 (Celery beat 로 주기 실행)
+
+    :return: 삭제한 내보내기 수
+    """
+    return DataExportService.prune()
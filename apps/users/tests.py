@@ -1,3 +1,93 @@
-from django.test import TestCase
+"""
+사용자 앱 테스트 (데이터 버전, 데이터 내보내기)
+"""
+import gzip
+import json
+import time
+import zipfile
+from datetime import timedelta
 
-# Create your tests here.
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.calendars.models import Event
+from apps.users.export import DataExportService
+from apps.users.models import CustomUser, DataExport
+from apps.users.tasks import run_data_export
+from core.versioning import DataVersionService
+
+
+@pytest.fixture
+def user(db):
+    return CustomUser.objects.create_user('user@example.com', 'password123!', nickname='user')
+
+
+@pytest.fixture
+def api_client(user):
+    client = APIClient()
+    client.force_authenticate(user)
+    return client
+
+
+def test_data_version(user, api_client):
+    url = reverse('users:data-version')
+    response = api_client.get(url)
+    assert response.status_code == 200
+    assert response.json() == {'version': 0, 'changed': True}
+    etag = response['ETag']
+
+    # 바뀌지 않았으면 304, 바뀌면 새 버전과 새 ETag
+    assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+    DataVersionService.increment(user.pk)
+    response = api_client.get(url, {'after': 0}, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.json() == {'version': 1, 'changed': True}
+    assert response['ETag'] != etag
+
+
+def test_data_version_does_not_wait_by_default(user, api_client):
+    # DATA_VERSION_MAX_WAIT 기본값(0)에서는 timeout 을 지정해도 워커를 붙잡지 않고 바로 응답
+    started = time.monotonic()
+    response = api_client.get(reverse('users:data-version'), {'after': 0, 'timeout': 30})
+    assert time.monotonic() - started < 1
+    assert response.json() == {'version': 0, 'changed': False}
+
+
+def test_data_export(user, api_client, settings, tmp_path, monkeypatch, django_capture_on_commit_callbacks):
+    settings.DATA_EXPORT_ROOT = tmp_path
+    # 브로커 없이 커밋 후 등록되는 작업을 그 자리에서 실행
+    monkeypatch.setattr(run_data_export, 'delay', lambda export_id: run_data_export.apply(args=[export_id]).get())
+    now = timezone.now()
+    Event.objects.create(user=user, title='일정', start_at=now, end_at=now + timedelta(hours=1))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.post(reverse('users:data-export-list'))
+    assert response.status_code == 202
+    export = DataExport.objects.get(user=user)
+    assert export.status == DataExport.STATUS_COMPLETED
+    assert export.completed_tables == DataExportService.get_tables()
+
+    with zipfile.ZipFile(DataExportService.get_archive_path(export)) as archive:
+        profile = json.loads(gzip.decompress(archive.read('profile.jsonl.gz')))
+        assert profile['email'] == user.email
+        events = archive.read('events.jsonl.gz')
+    assert [row['title'] for row in map(json.loads, gzip.decompress(events).splitlines())] == ['일정']
+
+
+def test_data_export_requeues_stale_jobs(user, settings, django_capture_on_commit_callbacks):
+    settings.DATA_EXPORT_STALE_MINUTES = 30
+    export = DataExport.objects.create(user=user, status=DataExport.STATUS_RUNNING)
+
+    # 진행 중인 작업은 그대로 반환
+    with django_capture_on_commit_callbacks() as callbacks:
+        assert DataExportService.request_export(user).pk == export.pk
+    assert not callbacks
+
+    # 워커가 죽어 오래 갱신되지 않은 작업은 같은 작업을 이어서 실행하도록 다시 예약
+    DataExport.objects.filter(pk=export.pk).update(updated_at=timezone.now() - timedelta(minutes=31))
+    with django_capture_on_commit_callbacks() as callbacks:
+        requeued = DataExportService.request_export(user)
+    assert requeued.pk == export.pk and requeued.status == DataExport.STATUS_PENDING
+    assert len(callbacks) == 1
@@ -66,6 +66,27 @@ urlpatterns = [
     # 인증: 필요 (JWT 토큰)
     path('api/users/me/profile/', views.UserProfileView.as_view(), name='profile-detail'),
     
+    # 데이터 버전 조회 / 변경 대기 (롱 폴링)
+    # GET /api/users/me/version/?after=<버전>&timeout=<초>
+    # 인증: 필요 (JWT 토큰)
+    path('api/users/me/version/', views.DataVersionView.as_view(), name='data-version'),
+    
+    # 데이터 내보내기 요청/목록
+    # POST /api/users/me/exports/ (요청, 백그라운드 실행)
+    # GET /api/users/me/exports/ (목록)
+    # 인증: 필요 (JWT 토큰)
+    path('api/users/me/exports/', views.DataExportView.as_view(), name='data-export-list'),
+    
+    # 데이터 내보내기 상태 조회
+    # GET /api/users/me/exports/<export_id>/
+    # 인증: 필요 (JWT 토큰)
+    path('api/users/me/exports/<int:export_id>/', views.DataExportDetailView.as_view(), name='data-export-detail'),
+    
+    # 데이터 내보내기 다운로드 (ZIP 파일 스트리밍)
+    # GET /api/users/me/exports/<export_id>/download/
+    # 인증: 필요 (JWT 토큰)
+    path('api/users/me/exports/<int:export_id>/download/', views.DataExportDownloadView.as_view(), name='data-export-download'),
+    
     # ========== 이메일 인증 관련 URL ==========
     
     # 이메일 인증 코드 발송 (설계서 기준: EmailView)
@@ -1,24 +1,31 @@
 """
 사용자 관련 API 뷰 모듈
 """
+from django.conf import settings
+from django.http import FileResponse
 from rest_framework import status, generics
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from rest_framework.renderers import JSONRenderer, BrowsableAPIRenderer
-from rest_framework.parsers import JSONParser, FormParser, MultiPartParser
+from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiRequest, OpenApiExample
 
-from .models import CustomUser
+from core.renderers import FastJSONRenderer
+from core.parsers import FastJSONParser
+from core.conditional import get_not_modified_response, make_etag, set_validator_headers
+from core.versioning import DataVersionService
+
+from .models import CustomUser, DataExport
 from .services import (
     AuthService,
     UserService,
     EmailVerificationService,
     PasswordResetService,
 )
+from .export import DataExportService
 from .utils import TokenService
-from .exceptions import UserException
+from .exceptions import UserException, DataExportNotFoundError, DataExportNotReadyError
 from .serializers import (
     RegisterSerializer,
     LoginSerializer,
@@ -31,6 +38,9 @@ from .serializers import (
     EmailExistCheckSerializer,
     PasswordResetRequestSerializer,
     PasswordResetConfirmSerializer,
+    DataVersionQuerySerializer,
+    DataVersionSerializer,
+    DataExportSerializer,
 )
 
 
@@ -97,19 +107,14 @@ class RegisterView(generics.CreateAPIView):
 class LoginView(APIView):
     """로그인 API"""
     permission_classes = [AllowAny]
-    renderer_classes = [JSONRenderer]
-    
-    def get_parsers(self):
-        """form-data와 JSON 모두 처리"""
-        return [JSONParser(), FormParser(), MultiPartParser()]
-    
-    def get_renderers(self):
-        """항상 JSON 렌더러만 사용"""
-        return [JSONRenderer()]
+    # form-data와 JSON 모두 처리, 응답은 항상 JSON
+    renderer_classes = [FastJSONRenderer]
+    parser_classes = [FastJSONParser, FormParser, MultiPartParser]
     
     def perform_content_negotiation(self, request, force=False):
         """Content negotiation을 강제로 JSON으로 설정"""
-        return (JSONRenderer(), 'application/json')
+        renderer = self.get_renderers()[0]
+        return (renderer, renderer.media_type)
     
     def dispatch(self, request, *args, **kwargs):
         """Accept 헤더를 강제로 application/json으로 설정"""
@@ -174,8 +179,8 @@ class LogoutView(APIView):
     """로그아웃 API"""
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication]
-    renderer_classes = [JSONRenderer]
-    parser_classes = [JSONParser, FormParser, MultiPartParser]
+    renderer_classes = [FastJSONRenderer]
+    parser_classes = [FastJSONParser, FormParser, MultiPartParser]
 
     @extend_schema(
         request=LoginOutSerializer,
@@ -284,10 +289,127 @@ class UserDeleteView(generics.DestroyAPIView):
     def destroy(self, request, *args, **kwargs):
         """회원탈퇴 처리"""
         user = self.get_object()
-        user.delete()
+        UserService.delete_user(user)
         return Response({'message': '회원탈퇴가 완료되었습니다.'}, status=status.HTTP_200_OK)
 
 
+@extend_schema(
+    tags=['사용자 정보'],
+    summary='데이터 버전 조회',
+    description=(
+        '일정/시험/스터디 데이터가 바뀔 때마다 증가하는 버전을 조회합니다. '
+        '응답의 ETag 를 If-None-Match 로 보내면 바뀌지 않았을 때 304 로 응답하므로 짧은 주기로 폴링할 수 있습니다. '
+        '?after=<버전> 을 지정하면 그 이후 변경 여부(changed)를 돌려주며, '
+        'DATA_VERSION_MAX_WAIT 가 설정된 서버에서만 버전이 바뀌거나 timeout 초가 지날 때까지 기다립니다 (롱 폴링)'
+    ),
+    parameters=[DataVersionQuerySerializer],
+    responses=DataVersionSerializer,
+)
+class DataVersionView(APIView):
+    """사용자 데이터 버전 조회 API"""
+    permission_classes = [IsAuthenticated]
+    # 변경 직후의 버전을 돌려줘야 하므로 primary 에서 읽음
+    replica_reads = False
+    
+    def get(self, request):
+        """현재 버전 조회 (after 지정 + 롱 폴링 허용 시 변경 대기)"""
+        query = DataVersionQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        after = query.validated_data.get('after')
+        
+        # 동기 워커를 대기로 묶지 않도록 기본값(0)은 바로 응답
+        max_wait = settings.DATA_VERSION_MAX_WAIT
+        timeout = min(query.validated_data.get('timeout', max_wait), max_wait)
+        if after is not None and timeout > 0:
+            version = DataVersionService.wait_for_change(request.user.pk, after, timeout)
+        else:
+            version = DataVersionService.get_version(request.user.pk)
+        
+        etag = make_etag('data-version', request.user.pk, version)
+        not_modified = get_not_modified_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+        changed = True if after is None else version > after
+        return set_validator_headers(
+            Response({'version': version, 'changed': changed}, status=status.HTTP_200_OK), etag
+        )
+
+
+@extend_schema(
+    tags=['사용자 정보'],
+    summary='데이터 내보내기 요청/목록',
+    description=(
+        '사용자 정보와 일정/시험/스터디 데이터를 ZIP 파일(테이블별 gzip JSON Lines)로 내보내는 작업을 요청하거나 '
+        '요청한 작업 목록을 조회합니다. 작업은 백그라운드에서 실행되며, 실패했거나 오래 멈춘 작업은 다시 요청하면 이어서 진행합니다'
+    ),
+    request=None,
+    responses=DataExportSerializer,
+)
+class DataExportView(APIView):
+    """데이터 내보내기 요청/목록 API"""
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request):
+        """내보내기 작업 목록 조회 (최신순)"""
+        exports = DataExport.objects.filter(user=request.user)
+        serializer = DataExportSerializer(exports, many=True, context={'request': request})
+        return Response(serializer.data, status=status.HTTP_200_OK)
+    
+    def post(self, request):
+        """내보내기 작업 요청 (진행 중인 작업이 있으면 그 작업 반환)"""
+        export = DataExportService.request_export(request.user)
+        serializer = DataExportSerializer(export, context={'request': request})
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+
+@extend_schema(
+    tags=['사용자 정보'],
+    summary='데이터 내보내기 상태 조회',
+    description='데이터 내보내기 작업의 진행 상태를 조회합니다',
+    responses=DataExportSerializer,
+)
+class DataExportDetailView(APIView):
+    """데이터 내보내기 상태 조회 API"""
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request, export_id):
+        """내보내기 작업 상태 조회"""
+        export = DataExport.objects.filter(user=request.user, pk=export_id).first()
+        if export is None:
+            return DataExportNotFoundError().to_response()
+        serializer = DataExportSerializer(export, context={'request': request})
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    tags=['사용자 정보'],
+    summary='데이터 내보내기 다운로드',
+    description='완료된 데이터 내보내기 ZIP 파일을 다운로드합니다 (파일 스트리밍)',
+    responses={(200, 'application/zip'): bytes},
+)
+class DataExportDownloadView(APIView):
+    """데이터 내보내기 다운로드 API"""
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request, export_id):
+        """ZIP 파일 스트리밍 응답"""
+        export = DataExport.objects.filter(user=request.user, pk=export_id).first()
+        if export is None:
+            return DataExportNotFoundError().to_response()
+        if export.status != DataExport.STATUS_COMPLETED:
+            return DataExportNotReadyError().to_response()
+        
+        path = DataExportService.get_archive_path(export)
+        if not path.exists():
+            return DataExportNotFoundError('내보내기 파일이 만료되었습니다. 다시 요청해 주세요.').to_response()
+        return FileResponse(
+            open(path, 'rb'),
+            as_attachment=True,
+            filename=f'data-export-{export.pk}.zip',
+            content_type='application/zip',
+        )
+
+
 @extend_schema(
     tags=['사용자 정보'],
     summary='유저 프로필 조회/수정',
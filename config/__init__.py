@@ -0,0 +1,4 @@
+# Django 시작 시 Celery 앱을 함께 로드하여 @shared_task 가 이 앱에 등록되도록 함
+from .celery import app as celery_app
+
+__all__ = ('celery_app',)
@@ -0,0 +1,15 @@
+"""
+Celery 애플리케이션 설정
+
+- Django settings 의 CELERY_* 값을 읽어 Celery 앱을 구성
+- 각 앱의 tasks.py 를 자동으로 탐색하여 등록
+"""
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.local')
+
+app = Celery('config')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
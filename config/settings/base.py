@@ -6,8 +6,12 @@ Django base settings
 from pathlib import Path
 import os
 from datetime import timedelta
+from celery.schedules import crontab
+from corsheaders.defaults import default_headers
 from dotenv import load_dotenv
 from django.core.mail.backends.smtp import EmailBackend
+
+from core.dbconfig import get_databases
 # --------------------------------------------------
 # BASE DIR & ENV
 # --------------------------------------------------
@@ -52,10 +56,13 @@ THIRD_APPS = [
 ]
 
 OWN_APPS = [
+    "core",
     "apps.users",
     "apps.calendars",
     "apps.study",
     "apps.reports",
+    "apps.sync",
+    "apps.search",
 ]
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_APPS + OWN_APPS
@@ -64,13 +71,23 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_APPS + OWN_APPS
 # MIDDLEWARE
 # --------------------------------------------------
 MIDDLEWARE = [
+    # 전체 처리 시간을 재도록 맨 앞에 위치 (URL 별 지연 시간/DB·캐시 시간, GET /metrics)
+    "core.metrics.MetricsMiddleware",
+    # 느린 요청 스택 샘플링/cProfile (PROFILING_ENABLED 가 아니면 제외됨)
+    "core.profiling.ProfilingMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    # 요청 전체(세션/인증 포함)의 쿼리를 세도록 앞쪽에 위치 (QUERY_BUDGET_ENABLED 가 아니면 제외됨)
+    "core.querybudget.QueryBudgetMiddleware",
+    # 응답 본문을 다시 쓰므로 본문을 읽거나 수정하는 미들웨어보다 앞에 위치
+    "core.compression.CompressionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    # 인증 이후에 위치 (데이터를 변경한 사용자를 primary 에 고정할 때 request.user 사용)
+    "core.db_router.ReplicaRoutingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "allauth.account.middleware.AccountMiddleware",
@@ -103,9 +120,21 @@ TEMPLATES = [
 
 # --------------------------------------------------
 # DATABASE
-# 👉 실제 DB 설정은 local / production 에서 오버라이드
+# 👉 POSTGRES_* / DB_* 환경변수로 설정 (지속 연결 또는 psycopg3 연결 풀, core/dbconfig.py 참고)
 # --------------------------------------------------
-DATABASES = {}
+DATABASES = get_databases()
+
+# 안전한 메서드(GET 등)의 읽기를 DATABASES['replica'] 로 보내는 라우터 (replica 가 없으면 항상 default)
+DATABASE_ROUTERS = ["core.db_router.ReplicaRouter"]
+REPLICA_DATABASE_ALIAS = "replica"
+
+# 데이터를 변경한 사용자를 primary 에 고정하는 시간 (초, read-your-writes)
+REPLICA_PIN_SECONDS = int(os.getenv("REPLICA_PIN_SECONDS", 5))
+REPLICA_PIN_COOKIE_NAME = "db_pin"
+
+# replica 상태 확인 주기 (초) / 허용할 최대 복제 지연 (초)
+REPLICA_HEALTH_CHECK_INTERVAL = int(os.getenv("REPLICA_HEALTH_CHECK_INTERVAL", 10))
+REPLICA_MAX_LAG_SECONDS = int(os.getenv("REPLICA_MAX_LAG_SECONDS", 5))
 
 # --------------------------------------------------
 # AUTH / USER
@@ -139,6 +168,27 @@ MEDIA_ROOT = BASE_DIR / "media"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# --------------------------------------------------
+# CACHE
+# --------------------------------------------------
+REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/1")
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+    }
+}
+
+# 사용자 데이터 버전 카운터 / 변경 알림(pub/sub)에 사용할 Redis (None 이면 DB 만 사용)
+DATA_VERSION_REDIS_URL = os.getenv("DATA_VERSION_REDIS_URL", REDIS_URL)
+# Redis 오류 후 Redis 를 건너뛰고 DB 미러만 사용할 시간 (초). 장애 중 요청마다 연결 시간 초과를 기다리지 않도록 함
+DATA_VERSION_REDIS_RETRY_SECONDS = int(os.getenv("DATA_VERSION_REDIS_RETRY_SECONDS", 30))
+
+# 데이터 버전 변경 대기(롱 폴링) 최대 시간 (초). 대기 중에는 워커 하나를 점유하므로
+# 기본값 0 은 대기하지 않고 바로 응답 (클라이언트는 If-None-Match 로 폴링), 비동기/gevent 워커에서만 늘릴 것
+DATA_VERSION_MAX_WAIT = int(os.getenv("DATA_VERSION_MAX_WAIT", 0))
+
 # --------------------------------------------------
 # REST FRAMEWORK
 # --------------------------------------------------
@@ -161,12 +211,22 @@ REST_FRAMEWORK = {
         "anon": "100/day",
         "user": "1000/day",
     },
+    # orjson 이 설치되어 있으면 orjson, 없으면 표준 json 으로 동작
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "core.renderers.FastJSONRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "core.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
     ],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
+# 응답 압축 (API_COMPRESSION_MIN_SIZE 바이트 이상 JSON/텍스트 응답만, brotli 설치 시 br 우선)
+API_COMPRESSION_ENABLED = os.getenv("API_COMPRESSION_ENABLED", "True").lower() == "true"
+API_COMPRESSION_MIN_SIZE = int(os.getenv("API_COMPRESSION_MIN_SIZE", 1024))
+
 # --------------------------------------------------
 # SIMPLE JWT
 # --------------------------------------------------
@@ -207,11 +267,187 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_TIMEZONE = "Asia/Seoul"
 DJANGO_CELERY_BEAT_TZ_AWARE = False
 
+CELERY_BEAT_SCHEDULE = {
+    # 전체 사용자 코호트 리포트 (매일 새벽 4시)
+    "reports-build-cohort-report": {
+        "task": "apps.reports.tasks.build_cohort_report",
+        "schedule": crontab(hour=4, minute=0),
+    },
+    # 보관 기간이 지난 삭제 기록 정리 (매일 새벽 4시 30분)
+    "sync-prune-tombstones": {
+        "task": "apps.sync.tasks.prune_tombstones",
+        "schedule": crontab(hour=4, minute=30),
+    },
+    # 유예 기간이 지난 소프트 삭제 행 / 탈퇴 사용자 실제 삭제 (5분마다)
+    "core-reap-soft-deleted": {
+        "task": "core.tasks.reap_soft_deleted",
+        "schedule": crontab(minute="*/5"),
+    },
+    # 보관 기간이 지난 데이터 내보내기 파일 정리 (매일 새벽 5시)
+    "users-prune-data-exports": {
+        "task": "apps.users.tasks.prune_data_exports",
+        "schedule": crontab(hour=5, minute=0),
+    },
+    # 오래 실행된 타이머 자동 종료 (15분마다)
+    "study-sweep-stale-timers": {
+        "task": "apps.study.tasks.sweep_stale_timers",
+        "schedule": crontab(minute="*/15"),
+    },
+    # 관리자 대시보드 사이트 지표 증분 집계 (5분마다)
+    "reports-refresh-site-metrics": {
+        "task": "apps.reports.tasks.refresh_site_metrics",
+        "schedule": crontab(minute="*/5"),
+    },
+}
+
+# --------------------------------------------------
+# REPORTS
+# --------------------------------------------------
+# 코호트 리포트 배치 집계 시 한 번에 읽을 행 수
+REPORTS_ANALYTICS_CHUNK_SIZE = int(os.getenv("REPORTS_ANALYTICS_CHUNK_SIZE", 5000))
+
+# 시험별 합격 기준(pass_threshold)이 없을 때 사용할 기본 합격 기준 (백분율)
+REPORTS_DEFAULT_PASS_THRESHOLD = float(os.getenv("REPORTS_DEFAULT_PASS_THRESHOLD", 70.0))
+
+# 합격 예측 결과 캐시 유지 시간 (초), 재학습 시 갱신됨
+REPORTS_PASS_PREDICTION_CACHE_TIMEOUT = int(os.getenv("REPORTS_PASS_PREDICTION_CACHE_TIMEOUT", 60 * 60 * 24))
+
+# 저장된 합격 예측 모델 최대 사용 기간 (초). 이보다 오래 전에 학습한 모델은 조회 시 다시 학습 (0 이면 제한 없음)
+REPORTS_PASS_PREDICTION_MAX_AGE = int(os.getenv("REPORTS_PASS_PREDICTION_MAX_AGE", 60 * 60 * 24 * 7))
+
+# 관리자 대시보드 지표 집계 시 워터마크를 겹쳐 읽는 시간 (초, 늦게 커밋된 행 포함)
+REPORTS_SITE_METRICS_OVERLAP_SECONDS = int(os.getenv("REPORTS_SITE_METRICS_OVERLAP_SECONDS", 60))
+
+# 관리자 대시보드 일별 지표 최대 조회 일수
+REPORTS_SITE_METRICS_MAX_DAYS = int(os.getenv("REPORTS_SITE_METRICS_MAX_DAYS", 365))
+
+# --------------------------------------------------
+# STUDY PLANNER
+# --------------------------------------------------
+# 시험 한 개당 기본 목표 공부 시간 (분), 과목 취약도에 따라 0.5~1.5배
+STUDY_PLANNER_TARGET_MINUTES = int(os.getenv("STUDY_PLANNER_TARGET_MINUTES", 600))
+
+# 계획 대상 시험이 이보다 많으면 요청 안에서 생성하지 않고 Celery 작업으로 생성
+STUDY_PLANNER_SYNC_EXAM_LIMIT = int(os.getenv("STUDY_PLANNER_SYNC_EXAM_LIMIT", 3))
+
+# 세션 배정에 쓸 최대 시간 (초), 넘기면 그때까지 배정한 계획만 저장
+STUDY_PLANNER_TIME_BUDGET_SECONDS = float(os.getenv("STUDY_PLANNER_TIME_BUDGET_SECONDS", 20))
+
+# --------------------------------------------------
+# STUDY TIMER
+# --------------------------------------------------
+# 이 시간(시간)보다 오래 실행 중인 타이머는 정리 작업이 자동 종료
+STUDY_TIMER_STALE_HOURS = int(os.getenv("STUDY_TIMER_STALE_HOURS", 12))
+
+# 자동 종료(또는 STUDY_TIMER_STALE_HOURS 를 넘겨 종료)한 타이머에 인정할 공부 시간 (분)
+STUDY_TIMER_AUTO_CLOSE_MINUTES = int(os.getenv("STUDY_TIMER_AUTO_CLOSE_MINUTES", 120))
+
+# 한 트랜잭션에서 종료할 타이머 수 / 한 번의 정리 작업에서 종료할 최대 타이머 수
+STUDY_TIMER_SWEEP_BATCH_SIZE = int(os.getenv("STUDY_TIMER_SWEEP_BATCH_SIZE", 500))
+STUDY_TIMER_SWEEP_MAX_PER_RUN = int(os.getenv("STUDY_TIMER_SWEEP_MAX_PER_RUN", 5000))
+
+# --------------------------------------------------
+# SYNC
+# --------------------------------------------------
+# 늦게 커밋된 트랜잭션의 행을 놓치지 않도록 동기화 토큰을 앞당기는 시간 (초)
+SYNC_OVERLAP_SECONDS = int(os.getenv("SYNC_OVERLAP_SECONDS", 5))
+
+# 한 번의 동기화 응답에 포함할 모델별 최대 행 수 (초과하면 has_more=True)
+SYNC_MAX_ROWS_PER_MODEL = int(os.getenv("SYNC_MAX_ROWS_PER_MODEL", 1000))
+
+# 삭제 기록 보관 기간 (일). 이보다 오래된 토큰은 전체 데이터로 재동기화
+SYNC_TOMBSTONE_RETENTION_DAYS = int(os.getenv("SYNC_TOMBSTONE_RETENTION_DAYS", 90))
+
+# --------------------------------------------------
+# ADMIN
+# --------------------------------------------------
+# 필터가 없는 관리자 목록에서 이 행 수(pg_class.reltuples) 이상인 테이블은 COUNT(*) 대신 추정 행 수 사용
+# (필터가 있으면 항상 COUNT, 0 이면 항상 COUNT)
+ADMIN_ESTIMATED_COUNT_THRESHOLD = int(os.getenv("ADMIN_ESTIMATED_COUNT_THRESHOLD", 100000))
+
+# --------------------------------------------------
+# METRICS
+# --------------------------------------------------
+# URL 별 지연 시간/상태 코드/DB·캐시 시간 메트릭 (GET /metrics, Prometheus 텍스트 형식)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+# gunicorn 워커별 메트릭을 합치기 위한 공유 디렉터리 (없으면 요청을 받은 워커의 값만 응답)
+METRICS_MULTIPROC_DIR = os.getenv("METRICS_MULTIPROC_DIR") or None
+
+# 워커가 공유 디렉터리에 메트릭을 저장하는 주기 (초)
+METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", 1.0))
+
+# 설정하면 /metrics 요청에 Authorization: Bearer <토큰> 필요 (없으면 DEBUG 또는 관리자 로그인 시에만 응답)
+METRICS_TOKEN = os.getenv("METRICS_TOKEN") or None
+
+# --------------------------------------------------
+# PROFILING
+# --------------------------------------------------
+# 느린 요청 프로파일링 (core.profiling, 끄면 미들웨어 체인에서 제외되어 비용 없음)
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+
+# 이 시간(ms)보다 오래 걸린 요청의 스택 샘플을 저장
+PROFILING_SLOW_THRESHOLD_MS = int(os.getenv("PROFILING_SLOW_THRESHOLD_MS", 500))
+
+# 스택 샘플링 간격 (ms)
+PROFILING_SAMPLE_INTERVAL_MS = int(os.getenv("PROFILING_SAMPLE_INTERVAL_MS", 5))
+
+# cProfile 로 전체 호출 그래프를 측정할 요청 비율 (0~1, 속도와 관계없이 저장)
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", 0.0))
+
+# 프로파일 저장 디렉터리와 최대 보관 개수 (넘으면 오래된 것부터 삭제)
+PROFILING_DIR = Path(os.getenv("PROFILING_DIR", BASE_DIR / "profiles"))
+PROFILING_MAX_FILES = int(os.getenv("PROFILING_MAX_FILES", 200))
+
+# --------------------------------------------------
+# QUERY BUDGET
+# --------------------------------------------------
+# 요청별 쿼리 수/DB 시간 측정 (local.py 는 DEBUG 일 때 기본 사용, 운영에서 켜면 측정 비용이 추가됨)
+QUERY_BUDGET_ENABLED = os.getenv("QUERY_BUDGET_ENABLED", "false").lower() == "true"
+
+# URL 패턴별 최대 쿼리 수 (QUERY_BUDGETS 에 없으면 기본값), 넘으면 경고 로그 / 테스트 실패
+QUERY_BUDGET_DEFAULT = 10
+QUERY_BUDGETS = {}
+
+# 같은 형태의 SQL 이 이 횟수 이상 반복되면 N+1 로 판단
+QUERY_BUDGET_DUPLICATE_THRESHOLD = 5
+
+# --------------------------------------------------
+# SOFT DELETE
+# --------------------------------------------------
+# 소프트 삭제 / 회원탈퇴 후 실제 삭제까지의 유예 기간 (시간)
+SOFT_DELETE_GRACE_HOURS = int(os.getenv("SOFT_DELETE_GRACE_HOURS", 24))
+
+# 실제 삭제 시 한 트랜잭션에서 삭제할 행 수
+SOFT_DELETE_REAP_CHUNK_SIZE = int(os.getenv("SOFT_DELETE_REAP_CHUNK_SIZE", 500))
+
+# 한 번의 삭제 작업 최대 실행 시간 (초), 남은 행은 다음 실행에서 이어서 처리
+SOFT_DELETE_REAP_TIME_BUDGET = int(os.getenv("SOFT_DELETE_REAP_TIME_BUDGET", 60))
+
+# --------------------------------------------------
+# DATA EXPORT
+# --------------------------------------------------
+# 데이터 내보내기 파일 저장 위치 (MEDIA_ROOT 밖, 다운로드 API 로만 제공)
+DATA_EXPORT_ROOT = Path(os.getenv("DATA_EXPORT_ROOT", BASE_DIR / "exports"))
+
+# 내보내기 시 한 번에 읽을 행 수
+DATA_EXPORT_CHUNK_SIZE = int(os.getenv("DATA_EXPORT_CHUNK_SIZE", 2000))
+
+# 내보내기 파일 보관 기간 (일)
+DATA_EXPORT_RETENTION_DAYS = int(os.getenv("DATA_EXPORT_RETENTION_DAYS", 7))
+
+# 대기/진행 중인 내보내기가 이 시간(분) 동안 갱신되지 않으면 멈춘 것으로 보고 다시 요청 시 재예약
+# (테이블 하나를 작성할 때마다 갱신되므로 가장 큰 테이블 작성 시간보다 길게 설정)
+DATA_EXPORT_STALE_MINUTES = int(os.getenv("DATA_EXPORT_STALE_MINUTES", 60))
+
 # --------------------------------------------------
 # CORS
 # --------------------------------------------------
 CORS_ALLOW_CREDENTIALS = True
 CORS_ALLOW_ALL_ORIGINS = True
+# 조건부 요청 (ETag / If-Match) 을 브라우저에서 사용할 수 있도록 허용
+CORS_ALLOW_HEADERS = (*default_headers, "if-match", "if-none-match", "if-modified-since", "if-unmodified-since")
+CORS_EXPOSE_HEADERS = ["etag", "last-modified", "x-query-count", "x-query-time-ms"]
 
 # --------------------------------------------------
 # DRF SPECTACULAR
@@ -240,6 +476,8 @@ SPECTACULAR_SETTINGS = {
         {"name": "시험"},
         {"name": "스터디"},
         {"name": "통계"},
+        {"name": "동기화"},
+        {"name": "운영"},
     ],
 }
 
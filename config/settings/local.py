@@ -13,6 +13,9 @@ from .base import *
 # 로컬 개발 환경에서는 디버그 모드를 활성화하여 상세한 에러 정보를 확인할 수 있음
 DEBUG = os.getenv('DEBUG', 'True').lower() == 'true'
 
+# 요청별 쿼리 수/N+1 측정 (응답 헤더 X-Query-Count, 예산 초과 시 경고 로그)
+QUERY_BUDGET_ENABLED = os.getenv('QUERY_BUDGET_ENABLED', str(DEBUG)).lower() == 'true'
+
 # CORS (Cross-Origin Resource Sharing) 설정
 # 프론트엔드와 백엔드가 다른 도메인/포트에서 실행될 때 필요한 설정
 
@@ -53,21 +56,16 @@ CORS_ALLOW_HEADERS = [
     'user-agent',
     'x-csrftoken',
     'x-requested-with',
+    'if-match',
+    'if-none-match',
+    'if-modified-since',
+    'if-unmodified-since',
 ]
 
 # ========== 데이터베이스 설정 (PostgreSQL 사용) ==========
-# PostgreSQL 데이터베이스 연결 정보를 환경변수에서 가져옴
-# 환경변수가 없으면 기본값 사용
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.postgresql',
-        'NAME': os.getenv('POSTGRES_DB', 'studycalender'),
-        'USER': os.getenv('POSTGRES_USER', 'postgres'),
-        'PASSWORD': os.getenv('POSTGRES_PASSWORD', 'postgres'),
-        'HOST': os.getenv('POSTGRES_HOST', 'localhost'),
-        'PORT': os.getenv('POSTGRES_PORT', '5432'),
-    }
-}
+# base.py 의 get_databases() 로 POSTGRES_* 환경변수에서 접속 정보를 가져옴 (없으면 localhost 기본값)
+# POSTGRES_REPLICA_HOST 가 있으면 읽기 복제본(replica)도 등록됨
+# 연결 재사용: DB_CONN_MAX_AGE (기본 60초) / 연결 풀: DB_POOL=true (core/dbconfig.py 참고)
 
 # SQLite를 사용하고 싶다면 아래 설정 사용 (로컬 개발용)
 # DATABASES = {
@@ -77,6 +75,9 @@ DATABASES = {
 #     }
 # }
 
+# 라우팅을 로컬에서 확인하려면 같은 파일을 replica 로도 등록 (GET 요청의 읽기가 replica 별칭으로 실행됨)
+# DATABASES['replica'] = {**DATABASES['default'], 'TEST': {'MIRROR': 'default'}}
+
 # ========== Celery 설정 (로컬 개발용) ==========
 # 로컬 개발 시 Celery를 사용하지 않으려면 아래 설정 주석 처리
 # 또는 로컬 Redis 설치 후 localhost로 변경
@@ -90,3 +91,13 @@ DATABASES = {
 # 또는 WSL2 사용
 CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND', 'django-db')
+
+# ========== 캐시 설정 (로컬 개발용) ==========
+# REDIS_URL 이 없으면 Redis 없이 실행할 수 있도록 프로세스 메모리 캐시 사용
+if not os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+    DATA_VERSION_REDIS_URL = os.getenv('DATA_VERSION_REDIS_URL')
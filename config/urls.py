@@ -11,7 +11,16 @@ from drf_spectacular.views import (
     SpectacularRedocView,
 )
 
-from .views import RootView, APIRootView
+from core.metrics import metrics_view
+
+from .views import (
+    RootView,
+    APIRootView,
+    DatabaseStatusView,
+    QueryStatsView,
+    ProfileListView,
+    ProfileDetailView,
+)
 
 
 # --------------------------------------------------
@@ -44,6 +53,19 @@ urlpatterns = [
     # Admin
     path("admin/", admin.site.urls),
 
+    # Prometheus 메트릭 (URL 별 지연 시간, METRICS_TOKEN 으로 보호)
+    path("metrics", metrics_view, name="metrics"),
+
+    # DB 연결 상태 진단 (관리자 전용)
+    path("api/health/db/", DatabaseStatusView.as_view(), name="database-status"),
+
+    # URL 별 쿼리 수/DB 시간 히스토그램 (관리자 전용)
+    path("api/health/queries/", QueryStatsView.as_view(), name="query-stats"),
+
+    # 느린 요청 프로파일 (관리자 전용)
+    path("api/health/profiles/", ProfileListView.as_view(), name="profile-list"),
+    path("api/health/profiles/<str:profile_id>/", ProfileDetailView.as_view(), name="profile-detail"),
+
     # ---------------------------
     # API - Apps
     # ---------------------------
@@ -51,6 +73,8 @@ urlpatterns = [
     path("api/calendars/", include("apps.calendars.urls")),
     path("api/study/", include("apps.study.urls")),
     path("api/reports/", include("apps.reports.urls")),
+    path("api/sync/", include("apps.sync.urls")),
+    path("api/search/", include("apps.search.urls")),
 
     # ---------------------------
     # Browsable API (Session Auth)
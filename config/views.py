@@ -1,9 +1,15 @@
 """
 프로젝트 루트 레벨 뷰
 """
+from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAdminUser
+from drf_spectacular.utils import extend_schema
+
+from core.dbstatus import DatabaseStatusService
+from core.profiling import ProfileStore
+from core.querybudget import QueryStats
 
 
 class RootView(APIView):
@@ -33,6 +39,7 @@ class RootView(APIView):
                 'exams': '/api/exams/',
                 'study': '/api/study-events/',
                 'reports': '/api/statistics/',
+                'sync': '/api/sync/',
             }
         })
 
@@ -80,5 +87,110 @@ class APIRootView(APIView):
                 'exams': '/api/exams/',
                 'study': '/api/study-events/',
                 'reports': '/api/statistics/',
+                'sync': '/api/sync/',
             }
         })
+
+
+@extend_schema(
+    tags=['운영'],
+    summary='DB 연결 상태 진단',
+    description=(
+        '요청을 처리한 워커 프로세스의 DB 연결 방식, 연결 풀 사용률/대기 시간, '
+        '연결 획득 시간과 서버 기준 연결 수를 조회합니다 (관리자 전용)'
+    ),
+)
+class DatabaseStatusView(APIView):
+    """
+    DB 연결 상태 진단 뷰
+    
+    엔드포인트: GET /api/health/db/?samples=<측정 횟수>
+    인증 필요: 관리자 (is_staff)
+    """
+    permission_classes = [IsAdminUser]
+    
+    def get(self, request):
+        """
+        DB 별칭별 연결 상태 반환
+        """
+        try:
+            samples = min(max(int(request.query_params.get('samples', 3)), 0), 20)
+        except ValueError:
+            samples = 3
+        return Response({'databases': DatabaseStatusService.get_all_status(samples)})
+
+
+@extend_schema(
+    tags=['운영'],
+    summary='URL 별 쿼리 수/DB 시간 히스토그램',
+    description=(
+        '요청을 처리한 워커 프로세스에서 URL 패턴별로 누적한 쿼리 수, DB 시간 히스토그램과 '
+        '예산 초과/N+1 의심 요청 수를 조회합니다 (QUERY_BUDGET_ENABLED 일 때만 누적, 관리자 전용)'
+    ),
+)
+class QueryStatsView(APIView):
+    """
+    쿼리 예산 통계 뷰
+    
+    엔드포인트: GET /api/health/queries/
+    인증 필요: 관리자 (is_staff)
+    """
+    permission_classes = [IsAdminUser]
+    
+    def get(self, request):
+        """
+        URL 패턴별 히스토그램 반환
+        """
+        return Response({'endpoints': QueryStats.snapshot()})
+
+
+@extend_schema(
+    tags=['운영'],
+    summary='최근 느린 요청 프로파일 목록',
+    description=(
+        'PROFILING_SLOW_THRESHOLD_MS 를 넘은 요청과 PROFILING_SAMPLE_RATE 로 선택된 요청의 프로파일을 '
+        '최신순으로 조회합니다. 항목마다 처리 시간, 쿼리 수와 상위 함수/쿼리 일부를 포함합니다 (관리자 전용)'
+    ),
+)
+class ProfileListView(APIView):
+    """
+    요청 프로파일 목록 뷰
+    
+    엔드포인트: GET /api/health/profiles/?limit=<개수>
+    인증 필요: 관리자 (is_staff)
+    """
+    permission_classes = [IsAdminUser]
+    
+    def get(self, request):
+        """
+        최근 프로파일 요약 반환
+        """
+        try:
+            limit = min(max(int(request.query_params.get('limit', 50)), 1), 200)
+        except ValueError:
+            limit = 50
+        return Response({'profiles': ProfileStore.list(limit)})
+
+
+@extend_schema(
+    tags=['운영'],
+    summary='요청 프로파일 상세',
+    description='프로파일 하나의 상위 함수(호출 그래프), 상위 쿼리와 접힌 스택(flamegraph 입력 형식)을 조회합니다 (관리자 전용)',
+)
+class ProfileDetailView(APIView):
+    """
+    요청 프로파일 상세 뷰
+    
+    엔드포인트: GET /api/health/profiles/<profile_id>/
+    인증 필요: 관리자 (is_staff)
+    """
+    permission_classes = [IsAdminUser]
+    
+    def get(self, request, profile_id):
+        """
+        프로파일 상세 반환
+        """
+        record = ProfileStore.get(profile_id)
+        if record is None:
+            return Response({'detail': '프로파일을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(record)
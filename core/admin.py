@@ -0,0 +1,62 @@
+"""
+관리자(Admin) 목록 화면 공통 설정
+
+행이 수백만 개인 테이블에서도 목록 화면이 느려지지 않도록
+- 페이지 수 계산에 정확한 COUNT(*) 대신 PostgreSQL 통계의 추정 행 수 사용
+  (필터가 없는 쿼리셋이면서 pg_class.reltuples 가 ADMIN_ESTIMATED_COUNT_THRESHOLD 이상인 테이블만,
+  필터가 있거나 그보다 작으면 정확한 COUNT)
+- 검색/필터 결과 화면에서 전체 행 수(show_full_result_count) 를 세지 않음
+- 행마다 __str__ 로 외래 키를 지연 로딩하지 않도록 각 ModelAdmin 에 list_select_related 지정
+- 소프트 삭제 모델은 탈퇴 유예 기간 중인 사용자의 행을 목록과 행 수에서 제외
+"""
+from django.conf import settings
+from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+from .softdelete import SoftDeleteModel
+
+
+def get_estimated_count(queryset):
+    """
+    쿼리셋의 행 수 (필터가 없는 큰 PostgreSQL 테이블은 pg_class.reltuples 추정 행 수)
+
+    reltuples 는 테이블 전체의 추정치이므로 필터가 있는 쿼리셋은 항상 정확한 COUNT
+    (soft delete 매니저는 deleted_at 조건이 항상 붙으므로 정확한 COUNT)
+    """
+    connection = connections[queryset.db]
+    threshold = getattr(settings, 'ADMIN_ESTIMATED_COUNT_THRESHOLD', 100000)
+    if connection.vendor != 'postgresql' or not threshold or queryset.query.where:
+        return queryset.count()
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)',
+            [connection.ops.quote_name(queryset.model._meta.db_table)],
+        )
+        row = cursor.fetchone()
+    # reltuples 는 ANALYZE 전이면 -1 (PostgreSQL 14+) 또는 0
+    if row is None or row[0] < threshold:
+        return queryset.count()
+    return int(row[0])
+
+
+class EstimatedCountPaginator(Paginator):
+    """추정 행 수로 페이지 수를 계산하는 페이지네이터"""
+
+    @cached_property
+    def count(self):
+        return get_estimated_count(self.object_list)
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """큰 테이블용 ModelAdmin (추정 행 수, 전체 행 수 생략)"""
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if issubclass(self.model, SoftDeleteModel):
+            queryset = queryset.exclude_withdrawn()
+        return queryset
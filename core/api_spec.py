@@ -109,6 +109,7 @@ class TimerStartSerializer(serializers.Serializer):
 class TimerEndSerializer(serializers.Serializer):
     ended_at = serializers.DateTimeField(read_only=True)
     total_minutes = serializers.IntegerField(read_only=True)
+    needs_review = serializers.BooleanField(read_only=True, help_text="최대 시간을 넘겨 공부 시간을 제한했는지 (사용자 확인 필요)")
 
 
 # 공부 내용
@@ -129,6 +130,7 @@ class ExamSerializer(serializers.Serializer):
     exam_date = serializers.DateField()
     score = serializers.IntegerField(required=False)
     max_score = serializers.IntegerField()
+    pass_threshold = serializers.FloatField(required=False, allow_null=True, help_text="합격 기준 (백분율)")
 
 
 
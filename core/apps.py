@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    """여러 앱이 공통으로 사용하는 API 인프라 (직렬화, 렌더링, 미들웨어 등)"""
+    name = 'core'
@@ -0,0 +1,414 @@
+"""
+API 부하 벤치마크
+
+users / calendars / study / reports / search 앱의 모든 URL 패턴을 시나리오로 정의하고,
+프로세스 안의 부하 생성기(스레드마다 django.test.Client)로 전체 미들웨어를 거쳐 요청합니다.
+
+- 시나리오별 p50/p95/p99 지연 시간, 처리량(요청/초), 요청당 쿼리 수, 오류 수를 측정
+- 기준선(baseline) JSON 과 비교하여 p95 지연 시간이나 쿼리 수가 늘어난 시나리오를 회귀로 보고
+- 시나리오도 제외 사유도 없는 URL 패턴이 있으면 회귀로 보고 (새 API 를 추가하면 시나리오도 추가)
+
+벤치마크 데이터는 core.seeding 이 만든 사용자(@benchmark.invalid)를 사용합니다.
+실행 명령은 benchmark_api 입니다.
+"""
+import json
+import logging
+import math
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import timedelta
+from uuid import uuid4
+
+from django.conf import settings
+from django.db import connections
+from django.test import Client
+from django.utils import timezone
+from rest_framework.throttling import SimpleRateThrottle
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .querybudget import record_queries
+
+
+BENCHMARK_PREFIXES = ('api/users/', 'api/calendars/', 'api/study/', 'api/reports/', 'api/search/')
+
+BASELINE_VERSION = 1
+
+re_placeholder = re.compile(r'\{\w+\}')
+
+# 시나리오에서 요청하지 않는 URL 패턴과 사유
+EXCLUDED_ROUTES = {
+    'api/users/api/users/account/': '회원탈퇴는 벤치마크 사용자를 삭제함',
+    'api/users/api/users/email/verify/': '실제 메일 발송',
+    'api/users/api/users/password/reset/': '실제 메일 발송',
+    # 앞에 등록된 'api/statistics/<str:stat_type>/' 가 같은 경로를 처리하므로 호출되지 않음
+    'api/reports/api/statistics/weak-parts/': '앞선 URL 패턴에 가려짐',
+    'api/reports/api/statistics/pass-prediction/': '앞선 URL 패턴에 가려짐',
+}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    API 요청 시나리오
+
+    path 는 가상 사용자 객체 id 로 채우는 형식 문자열 (예: '/api/calendars/events/{event_id}/')
+    body 는 (가상 사용자, random.Random) 을 받아 JSON 본문을 만드는 함수 (GET 은 쿼리 파라미터)
+    """
+    name: str
+    method: str
+    path: str
+    body: object = None
+    expected: tuple = (200,)
+    auth: bool = True
+    staff: bool = False
+
+
+def _event_body(user, rng):
+    started = timezone.now() + timedelta(days=rng.randint(1, 30), hours=rng.randint(0, 23))
+    return {
+        'title': '벤치마크 일정',
+        'description': '',
+        'start_at': started.isoformat(),
+        'end_at': (started + timedelta(hours=1)).isoformat(),
+    }
+
+
+def _conflict_query(user, rng):
+    started = timezone.now() + timedelta(days=rng.randint(-30, 30))
+    return {'start': started.isoformat(), 'end': (started + timedelta(days=7)).isoformat()}
+
+
+def _repeat_event_body(user, rng):
+    return {
+        **_event_body(user, rng),
+        'rule': rng.choice(('FREQ=DAILY;INTERVAL=1', 'FREQ=WEEKLY;BYDAY=MO,WE')),
+        'until': (timezone.now() + timedelta(days=90)).date().isoformat(),
+    }
+
+
+def _exam_body(user, rng):
+    return {
+        'subject': rng.choice(('수학', '영어', '과학')),
+        'exam_date': (timezone.now() + timedelta(days=rng.randint(1, 60))).date().isoformat(),
+        'score': rng.randint(0, 100),
+        'max_score': 100,
+    }
+
+
+def _study_event_body(user, rng):
+    return {**_event_body(user, rng), 'goal': '벤치마크 목표'}
+
+
+SCENARIOS = (
+    # users
+    Scenario('signup', 'POST', '/api/users/api/signup/',
+             body=lambda user, rng: {'email': f'signup-{uuid4().hex}@benchmark-signup.invalid',
+                                     'password': user.password},
+             expected=(201,), auth=False),
+    Scenario('login', 'POST', '/api/users/api/login/',
+             body=lambda user, rng: {'email': user.email, 'password': user.password}, auth=False),
+    Scenario('logout', 'POST', '/api/users/api/logout',
+             body=lambda user, rng: {'refresh': str(RefreshToken.for_user(user.user))}),
+    Scenario('me', 'GET', '/api/users/api/users/me/'),
+    Scenario('me-profile', 'GET', '/api/users/api/users/me/profile/'),
+    Scenario('data-version', 'GET', '/api/users/api/users/me/version/'),
+    Scenario('export-list', 'GET', '/api/users/api/users/me/exports/'),
+    Scenario('export-detail', 'GET', '/api/users/api/users/me/exports/{export_id}/'),
+    # 내보내기가 끝나지 않았거나 파일이 만료되었으면 409 / 404
+    Scenario('export-download', 'GET', '/api/users/api/users/me/exports/{export_id}/download/',
+             expected=(200, 404, 409)),
+    Scenario('email-verify-confirm', 'POST', '/api/users/api/users/email/verify/confirm/',
+             body=lambda user, rng: {'email': user.email, 'code': '000000'}, expected=(400,), auth=False),
+    Scenario('email-exists', 'POST', '/api/users/api/users/find/email/',
+             body=lambda user, rng: {'email': user.email}, auth=False),
+    Scenario('password-reset-confirm', 'POST', '/api/users/api/users/password/reset/confirm/',
+             body=lambda user, rng: {'email': user.email, 'code': '000000', 'new_password': user.password}, auth=False),
+
+    # calendars ('events/' GET 은 같은 경로의 생성 뷰에 가려져 있어 POST 만 측정)
+    Scenario('event-create', 'POST', '/api/calendars/events/',
+             body=_event_body, expected=(201,)),
+    Scenario('event-detail', 'GET', '/api/calendars/events/{event_id}/'),
+    Scenario('event-conflicts', 'GET', '/api/calendars/conflicts/', body=_conflict_query),
+    Scenario('free-slots', 'GET', '/api/calendars/free-slots/',
+             body=lambda user, rng: {**_conflict_query(user, rng), 'prefer_exams': 'true'}),
+    Scenario('repeat-event-create', 'POST', '/api/calendars/events/repeat/',
+             body=_repeat_event_body, expected=(201,)),
+    Scenario('repeat-event-detail', 'GET', '/api/calendars/events/repeat/{repeat_event_id}/'),
+    Scenario('exam-list', 'GET', '/api/calendars/exams/'),
+    Scenario('exam-create', 'POST', '/api/calendars/exams/',
+             body=_exam_body, expected=(201,)),
+    Scenario('exam-detail', 'GET', '/api/calendars/exams/{exam_id}/'),
+    Scenario('exam-upcoming', 'GET', '/api/calendars/exams/upcoming/'),
+
+    # study
+    Scenario('study-list', 'GET', '/api/study/api/study-events/'),
+    Scenario('study-create', 'POST', '/api/study/api/study-events/',
+             body=_study_event_body, expected=(201,)),
+    Scenario('study-detail', 'GET', '/api/study/api/study-events/{study_event_id}/'),
+    Scenario('study-plan-preview', 'POST', '/api/study/api/study-plans/',
+             body=lambda user, rng: {'dry_run': True}),
+    Scenario('timer-start', 'POST', '/api/study/api/events/{study_event_id}/timer/start/', expected=(201,)),
+    # 다른 스레드가 먼저 종료했으면 400
+    Scenario('timer-stop', 'POST', '/api/study/api/events/{study_event_id}/timer/stop/', expected=(200, 400)),
+    Scenario('content-list', 'GET', '/api/study/api/study-events/{study_event_id}/contents/'),
+    Scenario('content-create', 'POST', '/api/study/api/study-events/{study_event_id}/contents/',
+             body=lambda user, rng: {'content': '벤치마크 공부', 'duration_minutes': rng.randint(10, 90)},
+             expected=(201,)),
+    Scenario('content-detail', 'GET', '/api/study/api/study-contents/{content_id}/'),
+
+    # reports
+    # 코호트 리포트를 아직 만들지 않았으면 404
+    Scenario('statistics-cohort', 'GET', '/api/reports/api/statistics/cohort/', expected=(200, 404), staff=True),
+    # 사이트 지표를 아직 집계하지 않았으면 404
+    Scenario('statistics-site', 'GET', '/api/reports/api/statistics/site/', expected=(200, 404), staff=True),
+    Scenario('statistics-study-time', 'GET', '/api/reports/api/statistics/study-time/subjects/'),
+    Scenario('statistics-average-score', 'GET', '/api/reports/api/statistics/average-score/subjects/'),
+    Scenario('statistics-weak-parts', 'GET', '/api/reports/api/statistics/weak-parts/'),
+    Scenario('statistics-quiz-accuracy', 'GET', '/api/reports/api/statistics/quizzes/accuracy/'),
+    Scenario('statistics-pass-prediction', 'GET', '/api/reports/api/statistics/pass-prediction/'),
+
+    # search
+    Scenario('search', 'GET', '/api/search/', body=lambda user, rng: {'q': rng.choice(['스터디', '공부', '일정'])}),
+)
+
+
+def _iter_routes(patterns, prefix=''):
+    from django.urls import URLResolver
+
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _iter_routes(pattern.url_patterns, prefix + str(pattern.pattern))
+        else:
+            yield prefix + str(pattern.pattern)
+
+
+def get_route(scenario):
+    """시나리오 경로를 실제로 처리하는 URL 패턴 (경로 변수는 1 로 채움)"""
+    from django.urls import Resolver404, resolve
+
+    path = re_placeholder.sub('1', scenario.path)
+    try:
+        return resolve(path).route
+    except Resolver404:
+        return None
+
+
+def get_uncovered_routes(scenarios=SCENARIOS):
+    """시나리오도 제외 사유도 없는 벤치마크 대상 URL 패턴 목록"""
+    from django.urls import get_resolver
+
+    covered = {get_route(scenario) for scenario in scenarios} | set(EXCLUDED_ROUTES)
+    routes = dict.fromkeys(_iter_routes(get_resolver().url_patterns))
+    return [route for route in routes if route.startswith(BENCHMARK_PREFIXES) and route not in covered]
+
+
+@dataclass
+class VirtualUser:
+    """부하 생성기가 요청에 사용하는 사용자와 그 사용자의 객체 id"""
+    user: object
+    email: str
+    password: str
+    token: str
+    ids: dict = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, user, password):
+        from apps.calendars.models import Event, Exam, RepeatEvent
+        from apps.study.models import StudyContent, StudyEvent
+        from apps.users.models import DataExport
+
+        def first_id(queryset):
+            return queryset.order_by('id').values_list('id', flat=True).first()
+
+        ids = {
+            'event_id': first_id(Event.objects.filter(user=user)),
+            'repeat_event_id': first_id(RepeatEvent.objects.filter(user=user)),
+            'exam_id': first_id(Exam.objects.filter(user=user)),
+            'study_event_id': first_id(StudyEvent.objects.filter(user=user)),
+            'content_id': first_id(StudyContent.objects.filter(study_event__user=user)),
+            'export_id': first_id(DataExport.objects.filter(user=user)),
+        }
+        if ids['export_id'] is None:
+            ids['export_id'] = DataExport.objects.create(user=user).pk
+        token = str(RefreshToken.for_user(user).access_token)
+        return cls(user=user, email=user.email, password=password, token=token, ids=ids)
+
+
+@contextmanager
+def quiet_request_log():
+    """예상한 4xx 응답마다 남는 django.request 경고 로그를 숨김 (5xx 오류 로그는 유지)"""
+    request_logger = logging.getLogger('django.request')
+    level = request_logger.level
+    request_logger.setLevel(logging.ERROR)
+    try:
+        yield
+    finally:
+        request_logger.setLevel(level)
+
+
+@contextmanager
+def unthrottled():
+    """
+    DRF 요청 제한 해제 (횟수 확인/캐시 기록 비용은 그대로 측정)
+
+    THROTTLE_RATES 는 클래스 정의 시점의 설정값이므로 설정이 아닌 클래스 속성을 바꿈
+    """
+    original = SimpleRateThrottle.THROTTLE_RATES
+    SimpleRateThrottle.THROTTLE_RATES = {scope: '1000000/s' for scope in original}
+    try:
+        yield
+    finally:
+        SimpleRateThrottle.THROTTLE_RATES = original
+
+
+def _get_host():
+    hosts = [host for host in settings.ALLOWED_HOSTS if host != '*' and not host.startswith('.')]
+    return hosts[0] if hosts else 'localhost'
+
+
+def percentile(sorted_values, percent):
+    """정렬된 값의 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+@dataclass
+class ScenarioResult:
+    scenario: Scenario
+    latencies: list = field(default_factory=list)
+    queries: list = field(default_factory=list)
+    errors: int = 0
+    statuses: dict = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def summary(self):
+        latencies = sorted(self.latencies)
+        requests = len(latencies)
+
+        def ms(value):
+            return round(value * 1000, 2) if value is not None else None
+
+        return {
+            'method': self.scenario.method,
+            'route': get_route(self.scenario),
+            'requests': requests,
+            'errors': self.errors,
+            'statuses': {str(code): count for code, count in sorted(self.statuses.items())},
+            'p50_ms': ms(percentile(latencies, 50)),
+            'p95_ms': ms(percentile(latencies, 95)),
+            'p99_ms': ms(percentile(latencies, 99)),
+            'throughput_rps': round(requests / self.elapsed, 2) if self.elapsed else None,
+            'avg_queries': round(sum(self.queries) / requests, 2) if requests else None,
+        }
+
+
+def run_scenario(scenario, virtual_users, staff_user, requests, concurrency, seed=0):
+    """
+    시나리오 하나를 concurrency 개 스레드로 requests 번 요청
+
+    :param virtual_users: 요청마다 무작위로 고를 VirtualUser 목록
+    :param staff_user: staff 시나리오에 사용할 VirtualUser
+    :return: ScenarioResult
+    """
+    result = ScenarioResult(scenario)
+    lock = threading.Lock()
+    host = _get_host()
+    per_thread = [requests // concurrency + (1 if index < requests % concurrency else 0)
+                  for index in range(concurrency)]
+
+    def worker(index, count):
+        rng = random.Random(f'{seed}-{scenario.name}-{index}')
+        client = Client(raise_request_exception=False, HTTP_HOST=host)
+        latencies, queries, statuses, errors = [], [], {}, 0
+        try:
+            for _ in range(count):
+                user = staff_user if scenario.staff else rng.choice(virtual_users)
+                path = scenario.path.format(**user.ids)
+                extra = {'HTTP_AUTHORIZATION': f'Bearer {user.token}'} if scenario.auth else {}
+                body = scenario.body(user, rng) if scenario.body else None
+                request = getattr(client, scenario.method.lower())
+
+                started = time.perf_counter()
+                with record_queries() as recorder:
+                    if body is None:
+                        response = request(path, **extra)
+                    elif scenario.method == 'GET':
+                        response = request(path, data=body, **extra)
+                    else:
+                        response = request(path, data=json.dumps(body), content_type='application/json', **extra)
+                latencies.append(time.perf_counter() - started)
+
+                queries.append(recorder.count)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+                if response.status_code not in scenario.expected:
+                    errors += 1
+        finally:
+            connections.close_all()
+        with lock:
+            result.latencies.extend(latencies)
+            result.queries.extend(queries)
+            result.errors += errors
+            for code, count in statuses.items():
+                result.statuses[code] = result.statuses.get(code, 0) + count
+
+    threads = [
+        threading.Thread(target=worker, args=(index, count), name=f'benchmark-{index}')
+        for index, count in enumerate(per_thread) if count
+    ]
+    started = time.perf_counter()
+    with unthrottled(), quiet_request_log():
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def build_report(results, config):
+    """기준선/결과 JSON"""
+    return {
+        'version': BASELINE_VERSION,
+        'created_at': timezone.now().isoformat(),
+        'config': config,
+        'scenarios': {result.scenario.name: result.summary() for result in results},
+    }
+
+
+def compare_to_baseline(report, baseline, tolerance=0.2, min_delta_ms=5.0, query_tolerance=0, require_all=True):
+    """
+    기준선 대비 회귀 목록
+
+    - 예상하지 못한 상태 코드가 있는 시나리오
+    - p95 가 기준선보다 tolerance 비율 이상, 그리고 min_delta_ms 이상 느려진 시나리오 (작은 값의 잡음 무시)
+    - 요청당 평균 쿼리 수가 query_tolerance 보다 많이 늘어난 시나리오
+    - 기준선에 있던 시나리오가 빠진 경우 (require_all 일 때, 일부 시나리오만 실행하면 False)
+
+    :return: 회귀 설명 문자열 목록
+    """
+    regressions = []
+    current = report['scenarios']
+    for name, base in baseline.get('scenarios', {}).items():
+        result = current.get(name)
+        if result is None:
+            if not require_all:
+                continue
+            regressions.append(f'{name}: 기준선에 있는 시나리오가 실행되지 않음')
+            continue
+        if result['p95_ms'] is not None and base.get('p95_ms') is not None:
+            limit = max(base['p95_ms'] * (1 + tolerance), base['p95_ms'] + min_delta_ms)
+            if result['p95_ms'] > limit:
+                regressions.append(f'{name}: p95 {base["p95_ms"]}ms -> {result["p95_ms"]}ms (허용 {limit:.2f}ms)')
+        if result['avg_queries'] is not None and base.get('avg_queries') is not None:
+            if result['avg_queries'] > base['avg_queries'] + query_tolerance:
+                regressions.append(f'{name}: 요청당 쿼리 {base["avg_queries"]} -> {result["avg_queries"]}')
+    for name, result in current.items():
+        if result['errors']:
+            regressions.append(f'{name}: 예상하지 못한 응답 {result["errors"]}건 {result["statuses"]}')
+    return regressions
@@ -0,0 +1,75 @@
+"""
+응답 압축 미들웨어
+
+- 응답 본문이 API_COMPRESSION_MIN_SIZE 바이트 이상일 때만 압축 (작은 응답은 압축 비용이 더 큼)
+- 클라이언트가 지원하면 brotli(설치된 경우) → gzip 순으로 선택
+- JSON/텍스트 응답만 대상, 이미 압축된 응답과 스트리밍 응답은 건드리지 않음
+"""
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.cache import patch_vary_headers
+from django.utils.regex_helper import _lazy_re_compile
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: pip install brotli
+    brotli = None
+
+
+DEFAULT_MIN_SIZE = 1024
+
+# 동적 응답용 brotli 품질 (11 은 너무 느림)
+BROTLI_QUALITY = 4
+
+COMPRESSIBLE_CONTENT_TYPES = ('application/json', 'text/')
+
+re_accepts_br = _lazy_re_compile(r'\bbr\b')
+re_accepts_gzip = _lazy_re_compile(r'\bgzip\b')
+
+
+class CompressionMiddleware:
+    """임계값 이상 크기의 JSON/텍스트 응답을 brotli 또는 gzip 으로 압축"""
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'API_COMPRESSION_ENABLED', True):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.min_size = getattr(settings, 'API_COMPRESSION_MIN_SIZE', DEFAULT_MIN_SIZE)
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        return self.process_response(request, response)
+
+    def process_response(self, request, response):
+        if response.streaming or response.has_header('Content-Encoding'):
+            return response
+        if len(response.content) < self.min_size:
+            return response
+        content_type = response.get('Content-Type', '')
+        if not content_type.startswith(COMPRESSIBLE_CONTENT_TYPES):
+            return response
+
+        # 압축 여부와 관계없이 캐시가 Accept-Encoding 별로 구분하도록 설정
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        accept_encoding = request.META.get('HTTP_ACCEPT_ENCODING', '')
+        if brotli is not None and re_accepts_br.search(accept_encoding):
+            compressed, encoding = brotli.compress(response.content, quality=BROTLI_QUALITY), 'br'
+        elif re_accepts_gzip.search(accept_encoding):
+            compressed, encoding = compress_string(response.content), 'gzip'
+        else:
+            return response
+
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        response['Content-Encoding'] = encoding
+
+        # 본문이 바뀌었으므로 강한 ETag 는 약한 ETag 로 변경 (Django GZipMiddleware 와 동일)
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        return response
@@ -0,0 +1,179 @@
+"""
+조건부 요청 (ETag / Last-Modified)
+
+- 상세: (pk, updated_at) 한 행만 조회해 검증자를 만들고, 변경이 없으면 직렬화 없이 304 응답
+- 목록: 사용자 데이터 버전(core.versioning)과 (행 수, 최대 updated_at) 집계로 검증자 생성 (목록 쿼리 없이 304 응답)
+- 수정/삭제: If-Match / If-Unmodified-Since 가 현재 검증자와 다르면 412 (낙관적 동시성 제어)
+
+ETag 는 응답 바이트가 아니라 행의 버전(updated_at)에서 만들기 때문에
+압축 미들웨어가 약한 ETag(W/)로 바꿔도 같은 버전이면 같은 값으로 비교합니다.
+"""
+import hashlib
+from urllib.parse import urlencode
+
+from django.db import transaction
+from django.db.models import Count, Max
+from django.http import HttpResponseNotModified
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_etags, parse_http_date_safe, quote_etag
+
+from .exceptions import PreconditionFailedException
+from .versioning import DataVersionService
+
+
+def make_etag(*parts):
+    """검증자 구성 요소로 강한 ETag 생성"""
+    raw = '|'.join('' if part is None else str(part) for part in parts)
+    return quote_etag(hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest())
+
+
+def get_request_variant(request):
+    """같은 리소스라도 응답 본문을 바꾸는 요소 (사용자, ?fields=, ?page= 등 쿼리 파라미터)"""
+    params = sorted(request.query_params.lists())
+    return f'{request.user.pk}?{urlencode(params, doseq=True)}'
+
+
+def get_object_validators(request, queryset):
+    """
+    단일 객체 검증자 (pk, updated_at 만 조회)
+
+    :param queryset: 대상 객체 하나로 좁혀진 QuerySet
+    :return: (etag, last_modified) - 객체가 없으면 (None, None)
+    """
+    row = queryset.order_by().values_list('pk', 'updated_at').first()
+    if row is None:
+        return None, None
+    pk, updated_at = row
+    etag = make_etag('object', queryset.model._meta.label, pk, updated_at.isoformat(), get_request_variant(request))
+    return etag, updated_at
+
+
+def get_collection_validators(request, queryset, version):
+    """
+    목록 검증자 (사용자 데이터 버전 + 행 수 / 마지막 수정 시각)
+
+    데이터 버전은 서비스 레이어의 쓰기에서만 오르므로, 관리자 화면이나 bulk update() 처럼
+    서비스를 거치지 않은 변경도 드러나도록 (행 수, 최대 updated_at) 을 집계 쿼리 한 번으로 함께 사용
+    ((user, updated_at) 인덱스로 처리되며 목록 자체는 조회하지 않음)
+    삭제는 최대 updated_at 을 바꾸지 않을 수 있으므로 Last-Modified 는 돌려주지 않음
+    :param version: DataVersionService.get_version() 값 (필요하면 다른 요소를 덧붙인 문자열)
+    :return: (etag, None)
+    """
+    summary = queryset.order_by().aggregate(count=Count('pk'), last_modified=Max('updated_at'))
+    etag = make_etag(
+        'collection', queryset.model._meta.label, version, summary['count'], summary['last_modified'],
+        get_request_variant(request),
+    )
+    return etag, None
+
+
+def get_not_modified_response(request, etag, last_modified=None):
+    """
+    GET/HEAD 요청의 If-None-Match / If-Modified-Since 평가
+
+    :return: 변경이 없으면 HttpResponseNotModified, 아니면 None
+    """
+    if etag is None or request.method not in ('GET', 'HEAD'):
+        return None
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+    if isinstance(response, HttpResponseNotModified):
+        set_validator_headers(response, etag, last_modified)
+        return response
+    return None
+
+
+def check_preconditions(request, etag, last_modified=None):
+    """
+    수정/삭제 요청의 If-Match / If-Unmodified-Since 평가
+
+    :raises: PreconditionFailedException (현재 버전과 다름)
+    """
+    if_match = request.META.get('HTTP_IF_MATCH')
+    if if_match:
+        if etag is None:
+            raise PreconditionFailedException()
+        # 검증자가 행 버전을 나타내므로 W/ 여부와 관계없이 태그 값으로 비교
+        tags = {tag.removeprefix('W/') for tag in parse_etags(if_match)}
+        if '*' not in tags and etag not in tags:
+            raise PreconditionFailedException()
+        return
+
+    if_unmodified_since = parse_http_date_safe(request.META.get('HTTP_IF_UNMODIFIED_SINCE', ''))
+    if if_unmodified_since is not None and last_modified is not None:
+        if int(last_modified.timestamp()) > if_unmodified_since:
+            raise PreconditionFailedException()
+
+
+def has_preconditions(request):
+    """If-Match / If-Unmodified-Since 헤더가 있는지"""
+    return 'HTTP_IF_MATCH' in request.META or 'HTTP_IF_UNMODIFIED_SINCE' in request.META
+
+
+def set_validator_headers(response, etag, last_modified=None):
+    """응답에 ETag / Last-Modified 설정"""
+    if etag is not None:
+        response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    return response
+
+
+class ConditionalGetMixin:
+    """
+    generic 뷰 / ViewSet 용 조건부 요청 믹스인
+
+    - list: 데이터 버전과 (행 수, 최대 updated_at) 이 같으면 목록 조회/직렬화 없이 304 응답
+    - retrieve: (pk, updated_at) 이 같으면 쿼리 1번으로 304 응답
+    - 200 응답에는 ETag (상세는 Last-Modified 도) 설정
+    - update / destroy: If-Match 가 있으면 대상 행을 잠근 뒤 검증하여 412 또는 처리
+    """
+
+    def get_object_queryset(self):
+        """상세 조회와 같은 필터에 URL 의 lookup 값까지 적용한 QuerySet"""
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        return self.filter_queryset(self.get_queryset()).filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+
+    def get_object_validators(self, queryset=None):
+        return get_object_validators(self.request, queryset if queryset is not None else self.get_object_queryset())
+
+    def get_collection_version(self):
+        """목록 검증자에 사용할 버전 (날짜 등 데이터 외 조건으로 결과가 바뀌는 뷰는 재정의)"""
+        return DataVersionService.get_version(self.request.user.pk)
+
+    def get_collection_validators(self):
+        return get_collection_validators(self.request, self.get_queryset(), self.get_collection_version())
+
+    def list(self, request, *args, **kwargs):
+        etag, last_modified = self.get_collection_validators()
+        not_modified = get_not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+        return set_validator_headers(super().list(request, *args, **kwargs), etag, last_modified)
+
+    def retrieve(self, request, *args, **kwargs):
+        etag, last_modified = self.get_object_validators()
+        not_modified = get_not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+        return set_validator_headers(super().retrieve(request, *args, **kwargs), etag, last_modified)
+
+    def update(self, request, *args, **kwargs):
+        if not has_preconditions(request):
+            response = super().update(request, *args, **kwargs)
+        else:
+            with transaction.atomic():
+                check_preconditions(request, *self.get_object_validators(self.get_object_queryset().select_for_update()))
+                response = super().update(request, *args, **kwargs)
+        # 수정 후 새 버전의 ETag 를 돌려주어 다음 If-Match 에 바로 사용 가능
+        return set_validator_headers(response, *self.get_object_validators())
+
+    def destroy(self, request, *args, **kwargs):
+        if not has_preconditions(request):
+            return super().destroy(request, *args, **kwargs)
+        with transaction.atomic():
+            check_preconditions(request, *self.get_object_validators(self.get_object_queryset().select_for_update()))
+            return super().destroy(request, *args, **kwargs)
@@ -0,0 +1,259 @@
+"""
+읽기 복제본(replica) 라우팅
+
+- ReplicaRoutingMiddleware 가 요청마다 라우팅 상태를 정하고, ReplicaRouter 가 그 상태에 따라 읽기 DB 를 선택
+- 안전한 메서드(GET/HEAD/OPTIONS)의 읽기만 replica 로 보내고, 쓰기와 그 밖의 모든 쿼리(Celery 작업 등)는 primary(default)
+- 데이터를 변경한 사용자는 REPLICA_PIN_SECONDS 동안 primary 에서 읽음 (read-your-writes)
+  쿠키(브라우저)와 사용자별 캐시 플래그(JWT 클라이언트) 두 가지로 고정
+- replica 연결 실패 / 복제 지연이 REPLICA_MAX_LAG_SECONDS 를 넘으면 REPLICA_HEALTH_CHECK_INTERVAL 동안 primary 사용
+  요청 처리 중 replica 쿼리가 실패하면 그 요청도 primary 에서 다시 실행
+- DATABASES 에 replica 별칭이 없으면 항상 primary 를 사용하므로 단일 DB 환경에서도 그대로 동작
+
+뷰 클래스에 replica_reads = False 를 두면 해당 뷰는 GET 이어도 primary 에서 읽음 (동기화 토큰 등 최신성이 중요한 경우)
+"""
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, OperationalError, connections
+from django.utils.functional import LazyObject
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_ALIAS = 'default'
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+PIN_CACHE_KEY = 'db-router:pin:{user_id}'
+
+# 요청(또는 read_from_replica 블록)별 라우팅 상태 (None 이면 primary)
+_routing_state = ContextVar('db_routing_state', default=None)
+
+
+def get_replica_alias():
+    """설정된 replica 별칭 (DATABASES 에 없으면 None)"""
+    alias = getattr(settings, 'REPLICA_DATABASE_ALIAS', 'replica')
+    return alias if alias in settings.DATABASES else None
+
+
+def get_resolved_user(request):
+    """평가가 끝난 request.user (아직 지연 객체면 None)"""
+    user = getattr(request, '_cached_user', None)
+    if user is not None:
+        return user
+    user = request.__dict__.get('user')
+    if user is None or isinstance(user, LazyObject):
+        return None
+    return user
+
+
+class RoutingState:
+    """요청 하나의 라우팅 상태"""
+
+    def __init__(self, use_replica, request=None):
+        self.use_replica = use_replica
+        self.request = request
+        self.user_checked = request is None
+        self.replica_used = False
+        # replica 실패 시 primary 에서 다시 실행할 뷰 (view_func, args, kwargs)
+        self.view = None
+
+    def check_user_pin(self):
+        """
+        인증된 사용자가 최근 데이터를 변경했으면 replica 사용 중지
+
+        라우터 안에서 request.user 를 평가하면 세션/사용자 조회가 다시 라우터를 거쳐 무한 재귀가 되므로,
+        이미 인증이 끝난 사용자만 확인 (세션 인증은 _cached_user, JWT 는 DRF 가 설정한 request.user)
+        인증 전이면 다음 읽기 쿼리에서 다시 확인
+        """
+        user = get_resolved_user(self.request)
+        if user is None:
+            return
+        self.user_checked = True
+        if user.is_authenticated and ReplicaPin.is_pinned(user.pk):
+            self.use_replica = False
+
+
+class ReplicaHealth:
+    """replica 상태 확인 (프로세스별로 REPLICA_HEALTH_CHECK_INTERVAL 동안 결과 재사용)"""
+
+    _checked_at = {}
+    _available = {}
+
+    @classmethod
+    def is_available(cls, alias):
+        interval = getattr(settings, 'REPLICA_HEALTH_CHECK_INTERVAL', 10)
+        now = time.monotonic()
+        if alias in cls._checked_at and now - cls._checked_at[alias] < interval:
+            return cls._available[alias]
+
+        cls._checked_at[alias] = now
+        cls._available[alias] = cls.check(alias)
+        return cls._available[alias]
+
+    @staticmethod
+    def check(alias):
+        """연결과 복제 지연(PostgreSQL 만) 확인"""
+        connection = connections[alias]
+        try:
+            connection.ensure_connection()
+            if connection.vendor != 'postgresql':
+                return True
+            with connection.cursor() as cursor:
+                # 받은 WAL 을 모두 재생했으면 (primary 에 쓰기가 없어 재생 시각이 오래된 경우 포함) 지연 0
+                cursor.execute(
+                    "SELECT CASE WHEN NOT pg_is_in_recovery() "
+                    "OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+                    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+                )
+                lag = cursor.fetchone()[0]
+        except DatabaseError:
+            logger.warning('replica(%s) 연결 실패, primary 로 읽기', alias, exc_info=True)
+            return False
+
+        max_lag = getattr(settings, 'REPLICA_MAX_LAG_SECONDS', 5)
+        if lag is not None and lag > max_lag:
+            logger.warning('replica(%s) 복제 지연 %.1f초, primary 로 읽기', alias, lag)
+            return False
+        return True
+
+    @classmethod
+    def mark_unavailable(cls, alias):
+        """쿼리 실패 등으로 replica 를 사용할 수 없을 때 다음 확인 주기까지 primary 사용"""
+        cls._checked_at[alias] = time.monotonic()
+        cls._available[alias] = False
+
+
+class ReplicaPin:
+    """데이터를 변경한 사용자를 일정 시간 primary 에 고정"""
+
+    @staticmethod
+    def get_seconds():
+        return getattr(settings, 'REPLICA_PIN_SECONDS', 5)
+
+    @staticmethod
+    def pin(user_id):
+        cache.set(PIN_CACHE_KEY.format(user_id=user_id), 1, ReplicaPin.get_seconds())
+
+    @staticmethod
+    def is_pinned(user_id):
+        return cache.get(PIN_CACHE_KEY.format(user_id=user_id)) is not None
+
+
+@contextmanager
+def read_from_replica():
+    """
+    요청 밖(Celery 배치 집계 등)에서 블록 안의 읽기를 replica 로 보냄
+
+    예: with read_from_replica(): CohortAnalyticsService.build_report()
+    """
+    token = _routing_state.set(RoutingState(use_replica=True))
+    try:
+        yield
+    finally:
+        _routing_state.reset(token)
+
+
+class ReplicaRouter:
+    """라우팅 상태에 따라 읽기를 replica 로 보내는 DB 라우터 (쓰기는 항상 primary)"""
+
+    def db_for_read(self, model, **hints):
+        state = _routing_state.get()
+        if state is None or not state.use_replica:
+            return DEFAULT_DB_ALIAS
+
+        # 이미 primary 에서 읽은 인스턴스의 관계는 같은 DB 에서 조회
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db:
+            return instance._state.db
+
+        if not state.user_checked:
+            state.check_user_pin()
+            if not state.use_replica:
+                return DEFAULT_DB_ALIAS
+
+        alias = get_replica_alias()
+        if alias is None or not ReplicaHealth.is_available(alias):
+            return DEFAULT_DB_ALIAS
+        state.replica_used = True
+        return alias
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # replica 는 primary 의 복제본이므로 같은 DB 로 취급
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReplicaRoutingMiddleware:
+    """
+    요청별 라우팅 상태 설정 및 read-your-writes 고정
+
+    - 안전한 메서드이고 고정 쿠키가 없으면 replica 사용
+    - 안전하지 않은 메서드가 성공하면 고정 쿠키와 사용자별 캐시 플래그를 REPLICA_PIN_SECONDS 동안 설정
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.cookie_name = getattr(settings, 'REPLICA_PIN_COOKIE_NAME', 'db_pin')
+
+    def __call__(self, request):
+        use_replica = (
+            request.method in SAFE_METHODS
+            and self.cookie_name not in request.COOKIES
+            and get_replica_alias() is not None
+        )
+        token = _routing_state.set(RoutingState(use_replica, request))
+        try:
+            response = self.get_response(request)
+        finally:
+            _routing_state.reset(token)
+
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            self.pin(request, response)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        state = _routing_state.get()
+        if state is None:
+            return
+        state.view = (view_func, view_args, view_kwargs)
+        view_class = getattr(view_func, 'view_class', None) or getattr(view_func, 'cls', None)
+        if view_class is not None and not getattr(view_class, 'replica_reads', True):
+            state.use_replica = False
+
+    def process_exception(self, request, exception):
+        """
+        replica 쿼리가 실패하면 다음 확인 주기까지 primary 를 사용하고,
+        같은 요청도 primary 에서 뷰를 한 번 다시 실행 (안전한 메서드만 replica 를 쓰므로 재실행해도 안전)
+        """
+        state = _routing_state.get()
+        if not isinstance(exception, OperationalError) or state is None or not state.replica_used:
+            return None
+        alias = get_replica_alias()
+        if alias is None or not connections[alias].errors_occurred:
+            return None
+
+        ReplicaHealth.mark_unavailable(alias)
+        if state.view is None:
+            return None
+        logger.warning('replica(%s) 쿼리 실패, primary 에서 다시 실행', alias, exc_info=exception)
+        state.use_replica = False
+        state.replica_used = False
+        view_func, view_args, view_kwargs = state.view
+        return view_func(request, *view_args, **view_kwargs)
+
+    def pin(self, request, response):
+        seconds = ReplicaPin.get_seconds()
+        response.set_cookie(self.cookie_name, '1', max_age=seconds, httponly=True, samesite='Lax')
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated:
+            ReplicaPin.pin(user.pk)
@@ -0,0 +1,90 @@
+"""
+환경변수 기반 데이터베이스 설정
+
+settings 에서 import 하므로 Django 에 의존하지 않습니다.
+
+연결 방식 (DB_POOL 로 선택)
+- 지속 연결 (기본): 워커 스레드마다 연결을 CONN_MAX_AGE 초 동안 재사용하고, 요청 시작 시 CONN_HEALTH_CHECKS 로 끊긴 연결 확인
+- 연결 풀 (DB_POOL=true): psycopg3 ConnectionPool 을 프로세스마다 하나 두고 요청마다 빌려 씀
+  (Django 는 풀 사용 시 CONN_MAX_AGE=0 이어야 하며, 풀이 유휴/수명 관리와 빌려줄 때의 연결 확인을 담당)
+
+환경변수
+- POSTGRES_DB / POSTGRES_USER / POSTGRES_PASSWORD / POSTGRES_HOST / POSTGRES_PORT: 접속 정보
+- POSTGRES_REPLICA_HOST / POSTGRES_REPLICA_PORT: 읽기 복제본 (core.db_router 참고)
+- DB_CONN_MAX_AGE (60), DB_CONN_HEALTH_CHECKS (true), DB_CONNECT_TIMEOUT (5)
+- DB_POOL (false), DB_POOL_MIN_SIZE (2), DB_POOL_MAX_SIZE (10), DB_POOL_TIMEOUT (10),
+  DB_POOL_MAX_IDLE (300), DB_POOL_MAX_LIFETIME (3600)
+"""
+import os
+
+
+def _env_bool(name, default):
+    return os.getenv(name, str(default)).lower() in ('1', 'true', 'yes', 'on')
+
+
+def get_pool_options():
+    """psycopg_pool.ConnectionPool 인자 (DB_POOL 이 꺼져 있으면 None)"""
+    if not _env_bool('DB_POOL', False):
+        return None
+
+    options = {
+        'min_size': int(os.getenv('DB_POOL_MIN_SIZE', 2)),
+        'max_size': int(os.getenv('DB_POOL_MAX_SIZE', 10)),
+        # 풀에서 연결을 기다리는 최대 시간 (초), 넘으면 PoolTimeout
+        'timeout': float(os.getenv('DB_POOL_TIMEOUT', 10)),
+        'max_idle': float(os.getenv('DB_POOL_MAX_IDLE', 300)),
+        'max_lifetime': float(os.getenv('DB_POOL_MAX_LIFETIME', 3600)),
+    }
+    try:
+        from psycopg_pool import ConnectionPool
+    except ImportError:  # psycopg[pool] 미설치: Django 가 연결 시 설치 안내 오류를 냄
+        return options
+    # 빌려줄 때 끊긴 연결을 걸러냄 (CONN_HEALTH_CHECKS 에 해당)
+    options['check'] = ConnectionPool.check_connection
+    return options
+
+
+def get_postgres_database(prefix='POSTGRES'):
+    """
+    PostgreSQL DATABASES 항목
+
+    :param prefix: 접속 정보 환경변수 접두사
+    :return: DATABASES['default'] 형식 dict
+    """
+    pool_options = get_pool_options()
+    database = {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.getenv(f'{prefix}_DB', 'studycalender'),
+        'USER': os.getenv(f'{prefix}_USER', 'postgres'),
+        'PASSWORD': os.getenv(f'{prefix}_PASSWORD', 'postgres'),
+        'HOST': os.getenv(f'{prefix}_HOST', 'localhost'),
+        'PORT': os.getenv(f'{prefix}_PORT', '5432'),
+        'CONN_MAX_AGE': 0 if pool_options else int(os.getenv('DB_CONN_MAX_AGE', 60)),
+        'CONN_HEALTH_CHECKS': _env_bool('DB_CONN_HEALTH_CHECKS', True),
+        'OPTIONS': {
+            'connect_timeout': int(os.getenv('DB_CONNECT_TIMEOUT', 5)),
+        },
+    }
+    if pool_options:
+        database['OPTIONS']['pool'] = pool_options
+    return database
+
+
+def get_databases():
+    """
+    DATABASES 설정 (POSTGRES_REPLICA_HOST 가 있으면 읽기 복제본 replica 포함)
+
+    테스트에서는 replica 를 별도로 만들지 않고 default 를 그대로 읽음 (TEST MIRROR)
+    """
+    default = get_postgres_database()
+    databases = {'default': default}
+    replica_host = os.getenv('POSTGRES_REPLICA_HOST')
+    if replica_host:
+        databases['replica'] = {
+            **default,
+            'OPTIONS': {**default['OPTIONS']},
+            'HOST': replica_host,
+            'PORT': os.getenv('POSTGRES_REPLICA_PORT', default['PORT']),
+            'TEST': {'MIRROR': 'default'},
+        }
+    return databases
@@ -0,0 +1,130 @@
+"""
+데이터베이스 연결 상태 진단
+
+- 연결 방식(풀/지속 연결/요청마다 연결)과 설정값
+- 연결 풀 통계 (psycopg_pool.ConnectionPool.get_stats(): 사용 중/유휴 연결 수, 대기 요청 수, 누적 대기 시간)
+- 연결 획득 시간 측정 (풀이면 풀에서 빌리는 시간, 아니면 새 연결을 여는 시간)
+- PostgreSQL 서버 기준 상태별 연결 수 (pg_stat_activity, 모든 워커 프로세스 합계)
+
+풀 통계는 프로세스별 값이므로 관리 명령(db_pool_status)은 명령 프로세스의 풀을,
+진단 API 는 요청을 처리한 워커 프로세스의 풀을 보여줍니다.
+"""
+import time
+
+from django.db import DatabaseError, connections
+
+
+class DatabaseStatusService:
+    """DB 연결 상태 진단 서비스"""
+
+    @staticmethod
+    def get_mode(connection):
+        if getattr(connection, 'pool', None) is not None:
+            return 'pool'
+        if connection.settings_dict.get('CONN_MAX_AGE'):
+            return 'persistent'
+        return 'per-request'
+
+    @staticmethod
+    def get_pool_stats(connection):
+        """
+        연결 풀 통계 (풀을 쓰지 않으면 None)
+
+        requests_wait_ms / requests_queued 로 연결을 기다린 요청의 평균 대기 시간 계산
+        """
+        pool = getattr(connection, 'pool', None)
+        if pool is None:
+            return None
+        stats = pool.get_stats()
+        size = stats.get('pool_size', 0)
+        available = stats.get('pool_available', 0)
+        queued = stats.get('requests_queued', 0)
+        return {
+            **stats,
+            'in_use': size - available,
+            'utilization': round((size - available) / stats['pool_max'], 4) if stats.get('pool_max') else None,
+            'avg_wait_ms': round(stats.get('requests_wait_ms', 0) / queued, 2) if queued else 0.0,
+        }
+
+    @staticmethod
+    def measure_acquire(connection, samples):
+        """
+        연결 획득 시간 측정 (밀리초)
+
+        :return: {'samples', 'avg_ms', 'max_ms'} (연결 실패 시 error 포함)
+        """
+        pool = getattr(connection, 'pool', None)
+        timings = []
+        try:
+            for _ in range(samples):
+                started = time.perf_counter()
+                if pool is not None:
+                    pool.open()
+                    with pool.connection():
+                        timings.append((time.perf_counter() - started) * 1000)
+                else:
+                    # 요청마다 연결하는 경우의 비용 (현재 연결은 유지)
+                    new_connection = connection.get_new_connection(connection.get_connection_params())
+                    timings.append((time.perf_counter() - started) * 1000)
+                    new_connection.close()
+        except DatabaseError as error:
+            return {'samples': len(timings), 'error': str(error)}
+        except Exception as error:  # psycopg 드라이버 오류 / PoolTimeout 은 DatabaseError 로 감싸지지 않음
+            return {'samples': len(timings), 'error': f'{type(error).__name__}: {error}'}
+
+        if not timings:
+            return {'samples': 0, 'avg_ms': None, 'max_ms': None}
+        return {
+            'samples': len(timings),
+            'avg_ms': round(sum(timings) / len(timings), 2),
+            'max_ms': round(max(timings), 2),
+        }
+
+    @staticmethod
+    def get_server_connections(connection):
+        """PostgreSQL 서버의 현재 DB 연결 수 (상태별) 와 max_connections"""
+        if connection.vendor != 'postgresql':
+            return None
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT COALESCE(state, 'unknown'), count(*) FROM pg_stat_activity "
+                    "WHERE datname = current_database() GROUP BY 1"
+                )
+                by_state = dict(cursor.fetchall())
+                cursor.execute("SHOW max_connections")
+                max_connections = int(cursor.fetchone()[0])
+        except DatabaseError as error:
+            return {'error': str(error)}
+        return {
+            'total': sum(by_state.values()),
+            'max_connections': max_connections,
+            'by_state': by_state,
+        }
+
+    @staticmethod
+    def get_status(alias='default', samples=5):
+        """
+        DB 별칭 하나의 연결 상태
+
+        :param alias: DATABASES 별칭
+        :param samples: 연결 획득 시간 측정 횟수 (0 이면 측정하지 않음)
+        :return: 상태 dict
+        """
+        connection = connections[alias]
+        settings_dict = connection.settings_dict
+        return {
+            'alias': alias,
+            'vendor': connection.vendor,
+            'mode': DatabaseStatusService.get_mode(connection),
+            'conn_max_age': settings_dict.get('CONN_MAX_AGE'),
+            'conn_health_checks': settings_dict.get('CONN_HEALTH_CHECKS'),
+            'pool': DatabaseStatusService.get_pool_stats(connection),
+            'acquire': DatabaseStatusService.measure_acquire(connection, samples) if samples else None,
+            'server_connections': DatabaseStatusService.get_server_connections(connection),
+        }
+
+    @staticmethod
+    def get_all_status(samples=5):
+        """설정된 모든 DB 별칭의 연결 상태"""
+        return [DatabaseStatusService.get_status(alias, samples) for alias in connections]
@@ -0,0 +1,16 @@
+"""
+공통 커스텀 예외 클래스
+
+SOLID 원칙:
+- Single Responsibility: 예외 처리만 담당
+- Open/Closed: 새로운 예외 타입 추가 가능
+"""
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class PreconditionFailedException(APIException):
+    """If-Match / If-Unmodified-Since 조건이 맞지 않을 때 발생하는 예외 (다른 곳에서 먼저 수정됨)"""
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = "리소스가 다른 요청에 의해 변경되었습니다. 최신 데이터를 다시 조회한 뒤 시도하세요."
+    default_code = "precondition_failed"
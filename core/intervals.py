@@ -0,0 +1,93 @@
+"""
+구간 트리 (겹치는 일정 조회용) 와 빈 구간 찾기 (빈 시간 찾기용)
+
+정렬된 배열을 암묵적인 균형 이진 트리로 보고 각 부분 트리의 최대 종료 시각을 저장합니다.
+- 생성 O(n log n), 겹침 조회 O(log n + k)
+- 구간은 [start, end) 반열린 구간 (PostgreSQL tstzrange 기본값과 동일)
+  끝이 다른 구간의 시작과 같으면 겹치지 않고, 길이가 0 인 구간은 어떤 구간과도 겹치지 않음
+"""
+
+
+class IntervalTree:
+    """
+    정적 구간 트리
+
+    tree = IntervalTree([(start, end, payload), ...])
+    tree.overlap(start, end)  # 겹치는 payload 목록 (시작 시각 순)
+    """
+
+    def __init__(self, intervals):
+        items = sorted((
+            (min(start, end), max(start, end), payload)
+            for start, end, payload in intervals
+            if start != end
+        ), key=lambda item: (item[0], item[1]))
+        self.starts = [item[0] for item in items]
+        self.ends = [item[1] for item in items]
+        self.payloads = [item[2] for item in items]
+        self.max_ends = list(self.ends)
+        self._build(0, len(items))
+
+    def __len__(self):
+        return len(self.starts)
+
+    def _build(self, lo, hi):
+        """[lo, hi) 부분 트리의 최대 종료 시각 (루트는 가운데 원소)"""
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        max_end = self.ends[mid]
+        for child in (self._build(lo, mid), self._build(mid + 1, hi)):
+            if child is not None and child > max_end:
+                max_end = child
+        self.max_ends[mid] = max_end
+        return max_end
+
+    def overlap(self, start, end):
+        """[start, end) 와 겹치는 구간의 payload 목록"""
+        start, end = min(start, end), max(start, end)
+        found = []
+        if start == end:
+            return found
+        stack = [(0, len(self.starts))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            # 부분 트리의 모든 구간이 start 이전에 끝남
+            if self.max_ends[mid] <= start:
+                continue
+            # 오른쪽 부분 트리는 mid 보다 늦게 시작하므로 mid 가 end 이후면 볼 필요 없음
+            if self.starts[mid] < end:
+                stack.append((mid + 1, hi))
+                if self.ends[mid] > start:
+                    found.append(mid)
+            stack.append((lo, mid))
+        return [self.payloads[index] for index in sorted(found)]
+
+
+def find_gaps(busy, start, end, min_length):
+    """
+    [start, end) 안에서 busy 구간들이 덮지 않는 빈 구간 (스윕 라인)
+
+    busy 를 시작 시각으로 정렬한 뒤 한 번 훑으므로 O(n log n)
+
+    :param busy: (시작, 끝) 목록 (겹치거나 구간 밖으로 나가도 됨)
+    :param min_length: 빈 구간 최소 길이 (start/end 와 뺄셈 결과가 같은 타입)
+    :return: [(시작, 끝), ...] (시작 시각 순)
+    """
+    gaps = []
+    cursor = start
+    for busy_start, busy_end in sorted((min(item), max(item)) for item in busy):
+        if cursor >= end:
+            break
+        if busy_start > cursor:
+            gap_end = min(busy_start, end)
+            if gap_end - cursor >= min_length:
+                gaps.append((cursor, gap_end))
+        if busy_end > cursor:
+            cursor = busy_end
+    if cursor < end and end - cursor >= min_length:
+        gaps.append((cursor, end))
+    return gaps
@@ -0,0 +1,80 @@
+"""
+벤치마크 명령에서 공통으로 사용하는 목록 데이터 생성 도우미
+
+호출하는 쪽에서 트랜잭션을 열고 마지막에 롤백해야 합니다 (Rollback 예외 사용).
+"""
+from datetime import timedelta
+
+from django.utils import timezone
+
+from apps.users.models import CustomUser
+from apps.calendars.models import Event, Exam
+from apps.calendars.serializers import CalendarSerializer, ExamSerializer
+from apps.study.models import StudyEvent, StudyContent, Subject
+from apps.study.serializers import StudySerializer, StudyContentSerializer
+
+
+# goal / description / content 처럼 큰 TextField 를 흉내내기 위한 본문 길이
+TEXT_LENGTH = 2000
+
+
+class Rollback(Exception):
+    """벤치마크 데이터 롤백용"""
+
+
+def seed_list_rows(rows, email='benchmark-list@example.com'):
+    """
+    목록 API 가 조회하는 모델별로 rows 개의 행 생성
+
+    :return: [(라벨, QuerySet, 시리얼라이저 클래스), ...]
+    """
+    user = CustomUser.objects.create(email=email)
+    subject_id = Subject.objects.resolve_id('benchmark')
+    now = timezone.now()
+    text = '공부 내용 ' * (TEXT_LENGTH // 6)
+
+    StudyEvent.objects.bulk_create(
+        StudyEvent(
+            user=user,
+            title=f'스터디 {i}',
+            canonical_subject_id=subject_id,
+            goal=text,
+            start_at=now + timedelta(hours=i),
+            end_at=now + timedelta(hours=i, minutes=50),
+        )
+        for i in range(rows)
+    )
+    study_event = StudyEvent.objects.filter(user=user).first()
+    StudyContent.objects.bulk_create(
+        StudyContent(study_event=study_event, content=text, duration_minutes=i % 120)
+        for i in range(rows)
+    )
+    Event.objects.bulk_create(
+        Event(
+            user=user,
+            title=f'일정 {i}',
+            description=text,
+            start_at=now + timedelta(hours=i),
+            end_at=now + timedelta(hours=i, minutes=50),
+        )
+        for i in range(rows)
+    )
+    Exam.objects.bulk_create(
+        Exam(
+            user=user,
+            subject='benchmark',
+            canonical_subject_id=subject_id,
+            exam_date=(now + timedelta(days=i)).date(),
+            score=i % 101,
+            max_score=100,
+        )
+        for i in range(rows)
+    )
+
+    return [
+        ('StudyEvent', StudyEvent.objects.filter(user=user), StudySerializer),
+        ('Event', Event.objects.filter(user=user), CalendarSerializer),
+        ('Exam', Exam.objects.filter(user=user), ExamSerializer),
+        ('StudyContent', StudyContent.objects.filter(study_event__user=user), StudyContentSerializer),
+    ]
+
@@ -0,0 +1,117 @@
+"""
+API 부하 벤치마크
+
+users / calendars / study / reports 의 모든 URL 패턴을 프로세스 안의 부하 생성기로 요청하고
+시나리오별 p50/p95/p99 지연 시간, 처리량, 요청당 쿼리 수를 측정합니다 (core.benchmark).
+--baseline 과 비교하여 회귀가 있으면 CommandError 로 종료 코드 1 을 반환하므로 CI 에서 사용할 수 있습니다.
+
+벤치마크 사용자(@benchmark.invalid)와 데이터는 seed_load 와 같은 생성기(core.seeding)로 만들고
+커밋되어 다음 실행에서 재사용됩니다. 전용 데이터베이스에서 실행하세요.
+
+사용 예시:
+    python manage.py seed_load --users 10000 --days 730 --copy
+    python manage.py benchmark_api --requests 200 --concurrency 8 --output result.json
+    python manage.py benchmark_api --baseline benchmarks/api_baseline.json
+    python manage.py benchmark_api --save-baseline benchmarks/api_baseline.json
+"""
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmark import (
+    SCENARIOS,
+    VirtualUser,
+    build_report,
+    compare_to_baseline,
+    get_uncovered_routes,
+    run_scenario,
+)
+from core.seeding import SEED_USER_PASSWORD, LoadSeeder, SeedScale
+
+
+class Command(BaseCommand):
+    help = 'API URL 패턴별 지연 시간/처리량/쿼리 수 벤치마크와 기준선 비교'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100, help='벤치마크 사용자 수 (부족하면 생성)')
+        parser.add_argument('--days', type=int, default=365, help='새로 만드는 사용자별 데이터 기간 (일)')
+        parser.add_argument('--seed', type=int, default=0, help='데이터 생성/요청 순서 난수 시드')
+        parser.add_argument('--virtual-users', type=int, default=50, help='요청에 사용할 사용자 수')
+        parser.add_argument('--requests', type=int, default=100, help='시나리오별 요청 수')
+        parser.add_argument('--concurrency', type=int, default=4, help='동시 요청 스레드 수')
+        parser.add_argument('--warmup', type=int, default=5, help='측정 전 시나리오별 예열 요청 수')
+        parser.add_argument('--scenario', action='append', help='실행할 시나리오 이름 (여러 번 지정 가능)')
+        parser.add_argument('--output', help='결과 JSON 저장 경로')
+        parser.add_argument('--baseline', help='비교할 기준선 JSON 경로')
+        parser.add_argument('--save-baseline', help='이번 결과를 기준선으로 저장할 경로')
+        parser.add_argument('--tolerance', type=float, default=0.2, help='p95 허용 증가 비율')
+        parser.add_argument('--min-delta-ms', type=float, default=5.0, help='p95 허용 증가량 하한 (ms)')
+
+    def handle(self, *args, **options):
+        if options['concurrency'] < 1 or options['requests'] < 1:
+            raise CommandError('--requests / --concurrency 는 1 이상이어야 합니다.')
+
+        seeder = LoadSeeder(SeedScale(users=options['users'], days=options['days']), seed=options['seed'])
+        counts = seeder.run()
+        if counts:
+            self.stdout.write(f'벤치마크 사용자 {counts["CustomUser"]}명 생성 ({sum(counts.values()):,} 행)')
+
+        uncovered = get_uncovered_routes()
+        scenarios = SCENARIOS
+        if options['scenario']:
+            unknown = set(options['scenario']) - {scenario.name for scenario in SCENARIOS}
+            if unknown:
+                raise CommandError(f'알 수 없는 시나리오: {", ".join(sorted(unknown))}')
+            scenarios = [scenario for scenario in SCENARIOS if scenario.name in options['scenario']]
+
+        users = list(seeder.get_users()[:max(options['virtual_users'], 1)])
+        staff_user = VirtualUser.build(seeder.get_users().filter(is_staff=True).first() or users[0], SEED_USER_PASSWORD)
+        virtual_users = [VirtualUser.build(user, SEED_USER_PASSWORD) for user in users]
+
+        results = []
+        for scenario in scenarios:
+            if options['warmup']:
+                run_scenario(scenario, virtual_users, staff_user, options['warmup'], 1, options['seed'])
+            result = run_scenario(
+                scenario, virtual_users, staff_user, options['requests'], options['concurrency'], options['seed']
+            )
+            results.append(result)
+            self._write_summary(scenario.name, result.summary())
+
+        config = {
+            key: options[key]
+            for key in ('users', 'virtual_users', 'requests', 'concurrency', 'seed')
+        }
+        report = build_report(results, config)
+        for path in (options['output'], options['save_baseline']):
+            if path:
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                Path(path).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+
+        regressions = [f'{route}: 벤치마크 시나리오 없음' for route in uncovered]
+        if options['baseline']:
+            try:
+                baseline = json.loads(Path(options['baseline']).read_text(encoding='utf-8'))
+            except (OSError, ValueError) as error:
+                raise CommandError(f'기준선을 읽을 수 없습니다: {error}')
+            regressions += compare_to_baseline(
+                report, baseline, options['tolerance'], options['min_delta_ms'],
+                require_all=not options['scenario'],
+            )
+        else:
+            regressions += compare_to_baseline(report, {})
+
+        if regressions:
+            for regression in regressions:
+                self.stderr.write(self.style.ERROR(f'  {regression}'))
+            raise CommandError(f'성능 회귀 {len(regressions)}건')
+        self.stdout.write(self.style.SUCCESS('회귀 없음'))
+
+    def _write_summary(self, name, summary):
+        self.stdout.write(
+            f'{name:<28} {summary["method"]:<6} '
+            f'p50 {summary["p50_ms"]:>8.2f}ms  p95 {summary["p95_ms"]:>8.2f}ms  p99 {summary["p99_ms"]:>8.2f}ms  '
+            f'{summary["throughput_rps"]:>8.1f} req/s  queries {summary["avg_queries"]:>5.1f}  '
+            f'errors {summary["errors"]}'
+        )
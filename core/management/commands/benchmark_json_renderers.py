@@ -0,0 +1,79 @@
+"""
+JSON 렌더러/파서 및 응답 압축 벤치마크
+
+기존 목록 API(스터디/일정/시험/공부 내용)가 돌려주는 payload 로
+DRF 기본 JSONRenderer/JSONParser 와 FastJSONRenderer/FastJSONParser 의 처리량을 비교하고,
+gzip/brotli 압축률과 소요 시간을 측정합니다. 벤치마크 데이터는 롤백됩니다.
+
+사용 예시:
+    python manage.py benchmark_json_renderers --rows 2000 --repeat 5
+"""
+import io
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils.text import compress_string
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core.compression import BROTLI_QUALITY, brotli
+from core.parsers import FastJSONParser
+from core.renderers import FastJSONRenderer, orjson
+from ._benchmark_data import Rollback, seed_list_rows
+
+
+class Command(BaseCommand):
+    help = '목록 API payload 기준 JSON 렌더러/파서/압축 처리량 벤치마크 (데이터는 롤백됨)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1000, help='모델별 생성할 행 수')
+        parser.add_argument('--repeat', type=int, default=3, help='항목별 반복 횟수 (최고 기록 사용)')
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stdout.write(self.style.WARNING('orjson 이 설치되어 있지 않아 FastJSONRenderer 는 표준 json 으로 동작합니다.'))
+        try:
+            with transaction.atomic():
+                self._run(options['rows'], options['repeat'])
+                raise Rollback()
+        except Rollback:
+            pass
+
+    def _run(self, rows, repeat):
+        for label, queryset, serializer_class in seed_list_rows(rows):
+            data = serializer_class(queryset, many=True).data
+            std_body = JSONRenderer().render(data)
+            fast_body = FastJSONRenderer().render(data)
+            size_mb = len(std_body) / (1024 * 1024)
+
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                f'{label} ({rows} rows, {len(std_body):,} bytes, 출력 동일: {std_body == fast_body})'
+            ))
+            measurements = [
+                ('render  JSONRenderer (json)', lambda: JSONRenderer().render(data)),
+                ('render  FastJSONRenderer', lambda: FastJSONRenderer().render(data)),
+                ('parse   JSONParser (json)', lambda: JSONParser().parse(io.BytesIO(std_body))),
+                ('parse   FastJSONParser', lambda: FastJSONParser().parse(io.BytesIO(std_body))),
+            ]
+            for name, run in measurements:
+                elapsed = min(self._timed(run) for _ in range(repeat))
+                self.stdout.write(
+                    f'  {name:<32} {rows / elapsed:>12,.0f} rows/sec {size_mb / elapsed:>8,.1f} MB/s'
+                )
+
+            compressors = [('gzip', compress_string)]
+            if brotli is not None:
+                compressors.append((f'brotli (q={BROTLI_QUALITY})', lambda body: brotli.compress(body, quality=BROTLI_QUALITY)))
+            for name, compress in compressors:
+                elapsed = min(self._timed(lambda: compress(std_body)) for _ in range(repeat))
+                ratio = len(compress(std_body)) / len(std_body)
+                self.stdout.write(
+                    f'  {"compress " + name:<32} {elapsed * 1000:>9,.2f} ms     크기 {ratio:.1%}'
+                )
+
+    @staticmethod
+    def _timed(run):
+        started = time.perf_counter()
+        run()
+        return time.perf_counter() - started
@@ -0,0 +1,82 @@
+"""
+목록 직렬화 벤치마크
+
+기존 ModelSerializer 경로와 sparse fieldset(.only()) / FastListSerializer(.values()) 경로의
+초당 처리 행 수(rows/sec)를 비교합니다. 벤치마크 데이터는 트랜잭션 안에서 만들고 롤백합니다.
+
+사용 예시:
+    python manage.py benchmark_list_serializers --rows 5000 --repeat 5
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.projection import (
+    FastListSerializer,
+    project_queryset,
+    restrict_serializer_fields,
+)
+from ._benchmark_data import Rollback, seed_list_rows
+
+
+# 목록 화면에서 실제로 사용하는 필드 (?fields= 예시)
+LIST_FIELDS = ('id', 'title', 'start_at', 'end_at')
+
+
+class Command(BaseCommand):
+    help = '목록 직렬화 경로별 rows/sec 벤치마크 (데이터는 롤백됨)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=2000, help='모델별 생성할 행 수')
+        parser.add_argument('--repeat', type=int, default=3, help='경로별 반복 횟수 (최고 기록 사용)')
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self._run(options['rows'], options['repeat'])
+                raise Rollback()
+        except Rollback:
+            pass
+
+    def _run(self, rows, repeat):
+        # 제목/시간 필드가 있는 목록(StudyEvent, Event)만 비교
+        targets = seed_list_rows(rows)[:2]
+        for label, queryset, serializer_class in targets:
+            self.stdout.write(self.style.MIGRATE_HEADING(f'{label} ({rows} rows)'))
+            results = [
+                ('ModelSerializer (전체 컬럼)', self._model_serializer(queryset, serializer_class, None)),
+                (f'ModelSerializer + only({",".join(LIST_FIELDS)})', self._model_serializer(queryset, serializer_class, LIST_FIELDS)),
+                ('FastListSerializer (전체 컬럼)', self._fast_serializer(queryset, serializer_class, None)),
+                (f'FastListSerializer + values({",".join(LIST_FIELDS)})', self._fast_serializer(queryset, serializer_class, LIST_FIELDS)),
+            ]
+            baseline = None
+            for name, run in results:
+                elapsed = min(self._timed(run) for _ in range(repeat))
+                rows_per_sec = rows / elapsed if elapsed else float('inf')
+                baseline = baseline or rows_per_sec
+                self.stdout.write(
+                    f'  {name:<55} {rows_per_sec:>12,.0f} rows/sec  (x{rows_per_sec / baseline:.2f})'
+                )
+
+    @staticmethod
+    def _timed(run):
+        started = time.perf_counter()
+        run()
+        return time.perf_counter() - started
+
+    @staticmethod
+    def _model_serializer(queryset, serializer_class, field_names):
+        def run():
+            projected = project_queryset(queryset.all(), serializer_class, field_names)
+            serializer = restrict_serializer_fields(serializer_class(projected, many=True), field_names)
+            return serializer.data
+        return run
+
+    @staticmethod
+    def _fast_serializer(queryset, serializer_class, field_names):
+        fast_serializer = FastListSerializer(serializer_class, field_names)
+
+        def run():
+            return fast_serializer.to_representation(fast_serializer.get_values_queryset(queryset.all()))
+        return run
@@ -0,0 +1,74 @@
+"""
+데이터베이스 연결 풀 / 지속 연결 상태 진단
+
+연결 방식과 풀 사용률, 연결 획득 시간, 서버 기준 연결 수를 출력합니다.
+풀 통계는 이 명령 프로세스의 값이므로, 실행 중인 워커의 풀은 GET /api/health/db/ 로 확인합니다.
+
+사용 예시:
+    python manage.py db_pool_status
+    python manage.py db_pool_status --database replica --samples 20 --json
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from core.dbstatus import DatabaseStatusService
+
+
+class Command(BaseCommand):
+    help = 'DB 연결 방식, 연결 풀 사용률/대기 시간, 서버 연결 수 진단'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', help='확인할 DB 별칭 (기본값: 전체)')
+        parser.add_argument('--samples', type=int, default=5, help='연결 획득 시간 측정 횟수')
+        parser.add_argument('--json', action='store_true', help='JSON 으로 출력')
+
+    def handle(self, *args, **options):
+        alias = options['database']
+        if alias and alias not in connections:
+            raise CommandError(f'DATABASES 에 {alias} 별칭이 없습니다.')
+
+        if alias:
+            statuses = [DatabaseStatusService.get_status(alias, options['samples'])]
+        else:
+            statuses = DatabaseStatusService.get_all_status(options['samples'])
+
+        if options['json']:
+            self.stdout.write(json.dumps(statuses, ensure_ascii=False, indent=2, default=str))
+            return
+
+        for status in statuses:
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                f"{status['alias']} ({status['vendor']}, {status['mode']}, "
+                f"CONN_MAX_AGE={status['conn_max_age']}, CONN_HEALTH_CHECKS={status['conn_health_checks']})"
+            ))
+
+            pool = status['pool']
+            if pool is not None:
+                self.stdout.write(
+                    f"  pool         {pool['in_use']}/{pool.get('pool_size', 0)} 사용 중 "
+                    f"(min={pool.get('pool_min')}, max={pool.get('pool_max')}, 사용률={pool['utilization']}), "
+                    f"대기 중 요청 {pool.get('requests_waiting', 0)}"
+                )
+                self.stdout.write(
+                    f"  pool wait    대기한 요청 {pool.get('requests_queued', 0)} / 전체 {pool.get('requests_num', 0)}, "
+                    f"평균 대기 {pool['avg_wait_ms']}ms, 타임아웃/오류 {pool.get('requests_errors', 0)}"
+                )
+
+            acquire = status['acquire']
+            if acquire is not None:
+                if 'error' in acquire:
+                    self.stdout.write(self.style.ERROR(f"  acquire      실패: {acquire['error']}"))
+                else:
+                    self.stdout.write(
+                        f"  acquire      평균 {acquire['avg_ms']}ms, 최대 {acquire['max_ms']}ms ({acquire['samples']}회)"
+                    )
+
+            server = status['server_connections']
+            if server is not None:
+                if 'error' in server:
+                    self.stdout.write(self.style.ERROR(f"  server       조회 실패: {server['error']}"))
+                else:
+                    states = ', '.join(f'{state}={count}' for state, count in sorted(server['by_state'].items()))
+                    self.stdout.write(f"  server       {server['total']}/{server['max_connections']} 연결 ({states})")
@@ -0,0 +1,80 @@
+"""
+대용량 합성 데이터 생성
+
+인덱스 튜닝/벤치마크용으로 운영 데이터와 비슷한 모양의 데이터를 만듭니다 (core.seeding.LoadSeeder).
+같은 --seed / --end-date 면 같은 데이터가 만들어지고, 이미 있는 사용자는 건너뜁니다.
+
+사용 예시:
+    python manage.py seed_load --users 10000 --days 730
+    python manage.py seed_load --users 10000 --days 730 --copy --seed 42
+    python manage.py seed_load --scale 10 --events-per-day 2
+"""
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.seeding import LoadSeeder, SeedScale
+
+
+class Command(BaseCommand):
+    help = '벤치마크/인덱스 튜닝용 대용량 합성 데이터 생성 (bulk_create 또는 PostgreSQL COPY)'
+
+    def add_arguments(self, parser):
+        defaults = SeedScale()
+        parser.add_argument('--users', type=int, default=defaults.users, help='사용자 수')
+        parser.add_argument('--scale', type=float, default=1.0, help='사용자 수 배율 (--users x --scale)')
+        parser.add_argument('--days', type=int, default=defaults.days, help='사용자별 데이터 기간 (일)')
+        parser.add_argument('--events-per-day', type=float, default=defaults.events_per_day)
+        parser.add_argument('--repeat-events', type=int, default=defaults.repeat_events, help='사용자별 반복 일정 수')
+        parser.add_argument('--study-events-per-week', type=float, default=defaults.study_events_per_week)
+        parser.add_argument('--contents-per-study-event', type=int, default=defaults.contents_per_study_event)
+        parser.add_argument('--exams-per-month', type=float, default=defaults.exams_per_month)
+        parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+        parser.add_argument('--end-date', type=date.fromisoformat, help='데이터 마지막 날 (기본: 오늘, YYYY-MM-DD)')
+        parser.add_argument('--copy', action='store_true', help='PostgreSQL COPY 로 저장')
+        parser.add_argument('--batch-size', type=int, default=2000, help='bulk_create 배치 크기')
+        parser.add_argument('--users-per-batch', type=int, default=100, help='한 트랜잭션에서 만들 사용자 수')
+
+    def handle(self, *args, **options):
+        scale = SeedScale(
+            users=int(options['users'] * options['scale']),
+            days=options['days'],
+            events_per_day=options['events_per_day'],
+            repeat_events=options['repeat_events'],
+            study_events_per_week=options['study_events_per_week'],
+            contents_per_study_event=options['contents_per_study_event'],
+            exams_per_month=options['exams_per_month'],
+        )
+        try:
+            seeder = LoadSeeder(
+                scale,
+                seed=options['seed'],
+                use_copy=options['copy'],
+                batch_size=options['batch_size'],
+                users_per_batch=options['users_per_batch'],
+                end_date=options['end_date'],
+            )
+        except ValueError as error:
+            raise CommandError(str(error))
+
+        started = time.perf_counter()
+
+        def progress(done, total, counts):
+            elapsed = time.perf_counter() - started
+            rows = sum(counts.values())
+            self.stdout.write(f'  {done}/{total} 사용자, {rows:,} 행 ({rows / elapsed:,.0f} rows/sec)')
+
+        self.stdout.write(f'{seeder.writer.name} 로 사용자 {scale.users}명 x {scale.days}일 생성')
+        counts = seeder.run(progress)
+        if not counts:
+            self.stdout.write('이미 모든 사용자가 있습니다.')
+            return
+
+        elapsed = time.perf_counter() - started
+        for name, count in counts.items():
+            self.stdout.write(f'  {name:<14} {count:>12,}')
+        total = sum(counts.values())
+        self.stdout.write(self.style.SUCCESS(
+            f'{total:,} 행, {elapsed:.1f}초 ({total / elapsed:,.0f} rows/sec)'
+        ))
@@ -0,0 +1,351 @@
+"""
+URL 별 지연 시간 메트릭 (Prometheus 텍스트 형식)
+
+- MetricsMiddleware: 요청마다 URL 이름(resolver_match.view_name, 예: 'users:data-version')별로
+  지연 시간 히스토그램, 상태 코드별 응답 수, DB/캐시 시간과 쿼리 수를 프로세스 메모리(MetricsRegistry)에 누적
+- 여러 gunicorn 워커: METRICS_MULTIPROC_DIR 이 있으면 워커마다 metrics-<pid>.json 으로 주기적으로
+  (METRICS_FLUSH_INTERVAL 초) 원자적으로 저장하고, /metrics 에서 모든 파일을 합쳐 응답
+  (종료된 워커의 파일도 합산하여 카운터가 줄어들지 않음, 배포 시 디렉터리를 비우고 시작)
+- 측정 자체의 비용(미들웨어가 요청 처리 외에 쓴 시간)도 http_metrics_overhead_seconds 로 기록
+- Celery 작업 등 요청 밖의 카운터는 increment() 로 기록 (예: study_timers_auto_closed_total)
+
+외부 의존성 없이 동작하며, 캐시 시간은 설정된 캐시 백엔드 클래스의 메서드를 감싸서 측정합니다.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+from django.utils.module_loading import import_string
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+OVERHEAD_BUCKETS = (0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.001)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+UNRESOLVED_VIEW = '<unresolved>'
+
+# 시간을 측정할 캐시 메서드 (다른 메서드 안에서 호출되면 바깥 호출만 측정)
+CACHE_METHODS = (
+    'get', 'set', 'add', 'delete', 'touch', 'has_key', 'incr', 'decr',
+    'get_many', 'set_many', 'delete_many', 'get_or_set', 'clear',
+)
+
+HELP = {
+    'http_request_duration_seconds': 'URL 별 요청 처리 시간',
+    'http_responses_total': 'URL/상태 코드별 응답 수',
+    'http_request_db_seconds_total': 'URL 별 DB 쿼리 누적 시간',
+    'http_request_db_queries_total': 'URL 별 DB 쿼리 수',
+    'http_request_cache_seconds_total': 'URL 별 캐시 호출 누적 시간',
+    'http_request_cache_calls_total': 'URL 별 캐시 호출 수',
+    'http_metrics_overhead_seconds': '메트릭 수집 자체에 걸린 요청당 시간',
+    'study_timers_auto_closed_total': '정리 작업이 자동 종료한 오래된 타이머 수',
+}
+
+# 현재 요청의 측정값 (None 이면 요청 밖)
+_current = ContextVar('metrics_request', default=None)
+
+
+class RequestTimings:
+    """요청 하나의 DB/캐시 측정값 (execute_wrapper, 캐시 메서드 래퍼가 누적)"""
+    __slots__ = ('db_time', 'db_queries', 'cache_time', 'cache_calls', 'cache_depth')
+
+    def __init__(self):
+        self.db_time = 0.0
+        self.db_queries = 0
+        self.cache_time = 0.0
+        self.cache_calls = 0
+        self.cache_depth = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - started
+            self.db_queries += 1
+
+
+def _timed_cache_method(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        timings = _current.get()
+        if timings is None or timings.cache_depth:
+            return method(self, *args, **kwargs)
+        timings.cache_depth += 1
+        started = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            timings.cache_time += time.perf_counter() - started
+            timings.cache_calls += 1
+            timings.cache_depth -= 1
+    wrapper._metrics_timed = True
+    return wrapper
+
+
+def instrument_cache_backends():
+    """설정된 캐시 백엔드 클래스의 메서드를 시간 측정 래퍼로 교체 (한 번만)"""
+    for config in settings.CACHES.values():
+        backend_class = import_string(config['BACKEND'])
+        for name in CACHE_METHODS:
+            method = getattr(backend_class, name, None)
+            if method is None or getattr(method, '_metrics_timed', False):
+                continue
+            setattr(backend_class, name, _timed_cache_method(method))
+
+
+class MetricsRegistry:
+    """
+    프로세스 내 메트릭 저장소
+
+    counters: {(이름, 라벨 tuple): 값}
+    histograms: {(이름, 라벨 tuple): [구간별 개수..., 합계, 개수]}
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+        self.flushed_at = 0.0
+
+    def inc(self, name, labels, value=1.0):
+        key = (name, labels)
+        self.counters[key] = self.counters.get(key, 0.0) + value
+
+    def observe(self, name, labels, value, buckets):
+        key = (name, labels)
+        values = self.histograms.get(key)
+        if values is None:
+            values = self.histograms[key] = [0] * len(buckets) + [0.0, 0]
+        for index, bound in enumerate(buckets):
+            if value <= bound:
+                values[index] += 1
+                break
+        values[-2] += value
+        values[-1] += 1
+
+    def record_request(self, view, method, status, duration, timings):
+        labels = (('view', view), ('method', method))
+        with self.lock:
+            self.observe('http_request_duration_seconds', labels, duration, LATENCY_BUCKETS)
+            self.inc('http_responses_total', labels + (('status', str(status)),))
+            if timings.db_queries:
+                self.inc('http_request_db_seconds_total', labels, timings.db_time)
+                self.inc('http_request_db_queries_total', labels, timings.db_queries)
+            if timings.cache_calls:
+                self.inc('http_request_cache_seconds_total', labels, timings.cache_time)
+                self.inc('http_request_cache_calls_total', labels, timings.cache_calls)
+
+    def record_overhead(self, overhead):
+        with self.lock:
+            self.observe('http_metrics_overhead_seconds', (), overhead, OVERHEAD_BUCKETS)
+
+    def dump(self):
+        """JSON 저장용 (라벨 tuple 은 목록으로 변환)"""
+        with self.lock:
+            return {
+                'counters': [[name, labels, value] for (name, labels), value in self.counters.items()],
+                'histograms': [[name, labels, list(values)] for (name, labels), values in self.histograms.items()],
+            }
+
+    def flush(self, directory, force=False):
+        """METRICS_FLUSH_INTERVAL 마다 이 프로세스의 값을 metrics-<pid>.json 으로 저장 (임시 파일 → 이름 변경)"""
+        now = time.monotonic()
+        interval = getattr(settings, 'METRICS_FLUSH_INTERVAL', 1.0)
+        if not force and now - self.flushed_at < interval:
+            return
+        # 같은 프로세스의 다른 스레드가 저장 중이면 건너뜀 (강제 저장은 끝날 때까지 대기)
+        if not self.flush_lock.acquire(blocking=force):
+            return
+        try:
+            self.flushed_at = now
+            directory = Path(directory)
+            directory.mkdir(parents=True, exist_ok=True)
+            path = directory / f'metrics-{os.getpid()}.json'
+            temp_path = directory / f'.metrics-{os.getpid()}.json.tmp'
+            temp_path.write_text(json.dumps(self.dump()))
+            os.replace(temp_path, path)
+        finally:
+            self.flush_lock.release()
+
+
+registry = MetricsRegistry()
+
+
+def get_multiproc_dir():
+    return getattr(settings, 'METRICS_MULTIPROC_DIR', None)
+
+
+def increment(name, value=1.0, labels=()):
+    """
+    요청 밖(Celery 작업 등)에서 카운터 증가
+
+    공유 디렉터리가 있으면 바로 저장하여 웹 워커의 /metrics 에서 합산되도록 함
+    (name 은 HELP 에 설명이 있어야 함)
+    """
+    if not getattr(settings, 'METRICS_ENABLED', True):
+        return
+    with registry.lock:
+        registry.inc(name, tuple(labels), value)
+    directory = get_multiproc_dir()
+    if directory:
+        registry.flush(directory, force=True)
+
+
+def collect():
+    """
+    모든 워커의 메트릭 합산
+
+    :return: (counters, histograms) dict
+    """
+    directory = get_multiproc_dir()
+    dumps = []
+    if directory:
+        registry.flush(directory, force=True)
+        for path in sorted(Path(directory).glob('metrics-*.json')):
+            try:
+                dumps.append(json.loads(path.read_text()))
+            except (OSError, ValueError):
+                # 다른 워커가 교체 중인 파일은 다음 수집에서 반영
+                continue
+    else:
+        dumps.append(registry.dump())
+
+    counters = {}
+    histograms = {}
+    for dump in dumps:
+        for name, labels, value in dump['counters']:
+            key = (name, tuple(tuple(label) for label in labels))
+            counters[key] = counters.get(key, 0.0) + value
+        for name, labels, values in dump['histograms']:
+            key = (name, tuple(tuple(label) for label in labels))
+            merged = histograms.get(key)
+            histograms[key] = values if merged is None else [a + b for a, b in zip(merged, values)]
+    return counters, histograms
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labels, extra=()):
+    items = list(labels) + list(extra)
+    if not items:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in items) + '}'
+
+
+def _format_value(value):
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def render_prometheus(counters, histograms):
+    """Prometheus 텍스트 형식 (version 0.0.4)"""
+    lines = []
+    histogram_buckets = {
+        'http_request_duration_seconds': LATENCY_BUCKETS,
+        'http_metrics_overhead_seconds': OVERHEAD_BUCKETS,
+    }
+
+    for name in sorted({name for name, _ in histograms}):
+        buckets = histogram_buckets[name]
+        lines.append(f'# HELP {name} {HELP[name]}')
+        lines.append(f'# TYPE {name} histogram')
+        for (metric, labels), values in sorted(histograms.items()):
+            if metric != name:
+                continue
+            cumulative = 0
+            for bound, count in zip(buckets, values):
+                cumulative += count
+                lines.append(f'{name}_bucket{_format_labels(labels, [("le", bound)])} {cumulative}')
+            lines.append(f'{name}_bucket{_format_labels(labels, [("le", "+Inf")])} {values[-1]}')
+            lines.append(f'{name}_sum{_format_labels(labels)} {_format_value(values[-2])}')
+            lines.append(f'{name}_count{_format_labels(labels)} {values[-1]}')
+
+    for name in sorted({name for name, _ in counters}):
+        lines.append(f'# HELP {name} {HELP[name]}')
+        lines.append(f'# TYPE {name} counter')
+        for (metric, labels), value in sorted(counters.items()):
+            if metric == name:
+                lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+
+    return '\n'.join(lines) + '\n'
+
+
+def metrics_view(request):
+    """
+    GET /metrics (Prometheus 수집용)
+
+    METRICS_TOKEN 이 설정되어 있으면 Authorization: Bearer <토큰> 필요,
+    설정되어 있지 않으면 DEBUG 이거나 관리자(is_staff)로 로그인한 경우에만 응답 (URL 목록 등 내부 정보 노출 방지)
+    """
+    token = getattr(settings, 'METRICS_TOKEN', None)
+    if token:
+        provided = request.META.get('HTTP_AUTHORIZATION', '').removeprefix('Bearer ')
+        if not constant_time_compare(provided, token):
+            return HttpResponseForbidden()
+    elif not settings.DEBUG:
+        user = getattr(request, 'user', None)
+        if user is None or not user.is_staff:
+            return HttpResponseForbidden()
+    counters, histograms = collect()
+    return HttpResponse(render_prometheus(counters, histograms), content_type=CONTENT_TYPE)
+
+
+class MetricsMiddleware:
+    """
+    URL 별 지연 시간/상태 코드/DB·캐시 시간 측정 미들웨어
+
+    전체 처리 시간을 재도록 미들웨어 목록의 맨 앞에 위치 (METRICS_ENABLED 가 False 이면 제외됨)
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'METRICS_ENABLED', True):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        instrument_cache_backends()
+
+    def __call__(self, request):
+        started = time.perf_counter()
+        timings = RequestTimings()
+        token = _current.set(timings)
+        wrappers = [connection.execute_wrapper(timings) for connection in connections.all()]
+        for wrapper in wrappers:
+            wrapper.__enter__()
+        handler_started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            handler_finished = time.perf_counter()
+            for wrapper in reversed(wrappers):
+                wrapper.__exit__(None, None, None)
+            _current.reset(token)
+
+        match = getattr(request, 'resolver_match', None)
+        if match is None:
+            view = UNRESOLVED_VIEW
+        else:
+            # 이름이 없는 URL 패턴은 route (예: 'api/calendars/exams/') 로 구분
+            view = match.view_name if match.url_name else match.route
+        registry.record_request(view, request.method, response.status_code, handler_finished - started, timings)
+
+        directory = get_multiproc_dir()
+        if directory:
+            registry.flush(directory)
+
+        finished = time.perf_counter()
+        registry.record_overhead((handler_started - started) + (finished - handler_finished))
+        return response
@@ -0,0 +1,29 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:55
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('users', '0003_alter_customuser_options_remove_customuser_username_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserDataVersion',
+            fields=[
+                ('user', models.OneToOneField(help_text='사용자', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='data_version', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('version', models.PositiveBigIntegerField(default=0, help_text='데이터 버전')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='마지막 변경 시간')),
+            ],
+            options={
+                'verbose_name': '사용자 데이터 버전',
+                'verbose_name_plural': '사용자 데이터 버전들',
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+"""
+공통 모델
+
+여러 앱에 걸친 사용자 데이터의 메타 정보를 저장합니다.
+"""
+from django.conf import settings
+from django.db import models
+
+
+class UserDataVersion(models.Model):
+    """
+    사용자 데이터 버전 (Redis 카운터의 DB 미러)
+
+    일정/시험/스터디 데이터가 바뀔 때마다 증가하는 단조 증가 카운터.
+    평소에는 Redis 에서 읽고, Redis 가 비어 있거나 사용할 수 없을 때 이 값을 사용
+    """
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='data_version',
+        help_text="사용자"
+    )
+    version = models.PositiveBigIntegerField(default=0, help_text="데이터 버전")
+    updated_at = models.DateTimeField(auto_now=True, help_text="마지막 변경 시간")
+
+    class Meta:
+        verbose_name = '사용자 데이터 버전'
+        verbose_name_plural = '사용자 데이터 버전들'
+
+    def __str__(self):
+        return f"데이터 버전 (user={self.user_id}, v={self.version})"
@@ -0,0 +1,29 @@
+"""
+고성능 JSON 파서
+
+orjson 이 설치되어 있으면 orjson 으로 파싱하고, 없으면 DRF 기본 JSONParser 로 대체
+"""
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from .renderers import FastJSONRenderer, orjson
+
+
+class FastJSONParser(JSONParser):
+    """orjson 기반 JSON 파서 (표준 json 대체 가능)"""
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', 'utf-8')
+        body = stream.read() if stream is not None else b''
+        try:
+            if encoding.lower().replace('_', '-') not in ('utf-8', 'utf8'):
+                body = body.decode(encoding)
+            # orjson 은 NaN/Infinity 를 허용하지 않으므로 STRICT_JSON 과 동일하게 동작
+            return orjson.loads(body)
+        except (ValueError, UnicodeDecodeError) as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
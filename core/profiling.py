@@ -0,0 +1,339 @@
+"""
+느린 요청 프로파일링 (opt-in)
+
+PROFILING_ENABLED 가 False 이면 미들웨어 체인에서 제외되어 비용이 없습니다.
+
+- 스택 샘플링: 프로세스마다 데몬 스레드 하나가 PROFILING_SAMPLE_INTERVAL_MS 마다 처리 중인 요청 스레드의
+  스택(sys._current_frames)을 모으고, 요청이 PROFILING_SLOW_THRESHOLD_MS 보다 오래 걸렸을 때만 저장
+  (요청 스레드에는 훅을 걸지 않으므로 빠른 요청의 비용은 등록/해제 정도)
+- cProfile: PROFILING_SAMPLE_RATE 비율(0~1)의 요청은 cProfile 로 전체 호출 그래프를 측정하여 속도와 관계없이 저장
+- 요청 중 실행된 쿼리를 SQL 형태별 누적 시간으로 함께 기록 (core.querybudget.QueryRecorder)
+
+저장소 (ProfileStore)
+- PROFILING_DIR 에 프로파일마다 <id>.json (요약, 상위 함수/쿼리, 접힌 스택) 과
+  cProfile 이면 <id>.prof (pstats 덤프, snakeviz 등으로 열기) 를 원자적으로 저장
+- PROFILING_MAX_FILES 개를 넘으면 오래된 것부터 삭제
+- GET /api/health/profiles/ 로 최근 목록, /api/health/profiles/<id>/ 로 상세 조회 (관리자 전용)
+"""
+import cProfile
+import json
+import logging
+import os
+import pstats
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from itertools import count
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils import timezone
+
+from .querybudget import record_queries
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SLOW_THRESHOLD_MS = 500
+DEFAULT_SAMPLE_INTERVAL_MS = 5
+DEFAULT_MAX_FILES = 200
+TOP_FUNCTIONS = 30
+TOP_QUERIES = 10
+TOP_CALLERS = 5
+# 저장할 접힌 스택 수 (샘플이 많은 순)
+MAX_STACKS = 500
+
+re_profile_id = re.compile(r'^\d+-\d+-\d+$')
+
+
+def _frame_label(code):
+    return f'{code.co_filename}:{code.co_firstlineno}({code.co_name})'
+
+
+class StackSampler:
+    """
+    요청 스레드 스택 샘플러 (프로세스마다 하나, fork 이후 새 프로세스에서 다시 시작)
+
+    start(thread_id) 로 등록한 스레드의 스택을 간격마다 접힌 문자열('바깥;...;안쪽')로 세어 두고,
+    stop(thread_id) 에서 모은 샘플의 복사본을 돌려줌 (등록된 스레드가 없으면 대기)
+    """
+
+    _lock = threading.Lock()
+    _instance = None
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.pid = os.getpid()
+        self.active = {}
+        # active 와 각 요청의 Counter 는 샘플러 스레드와 요청 스레드가 함께 쓰므로 이 조건 변수의 락으로 보호
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self._run, name='profiling-sampler', daemon=True)
+        self.thread.start()
+
+    @classmethod
+    def get(cls):
+        instance = cls._instance
+        if instance is None or instance.pid != os.getpid():
+            with cls._lock:
+                instance = cls._instance
+                if instance is None or instance.pid != os.getpid():
+                    interval = getattr(settings, 'PROFILING_SAMPLE_INTERVAL_MS', DEFAULT_SAMPLE_INTERVAL_MS) / 1000
+                    instance = cls._instance = cls(interval)
+        return instance
+
+    def start(self, thread_id):
+        with self.condition:
+            self.active[thread_id] = Counter()
+            self.condition.notify()
+
+    def stop(self, thread_id):
+        """
+        등록 해제
+
+        :return: 모은 스택 샘플의 복사본 (Counter)
+        """
+        with self.condition:
+            return Counter(self.active.pop(thread_id, None) or ())
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while True:
+            # 처리 중인 요청이 없으면 깨어나지 않고 등록될 때까지 대기
+            with self.condition:
+                while not self.active:
+                    self.condition.wait()
+            time.sleep(self.interval)
+            with self.condition:
+                frames = sys._current_frames()
+                for thread_id, stacks in self.active.items():
+                    frame = frames.get(thread_id)
+                    if frame is None or thread_id == own_id:
+                        continue
+                    labels = []
+                    while frame is not None:
+                        labels.append(_frame_label(frame.f_code))
+                        frame = frame.f_back
+                    stacks[';'.join(reversed(labels))] += 1
+                del frames
+
+
+def summarize_stacks(stacks, limit=TOP_FUNCTIONS):
+    """
+    접힌 스택 샘플로 함수별 샘플 수 계산
+
+    :return: [{'function', 'self_samples', 'total_samples'}] (total 많은 순)
+    """
+    own = Counter()
+    total = Counter()
+    for stack, samples in stacks.items():
+        frames = stack.split(';')
+        own[frames[-1]] += samples
+        for label in set(frames):
+            total[label] += samples
+    return [
+        {'function': label, 'self_samples': own[label], 'total_samples': samples}
+        for label, samples in total.most_common(limit)
+    ]
+
+
+def summarize_cprofile(profiler, limit=TOP_FUNCTIONS):
+    """
+    cProfile 결과로 함수별 호출 수/시간과 주요 호출자 계산
+
+    :return: [{'function', 'calls', 'self_ms', 'cumulative_ms', 'callers'}] (누적 시간 많은 순)
+    """
+    stats = pstats.Stats(profiler).stats
+
+    def label(key):
+        filename, line, name = key
+        return f'{filename}:{line}({name})'
+
+    rows = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:limit]
+    functions = []
+    for key, (_, calls, self_time, cumulative, callers) in rows:
+        top_callers = sorted(callers.items(), key=lambda item: item[1][3], reverse=True)[:TOP_CALLERS]
+        functions.append({
+            'function': label(key),
+            'calls': calls,
+            'self_ms': round(self_time * 1000, 3),
+            'cumulative_ms': round(cumulative * 1000, 3),
+            'callers': [
+                {'function': label(caller), 'cumulative_ms': round(caller_stats[3] * 1000, 3)}
+                for caller, caller_stats in top_callers
+            ],
+        })
+    return functions
+
+
+class ProfileStore:
+    """프로파일 파일 저장소 (PROFILING_DIR, 최대 PROFILING_MAX_FILES 개)"""
+
+    _sequence = count()
+
+    @staticmethod
+    def get_dir():
+        return Path(getattr(settings, 'PROFILING_DIR', Path(settings.BASE_DIR) / 'profiles'))
+
+    @staticmethod
+    def _write_atomic(path, write):
+        temp_path = path.with_name(path.name + '.part')
+        write(temp_path)
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def save(record, profiler=None):
+        """
+        프로파일 저장 후 오래된 파일 정리
+
+        :param record: 요약 dict (id 는 여기서 채움)
+        :param profiler: cProfile.Profile (있으면 <id>.prof 도 저장)
+        :return: 프로파일 id
+        """
+        directory = ProfileStore.get_dir()
+        directory.mkdir(parents=True, exist_ok=True)
+        profile_id = f'{int(time.time() * 1000)}-{os.getpid()}-{next(ProfileStore._sequence)}'
+        record['id'] = profile_id
+
+        if profiler is not None:
+            ProfileStore._write_atomic(directory / f'{profile_id}.prof', profiler.dump_stats)
+            record['has_pstats'] = True
+
+        def write_json(path):
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(record, f, ensure_ascii=False)
+
+        ProfileStore._write_atomic(directory / f'{profile_id}.json', write_json)
+        ProfileStore.rotate()
+        return profile_id
+
+    @staticmethod
+    def _list_ids(directory):
+        try:
+            names = os.listdir(directory)
+        except FileNotFoundError:
+            return []
+        ids = [name[:-5] for name in names if name.endswith('.json') and re_profile_id.match(name[:-5])]
+        # 시간(ms) -> pid -> 순번 순
+        return sorted(ids, key=lambda profile_id: tuple(int(part) for part in profile_id.split('-')))
+
+    @staticmethod
+    def rotate():
+        directory = ProfileStore.get_dir()
+        max_files = getattr(settings, 'PROFILING_MAX_FILES', DEFAULT_MAX_FILES)
+        ids = ProfileStore._list_ids(directory)
+        for profile_id in ids[:max(len(ids) - max_files, 0)]:
+            for suffix in ('.json', '.prof'):
+                try:
+                    os.remove(directory / f'{profile_id}{suffix}')
+                except FileNotFoundError:  # 다른 워커가 먼저 삭제
+                    pass
+
+    @staticmethod
+    def get(profile_id):
+        """프로파일 상세 (없거나 형식이 잘못된 id 면 None)"""
+        if not re_profile_id.match(profile_id or ''):
+            return None
+        try:
+            with open(ProfileStore.get_dir() / f'{profile_id}.json', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    @staticmethod
+    def list(limit=50):
+        """최근 프로파일 요약 목록 (최신순, 접힌 스택 제외)"""
+        summaries = []
+        for profile_id in reversed(ProfileStore._list_ids(ProfileStore.get_dir())):
+            record = ProfileStore.get(profile_id)
+            if record is None:
+                continue
+            record.pop('stacks', None)
+            record['top_functions'] = record.get('top_functions', [])[:5]
+            record['top_queries'] = record.get('top_queries', [])[:3]
+            summaries.append(record)
+            if len(summaries) >= limit:
+                break
+        return summaries
+
+
+class ProfilingMiddleware:
+    """
+    느린 요청 프로파일링 미들웨어
+
+    요청 전체를 측정하도록 MetricsMiddleware 바로 뒤에 위치 (PROFILING_ENABLED 가 False 이면 제외됨)
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'PROFILING_ENABLED', False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.threshold = getattr(settings, 'PROFILING_SLOW_THRESHOLD_MS', DEFAULT_SLOW_THRESHOLD_MS) / 1000
+        self.sample_rate = getattr(settings, 'PROFILING_SAMPLE_RATE', 0.0)
+
+    def __call__(self, request):
+        profiler = None
+        if self.sample_rate and random.random() < self.sample_rate:
+            profiler = cProfile.Profile()
+
+        sampler = StackSampler.get()
+        thread_id = threading.get_ident()
+        sampler.start(thread_id)
+        started = time.perf_counter()
+        try:
+            with record_queries() as recorder:
+                if profiler is not None:
+                    try:
+                        profiler.enable()
+                    except ValueError:  # 다른 요청이 cProfile 사용 중 (Python 3.12+ 는 프로세스에 하나)
+                        profiler = None
+                try:
+                    response = self.get_response(request)
+                finally:
+                    if profiler is not None:
+                        profiler.disable()
+        finally:
+            stacks = sampler.stop(thread_id)
+        duration = time.perf_counter() - started
+
+        slow = duration >= self.threshold
+        if slow or profiler is not None:
+            try:
+                self._save(request, response, duration, slow, stacks, recorder, profiler)
+            except OSError:
+                logger.exception('프로파일 저장 실패: %s %s', request.method, request.path)
+        return response
+
+    @staticmethod
+    def _save(request, response, duration, slow, stacks, recorder, profiler):
+        match = getattr(request, 'resolver_match', None)
+        user = getattr(request, 'user', None)
+        record = {
+            'created_at': timezone.now().isoformat(),
+            'method': request.method,
+            'path': request.path,
+            'view': match.view_name if match is not None else None,
+            'route': match.route if match is not None else None,
+            'status': response.status_code,
+            'user_id': user.pk if user is not None and user.is_authenticated else None,
+            'duration_ms': round(duration * 1000, 2),
+            'slow': slow,
+            'mode': 'cprofile' if profiler is not None else 'sampling',
+            'samples': sum(stacks.values()),
+            'query_count': recorder.count,
+            'query_time_ms': round(recorder.duration_ms, 2),
+            'top_queries': recorder.get_slowest(TOP_QUERIES),
+        }
+        if profiler is not None:
+            record['top_functions'] = summarize_cprofile(profiler)
+        else:
+            record['top_functions'] = summarize_stacks(stacks)
+        record['stacks'] = [
+            {'stack': stack, 'samples': samples} for stack, samples in stacks.most_common(MAX_STACKS)
+        ]
+        ProfileStore.save(record, profiler)
+        logger.info('요청 프로파일 저장: %s %s %.1fms (%s)', request.method, request.path,
+                    record['duration_ms'], record['id'])
@@ -0,0 +1,239 @@
+"""
+목록 API 용 경량 프로젝션
+
+- ?fields=title,start_at 형태의 sparse fieldset 으로 응답 필드를 선택
+- 선택한 필드만 .only() / .values() 로 조회하여 큰 TextField(goal, description, content)를 읽지 않음
+- 읽기 전용 목록은 모델 인스턴스/필드별 DRF 직렬화 과정을 건너뛰는 빠른 경로 제공
+"""
+from functools import lru_cache
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import fields as drf_fields
+from rest_framework import relations as drf_relations
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+
+FIELDS_QUERY_PARAM = 'fields'
+
+# values() 가 돌려주는 파이썬 값을 그대로 응답에 쓸 수 있는 필드 타입
+PASSTHROUGH_FIELD_TYPES = (
+    drf_fields.CharField,
+    drf_fields.IntegerField,
+    drf_fields.BooleanField,
+    drf_fields.FloatField,
+    drf_fields.ReadOnlyField,
+)
+
+# DateTimeField 를 DRF 와 동일한 ISO 8601 문자열로 직접 변환하는 경우의 표식
+ISO_DATETIME = 'iso-datetime'
+
+
+def parse_requested_fields(request, serializer_class):
+    """
+    ?fields= 파라미터 파싱
+
+    :param request: DRF Request
+    :param serializer_class: 응답 시리얼라이저 클래스
+    :return: 선택된 필드 이름 목록 (파라미터가 없으면 None)
+    :raises: ValidationError (알 수 없는 필드)
+    """
+    raw = request.query_params.get(FIELDS_QUERY_PARAM)
+    if not raw:
+        return None
+
+    requested = [name.strip() for name in raw.split(',') if name.strip()]
+    available = list(serializer_class().fields)
+    unknown = [name for name in requested if name not in available]
+    if unknown:
+        raise ValidationError({
+            FIELDS_QUERY_PARAM: f"알 수 없는 필드입니다: {', '.join(unknown)} (사용 가능: {', '.join(available)})"
+        })
+    # 시리얼라이저에 선언된 순서를 유지
+    return [name for name in available if name in requested]
+
+
+def get_model_field_names(serializer, field_names):
+    """시리얼라이저 필드 중 모델 컬럼에 바로 대응하는 source 이름 목록 (.only() 용)"""
+    model = serializer.Meta.model
+    concrete = {field.attname for field in model._meta.concrete_fields} | {field.name for field in model._meta.concrete_fields}
+    sources = []
+    for name in field_names:
+        source = serializer.fields[name].source
+        if source in concrete:
+            sources.append(source)
+    return sources
+
+
+def get_value_column(model, field):
+    """
+    values() 로 읽은 값을 그대로 쓸 수 있는 시리얼라이저 필드의 컬럼 이름 (없으면 None)
+
+    values('<외래 키>') 는 관계 객체가 아니라 pk 를 돌려주므로,
+    외래 키는 pk 를 그대로 내보내는 PrimaryKeyRelatedField 만 *_id 컬럼으로 대응
+    """
+    for model_field in model._meta.concrete_fields:
+        if field.source == model_field.attname:
+            return model_field.attname
+        if field.source == model_field.name:
+            if not model_field.is_relation:
+                return model_field.name
+            if isinstance(field, drf_relations.PrimaryKeyRelatedField) and field.pk_field is None:
+                return model_field.attname
+            return None
+    return None
+
+
+def project_queryset(queryset, serializer_class, field_names):
+    """
+    선택된 필드에 해당하는 컬럼만 조회하도록 .only() 적용
+
+    :param field_names: 선택된 필드 이름 목록 (None 이면 그대로 반환)
+    """
+    if field_names is None:
+        return queryset
+    serializer = serializer_class()
+    return queryset.only('pk', *get_model_field_names(serializer, field_names))
+
+
+def restrict_serializer_fields(serializer, field_names):
+    """생성된 시리얼라이저(또는 ListSerializer)에서 선택되지 않은 필드 제거"""
+    if field_names is None:
+        return serializer
+    target = getattr(serializer, 'child', serializer)
+    for name in list(target.fields):
+        if name not in field_names:
+            target.fields.pop(name)
+    return serializer
+
+
+class FastListSerializer:
+    """
+    읽기 전용 목록을 위한 빠른 직렬화 경로
+
+    queryset.values() 로 필요한 컬럼만 dict 로 가져온 뒤,
+    필드별 변환 함수를 미리 계산해 두고 행마다 한 번의 dict 생성으로 직렬화
+    (모델 인스턴스 생성, 필드별 get_attribute/to_representation 호출을 생략)
+    """
+
+    def __init__(self, serializer_class, field_names=None):
+        serializer = serializer_class()
+        names = field_names or list(serializer.fields)
+        self.columns = []
+        self.converters = []
+        for name in names:
+            field = serializer.fields[name]
+            self.columns.append((name, get_value_column(serializer.Meta.model, field)))
+            # 외래 키는 *_id 값(pk)을 그대로 사용
+            if isinstance(field, PASSTHROUGH_FIELD_TYPES + (drf_relations.PrimaryKeyRelatedField,)):
+                self.converters.append(None)
+            elif self._is_default_iso_datetime(field):
+                self.converters.append(ISO_DATETIME)
+            else:
+                self.converters.append(field.to_representation)
+        self.sources = [source for _, source in self.columns]
+
+    @staticmethod
+    def _is_default_iso_datetime(field):
+        """기본 출력 형식(ISO 8601) + 기본 시간대를 쓰는 DateTimeField 인지"""
+        if not isinstance(field, drf_fields.DateTimeField) or hasattr(field, 'timezone'):
+            return False
+        output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+        return isinstance(output_format, str) and output_format.lower() == drf_fields.ISO_8601
+
+    @staticmethod
+    def supports(serializer_class, field_names=None):
+        """모든 필드가 모델 컬럼에 바로 대응하는 경우에만 빠른 경로 사용 가능 (외래 키는 PrimaryKeyRelatedField 만)"""
+        serializer = serializer_class()
+        if not hasattr(serializer, 'Meta') or not hasattr(serializer.Meta, 'model'):
+            return False
+        names = field_names or list(serializer.fields)
+        return all(get_value_column(serializer.Meta.model, serializer.fields[name]) is not None for name in names)
+
+    def get_values_queryset(self, queryset):
+        """필요한 컬럼만 dict 로 조회하는 QuerySet (페이지네이션 전에 적용)"""
+        return queryset.values(*self.sources)
+
+    def to_representation(self, rows):
+        """
+        :param rows: get_values_queryset() 결과 (또는 그 페이지)
+        :return: dict 목록
+        """
+        # DRF DateTimeField.to_representation 과 같은 결과를 내되, 시간대는 호출당 한 번만 조회
+        current_timezone = timezone.get_current_timezone() if settings.USE_TZ else None
+
+        def to_iso_datetime(value):
+            if current_timezone is not None:
+                value = value.astimezone(current_timezone)
+            value = value.isoformat()
+            return value[:-6] + 'Z' if value.endswith('+00:00') else value
+
+        plan = [
+            (name, source, to_iso_datetime if converter is ISO_DATETIME else converter)
+            for (name, source), converter in zip(self.columns, self.converters)
+        ]
+        result = []
+        for row in rows:
+            item = {}
+            for name, source, converter in plan:
+                value = row[source]
+                item[name] = value if converter is None or value is None else converter(value)
+            result.append(item)
+        return result
+
+
+@lru_cache(maxsize=256)
+def get_fast_list_serializer(serializer_class, field_names=None):
+    """
+    시리얼라이저 클래스/필드 조합별 FastListSerializer (변환 계획을 재사용하도록 캐시)
+
+    :param field_names: 선택된 필드 이름 tuple (None 이면 전체 필드)
+    :return: FastListSerializer (빠른 경로를 쓸 수 없으면 None)
+    """
+    if not FastListSerializer.supports(serializer_class, field_names):
+        return None
+    return FastListSerializer(serializer_class, field_names)
+
+
+class SparseFieldsetMixin:
+    """
+    generic 뷰용 sparse fieldset 믹스인
+
+    - GET 요청의 ?fields= 로 응답 필드 선택 및 .only() 적용
+    - fast_list = True 인 목록 뷰는 FastListSerializer 로 직렬화
+    """
+    fast_list = True
+
+    def get_requested_fields(self):
+        """안전한 메서드(GET/HEAD)에서만 ?fields= 적용 (쓰기 요청의 입력 필드는 건드리지 않음)"""
+        if self.request.method not in ('GET', 'HEAD'):
+            return None
+        if not hasattr(self, '_requested_fields'):
+            self._requested_fields = parse_requested_fields(self.request, self.get_serializer_class())
+        return self._requested_fields
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        return project_queryset(queryset, self.get_serializer_class(), self.get_requested_fields())
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        return restrict_serializer_fields(serializer, self.get_requested_fields())
+
+    def list(self, request, *args, **kwargs):
+        """읽기 전용 목록은 values() 기반 빠른 경로로 직렬화"""
+        field_names = self.get_requested_fields()
+        fast_serializer = self.fast_list and get_fast_list_serializer(
+            self.get_serializer_class(),
+            tuple(field_names) if field_names else None
+        )
+        if not fast_serializer:
+            return super().list(request, *args, **kwargs)
+
+        rows = fast_serializer.get_values_queryset(super().filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(fast_serializer.to_representation(page))
+        return Response(fast_serializer.to_representation(rows))
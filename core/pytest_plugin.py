@@ -0,0 +1,112 @@
+"""
+쿼리 예산 pytest 플러그인
+
+config/urls.py 의 모든 GET API URL 패턴을 테스트 케이스로 만들어 쿼리 예산(core.querybudget)을 검사합니다.
+pyproject.toml 의 addopts 에 "-p core.pytest_plugin" 으로 등록되어 있습니다.
+
+- url_budget_case 인자를 받는 테스트는 URL 패턴마다 한 번씩 실행됨 (UrlBudgetCase)
+- url_budget_kwargs 픽스처를 덮어써서 경로 변수 값을 지정 ({route: {이름: 값}}, 없으면 int=1, str='x')
+- query_budget 픽스처: assert_query_budget 컨텍스트 매니저
+
+def test_url_query_budget(url_budget_case, url_budget_kwargs, client):
+    path = url_budget_case.build_path(url_budget_kwargs)
+    with url_budget_case.assert_budget():
+        client.get(path)
+"""
+import re
+from dataclasses import dataclass
+
+import pytest
+
+from .querybudget import assert_query_budget, get_budget
+
+
+# 검사할 URL 패턴 접두사 / 제외할 접두사 (문서, 세션 로그인 화면)
+URL_PREFIXES = ('api/',)
+EXCLUDED_PREFIXES = ('api/schema/', 'api/auth-session/')
+
+re_converter = re.compile(r'<(?:(?P<converter>\w+):)?(?P<name>\w+)>')
+
+DEFAULT_CONVERTER_VALUES = {'int': 1, 'str': 'x', 'slug': 'x', 'path': 'x'}
+
+
+@dataclass(frozen=True)
+class UrlBudgetCase:
+    """URL 패턴 하나의 쿼리 예산 테스트 케이스"""
+    route: str
+
+    @property
+    def budget(self):
+        return get_budget(self.route)
+
+    def build_path(self, kwargs_by_route=None):
+        """경로 변수를 채운 요청 경로"""
+        values = (kwargs_by_route or {}).get(self.route, {})
+
+        def replace(match):
+            default = DEFAULT_CONVERTER_VALUES.get(match.group('converter') or 'str', 'x')
+            return str(values.get(match.group('name'), default))
+
+        return '/' + re_converter.sub(replace, self.route)
+
+    def assert_budget(self, duplicate_threshold=None):
+        return assert_query_budget(self.budget, duplicate_threshold)
+
+
+def _iter_routes(patterns, prefix=''):
+    from django.urls import URLResolver
+
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _iter_routes(pattern.url_patterns, prefix + str(pattern.pattern))
+        else:
+            yield prefix + str(pattern.pattern)
+
+
+def _supports_get(match):
+    callback = match.func
+    actions = getattr(callback, 'actions', None)
+    if actions is not None:
+        return 'get' in actions
+    view_class = getattr(callback, 'view_class', None) or getattr(callback, 'cls', None)
+    return view_class is not None and hasattr(view_class, 'get')
+
+
+def collect_url_budget_cases():
+    """
+    config/urls.py 의 GET API URL 패턴 목록
+
+    같은 경로에 먼저 등록된 다른 패턴에 가려진 패턴(실제로 호출될 수 없는 패턴)은 제외
+    """
+    from django.urls import Resolver404, get_resolver, resolve
+
+    cases = []
+    for route in _iter_routes(get_resolver().url_patterns):
+        if not route.startswith(URL_PREFIXES) or route.startswith(EXCLUDED_PREFIXES):
+            continue
+        case = UrlBudgetCase(route)
+        try:
+            match = resolve(case.build_path())
+        except Resolver404:
+            continue
+        if match.route == route and _supports_get(match) and case not in cases:
+            cases.append(case)
+    return cases
+
+
+def pytest_generate_tests(metafunc):
+    if 'url_budget_case' in metafunc.fixturenames:
+        cases = collect_url_budget_cases()
+        metafunc.parametrize('url_budget_case', cases, ids=[case.route for case in cases])
+
+
+@pytest.fixture
+def url_budget_kwargs():
+    """URL 패턴별 경로 변수 값 ({route: {이름: 값}}), 테스트 모듈에서 덮어써서 사용"""
+    return {}
+
+
+@pytest.fixture
+def query_budget():
+    """assert_query_budget 컨텍스트 매니저"""
+    return assert_query_budget
@@ -0,0 +1,251 @@
+"""
+요청별 쿼리 예산 측정과 N+1 탐지
+
+- QueryRecorder: connection.execute_wrapper 로 쿼리 수, DB 시간, SQL 형태(값을 지운 SQL)별 실행 횟수를 기록
+- 같은 형태의 SQL 이 QUERY_BUDGET_DUPLICATE_THRESHOLD 번 이상 반복되면 N+1 패턴으로 판단
+  (예: 관리자 목록에서 행마다 self.user 를 지연 로딩하는 __str__)
+- QueryBudgetMiddleware: URL 패턴(route)별 예산을 넘거나 N+1 이 있는 요청을 경고 로그로 남기고,
+  쿼리 수/DB 시간 히스토그램을 프로세스 메모리에 누적 (GET /api/health/queries/ 로 조회)
+- assert_query_budget: 테스트에서 블록 안의 쿼리 수와 N+1 을 검사하는 컨텍스트 매니저
+
+예산 설정
+- QUERY_BUDGET_DEFAULT: URL 패턴별 기본 최대 쿼리 수
+- QUERY_BUDGETS: {'api/calendars/exams/': 8, ...} URL 패턴별 최대 쿼리 수
+"""
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUDGET = 20
+DEFAULT_DUPLICATE_THRESHOLD = 5
+
+# 히스토그램 구간 (이하, 마지막 구간은 그보다 큰 값)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+DB_TIME_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+re_in_list = re.compile(r'\bIN \((?:%s|\?)(?:, (?:%s|\?))*\)', re.IGNORECASE)
+re_string = re.compile(r"'(?:[^']|'')*'")
+re_number = re.compile(r'\b\d+(?:\.\d+)?\b')
+re_whitespace = re.compile(r'\s+')
+
+
+def get_sql_shape(sql):
+    """
+    값과 IN 목록 길이를 지운 SQL 형태 (같은 쿼리가 값만 바꿔 반복되는지 비교용)
+
+    예: SELECT ... WHERE "users"."id" = %s LIMIT 21
+    """
+    shape = re_in_list.sub('IN (...)', sql)
+    shape = re_string.sub('?', shape)
+    shape = re_number.sub('?', shape)
+    return re_whitespace.sub(' ', shape).strip()
+
+
+def get_budget(route):
+    """URL 패턴별 최대 쿼리 수"""
+    budgets = getattr(settings, 'QUERY_BUDGETS', {})
+    return budgets.get(route, getattr(settings, 'QUERY_BUDGET_DEFAULT', DEFAULT_BUDGET))
+
+
+def get_duplicate_threshold():
+    return getattr(settings, 'QUERY_BUDGET_DUPLICATE_THRESHOLD', DEFAULT_DUPLICATE_THRESHOLD)
+
+
+class QueryRecorder:
+    """execute_wrapper 로 등록하여 쿼리를 기록"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+        self.shape_durations = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            shape = get_sql_shape(sql)
+            self.duration += elapsed
+            self.count += 1
+            self.shapes[shape] += 1
+            self.shape_durations[shape] += elapsed
+
+    @property
+    def duration_ms(self):
+        return self.duration * 1000
+
+    def get_duplicates(self, threshold=None):
+        """N+1 로 의심되는 (SQL 형태, 실행 횟수) 목록 (많은 순)"""
+        threshold = threshold or get_duplicate_threshold()
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+    def get_slowest(self, limit=10):
+        """누적 시간이 긴 SQL 형태 목록 [{'sql', 'count', 'time_ms'}]"""
+        return [
+            {'sql': shape, 'count': self.shapes[shape], 'time_ms': round(duration * 1000, 3)}
+            for shape, duration in self.shape_durations.most_common(limit)
+        ]
+
+    def format_report(self, threshold=None, limit=3):
+        """로그/테스트 실패 메시지용 요약"""
+        lines = [f'{self.count} queries, {self.duration_ms:.1f}ms']
+        for shape, count in self.get_duplicates(threshold)[:limit]:
+            lines.append(f'  x{count} {shape[:300]}')
+        return '\n'.join(lines)
+
+
+@contextmanager
+def record_queries(using=None):
+    """
+    블록 안의 쿼리를 기록 (using 이 없으면 모든 DB 별칭)
+
+    :return: QueryRecorder
+    """
+    recorder = QueryRecorder()
+    aliases = [using] if using else list(connections)
+    with ExitStack() as stack:
+        for alias in aliases:
+            stack.enter_context(connections[alias].execute_wrapper(recorder))
+        yield recorder
+
+
+@contextmanager
+def assert_query_budget(max_queries, duplicate_threshold=None, using=None):
+    """
+    테스트용: 블록 안의 쿼리 수가 max_queries 이하이고 N+1 패턴이 없는지 검사
+
+    with assert_query_budget(5):
+        client.get('/api/calendars/exams/')
+
+    :raises: AssertionError
+    """
+    with record_queries(using) as recorder:
+        yield recorder
+
+    problems = []
+    if recorder.count > max_queries:
+        problems.append(f'쿼리 예산 초과 ({recorder.count} > {max_queries})')
+    if recorder.get_duplicates(duplicate_threshold):
+        problems.append('같은 형태의 쿼리 반복 (N+1 의심)')
+    if problems:
+        raise AssertionError(', '.join(problems) + '\n' + recorder.format_report(duplicate_threshold))
+
+
+class QueryStats:
+    """URL 패턴별 쿼리 수 / DB 시간 히스토그램 (프로세스별)"""
+
+    _lock = threading.Lock()
+    _stats = {}
+
+    @staticmethod
+    def _observe(buckets, counts, value):
+        for index, bound in enumerate(buckets):
+            if value <= bound:
+                counts[index] += 1
+                return
+        counts[-1] += 1
+
+    @classmethod
+    def record(cls, route, method, recorder, over_budget, duplicates):
+        with cls._lock:
+            stats = cls._stats.get((method, route))
+            if stats is None:
+                stats = cls._stats[(method, route)] = {
+                    'requests': 0,
+                    'queries_total': 0,
+                    'db_time_ms_total': 0.0,
+                    'over_budget': 0,
+                    'n_plus_one': 0,
+                    'query_count_histogram': [0] * (len(QUERY_COUNT_BUCKETS) + 1),
+                    'db_time_histogram': [0] * (len(DB_TIME_BUCKETS_MS) + 1),
+                }
+            stats['requests'] += 1
+            stats['queries_total'] += recorder.count
+            stats['db_time_ms_total'] += recorder.duration_ms
+            stats['over_budget'] += int(over_budget)
+            stats['n_plus_one'] += int(bool(duplicates))
+            cls._observe(QUERY_COUNT_BUCKETS, stats['query_count_histogram'], recorder.count)
+            cls._observe(DB_TIME_BUCKETS_MS, stats['db_time_histogram'], recorder.duration_ms)
+
+    @classmethod
+    def snapshot(cls):
+        """
+        히스토그램 조회용 목록
+
+        histogram 의 le 는 구간 상한 ('+Inf' 는 마지막 구간)
+        """
+        def buckets(bounds, counts):
+            labels = [str(bound) for bound in bounds] + ['+Inf']
+            return [{'le': label, 'count': count} for label, count in zip(labels, counts)]
+
+        with cls._lock:
+            items = sorted(cls._stats.items(), key=lambda item: item[0][1])
+            return [
+                {
+                    'route': route,
+                    'method': method,
+                    'budget': get_budget(route),
+                    'requests': stats['requests'],
+                    'avg_queries': round(stats['queries_total'] / stats['requests'], 2),
+                    'avg_db_time_ms': round(stats['db_time_ms_total'] / stats['requests'], 2),
+                    'over_budget': stats['over_budget'],
+                    'n_plus_one': stats['n_plus_one'],
+                    'query_count_histogram': buckets(QUERY_COUNT_BUCKETS, stats['query_count_histogram']),
+                    'db_time_ms_histogram': buckets(DB_TIME_BUCKETS_MS, stats['db_time_histogram']),
+                }
+                for (method, route), stats in items
+            ]
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._stats.clear()
+
+
+class QueryBudgetMiddleware:
+    """
+    요청별 쿼리 수/DB 시간 측정 미들웨어
+
+    QUERY_BUDGET_ENABLED 가 False 이면 미들웨어 체인에서 제외되어 비용이 없음 (기본값: DEBUG)
+    응답에 X-Query-Count / X-Query-Time-Ms 헤더 추가
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'QUERY_BUDGET_ENABLED', settings.DEBUG):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with record_queries() as recorder:
+            response = self.get_response(request)
+
+        match = getattr(request, 'resolver_match', None)
+        if match is None:
+            return response
+
+        route = match.route
+        budget = get_budget(route)
+        duplicates = recorder.get_duplicates()
+        over_budget = recorder.count > budget
+        QueryStats.record(route, request.method, recorder, over_budget, duplicates)
+
+        if over_budget or duplicates:
+            logger.warning(
+                '쿼리 예산 초과/N+1 의심: %s %s (route=%s, budget=%s)\n%s',
+                request.method, request.path, route, budget, recorder.format_report()
+            )
+        response['X-Query-Count'] = str(recorder.count)
+        response['X-Query-Time-Ms'] = f'{recorder.duration_ms:.1f}'
+        return response
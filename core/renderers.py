@@ -0,0 +1,52 @@
+"""
+고성능 JSON 렌더러
+
+- orjson 이 설치되어 있으면 orjson 으로 직렬화 (표준 json 대비 수 배 빠름)
+- 설치되어 있지 않거나 들여쓰기(browsable API 등)가 필요하면 DRF 기본 JSONRenderer 로 대체
+- 출력은 DRF JSONRenderer 와 동일하게 유지
+  (UTC 는 'Z', Decimal 은 float, UUID 는 문자열, U+2028/U+2029 이스케이프)
+"""
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성: pip install orjson
+    orjson = None
+
+
+_encoder = JSONEncoder()
+
+
+def _default(obj):
+    """
+    orjson 이 직접 처리하지 못하는 타입 변환
+
+    지연 번역 문자열(gettext_lazy), QuerySet, Decimal, timedelta 등은
+    DRF JSONRenderer 와 같은 결과가 되도록 rest_framework.utils.encoders.JSONEncoder 에 맡김
+    """
+    return _encoder.default(obj)
+
+
+if orjson is not None:
+    ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class FastJSONRenderer(JSONRenderer):
+    """orjson 기반 JSON 렌더러 (표준 json 대체 가능)"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+
+        # 들여쓰기 요청은 드물고 orjson 은 2칸 들여쓰기만 지원하므로 기본 렌더러 사용
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=_default, option=ORJSON_OPTIONS)
+        # JSON 이 JavaScript 의 부분집합이 되도록 U+2028/U+2029 이스케이프 (DRF 와 동일)
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
@@ -0,0 +1,307 @@
+"""
+대용량 합성 데이터 생성 (seed_load 명령, benchmark_api 에서 사용)
+
+운영 데이터와 비슷한 모양의 데이터를 사용자 단위로 만들어 한 번에 저장합니다.
+
+- 사용자: 비밀번호 해시를 한 번만 계산하여 모든 사용자가 공유 (사용자마다 set_password 를 하지 않음)
+- 일정, 다양한 RRULE 의 반복 일정, 과목별 점수 분포를 가진 시험(미래 시험은 점수 없음),
+  스터디 일정과 타이머/공부 내용
+- 저장 방식: bulk_create (기본) 또는 PostgreSQL COPY (psycopg3 cursor.copy, --copy)
+  COPY 는 id 를 시퀀스에서 미리 받아 자식 행의 외래 키를 채움
+- 결정적 생성: 사용자마다 (seed, 사용자 번호) 로 난수를 만들어 배치 크기/이미 있는 사용자 수와 관계없이
+  같은 seed, end_date 면 같은 데이터
+
+이메일은 user<번호>@<domain> 이며, 이미 있는 번호는 건너뛰므로 늘려가며 다시 실행할 수 있습니다.
+"""
+import random
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.calendars.models import Event, Exam, RepeatEvent
+from apps.study.models import StudyContent, StudyEvent, StudyTimer, Subject
+from apps.users.models import CustomUser
+
+
+SEED_USER_DOMAIN = 'benchmark.invalid'
+SEED_USER_PASSWORD = 'benchmark-password'
+
+REPEAT_RULES = (
+    'FREQ=DAILY;INTERVAL=1',
+    'FREQ=DAILY;INTERVAL=2',
+    'FREQ=WEEKLY;BYDAY=MO,WE,FR',
+    'FREQ=WEEKLY;BYDAY=TU,TH',
+    'FREQ=WEEKLY;INTERVAL=2;BYDAY=SA',
+    'FREQ=MONTHLY;BYMONTHDAY=1,15',
+    'FREQ=MONTHLY;BYDAY=1MO',
+    'FREQ=YEARLY;BYMONTH=3,9;BYMONTHDAY=1',
+)
+
+# (과목명, 평균 점수 보정) - 사용자 실력에 더해 과목별 난이도 차이를 줌
+SUBJECTS = (
+    ('수학', -8),
+    ('영어', 0),
+    ('국어', 3),
+    ('과학', -4),
+    ('한국사', 6),
+    ('정보처리기사', -2),
+    ('토익', 5),
+)
+
+PASS_THRESHOLDS = (None, None, 60.0, 70.0, 80.0)
+
+
+@dataclass(frozen=True)
+class SeedScale:
+    """생성 규모 (사용자당 값은 평균, 실제 개수는 사용자마다 무작위)"""
+    users: int = 100
+    days: int = 365
+    events_per_day: float = 1.0
+    repeat_events: int = 3
+    study_events_per_week: float = 4.0
+    contents_per_study_event: int = 2
+    exams_per_month: float = 1.0
+    # 마지막 날 이후로 만들 미래 시험 기간 (일)
+    future_days: int = 60
+
+
+def _chance(rng, rate):
+    """평균 rate 개 (정수 부분 + 소수 부분 확률)"""
+    whole = int(rate)
+    return whole + (1 if rng.random() < rate - whole else 0)
+
+
+class BulkCreateWriter:
+    """Model.objects.bulk_create 로 저장 (모든 DB)"""
+    name = 'bulk_create'
+
+    def __init__(self, batch_size):
+        self.batch_size = batch_size
+
+    def write(self, model, objects):
+        return model.objects.bulk_create(objects, batch_size=self.batch_size)
+
+
+class CopyWriter:
+    """
+    PostgreSQL COPY FROM STDIN 으로 저장 (psycopg3)
+
+    id 를 시퀀스에서 미리 받아 객체에 채우므로 bulk_create 와 같이 저장 후 pk 를 사용할 수 있음
+    """
+    name = 'copy'
+
+    def __init__(self, batch_size):
+        if connection.vendor != 'postgresql':
+            raise ValueError('COPY 는 PostgreSQL 에서만 사용할 수 있습니다.')
+        self.batch_size = batch_size
+
+    def _allocate_ids(self, cursor, model, count):
+        table = model._meta.db_table
+        cursor.execute(
+            'SELECT nextval(pg_get_serial_sequence(%s, %s)) FROM generate_series(1, %s)',
+            [table, model._meta.pk.column, count],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+    def write(self, model, objects):
+        if not objects:
+            return objects
+        fields = [field for field in model._meta.local_concrete_fields]
+        columns = ', '.join(connection.ops.quote_name(field.column) for field in fields)
+        table = connection.ops.quote_name(model._meta.db_table)
+        with connection.cursor() as cursor:
+            for obj, pk in zip(objects, self._allocate_ids(cursor, model, len(objects))):
+                obj.pk = pk
+            with cursor.cursor.copy(f'COPY {table} ({columns}) FROM STDIN') as copy:
+                for obj in objects:
+                    copy.write_row([
+                        field.get_db_prep_save(field.pre_save(obj, True), connection)
+                        for field in fields
+                    ])
+        for obj in objects:
+            obj._state.adding = False
+            obj._state.db = connection.alias
+        return objects
+
+
+class LoadSeeder:
+    """
+    합성 데이터 생성기
+
+    seeder = LoadSeeder(SeedScale(users=10000, days=730), seed=42)
+    seeder.run(progress=print)
+    """
+
+    def __init__(self, scale, seed=0, use_copy=False, batch_size=2000, users_per_batch=100,
+                 domain=SEED_USER_DOMAIN, password=SEED_USER_PASSWORD, end_date=None):
+        self.scale = scale
+        self.seed = seed
+        self.domain = domain
+        self.password = password
+        self.users_per_batch = users_per_batch
+        self.writer = CopyWriter(batch_size) if use_copy else BulkCreateWriter(batch_size)
+        end_date = end_date or timezone.localdate()
+        self.end = timezone.make_aware(datetime.combine(end_date, time.min))
+        self.start = self.end - timedelta(days=scale.days)
+
+    def get_email(self, index):
+        return f'user{index}@{self.domain}'
+
+    def get_users(self):
+        """생성기 사용자 QuerySet (id 순)"""
+        return CustomUser.objects.filter(email__endswith=f'@{self.domain}').order_by('id')
+
+    def run(self, progress=None):
+        """
+        부족한 사용자와 그 데이터 생성
+
+        :param progress: 배치마다 (완료 사용자 수, 전체 사용자 수, 모델별 누적 행 수) 를 받는 함수
+        :return: 모델 이름별 생성 행 수
+        """
+        existing = set(
+            self.get_users().values_list('email', flat=True)
+        )
+        indexes = [index for index in range(self.scale.users) if self.get_email(index) not in existing]
+        counts = {}
+        if not indexes:
+            return counts
+
+        # 사용자마다 해시하지 않고 같은 해시를 재사용
+        password_hash = make_password(self.password)
+        subject_ids = [Subject.objects.resolve_id(name) for name, _ in SUBJECTS]
+
+        for offset in range(0, len(indexes), self.users_per_batch):
+            batch = indexes[offset:offset + self.users_per_batch]
+            with transaction.atomic():
+                for name, count in self._seed_batch(batch, password_hash, subject_ids).items():
+                    counts[name] = counts.get(name, 0) + count
+            if progress:
+                progress(offset + len(batch), len(indexes), counts)
+        return counts
+
+    def _seed_batch(self, indexes, password_hash, subject_ids):
+        users = self.writer.write(CustomUser, [
+            CustomUser(
+                email=self.get_email(index),
+                password=password_hash,
+                nickname=f'user{index}',
+                # 관리자 전용 API 벤치마크용
+                is_staff=index == 0,
+                email_verified=True,
+            )
+            for index in indexes
+        ])
+
+        events, repeat_events, exams, study_events, plans = [], [], [], [], []
+        for index, user in zip(indexes, users):
+            rng = random.Random(f'{self.seed}-{index}')
+            events.extend(self._build_events(rng, user))
+            repeat_events.extend(self._build_repeat_events(rng, user))
+            exams.extend(self._build_exams(rng, user, subject_ids))
+            for study_event in self._build_study_events(rng, user, subject_ids):
+                study_events.append(study_event)
+                # 타이머/공부 내용은 스터디 일정 id 가 생긴 뒤에 만들기 위해 개수만 미리 정함
+                plans.append(rng.randint(max(self.scale.contents_per_study_event - 1, 0),
+                                         self.scale.contents_per_study_event + 1))
+
+        self.writer.write(Event, events)
+        self.writer.write(RepeatEvent, repeat_events)
+        self.writer.write(Exam, exams)
+        study_events = self.writer.write(StudyEvent, study_events)
+
+        timers, contents = [], []
+        for study_event, content_count in zip(study_events, plans):
+            minutes = int((study_event.end_at - study_event.start_at).total_seconds() // 60)
+            timers.append(StudyTimer(
+                study_event=study_event,
+                started_at=study_event.start_at,
+                ended_at=study_event.end_at,
+                total_minutes=minutes,
+            ))
+            for part in range(content_count):
+                contents.append(StudyContent(
+                    study_event=study_event,
+                    content=f'{study_event.title} 정리 {part + 1}',
+                    duration_minutes=max(minutes // max(content_count, 1), 1),
+                ))
+        self.writer.write(StudyTimer, timers)
+        self.writer.write(StudyContent, contents)
+
+        return {
+            'CustomUser': len(users),
+            'Event': len(events),
+            'RepeatEvent': len(repeat_events),
+            'Exam': len(exams),
+            'StudyEvent': len(study_events),
+            'StudyTimer': len(timers),
+            'StudyContent': len(contents),
+        }
+
+    def _random_start(self, rng, day):
+        return self.start + timedelta(days=day, hours=rng.randint(7, 21), minutes=rng.choice((0, 15, 30, 45)))
+
+    def _build_events(self, rng, user):
+        for day in range(self.scale.days):
+            for _ in range(_chance(rng, self.scale.events_per_day)):
+                started = self._random_start(rng, day)
+                yield Event(
+                    user=user,
+                    title=rng.choice(('회의', '약속', '과제 마감', '운동', '병원')),
+                    description='',
+                    start_at=started,
+                    end_at=started + timedelta(minutes=rng.choice((30, 60, 90, 120))),
+                )
+
+    def _build_repeat_events(self, rng, user):
+        for rule in rng.sample(REPEAT_RULES, min(self.scale.repeat_events, len(REPEAT_RULES))):
+            started = self._random_start(rng, rng.randrange(max(self.scale.days, 1)))
+            yield RepeatEvent(
+                user=user,
+                title=f'반복 {rule.split(";")[0][5:].lower()}',
+                description='',
+                start_at=started,
+                end_at=started + timedelta(hours=1),
+                rule=rule,
+                until=(self.end + timedelta(days=rng.randint(30, 365))).date(),
+            )
+
+    def _build_exams(self, rng, user, subject_ids):
+        # 사용자 실력 (평균 점수) 과 과목별 난이도로 점수 분포를 만듦
+        ability = rng.gauss(70, 12)
+        total_days = self.scale.days + self.scale.future_days
+        count = _chance(rng, self.scale.exams_per_month * total_days / 30)
+        for _ in range(count):
+            subject_index = rng.randrange(len(SUBJECTS))
+            name, offset = SUBJECTS[subject_index]
+            exam_date = (self.start + timedelta(days=rng.randrange(max(total_days, 1)))).date()
+            max_score = rng.choice((100, 100, 100, 50, 200))
+            score = None
+            if exam_date <= self.end.date():
+                percent = min(max(rng.gauss(ability + offset, 10), 0), 100)
+                score = round(percent * max_score / 100)
+            yield Exam(
+                user=user,
+                subject=name,
+                canonical_subject_id=subject_ids[subject_index],
+                exam_date=exam_date,
+                score=score,
+                max_score=max_score,
+                pass_threshold=rng.choice(PASS_THRESHOLDS),
+            )
+
+    def _build_study_events(self, rng, user, subject_ids):
+        count = _chance(rng, self.scale.study_events_per_week * self.scale.days / 7)
+        for _ in range(count):
+            subject_index = rng.randrange(len(SUBJECTS))
+            started = self._random_start(rng, rng.randrange(max(self.scale.days, 1)))
+            yield StudyEvent(
+                user=user,
+                title=f'{SUBJECTS[subject_index][0]} 공부',
+                canonical_subject_id=subject_ids[subject_index],
+                goal='',
+                start_at=started,
+                end_at=started + timedelta(minutes=rng.choice((30, 50, 90, 120, 180))),
+            )
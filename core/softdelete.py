@@ -0,0 +1,160 @@
+"""
+소프트 삭제
+
+- 삭제 요청은 deleted_at 만 기록하고 바로 응답 (기본 매니저 objects 는 삭제된 행을 제외)
+- 실제 삭제는 Celery 작업(SoftDeleteReaper)이 유예 기간이 지난 행을 작은 청크로 나눠 수행하므로
+  큰 CASCADE 삭제가 요청 중에 오래 잠금을 잡지 않음
+- 탈퇴한 사용자(deleted_at 이 있는 사용자)의 데이터도 같은 방식으로 청크 삭제한 뒤 사용자 행을 삭제
+  (유예 기간 중인 데이터는 exclude_withdrawn() 으로 전체 집계와 관리자 목록에서 제외)
+"""
+import time
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import models, transaction
+from django.utils import timezone
+
+
+# 한 번의 실행에서 처리할 탈퇴 사용자 수
+USER_BATCH_SIZE = 100
+
+
+class SoftDeleteQuerySet(models.QuerySet):
+    """소프트 삭제 QuerySet"""
+
+    def soft_delete(self, deleted_at=None):
+        """조회된 행을 한 번의 UPDATE 로 소프트 삭제"""
+        deleted_at = deleted_at or timezone.now()
+        return self.update(deleted_at=deleted_at, updated_at=deleted_at)
+
+    def exclude_withdrawn(self):
+        """탈퇴한 뒤 실제 삭제를 기다리는(유예 기간 중인) 사용자의 행 제외 (전체 집계/관리자 목록용)"""
+        return self.filter(**{f'{self.model.owner_lookup}__deleted_at__isnull': True})
+
+
+class SoftDeleteManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    """삭제되지 않은 행만 조회하는 기본 매니저"""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
+
+class SoftDeleteModel(models.Model):
+    """
+    소프트 삭제 추상 모델
+
+    - objects: 삭제되지 않은 행 (기본 매니저, 역참조 매니저도 같은 필터 사용)
+    - all_objects: 삭제된 행 포함
+    - soft_delete_cascade: 함께 소프트 삭제할 역참조 이름 (예: ('timers', 'contents'))
+    - owner_lookup: 소유 사용자까지의 조회 경로 (탈퇴 사용자 데이터 정리에 사용)
+    """
+    deleted_at = models.DateTimeField(null=True, blank=True, db_index=True, help_text="삭제 시간 (소프트 삭제)")
+
+    objects = SoftDeleteManager()
+    all_objects = SoftDeleteQuerySet.as_manager()
+
+    soft_delete_cascade = ()
+    owner_lookup = 'user'
+
+    class Meta:
+        abstract = True
+
+    def soft_delete(self, deleted_at=None):
+        """
+        행과 soft_delete_cascade 의 하위 행을 소프트 삭제
+
+        :return: {모델: [삭제한 ID 목록]}
+        """
+        deleted_at = deleted_at or timezone.now()
+        deleted = {type(self): [self.pk]}
+        for name in self.soft_delete_cascade:
+            related = getattr(self, name).all()
+            ids = list(related.values_list('pk', flat=True))
+            if ids:
+                related.model.all_objects.filter(pk__in=ids).soft_delete(deleted_at)
+                deleted[related.model] = ids
+
+        self.deleted_at = deleted_at
+        self.save(update_fields=['deleted_at', 'updated_at'])
+        return deleted
+
+
+def get_soft_delete_models():
+    """SoftDeleteModel 을 상속한 모델 목록 (다른 소프트 삭제 모델을 참조하는 하위 모델 먼저)"""
+    soft_models = [model for model in apps.get_models() if issubclass(model, SoftDeleteModel)]
+
+    def depth(model):
+        parents = [
+            field.related_model for field in model._meta.concrete_fields
+            if field.is_relation and field.related_model in soft_models and field.related_model is not model
+        ]
+        return 1 + max((depth(parent) for parent in parents), default=-1)
+
+    return sorted(soft_models, key=depth, reverse=True)
+
+
+class SoftDeleteReaper:
+    """유예 기간이 지난 소프트 삭제 행 / 탈퇴 사용자의 실제 삭제"""
+
+    @staticmethod
+    def delete_chunk(queryset, chunk_size):
+        """
+        QuerySet 의 앞쪽 chunk_size 행을 하나의 짧은 트랜잭션으로 삭제
+
+        :return: 삭제한 행 수 (CASCADE 포함)
+        """
+        model = queryset.model
+        ids = list(queryset.order_by().values_list('pk', flat=True)[:chunk_size])
+        if not ids:
+            return 0
+        with transaction.atomic():
+            return model._base_manager.filter(pk__in=ids).delete()[0]
+
+    @staticmethod
+    def run(grace=None, chunk_size=None, time_budget=None):
+        """
+        실제 삭제 실행 (시간 예산을 넘으면 중단하고 다음 실행에서 이어서 처리)
+
+        :param grace: 소프트 삭제 후 실제 삭제까지의 유예 기간 (timedelta)
+        :param chunk_size: 한 트랜잭션에서 삭제할 행 수
+        :param time_budget: 최대 실행 시간 (초)
+        :return: {'rows': 삭제한 행 수, 'users': 삭제한 사용자 수, 'finished': 남은 작업이 없는지}
+        """
+        grace = grace if grace is not None else timedelta(hours=settings.SOFT_DELETE_GRACE_HOURS)
+        chunk_size = chunk_size or settings.SOFT_DELETE_REAP_CHUNK_SIZE
+        time_budget = time_budget if time_budget is not None else settings.SOFT_DELETE_REAP_TIME_BUDGET
+        deadline = time.monotonic() + time_budget
+        cutoff = timezone.now() - grace
+        soft_models = get_soft_delete_models()
+        result = {'rows': 0, 'users': 0, 'finished': False}
+
+        def drain(queryset):
+            """시간 예산 안에서 queryset 을 모두 삭제했으면 True"""
+            while time.monotonic() < deadline:
+                deleted = SoftDeleteReaper.delete_chunk(queryset, chunk_size)
+                result['rows'] += deleted
+                if deleted == 0:
+                    return True
+            return False
+
+        for model in soft_models:
+            if not drain(model.all_objects.filter(deleted_at__lt=cutoff)):
+                return result
+
+        user_model = get_user_model()
+        users = list(user_model._base_manager.filter(deleted_at__lt=cutoff).order_by('deleted_at')[:USER_BATCH_SIZE])
+        for user in users:
+            for model in soft_models:
+                if not drain(model.all_objects.filter(**{model.owner_lookup: user})):
+                    return result
+            # 남은 작은 행(토큰, 예측 모델 등)은 사용자 삭제 CASCADE 로 정리
+            with transaction.atomic():
+                user.delete()
+            result['users'] += 1
+            if time.monotonic() >= deadline:
+                return result
+
+        result['finished'] = len(users) < USER_BATCH_SIZE
+        return result
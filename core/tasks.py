@@ -0,0 +1,17 @@
+"""
+공통 Celery 작업
+"""
+from celery import shared_task
+
+from .softdelete import SoftDeleteReaper
+
+
+@shared_task
+def reap_soft_deleted():
+    """
+    유예 기간이 지난 소프트 삭제 행과 탈퇴 사용자 실제 삭제 (Celery beat 로 주기 실행)
+
+    한 번에 SOFT_DELETE_REAP_TIME_BUDGET 초까지만 실행하고 남은 작업은 다음 실행에서 이어서 처리
+    :return: 삭제 결과
+    """
+    return SoftDeleteReaper.run()
@@ -0,0 +1,527 @@
+"""
+공통 모듈 테스트
+
+모든 GET API URL 에 대해 쿼리 예산(QUERY_BUDGET_DEFAULT / QUERY_BUDGETS)과 N+1 패턴을 검사합니다.
+N+1 이 드러나도록 모델별로 중복 탐지 기준보다 많은 행을 만듭니다.
+"""
+import logging
+import threading
+import time
+from datetime import date, timedelta
+
+import pytest
+import redis
+from django.contrib import admin
+from django.db import connection, connections
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.test import APIClient
+
+from apps.calendars.models import Event, RepeatEvent, Exam
+from apps.study.models import StudyEvent, StudyTimer, StudyContent, Subject
+from apps.users.models import CustomUser, DataExport
+from apps.users.services import UserService
+from core import db_router, metrics, versioning
+from core.admin import get_estimated_count
+from core.benchmark import get_uncovered_routes, percentile
+from core.dbconfig import get_databases
+from core.intervals import IntervalTree, find_gaps
+from core.profiling import ProfileStore, ProfilingMiddleware, StackSampler, summarize_stacks
+from core.projection import get_fast_list_serializer
+from core.querybudget import DEFAULT_DUPLICATE_THRESHOLD, assert_query_budget, get_sql_shape
+from core.seeding import LoadSeeder, SeedScale
+from core.softdelete import SoftDeleteReaper
+from core.versioning import DataVersionService
+
+
+ROWS = DEFAULT_DUPLICATE_THRESHOLD + 1
+
+
+@pytest.fixture
+def budget_user(db):
+    user = CustomUser.objects.create_user('budget@example.com', 'password123!', nickname='budget', is_staff=True)
+    subject_id = Subject.objects.resolve_id('수학')
+    now = timezone.now()
+
+    for i in range(ROWS):
+        Event.objects.create(user=user, title=f'일정 {i}', start_at=now, end_at=now + timedelta(hours=1))
+        RepeatEvent.objects.create(
+            user=user, title=f'반복 {i}', start_at=now, end_at=now + timedelta(hours=1),
+            rule='FREQ=DAILY;INTERVAL=1', until=(now + timedelta(days=7)).date()
+        )
+        Exam.objects.create(
+            user=user, subject='수학', canonical_subject_id=subject_id,
+            exam_date=(now + timedelta(days=i)).date(), score=80 if i % 2 else None, max_score=100
+        )
+        study_event = StudyEvent.objects.create(
+            user=user, title=f'스터디 {i}', canonical_subject_id=subject_id, goal='목표',
+            start_at=now, end_at=now + timedelta(hours=1)
+        )
+        StudyTimer.objects.create(study_event=study_event, total_minutes=30)
+        StudyContent.objects.create(study_event=study_event, content='내용', duration_minutes=30)
+    DataExport.objects.create(user=user)
+    return user
+
+
+@pytest.fixture
+def url_budget_kwargs(budget_user):
+    event = Event.objects.filter(user=budget_user).first()
+    repeat_event = RepeatEvent.objects.filter(user=budget_user).first()
+    exam = Exam.objects.filter(user=budget_user).first()
+    study_event = StudyEvent.objects.filter(user=budget_user).first()
+    content = StudyContent.objects.filter(study_event=study_event).first()
+    export = DataExport.objects.filter(user=budget_user).first()
+    return {
+        'api/calendars/events/<int:pk>/': {'pk': event.pk},
+        'api/calendars/events/repeat/<int:pk>/': {'pk': repeat_event.pk},
+        'api/calendars/exams/<int:pk>/': {'pk': exam.pk},
+        'api/study/api/study-events/<int:pk>/': {'pk': study_event.pk},
+        'api/study/api/study-events/<int:event_id>/contents/': {'event_id': study_event.pk},
+        'api/study/api/study-contents/<int:content_id>/': {'content_id': content.pk},
+        'api/users/api/users/me/exports/<int:export_id>/': {'export_id': export.pk},
+        'api/users/api/users/me/exports/<int:export_id>/download/': {'export_id': export.pk},
+        'api/reports/api/statistics/<str:stat_type>/': {'stat_type': 'weak-parts'},
+    }
+
+
+def test_url_query_budget(url_budget_case, url_budget_kwargs, budget_user):
+    client = APIClient()
+    client.force_authenticate(budget_user)
+    path = url_budget_case.build_path(url_budget_kwargs)
+
+    with url_budget_case.assert_budget():
+        response = client.get(path)
+
+    assert response.status_code < 500, f'{path}: {response.status_code}'
+
+
+def test_sql_shape_ignores_values():
+    first = get_sql_shape('SELECT * FROM "users" WHERE "id" = 1 AND "email" = \'a@a.com\' AND "id" IN (%s, %s)')
+    second = get_sql_shape('SELECT * FROM "users" WHERE "id" = 22 AND "email" = \'b@b.com\' AND "id" IN (%s)')
+    assert first == second
+
+
+def test_assert_query_budget_detects_n_plus_one(budget_user):
+    with pytest.raises(AssertionError, match='N\\+1'):
+        with assert_query_budget(100):
+            for study_event in StudyEvent.objects.filter(user=budget_user):
+                study_event.user.email
+
+    with assert_query_budget(1):
+        list(StudyEvent.objects.filter(user=budget_user).select_related('user'))
+
+
+def test_benchmark_scenarios_cover_all_routes():
+    # 새 API URL 을 추가하면 core.benchmark.SCENARIOS 에 시나리오(또는 제외 사유)도 추가
+    assert get_uncovered_routes() == []
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([], 50) is None
+
+
+class StudyContentEventSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = StudyContent
+        fields = ['id', 'study_event', 'content']
+
+
+class StudyContentEventTitleSerializer(serializers.ModelSerializer):
+    study_event = serializers.SlugRelatedField(slug_field='title', read_only=True)
+
+    class Meta:
+        model = StudyContent
+        fields = ['id', 'study_event', 'content']
+
+
+def test_fast_list_serializer_foreign_keys(budget_user):
+    # 외래 키(PrimaryKeyRelatedField)는 *_id 컬럼을 읽어 DRF 와 같은 pk 값으로 응답
+    contents = StudyContent.objects.filter(study_event__user=budget_user).order_by('pk')
+    fast_serializer = get_fast_list_serializer(StudyContentEventSerializer)
+    assert fast_serializer.get_values_queryset(contents).query.values_select == ('id', 'study_event_id', 'content')
+    assert fast_serializer.to_representation(fast_serializer.get_values_queryset(contents)) == [
+        dict(row) for row in StudyContentEventSerializer(contents, many=True).data
+    ]
+    # pk 가 아닌 값을 내보내는 관계 필드는 일반 직렬화 경로 사용
+    assert get_fast_list_serializer(StudyContentEventTitleSerializer) is None
+
+
+def test_interval_tree_overlap():
+    tree = IntervalTree([(1, 3, 'a'), (2, 5, 'b'), (5, 6, 'c'), (7, 7, 'empty'), (9, 8, 'reversed')])
+    assert tree.overlap(3, 5) == ['b']
+    # 반열린 구간: 끝과 시작이 같으면 겹치지 않음
+    assert tree.overlap(6, 7) == []
+    assert tree.overlap(0, 10) == ['a', 'b', 'c', 'reversed']
+    assert tree.overlap(7, 7) == []
+
+
+def test_find_gaps():
+    busy = [(4, 6), (1, 2), (5, 8), (12, 20)]
+    assert find_gaps(busy, 0, 15, 1) == [(0, 1), (2, 4), (8, 12)]
+    assert find_gaps(busy, 0, 15, 3) == [(8, 12)]
+    assert find_gaps([], 0, 5, 1) == [(0, 5)]
+
+
+@pytest.mark.parametrize('model_admin', list(admin.site._registry.values()), ids=str)
+def test_admin_changelist_query_budget(model_admin, budget_user, client):
+    # 행마다 __str__ 로 외래 키를 지연 로딩하면 같은 형태의 쿼리가 반복되어 실패
+    budget_user.is_superuser = True
+    budget_user.save(update_fields=['is_superuser'])
+    client.force_login(budget_user)
+    opts = model_admin.model._meta
+
+    with assert_query_budget(12):
+        response = client.get(reverse(f'admin:{opts.app_label}_{opts.model_name}_changelist'))
+    assert response.status_code == 200
+
+
+def test_admin_excludes_withdrawn_users_rows(budget_user, rf):
+    request = rf.get('/admin/')
+    request.user = budget_user
+    for model in (Event, StudyContent):
+        assert admin.site._registry[model].get_queryset(request).count() == ROWS
+
+    # 탈퇴 유예 기간 중인 사용자의 행은 목록/행 수에서 제외
+    UserService.delete_user(budget_user)
+    for model in (Event, StudyContent):
+        assert not admin.site._registry[model].get_queryset(request).exists()
+
+
+def test_estimated_count_falls_back_to_count(budget_user, monkeypatch):
+    # SQLite (추정 행 수 없음) 또는 작은 테이블은 정확한 COUNT
+    assert get_estimated_count(StudyEvent.objects.filter(user=budget_user)) == ROWS
+
+    # PostgreSQL 이어도 필터가 있으면 (soft delete 매니저 포함) pg_class 를 조회하지 않고 정확한 COUNT
+    monkeypatch.setattr(connection, 'vendor', 'postgresql')
+    with CaptureQueriesContext(connection) as queries:
+        assert get_estimated_count(StudyEvent.objects.filter(user=budget_user)) == ROWS
+        assert get_estimated_count(StudyTimer.objects.all()) == ROWS
+    assert not any('pg_class' in query['sql'] for query in queries.captured_queries)
+
+
+def test_soft_delete_reaper(db):
+    now = timezone.now()
+    user = CustomUser.objects.create_user('reaper@example.com', 'password123!', nickname='reaper')
+    withdrawn = CustomUser.objects.create_user('withdrawn@example.com', 'password123!', nickname='withdrawn')
+    expired, recent, kept = [
+        StudyEvent.objects.create(user=user, title=title, goal='목표', start_at=now, end_at=now)
+        for title in ('만료', '유예 중', '유지')
+    ]
+    for study_event in (expired, recent):
+        StudyContent.objects.create(study_event=study_event, content='내용', duration_minutes=30)
+    expired.soft_delete(now - timedelta(days=2))
+    recent.soft_delete(now)
+    assert not StudyEvent.objects.filter(pk=expired.pk).exists()
+    assert StudyEvent.all_objects.filter(pk=expired.pk).exists()
+
+    Event.objects.create(user=withdrawn, title='일정', start_at=now, end_at=now)
+    CustomUser.objects.filter(pk=withdrawn.pk).update(deleted_at=now - timedelta(days=2))
+
+    # 시간 예산을 다 쓰면 중단하고 다음 실행에서 이어서 처리
+    assert SoftDeleteReaper.run(grace=timedelta(hours=24), chunk_size=1, time_budget=0) == {
+        'rows': 0, 'users': 0, 'finished': False
+    }
+    result = SoftDeleteReaper.run(grace=timedelta(hours=24), chunk_size=1, time_budget=60)
+    assert result['finished'] and result['users'] == 1
+
+    assert set(StudyEvent.all_objects.values_list('title', flat=True)) == {'유예 중', '유지'}
+    assert StudyContent.all_objects.filter(study_event=recent).exists()
+    assert not StudyContent.all_objects.filter(study_event_id=expired.pk).exists()
+    assert not Event.all_objects.filter(user_id=withdrawn.pk).exists()
+    assert not CustomUser._base_manager.filter(pk=withdrawn.pk).exists()
+    assert kept.pk in StudyEvent.objects.values_list('pk', flat=True)
+
+
+def test_database_config_from_env(monkeypatch):
+    for name in ('DB_POOL', 'DB_CONN_MAX_AGE', 'DB_CONN_HEALTH_CHECKS', 'POSTGRES_REPLICA_HOST'):
+        monkeypatch.delenv(name, raising=False)
+
+    # 기본값: 지속 연결 + 연결 확인, replica 없음
+    databases = get_databases()
+    assert list(databases) == ['default']
+    assert databases['default']['CONN_MAX_AGE'] == 60 and databases['default']['CONN_HEALTH_CHECKS']
+    assert 'pool' not in databases['default']['OPTIONS']
+
+    # 연결 풀을 쓰면 Django 의 지속 연결은 끔
+    monkeypatch.setenv('DB_POOL', 'true')
+    monkeypatch.setenv('DB_POOL_MAX_SIZE', '20')
+    monkeypatch.setenv('POSTGRES_REPLICA_HOST', 'replica.internal')
+    databases = get_databases()
+    default, replica = databases['default'], databases['replica']
+    assert default['CONN_MAX_AGE'] == 0
+    assert default['OPTIONS']['pool']['max_size'] == 20
+    assert replica['HOST'] == 'replica.internal' and replica['PORT'] == default['PORT']
+    assert replica['TEST'] == {'MIRROR': 'default'}
+    assert replica['OPTIONS'] is not default['OPTIONS']
+
+
+def test_replica_router(budget_user, monkeypatch):
+    monkeypatch.setattr(db_router, 'get_replica_alias', lambda: 'replica')
+    monkeypatch.setattr(db_router.ReplicaHealth, '_checked_at', {})
+    monkeypatch.setattr(db_router.ReplicaHealth, '_available', {})
+    monkeypatch.setattr(db_router.ReplicaHealth, 'check', staticmethod(lambda alias: True))
+    router = db_router.ReplicaRouter()
+
+    # 요청 밖과 쓰기는 항상 primary, read_from_replica 블록의 읽기만 replica
+    assert router.db_for_read(Event) == 'default'
+    with db_router.read_from_replica():
+        assert router.db_for_read(Event) == 'replica'
+        assert router.db_for_write(Event) == 'default'
+        db_router.ReplicaHealth.mark_unavailable('replica')
+        assert router.db_for_read(Event) == 'default'
+
+    monkeypatch.setattr(db_router.ReplicaHealth, '_checked_at', {})
+    seen = []
+
+    def get_response(request):
+        request.user = budget_user
+        seen.append(router.db_for_read(Event))
+        return HttpResponse()
+
+    middleware = db_router.ReplicaRoutingMiddleware(get_response)
+    factory = RequestFactory()
+    assert middleware(factory.get('/')).cookies == {}
+    # 쓰기에 성공하면 쿠키와 사용자별 플래그로 primary 에 고정 (read-your-writes)
+    response = middleware(factory.post('/'))
+    assert response.cookies['db_pin'].value == '1'
+    assert db_router.ReplicaPin.is_pinned(budget_user.pk)
+    middleware(factory.get('/'))
+    assert seen == ['replica', 'default', 'default']
+
+
+def add_replica_alias(monkeypatch, replica):
+    """
+    replica 별칭과 연결 추가 (테스트가 끝나면 제거)
+
+    DATABASES 에 넣으면 테스트 케이스가 허용하지 않은 별칭으로 막으므로 연결만 등록
+    """
+    monkeypatch.setattr(db_router, 'get_replica_alias', lambda: 'replica')
+    monkeypatch.setattr(connections._connections, 'replica', replica, raising=False)
+    monkeypatch.setattr(db_router.ReplicaHealth, '_checked_at', {})
+    monkeypatch.setattr(db_router.ReplicaHealth, '_available', {})
+    monkeypatch.setattr(db_router.ReplicaHealth, 'check', staticmethod(lambda alias: True))
+
+
+@pytest.fixture
+def replica_routes(monkeypatch):
+    """replica 로 보낸 읽기 기록"""
+    routes = []
+    route = db_router.ReplicaRouter.db_for_read
+
+    def db_for_read(self, model, **hints):
+        routes.append(route(self, model, **hints))
+        return routes[-1]
+
+    monkeypatch.setattr(db_router.ReplicaRouter, 'db_for_read', db_for_read)
+    return routes
+
+
+def test_replica_router_with_session_user(budget_user, client, monkeypatch, replica_routes):
+    # TEST MIRROR 처럼 default 와 같은 연결을 쓰는 replica (테스트 트랜잭션의 데이터가 보이도록)
+    add_replica_alias(monkeypatch, connection)
+    client.force_login(budget_user)
+    replica_routes.clear()
+
+    # 세션/사용자 조회도 라우터를 거치지만, 지연 평가 중인 request.user 는 건드리지 않음
+    assert client.get('/admin/').status_code == 200
+    assert 'replica' in replica_routes
+
+    # 데이터를 변경한 사용자는 인증된 뒤의 읽기부터 primary
+    db_router.ReplicaPin.pin(budget_user.pk)
+    replica_routes.clear()
+    assert client.get('/admin/').status_code == 200
+    assert replica_routes[-1] == 'default'
+
+
+def test_replica_router_retries_failed_reads_on_primary(budget_user, client, monkeypatch, replica_routes, tmp_path):
+    # 연결할 수 없는 replica: 요청 중 실패하면 같은 요청을 primary 에서 다시 실행
+    replica_settings = {**connection.settings_dict, 'NAME': str(tmp_path / 'missing' / 'replica.sqlite3')}
+    add_replica_alias(monkeypatch, type(connections['default'])(replica_settings, 'replica'))
+    client.force_login(budget_user)
+    replica_routes.clear()
+    assert client.get('/admin/').status_code == 200
+    assert replica_routes[0] == 'replica' and replica_routes[-1] == 'default'
+    assert not db_router.ReplicaHealth.is_available('replica')
+
+
+def test_profiling_saves_slow_requests(budget_user, settings, tmp_path):
+    settings.PROFILING_ENABLED = True
+    settings.PROFILING_SLOW_THRESHOLD_MS = 20
+    settings.PROFILING_SAMPLE_RATE = 0.0
+    settings.PROFILING_DIR = tmp_path
+    settings.PROFILING_MAX_FILES = 2
+
+    def get_response(request):
+        CustomUser.objects.count()
+        if request.path == '/slow/':
+            time.sleep(0.05)
+        return HttpResponse()
+
+    middleware = ProfilingMiddleware(get_response)
+    factory = RequestFactory()
+    middleware(factory.get('/fast/'))
+    assert ProfileStore.list() == []
+
+    for _ in range(3):
+        middleware(factory.get('/slow/'))
+    # 최대 개수를 넘으면 오래된 것부터 삭제, 목록은 최신순
+    profiles = ProfileStore.list()
+    assert len(profiles) == 2 and len(list(tmp_path.glob('*.json'))) == 2
+    record = ProfileStore.get(profiles[0]['id'])
+    assert record['path'] == '/slow/' and record['slow'] and record['mode'] == 'sampling'
+    assert record['query_count'] == 1 and record['duration_ms'] >= 20
+    assert ProfileStore.get('../secret') is None
+
+
+def test_stack_sampler_returns_copies():
+    sampler = StackSampler(interval=0.001)
+    thread_id = threading.get_ident()
+    sampler.start(thread_id)
+    time.sleep(0.05)
+    stacks = sampler.stop(thread_id)
+    samples = sum(stacks.values())
+    assert samples > 0 and not sampler.active
+
+    # 해제 후 돌려받은 Counter 는 샘플러 스레드가 더 이상 건드리지 않음
+    sampler.start(threading.get_ident() + 1)
+    time.sleep(0.02)
+    assert sum(stacks.values()) == samples
+    sampler.stop(threading.get_ident() + 1)
+
+
+def test_summarize_stacks():
+    functions = summarize_stacks({'main;view;query': 3, 'main;view': 1})
+    assert {row['function']: (row['self_samples'], row['total_samples']) for row in functions} == {
+        'main': (0, 4), 'view': (1, 4), 'query': (3, 3),
+    }
+    assert functions[-1]['function'] == 'query'
+
+
+def get_seed_snapshot(seeder):
+    """사용자 번호별 생성 데이터 (도메인/ID 와 무관한 값만)"""
+    return {
+        user.nickname: (
+            sorted(Event.objects.filter(user=user).values_list('title', 'start_at', 'end_at')),
+            sorted(RepeatEvent.objects.filter(user=user).values_list('rule', 'start_at', 'until')),
+            sorted(Exam.objects.filter(user=user).values_list('subject', 'exam_date', 'score', 'pass_threshold')),
+            sorted(StudyEvent.objects.filter(user=user).values_list('title', 'start_at', 'end_at')),
+            StudyContent.objects.filter(study_event__user=user).count(),
+        )
+        for user in seeder.get_users()
+    }
+
+
+def test_seed_load_is_deterministic(db):
+    scale = SeedScale(users=3, days=30, future_days=10)
+    end_date = date(2026, 1, 31)
+    first = LoadSeeder(scale, seed=7, end_date=end_date, users_per_batch=2, domain='a.invalid')
+    counts = first.run()
+    assert counts['CustomUser'] == 3 and counts['StudyContent'] > 0
+    # 이미 있는 사용자는 건너뜀
+    assert first.run() == {}
+
+    # 배치 크기가 달라도 같은 seed / end_date 면 같은 데이터
+    second = LoadSeeder(scale, seed=7, end_date=end_date, users_per_batch=1, domain='b.invalid')
+    second.run()
+    assert get_seed_snapshot(first) == get_seed_snapshot(second)
+
+    other = LoadSeeder(scale, seed=8, end_date=end_date, domain='c.invalid')
+    other.run()
+    assert get_seed_snapshot(other) != get_seed_snapshot(first)
+
+
+def test_fast_json_renderer_matches_drf():
+    import datetime
+    import decimal
+    import uuid
+
+    from django.utils.translation import gettext_lazy
+    from rest_framework.renderers import JSONRenderer
+
+    from core.renderers import FastJSONRenderer
+
+    pytest.importorskip('orjson')
+    data = {
+        'label': gettext_lazy('Hello'),
+        'labels': [gettext_lazy('Hello')],
+        'amount': decimal.Decimal('1.50'),
+        'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+        'elapsed': datetime.timedelta(minutes=90),
+        'at': datetime.datetime(2026, 1, 1, 9, 30, tzinfo=datetime.timezone.utc),
+        'text': '줄\u2028바꿈',
+    }
+    assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_data_version_skips_redis_after_failure(budget_user, settings, monkeypatch, caplog):
+    caplog.set_level(logging.INFO, logger='core.versioning')
+    settings.DATA_VERSION_REDIS_URL = None
+    DataVersionService.increment(budget_user.pk)
+    settings.DATA_VERSION_REDIS_URL = 'redis://redis.invalid:6379/0'
+    settings.DATA_VERSION_REDIS_RETRY_SECONDS = 30
+    monkeypatch.setattr(versioning.RedisCircuit, '_retry_at', 0.0)
+    monkeypatch.setattr(versioning.RedisCircuit, '_failing', False)
+    calls = []
+
+    class Client:
+        down = True
+
+        def get(self, key):
+            calls.append(key)
+            if self.down:
+                raise redis.ConnectionError('down')
+            return b'3'
+
+    client = Client()
+    monkeypatch.setattr(versioning, '_get_client', lambda url: client)
+
+    # 실패하면 DB 값을 쓰고, 재시도 시간 전까지는 Redis 를 건너뜀 (장애 로그는 한 번만)
+    assert DataVersionService.get_version(budget_user.pk) == 1
+    assert DataVersionService.get_version(budget_user.pk) == 1
+    assert len(calls) == 1
+    assert caplog.text.count('Redis 오류') == 1
+
+    client.down = False
+    monkeypatch.setattr(versioning.RedisCircuit, '_retry_at', 0.0)
+    assert DataVersionService.get_version(budget_user.pk) == 3
+    assert 'Redis 복구' in caplog.text
+
+
+def test_metrics_view_requires_token_or_staff(budget_user, client, settings):
+    settings.DEBUG = False
+    settings.METRICS_TOKEN = None
+    metrics.increment('study_timers_auto_closed_total', 2)
+
+    # 토큰이 없으면 관리자만 조회 가능
+    assert client.get('/metrics').status_code == 403
+    client.force_login(budget_user)
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response['Content-Type'] == metrics.CONTENT_TYPE
+    body = response.content.decode()
+    assert '# TYPE study_timers_auto_closed_total counter' in body
+    assert '# TYPE http_request_duration_seconds histogram' in body
+
+    # 토큰이 있으면 로그인과 관계없이 Bearer 토큰 필요
+    settings.METRICS_TOKEN = 'secret'
+    assert client.get('/metrics').status_code == 403
+    assert client.get('/metrics', HTTP_AUTHORIZATION='Bearer secret').status_code == 200
+
+
+def test_render_prometheus():
+    counters = {('http_responses_total', (('status', '200'), ('view', 'users:data-version'))): 3}
+    histograms = {
+        ('http_metrics_overhead_seconds', ()): [1] + [0] * (len(metrics.OVERHEAD_BUCKETS) - 1) + [0.0001, 1],
+    }
+    lines = metrics.render_prometheus(counters, histograms).splitlines()
+    assert 'http_responses_total{status="200",view="users:data-version"} 3' in lines
+    assert 'http_metrics_overhead_seconds_bucket{le="+Inf"} 1' in lines
+    assert 'http_metrics_overhead_seconds_count 1' in lines
@@ -0,0 +1,233 @@
+"""
+사용자 데이터 버전 카운터
+
+일정/시험/스터디 데이터가 바뀔 때마다 사용자별 버전을 1씩 올립니다.
+- Redis INCR 로 원자적으로 증가시키고, DB(UserDataVersion)에 최대값을 미러링
+- 조회는 Redis GET 한 번 (O(1)), Redis 에 값이 없으면 DB 미러 값으로 채움
+- 증가할 때마다 Redis pub/sub 채널로 새 버전을 발행하여 변경을 구독 가능
+- Redis 를 사용할 수 없으면 DB 의 F('version') + 1 로 동작
+  오류가 나면 DATA_VERSION_REDIS_RETRY_SECONDS 동안 Redis 를 건너뛰고 장애는 한 번만 로그로 남김
+
+서비스 레이어 밖에서 데이터를 쓰는 코드(bulk_create 등)는 직접 DataVersionService.bump() 를 호출해야 합니다.
+"""
+import logging
+import threading
+import time
+from functools import lru_cache
+
+import redis
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import UserDataVersion
+
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = 'data-version:{user_id}'
+CHANNEL = 'data-version:{user_id}:changes'
+
+# Redis 없이 변경을 기다릴 때 DB 를 다시 읽는 간격 (초)
+POLL_INTERVAL = 1.0
+
+
+@lru_cache(maxsize=4)
+def _get_client(url):
+    return redis.Redis.from_url(url, socket_connect_timeout=0.5, socket_timeout=2)
+
+
+class RedisCircuit:
+    """
+    Redis 장애 차단기 (프로세스별)
+
+    오류가 나면 DATA_VERSION_REDIS_RETRY_SECONDS 동안 Redis 를 건너뛰고 DB 미러를 사용
+    장애는 시작과 복구 때만 로그를 남김
+    """
+
+    _lock = threading.Lock()
+    _retry_at = 0.0
+    _failing = False
+
+    @classmethod
+    def is_open(cls):
+        return time.monotonic() < cls._retry_at
+
+    @classmethod
+    def record_failure(cls, action):
+        with cls._lock:
+            cls._retry_at = time.monotonic() + getattr(settings, 'DATA_VERSION_REDIS_RETRY_SECONDS', 30)
+            failing, cls._failing = cls._failing, True
+        if not failing:
+            logger.warning('데이터 버전 %s 중 Redis 오류, DB 값 사용', action, exc_info=True)
+
+    @classmethod
+    def record_success(cls):
+        # 정상일 때는 락 없이 바로 반환
+        if not cls._failing:
+            return
+        with cls._lock:
+            recovered, cls._failing = cls._failing, False
+        if recovered:
+            logger.info('데이터 버전 Redis 복구')
+
+
+def get_redis_client():
+    """
+    버전 카운터용 Redis 클라이언트
+
+    :return: DATA_VERSION_REDIS_URL 이 없거나 최근 오류로 건너뛰는 중이면 None
+    """
+    url = getattr(settings, 'DATA_VERSION_REDIS_URL', None)
+    if not url or RedisCircuit.is_open():
+        return None
+    return _get_client(url)
+
+
+class DataVersionService:
+    """사용자 데이터 버전 조회/증가/구독 서비스"""
+
+    @staticmethod
+    def get_key(user_id):
+        return VERSION_KEY.format(user_id=user_id)
+
+    @staticmethod
+    def get_channel(user_id):
+        return CHANNEL.format(user_id=user_id)
+
+    @staticmethod
+    def get_stored_version(user_id):
+        """DB 미러에 저장된 버전"""
+        return UserDataVersion.objects.filter(user_id=user_id).values_list('version', flat=True).first() or 0
+
+    @staticmethod
+    def get_version(user_id):
+        """
+        현재 데이터 버전 조회
+
+        :param user_id: 사용자 ID
+        :return: 버전 (데이터를 한 번도 쓰지 않은 사용자는 0)
+        """
+        client = get_redis_client()
+        if client is not None:
+            key = DataVersionService.get_key(user_id)
+            try:
+                value = client.get(key)
+                if value is None:
+                    # 만료/유실된 경우 DB 미러 값으로 채움 (동시에 증가한 값이 있으면 덮어쓰지 않음)
+                    stored = DataVersionService.get_stored_version(user_id)
+                    client.set(key, stored, nx=True)
+                    value = client.get(key) or stored
+            except redis.RedisError:
+                RedisCircuit.record_failure('조회')
+            else:
+                RedisCircuit.record_success()
+                return int(value)
+        return DataVersionService.get_stored_version(user_id)
+
+    @staticmethod
+    def bump(user_id):
+        """
+        트랜잭션 커밋 후 데이터 버전 증가
+
+        커밋 전에 올리면 다른 요청이 새 버전과 이전 데이터를 함께 캐시할 수 있으므로 커밋 이후에 증가
+        """
+        transaction.on_commit(lambda: DataVersionService.increment(user_id))
+
+    @staticmethod
+    def increment(user_id):
+        """
+        데이터 버전을 즉시 1 증가시키고 새 버전을 발행
+
+        :return: 새 버전
+        """
+        client = get_redis_client()
+        if client is not None:
+            try:
+                version = DataVersionService._increment_redis(client, user_id)
+                client.publish(DataVersionService.get_channel(user_id), version)
+            except redis.RedisError:
+                RedisCircuit.record_failure('증가')
+            else:
+                RedisCircuit.record_success()
+                return version
+        return DataVersionService._increment_db(user_id)
+
+    @staticmethod
+    def _increment_redis(client, user_id):
+        key = DataVersionService.get_key(user_id)
+        if not client.exists(key):
+            client.set(key, DataVersionService.get_stored_version(user_id), nx=True)
+        version = client.incr(key)
+
+        # DB 미러는 더 큰 값으로만 갱신 (동시 증가 순서가 뒤바뀌어도 감소하지 않음)
+        if DataVersionService._mirror(user_id, version):
+            return version
+        _, created = UserDataVersion.objects.get_or_create(user_id=user_id, defaults={'version': version})
+        if created or DataVersionService._mirror(user_id, version):
+            return version
+
+        # Redis 값이 유실되어 DB 보다 작아진 경우: DB 기준으로 증가시킨 뒤 Redis 를 다시 맞춤
+        version = DataVersionService._increment_db(user_id)
+        client.set(key, version)
+        return version
+
+    @staticmethod
+    def _mirror(user_id, version):
+        """DB 미러를 version 으로 갱신 (이미 같거나 큰 값이면 False)"""
+        return bool(UserDataVersion.objects.filter(
+            user_id=user_id, version__lt=version
+        ).update(version=version, updated_at=timezone.now()))
+
+    @staticmethod
+    def _increment_db(user_id):
+        UserDataVersion.objects.get_or_create(user_id=user_id)
+        with transaction.atomic():
+            UserDataVersion.objects.filter(user_id=user_id).update(
+                version=F('version') + 1, updated_at=timezone.now()
+            )
+            # 갱신한 행은 커밋 전까지 잠겨 있으므로 방금 증가시킨 값을 그대로 읽음
+            return DataVersionService.get_stored_version(user_id)
+
+    @staticmethod
+    def wait_for_change(user_id, after, timeout):
+        """
+        버전이 after 보다 커질 때까지 대기 (롱 폴링용)
+
+        :param user_id: 사용자 ID
+        :param after: 클라이언트가 알고 있는 버전
+        :param timeout: 최대 대기 시간 (초)
+        :return: 현재 버전 (시간 초과 시 after 이하일 수 있음)
+        """
+        deadline = time.monotonic() + timeout
+        client = get_redis_client()
+        if client is not None:
+            try:
+                return DataVersionService._wait_pubsub(client, user_id, after, deadline)
+            except redis.RedisError:
+                RedisCircuit.record_failure('구독')
+
+        version = DataVersionService.get_stored_version(user_id)
+        while version <= after and time.monotonic() < deadline:
+            time.sleep(min(POLL_INTERVAL, max(deadline - time.monotonic(), 0)))
+            version = DataVersionService.get_stored_version(user_id)
+        return version
+
+    @staticmethod
+    def _wait_pubsub(client, user_id, after, deadline):
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        try:
+            pubsub.subscribe(DataVersionService.get_channel(user_id))
+            # 구독 이후에 다시 읽어 구독 직전의 변경을 놓치지 않음
+            version = DataVersionService.get_version(user_id)
+            while version <= after:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                message = pubsub.get_message(timeout=remaining)
+                if message is not None:
+                    version = max(version, int(message['data']))
+            return version
+        finally:
+            pubsub.close()